@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+用例收集与模块导入耗时基准测试
+
+多次执行 `pytest --collect-only` 统计收集耗时，并用 `python -X importtime` 列出
+导入最慢的项目模块，用于在CI中跟踪收集阶段（每个xdist worker都会重复执行）的开销。
+
+用法: python benchmarks/bench_collect.py [--runs 5] [--output collect_bench.json] [--max-seconds 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 统计导入耗时的项目模块
+PROJECT_MODULES = ["conftest", "common.", "tests."]
+
+
+def measure_collect(runs, pytest_args):
+    """返回每次 pytest --collect-only 的耗时（秒）及最后一次的收集结果"""
+    durations = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", *pytest_args],
+            cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+        durations.append(time.perf_counter() - start)
+    return durations, result
+
+
+def measure_imports(top, pytest_args):
+    """用 -X importtime 统计收集过程中项目模块的累计导入耗时（毫秒）"""
+    result = subprocess.run(
+        # -s 关闭输出捕获，否则收集阶段的导入耗时会被pytest吞掉
+        [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q", "-s", "-p", "no:cacheprovider", *pytest_args],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, module = line[len("import time:"):].split("|")
+            cumulative_ms = int(cumulative) / 1000
+        except ValueError:
+            continue
+        module = module.strip()
+        if any(module == name or module.startswith(name) for name in PROJECT_MODULES):
+            imports.append((module, cumulative_ms))
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pytest用例收集耗时基准测试")
+    parser.add_argument("--runs", type=int, default=5, help="执行 --collect-only 的次数")
+    parser.add_argument("--top", type=int, default=10, help="列出导入最慢的模块数")
+    parser.add_argument("--output", help="结果JSON文件路径，便于CI记录趋势")
+    parser.add_argument("--max-seconds", type=float, help="收集耗时中位数超过该值时返回非0退出码")
+    parser.add_argument("pytest_args", nargs="*", help="透传给pytest的参数，如 tests/")
+    args = parser.parse_args()
+
+    durations, result = measure_collect(args.runs, args.pytest_args)
+    summary_line = next((line.strip("= ") for line in reversed(result.stdout.splitlines())
+                         if "collected" in line or "error" in line), "")
+    median = statistics.median(durations)
+
+    print(f"pytest --collect-only 执行 {args.runs} 次: 中位数 {median:.2f}s, "
+          f"最小 {min(durations):.2f}s, 最大 {max(durations):.2f}s")
+    print(f"收集结果: {summary_line}")
+
+    imports = measure_imports(args.top, args.pytest_args)
+    print(f"{'项目模块':<40}{'累计导入耗时(ms)':>18}")
+    for module, cumulative_ms in imports:
+        print(f"{module:<44}{cumulative_ms:>14.1f}")
+
+    if args.output:
+        report = {
+            "runs": args.runs,
+            "collect_seconds": durations,
+            "collect_seconds_median": median,
+            "collect_returncode": result.returncode,
+            "collect_summary": summary_line,
+            "imports_ms": dict(imports)
+        }
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"结果已写入: {args.output}")
+
+    if result.returncode != 0:
+        print("用例收集失败")
+        sys.exit(result.returncode)
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"收集耗时中位数 {median:.2f}s 超过阈值 {args.max_seconds}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+HttpClient 请求/响应日志开销基准测试
+
+对比旧实现（每次请求都 json.dumps(indent=2) 并再次 response.json()）与
+惰性格式化实现在不同日志级别下的单次请求日志开销。
+
+用法: python benchmarks/bench_http_logging.py [--iterations 2000] [--payload-kb 64]
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests
+from common.http_client import HttpClient
+from common.logger import logger
+
+
+def legacy_log_request(method, url, **kwargs):
+    """旧实现：无论日志级别都格式化请求体"""
+    logger.info(f"发送 {method} 请求到: {url}")
+    if 'json' in kwargs:
+        logger.debug(f"请求体: {json.dumps(kwargs['json'], ensure_ascii=False, indent=2)}")
+    if 'data' in kwargs:
+        logger.debug(f"请求数据: {kwargs['data']}")
+
+
+def legacy_log_response(response):
+    """旧实现：无论日志级别都解析并格式化响应体"""
+    logger.info(f"响应状态码: {response.status_code}")
+    try:
+        response_json = response.json()
+        logger.debug(f"响应体: {json.dumps(response_json, ensure_ascii=False, indent=2)}")
+    except:
+        logger.debug(f"响应体: {response.text[:500]}...")
+
+
+def build_payloads(payload_kb):
+    """构造与语音聊天相近的请求体和聊天历史响应体"""
+    audio = base64.b64encode(os.urandom(payload_kb * 768)).decode()
+    request_json = {
+        "content": audio,
+        "region": "",
+        "sessionId": "71d34ea5-a9d5-45eb-bfc8-fe79132c7a4d",
+        "messageType": 1,
+        "voiceLanguage": 0,
+        "voiceDurationSeconds": 2.18
+    }
+    messages = [{"role": i % 2, "content": "这是一条聊天历史消息 " * 20} for i in range(payload_kb * 2)]
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = json.dumps({"code": "20000", "data": messages}, ensure_ascii=False).encode()
+    return request_json, response
+
+
+def measure(log_request, log_response, request_json, response, iterations):
+    url = "https://station-developer.aevatar.ai/godgptprod-client/api/godgpt/voice/chat"
+    start = time.perf_counter()
+    for _ in range(iterations):
+        log_request("POST", url, json=request_json)
+        log_response(response)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HttpClient日志开销基准测试")
+    parser.add_argument("--iterations", type=int, default=2000, help="每组测量的请求次数")
+    parser.add_argument("--payload-kb", type=int, default=64, help="请求体/响应体大小（KB）")
+    args = parser.parse_args()
+
+    request_json, response = build_payloads(args.payload_kb)
+    client = HttpClient("https://station-developer.aevatar.ai")
+
+    print(f"请求体 {len(json.dumps(request_json)) // 1024}KB, 响应体 {len(response.content) // 1024}KB, "
+          f"迭代 {args.iterations} 次")
+    print(f"{'日志级别':<10}{'旧实现(us/请求)':>18}{'惰性实现(us/请求)':>20}{'加速比':>10}")
+
+    for level in ("INFO", "DEBUG"):
+        # 使用空sink，只测量格式化开销，排除磁盘和终端I/O
+        logger.remove()
+        logger.add(lambda message: None, level=level)
+        legacy = measure(legacy_log_request, legacy_log_response, request_json, response, args.iterations)
+        lazy = measure(client._log_request, client._log_response, request_json, response, args.iterations)
+        print(f"{level:<14}{legacy:>16.1f}{lazy:>20.1f}{legacy / lazy:>12.1f}x")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
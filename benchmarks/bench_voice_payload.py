@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+语音聊天请求体大小伸缩基准测试
+
+按语音聊天用例的请求结构，向 /godgptprod-client/api/godgpt/voice/chat 发送从 1KB 到数十MB 的合成音频，
+记录每次请求的序列化耗时、上传耗时、服务端耗时（上传完成到首字节）和客户端内存峰值，
+输出吞吐量随请求体大小变化的曲线，并标出吞吐量明显下降的位置。
+
+两种发送方式：
+  stream  流式请求体（VoiceRequestBody），边编码base64边上传
+  json    先 json.dumps 整个请求体再发送，与 json=request_data 相同
+
+默认启动独立进程的本地模拟服务，避免服务端内存计入客户端；--base-url 可指向真实环境（使用 .env 中的账号认证）。
+
+用法: python benchmarks/bench_voice_payload.py [--sizes 1KB,64KB,1MB,16MB] [--modes stream,json] [--repeat 3]
+                                               [--base-url URL] [--output voice_payload_bench.json]
+"""
+
+import argparse
+import io
+import json
+import resource
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from common.http_client import HttpClient
+from common.logger import logger
+from common.mock_server import MOCK_TOKEN_PREFIX
+from common.voice_fixtures import SYNTHETIC_SAMPLE_RATE, VoiceFixtureManager
+
+DEFAULT_SIZES = "1KB,8KB,64KB,512KB,1MB,4MB,16MB,32MB"
+SESSION_ID = "71d34ea5-a9d5-45eb-bfc8-fe79132c7a4d"
+
+# 吞吐量低于更小请求体中最好成绩的该比例时标记为下降点
+CLIFF_RATIO = 0.5
+
+_UNITS = {"KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "B": 1}
+
+
+def parse_size(text):
+    """解析 1KB、16MB 或字节数"""
+    text = text.strip().upper()
+    for unit, factor in _UNITS.items():
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * factor)
+    return int(text)
+
+
+def format_size(size):
+    for unit in ("MB", "KB"):
+        if size >= _UNITS[unit]:
+            return f"{size / _UNITS[unit]:.1f}{unit}"
+    return f"{size}B"
+
+
+class TimedBody(io.RawIOBase):
+    """包装请求体，记录请求体最后一个字节被读走（交给socket）的时间"""
+
+    def __init__(self, raw, length):
+        self.raw = raw
+        self.length = length
+        self.sent = 0
+        self.done_at = None
+
+    def __len__(self):
+        return self.length
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.raw.tell()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.raw.seek(offset, whence)
+
+    def readinto(self, buffer):
+        n = self.raw.readinto(buffer)
+        self.sent += n
+        if self.done_at is None and self.sent >= self.length:
+            self.done_at = time.perf_counter()
+        return n
+
+
+def build_body(voice, mode):
+    """按发送方式构造请求体，返回 (请求体, 序列化耗时毫秒)"""
+    fields = {"region": "", "sessionId": SESSION_ID, "messageType": 1, "voiceLanguage": 0}
+    start = time.perf_counter()
+    if mode == "stream":
+        raw = voice.request_body(**fields)
+        length = len(raw)
+    else:
+        raw = io.BytesIO(json.dumps(voice.request_data(**fields)).encode("utf-8"))
+        length = len(raw.getbuffer())
+    return TimedBody(raw, length), (time.perf_counter() - start) * 1000
+
+
+def send_once(client, token, voice, mode):
+    """发送一次语音聊天请求并读完SSE响应，返回各阶段耗时和内存峰值"""
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    body, serialize_ms = build_body(voice, mode)
+    start = time.perf_counter()
+    with client.call("voice-chat", token=token, data=body) as stream:
+        status = stream.status_code
+        for _ in stream:
+            pass
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+
+    first_byte = stream.metrics.first_byte_time or end
+    done_at = body.done_at or first_byte
+    total_ms = (end - start) * 1000 + serialize_ms
+    return {
+        "status": status,
+        "body_bytes": len(body),
+        "serialize_ms": serialize_ms,
+        "upload_ms": (done_at - start) * 1000,
+        "server_ms": max(0.0, first_byte - done_at) * 1000,
+        "total_ms": total_ms,
+        "throughput_mb_s": len(body) / _UNITS["MB"] / (total_ms / 1000),
+        "peak_memory_mb": (peak - baseline) / _UNITS["MB"],
+    }
+
+
+def summarize(samples):
+    """多次重复取中位数，内存取最大值"""
+    def median(key):
+        values = sorted(sample[key] for sample in samples)
+        return values[len(values) // 2]
+
+    summary = {key: median(key) for key in ("serialize_ms", "upload_ms", "server_ms", "total_ms", "throughput_mb_s")}
+    summary["body_bytes"] = samples[0]["body_bytes"]
+    summary["peak_memory_mb"] = max(sample["peak_memory_mb"] for sample in samples)
+    summary["statuses"] = sorted({sample["status"] for sample in samples})
+    return summary
+
+
+def mark_cliffs(curve):
+    """吞吐量低于更小请求体中最好成绩 CLIFF_RATIO 倍的点标记为下降"""
+    best = 0.0
+    for point in curve:
+        point["cliff"] = best > 0 and point["throughput_mb_s"] < best * CLIFF_RATIO
+        best = max(best, point["throughput_mb_s"])
+
+
+def start_mock_server():
+    """在独立进程中启动本地模拟服务，返回 (进程, base_url)"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen([sys.executable, "-m", "common.mock_server", "--port", str(port)],
+                               cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("本地模拟服务启动超时")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="语音聊天请求体大小伸缩基准测试")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="音频大小列表，逗号分隔，如 1KB,1MB,16MB")
+    parser.add_argument("--modes", default="stream,json", help="发送方式：stream、json，逗号分隔")
+    parser.add_argument("--repeat", type=int, default=3, help="每个大小重复发送次数，取中位数")
+    parser.add_argument("--base-url", help="目标服务地址，不指定时启动本地模拟服务")
+    parser.add_argument("--cache-dir", help="合成音频缓存目录，默认系统临时目录")
+    parser.add_argument("--output", help="结果JSON文件路径，便于CI记录趋势")
+    args = parser.parse_args()
+
+    # 只保留警告日志，避免每次请求的日志格式化干扰计时
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    modes = [mode.strip() for mode in args.modes.split(",")]
+    manager = VoiceFixtureManager(cache_dir=args.cache_dir)
+
+    server = None
+    if args.base_url:
+        from common.auth_manager import auth_manager
+        base_url, token = args.base_url, auth_manager.get_auth_token()
+    else:
+        server, base_url = start_mock_server()
+        token = f"{MOCK_TOKEN_PREFIX}bench"
+
+    results = {}
+    tracemalloc.start()
+    try:
+        with HttpClient(base_url, timeout=300, retry_times=0) as client:
+            for mode in modes:
+                curve = []
+                for size in sizes:
+                    duration = max(size - 44, 2) / (SYNTHETIC_SAMPLE_RATE * 2)
+                    voice = manager.synthetic(duration)
+                    voice.base64  # 缓存的base64不计入 json 方式每次发送的开销
+                    samples = [send_once(client, token, voice, mode) for _ in range(args.repeat)]
+                    curve.append({"audio_bytes": voice.size, **summarize(samples)})
+                    voice.close()
+                mark_cliffs(curve)
+                results[mode] = curve
+    finally:
+        tracemalloc.stop()
+        manager.close()
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    header = (f"{'音频':>9}{'请求体':>10}{'序列化ms':>11}{'上传ms':>10}{'服务端ms':>11}"
+              f"{'总耗时ms':>11}{'吞吐MB/s':>11}{'内存峰值MB':>12}")
+    for mode, curve in results.items():
+        print(f"\n[{mode}] 目标 {base_url}，每个大小 {args.repeat} 次取中位数")
+        print(header)
+        for point in curve:
+            notes = "  <- 吞吐下降" if point["cliff"] else ""
+            if point["statuses"] != [200]:
+                notes += f"  状态码 {point['statuses']}"
+            print(f"{format_size(point['audio_bytes']):>10}{format_size(point['body_bytes']):>12}"
+                  f"{point['serialize_ms']:>13.1f}{point['upload_ms']:>12.1f}{point['server_ms']:>13.1f}"
+                  f"{point['total_ms']:>13.1f}{point['throughput_mb_s']:>12.1f}{point['peak_memory_mb']:>14.1f}{notes}")
+    print(f"\n进程最大常驻内存: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f}MB")
+
+    if args.output:
+        report = {"base_url": base_url, "repeat": args.repeat, "cliff_ratio": CLIFF_RATIO, "curves": results}
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"结果已写入: {args.output}")
+
+    if any(point["statuses"] != [200] for curve in results.values() for point in curve):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
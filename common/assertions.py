@@ -1,19 +1,160 @@
+import hashlib
 import json
-from typing import Any, Dict, List, Union
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Union
+import allure
 import jsonschema
-from common.logger import logger
+from common.json_path import compile_path, compile_paths
+from common.logger import logger, truncate_body
+
+
+# 编译后的JSON Schema校验器缓存数量
+SCHEMA_CACHE_SIZE = 128
+
+# 批量校验失败时错误信息中最多列出的条数
+SCHEMA_ERRORS_REPORTED = 5
+
+
+class SchemaValidatorCache:
+    """
+    编译后的JSON Schema校验器LRU缓存
+
+    同一个schema对象按id直接命中；内容相同的不同对象（如用例内每次新建的字典）按规范化JSON的摘要命中。
+    校验器只在首次使用时检查schema并创建，格式校验器随校验器一起配置。
+    """
+
+    def __init__(self, maxsize: int = SCHEMA_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # id(schema) -> (schema, 摘要)，保留schema引用避免对象回收后id被复用
+        self._by_id: "OrderedDict[int, tuple]" = OrderedDict()
+        self._validators: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def schema_key(schema: Dict[str, Any]) -> str:
+        return hashlib.sha1(json.dumps(schema, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, schema: Dict[str, Any]):
+        """获取schema对应的校验器，不存在时编译并缓存"""
+        with self._lock:
+            entry = self._by_id.get(id(schema))
+            if entry is not None and entry[0] is schema and entry[1] in self._validators:
+                self._by_id.move_to_end(id(schema))
+                self._validators.move_to_end(entry[1])
+                self.hits += 1
+                return self._validators[entry[1]]
+
+        key = self.schema_key(schema)
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is None:
+                validator_class = jsonschema.validators.validator_for(schema)
+                validator_class.check_schema(schema)
+                validator = validator_class(schema, format_checker=validator_class.FORMAT_CHECKER)
+                self._validators[key] = validator
+                self.misses += 1
+                if len(self._validators) > self.maxsize:
+                    self._validators.popitem(last=False)
+            else:
+                self._validators.move_to_end(key)
+                self.hits += 1
+            self._by_id[id(schema)] = (schema, key)
+            if len(self._by_id) > self.maxsize:
+                self._by_id.popitem(last=False)
+        return validator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_id.clear()
+            self._validators.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+
+# 全局校验器缓存
+schema_validator_cache = SchemaValidatorCache()
+
+
+def _schema_error(validator, instance) -> Optional[str]:
+    """返回最相关的校验错误描述，通过时返回None"""
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is None:
+        return None
+    path = "/".join(str(p) for p in error.absolute_path)
+    return f"{path}: {error.message}" if path else error.message
+
+
+class _Exists:
+    """assert_json_path 的默认期望值：只要求路径存在"""
+
+    def __repr__(self) -> str:
+        return "EXISTS"
+
+
+EXISTS = _Exists()
+
+
+def _response_json(response) -> Any:
+    try:
+        return response.json()
+    except json.JSONDecodeError:
+        raise AssertionError("响应不是有效的JSON格式")
+
+
+def _path_error(expression: str, matches: List[Any], expected: Any) -> Optional[str]:
+    """
+    检查一个路径的匹配结果，通过时返回 None
+
+    不含通配符的路径与唯一匹配值比较，含通配符的路径与匹配值列表比较；
+    expected 为可调用对象时作为判断条件。
+    """
+    if not matches:
+        return f"路径 '{expression}' 不存在"
+    if expected is EXISTS:
+        return None
+    actual = matches[0] if compile_path(expression).single else matches
+    if callable(expected):
+        return None if expected(actual) else f"路径 '{expression}' 的值不满足条件, 实际: {actual}"
+    if actual != expected:
+        return f"路径 '{expression}' 的值不匹配, 期望: {expected}, 实际: {actual}"
+    return None
+
+
+# 当前线程/协程中生效的软断言收集器
+_active_collector: ContextVar[Optional["SoftAssertions"]] = ContextVar("soft_assertions", default=None)
+
+
+def _log_passed(message: str) -> None:
+    """记录断言通过；处于软断言收集器中时只计数，由收集器统一输出汇总日志"""
+    collector = _active_collector.get()
+    if collector is None:
+        # 日志位置显示为调用方的断言方法
+        logger.opt(depth=1).info(message)
+    else:
+        collector.passed += 1
 
 
 class ApiAssertions:
     """API断言工具类"""
     
+    @staticmethod
+    def soft(name: str = "") -> "SoftAssertions":
+        """创建软断言收集器，用法见 SoftAssertions"""
+        return SoftAssertions(name)
+    
     @staticmethod
     def assert_status_code(response, expected_status_code: int) -> None:
         """断言响应状态码"""
         actual_status_code = response.status_code
         assert actual_status_code == expected_status_code, \
             f"期望状态码 {expected_status_code}, 实际状态码 {actual_status_code}"
-        logger.info(f"状态码断言通过: {actual_status_code}")
+        _log_passed(f"状态码断言通过: {actual_status_code}")
     
     @staticmethod
     def assert_response_contains(response, expected_content: str) -> None:
@@ -21,7 +162,7 @@ class ApiAssertions:
         response_text = response.text
         assert expected_content in response_text, \
             f"响应内容不包含 '{expected_content}', 实际响应: {response_text[:200]}..."
-        logger.info(f"响应内容包含断言通过: {expected_content}")
+        _log_passed(f"响应内容包含断言通过: {expected_content}")
     
     @staticmethod
     def assert_json_contains(response, expected_key: str, expected_value: Any = None) -> None:
@@ -39,7 +180,53 @@ class ApiAssertions:
             assert actual_value == expected_value, \
                 f"键 '{expected_key}' 的值不匹配, 期望: {expected_value}, 实际: {actual_value}"
         
-        logger.info(f"JSON包含断言通过: {expected_key}")
+        _log_passed(f"JSON包含断言通过: {expected_key}")
+    
+    @staticmethod
+    def assert_json_path(response, path: str, expected: Any = EXISTS) -> Any:
+        """
+        断言JSON响应中指定路径存在且值符合预期，返回路径的值
+
+        path 支持 JSON Pointer（/data/0/id）和 JSONPath 子集（$.data[0].id、$.data[*].id），
+        不带前缀时按 $. 处理（data.sessionId）。
+        """
+        response_json = _response_json(response)
+        compiled = compile_path(path)
+        matches = compiled.find(response_json)
+        error = _path_error(path, matches, expected)
+        assert error is None, f"{error}, 实际响应: {response_json}"
+        _log_passed(f"JSON路径断言通过: {path}")
+        return matches[0] if compiled.single else matches
+    
+    @staticmethod
+    def assert_json_paths(response, expectations: Union[Dict[str, Any], Iterable[str]]) -> Dict[str, Any]:
+        """
+        一次遍历断言多个JSON路径，所有不通过的路径合并到一条断言错误中
+
+        expectations 为 {路径: 期望值} 或只要求存在的路径列表，返回 {路径: 值}。
+        """
+        if not isinstance(expectations, dict):
+            expectations = dict.fromkeys(expectations, EXISTS)
+        response_json = _response_json(response)
+        results = compile_paths(tuple(expectations)).evaluate(response_json)
+        errors = [error for path, expected in expectations.items()
+                  if (error := _path_error(path, results[path], expected)) is not None]
+        assert not errors, "JSON路径断言失败:\n" + "\n".join(errors) + f"\n实际响应: {response_json}"
+        _log_passed(f"JSON路径断言通过: {len(expectations)} 个路径")
+        return {path: matches[0] if compile_path(path).single else matches
+                for path, matches in results.items()}
+    
+    @staticmethod
+    def assert_json_path_any(response, paths: Iterable[str]) -> Any:
+        """断言候选路径中至少有一个存在，按顺序返回第一个存在的路径的值"""
+        paths = tuple(paths)
+        response_json = _response_json(response)
+        results = compile_paths(paths).evaluate(response_json)
+        for path in paths:
+            if results[path]:
+                _log_passed(f"JSON路径断言通过: {path}")
+                return results[path][0] if compile_path(path).single else results[path]
+        raise AssertionError(f"JSON响应不包含以下任一路径: {list(paths)}, 实际响应: {response_json}")
     
     @staticmethod
     def assert_json_schema(response, schema: Dict[str, Any]) -> None:
@@ -49,11 +236,50 @@ class ApiAssertions:
         except json.JSONDecodeError:
             raise AssertionError("响应不是有效的JSON格式")
         
-        try:
-            jsonschema.validate(instance=response_json, schema=schema)
-            logger.info("JSON Schema验证通过")
-        except jsonschema.exceptions.ValidationError as e:
-            raise AssertionError(f"JSON Schema验证失败: {e.message}")
+        error = _schema_error(schema_validator_cache.get(schema), response_json)
+        if error is not None:
+            raise AssertionError(f"JSON Schema验证失败: {error}")
+        _log_passed("JSON Schema验证通过")
+    
+    @staticmethod
+    def assert_json_schema_all(responses: Iterable, schema: Dict[str, Any]) -> int:
+        """批量断言多个响应都符合同一个schema，校验器只编译一次，返回校验的响应数"""
+        validator = schema_validator_cache.get(schema)
+        errors = []
+        count = 0
+        for i, response in enumerate(responses):
+            count += 1
+            try:
+                error = _schema_error(validator, response.json())
+            except json.JSONDecodeError:
+                error = "响应不是有效的JSON格式"
+            if error is not None:
+                errors.append(f"[{i}] {error}")
+        if errors:
+            raise AssertionError(f"JSON Schema验证失败 {len(errors)}/{count} 个响应: "
+                                 + "; ".join(errors[:SCHEMA_ERRORS_REPORTED]))
+        _log_passed(f"JSON Schema批量验证通过: {count} 个响应")
+        return count
+    
+    @staticmethod
+    def assert_sse_events_schema(stream, schema: Dict[str, Any]) -> int:
+        """逐个读取SSE事件并断言每个事件的JSON数据都符合schema，返回校验的事件数"""
+        validator = schema_validator_cache.get(schema)
+        errors = []
+        count = 0
+        for i, event in enumerate(stream):
+            count += 1
+            try:
+                error = _schema_error(validator, event.json())
+            except json.JSONDecodeError:
+                error = "事件数据不是有效的JSON格式"
+            if error is not None:
+                errors.append(f"[事件{i}] {error}")
+        if errors:
+            raise AssertionError(f"SSE事件JSON Schema验证失败 {len(errors)}/{count} 个事件: "
+                                 + "; ".join(errors[:SCHEMA_ERRORS_REPORTED]))
+        _log_passed(f"SSE事件JSON Schema验证通过: {count} 个事件")
+        return count
     
     @staticmethod
     def assert_response_time(response, max_time: float) -> None:
@@ -61,7 +287,51 @@ class ApiAssertions:
         response_time = response.elapsed.total_seconds()
         assert response_time <= max_time, \
             f"响应时间超过限制, 期望 <= {max_time}秒, 实际: {response_time}秒"
-        logger.info(f"响应时间断言通过: {response_time}秒")
+        _log_passed(f"响应时间断言通过: {response_time}秒")
+    
+    @staticmethod
+    def _completed_stream_metrics(stream):
+        """获取已读取完毕的流式响应指标"""
+        metrics = stream.metrics
+        assert metrics.completed, "流式响应尚未读取完毕，无法断言耗时指标"
+        return metrics
+    
+    @staticmethod
+    def assert_ttfb(stream, max_ms: float) -> None:
+        """断言流式响应首字节耗时不超过指定毫秒数"""
+        ttfb = ApiAssertions._completed_stream_metrics(stream).ttfb_ms
+        assert ttfb is not None, "流式响应未收到任何数据"
+        assert ttfb <= max_ms, \
+            f"首字节耗时超过限制, 期望 <= {max_ms}ms, 实际: {ttfb:.1f}ms"
+        _log_passed(f"首字节耗时断言通过: {ttfb:.1f}ms")
+    
+    @staticmethod
+    def assert_ttft(stream, max_ms: float) -> None:
+        """断言流式响应首个事件（首token）耗时不超过指定毫秒数"""
+        ttft = ApiAssertions._completed_stream_metrics(stream).ttft_ms
+        assert ttft is not None, "流式响应未收到任何事件"
+        assert ttft <= max_ms, \
+            f"首token耗时超过限制, 期望 <= {max_ms}ms, 实际: {ttft:.1f}ms"
+        _log_passed(f"首token耗时断言通过: {ttft:.1f}ms")
+    
+    @staticmethod
+    def assert_event_gap_percentile(stream, p: float, max_ms: float) -> None:
+        """断言流式响应事件间隔的p分位数不超过指定毫秒数"""
+        gap = ApiAssertions._completed_stream_metrics(stream).gap_percentile_ms(p)
+        if gap is None:
+            _log_passed(f"事件数不足，跳过p{p}事件间隔断言")
+            return
+        assert gap <= max_ms, \
+            f"p{p}事件间隔超过限制, 期望 <= {max_ms}ms, 实际: {gap:.1f}ms"
+        _log_passed(f"p{p}事件间隔断言通过: {gap:.1f}ms")
+    
+    @staticmethod
+    def assert_stream_duration(stream, max_ms: float) -> None:
+        """断言流式响应总耗时不超过指定毫秒数"""
+        duration = ApiAssertions._completed_stream_metrics(stream).duration_ms
+        assert duration <= max_ms, \
+            f"流式响应总耗时超过限制, 期望 <= {max_ms}ms, 实际: {duration:.1f}ms"
+        _log_passed(f"流式响应总耗时断言通过: {duration:.1f}ms")
     
     @staticmethod
     def assert_header_contains(response, header_name: str, expected_value: str = None) -> None:
@@ -75,7 +345,7 @@ class ApiAssertions:
             assert actual_value == expected_value, \
                 f"响应头 '{header_name}' 的值不匹配, 期望: {expected_value}, 实际: {actual_value}"
         
-        logger.info(f"响应头断言通过: {header_name}")
+        _log_passed(f"响应头断言通过: {header_name}")
     
     @staticmethod
     def assert_list_length(response, expected_length: int) -> None:
@@ -92,14 +362,14 @@ class ApiAssertions:
         assert actual_length == expected_length, \
             f"列表长度不匹配, 期望: {expected_length}, 实际: {actual_length}"
         
-        logger.info(f"列表长度断言通过: {actual_length}")
+        _log_passed(f"列表长度断言通过: {actual_length}")
     
     @staticmethod
     def assert_not_empty(response) -> None:
         """断言响应不为空"""
         response_text = response.text.strip()
         assert response_text, "响应内容为空"
-        logger.info("响应非空断言通过")
+        _log_passed("响应非空断言通过")
     
     @staticmethod
     def assert_custom_condition(response, condition_func, description: str = "") -> None:
@@ -107,6 +377,80 @@ class ApiAssertions:
         try:
             result = condition_func(response)
             assert result, f"自定义断言失败: {description}"
-            logger.info(f"自定义断言通过: {description}")
+            _log_passed(f"自定义断言通过: {description}")
         except Exception as e:
-            raise AssertionError(f"自定义断言异常: {description}, 错误: {str(e)}") 
\ No newline at end of file
+            raise AssertionError(f"自定义断言异常: {description}, 错误: {str(e)}") 
+
+
+class SoftAssertions:
+    """
+    软断言收集器：对同一响应执行一批断言，失败不中断，退出时汇总
+
+    用法::
+
+        with self.assertions.soft("用户聊天") as check:
+            check.status_code(stream, 200)
+            check.json_path(response, "/data/sessionId")
+            check.that(stream.bytes_received > 0, "响应内容不应为空")
+
+    check.xxx(...) 调用 ApiAssertions.assert_xxx(...)，失败时返回 None。
+    全部通过时只输出一条汇总日志；有失败时输出一条错误日志和一个Allure附件，
+    并在退出时抛出包含所有失败信息的 AssertionError。
+    """
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.passed = 0
+        self.failures: List[str] = []
+        self._token = None
+
+    def __enter__(self) -> "SoftAssertions":
+        self._token = _active_collector.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        _active_collector.reset(self._token)
+        self._token = None
+        report = self.report()
+        if not self.failures:
+            logger.opt(depth=1).info(report)
+            return False
+        logger.opt(depth=1).error(report)
+        allure.attach(report, name=f"断言汇总{f' - {self.name}' if self.name else ''}",
+                      attachment_type=allure.attachment_type.TEXT)
+        # 块内抛出的其它异常优先向上传递，失败信息已记录在日志和附件中
+        if exc_type is None:
+            raise AssertionError(report)
+        return False
+
+    def __getattr__(self, name: str):
+        method = getattr(ApiAssertions, name if name.startswith("assert_") else f"assert_{name}")
+
+        def check(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except AssertionError as e:
+                self.failures.append(f"{name}: {e}")
+                return None
+
+        return check
+
+    def that(self, condition: Any, message: str) -> bool:
+        """断言任意条件成立，返回条件是否成立"""
+        if condition:
+            self.passed += 1
+            return True
+        self.failures.append(message)
+        return False
+
+    @property
+    def total(self) -> int:
+        return self.passed + len(self.failures)
+
+    def report(self) -> str:
+        """汇总报告，每个失败的断言占一行"""
+        title = f"断言汇总{f'[{self.name}]' if self.name else ''}: 通过 {self.passed}/{self.total}"
+        if not self.failures:
+            return title
+        lines = [f"  {i}. {truncate_body(failure)}" for i, failure in enumerate(self.failures, 1)]
+        return "\n".join([f"{title}, 失败 {len(self.failures)}", *lines])
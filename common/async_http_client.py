@@ -0,0 +1,221 @@
+import asyncio
+import json
+import time
+from datetime import timedelta
+from typing import Any, Awaitable, Dict, Iterable, List, Optional
+
+import aiohttp
+from common.logger import logger, truncate_body, truncate_body_bytes
+from common.response import loads
+
+
+# 与 HttpClient 的 urllib3 重试策略保持一致
+RETRY_STATUS_FORCELIST = [429, 500, 502, 503, 504]
+RETRY_BACKOFF_FACTOR = 1
+
+_UNSET = object()
+
+
+class AsyncRetryError(Exception):
+    """重试次数耗尽异常，对应 requests 的 RetryError"""
+
+    def __init__(self, method: str, url: str, status_code: int):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        super().__init__(
+            f"Max retries exceeded with url: {url} "
+            f"(Caused by ResponseError('too many {status_code} error responses'))"
+        )
+
+
+class AsyncResponse:
+    """异步响应对象，接口与 requests.Response 保持兼容，可直接用于 ApiAssertions"""
+
+    def __init__(self, method: str, url: str, status_code: int, headers: Dict[str, str],
+                 content: bytes, elapsed: float, encoding: Optional[str] = None):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.elapsed = timedelta(seconds=elapsed)
+        self.encoding = encoding or "utf-8"
+        self._parsed_json = _UNSET
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self, **kwargs) -> Any:
+        """解码JSON响应体，不传参数时只解码一次"""
+        if kwargs:
+            return json.loads(self.text, **kwargs)
+        if self._parsed_json is _UNSET:
+            self._parsed_json = loads(self.content, self.encoding)
+        return self._parsed_json
+
+    def __repr__(self) -> str:
+        return f"<AsyncResponse [{self.status_code}]>"
+
+
+class AsyncHttpClient:
+    """基于asyncio的HTTP客户端封装类，与 HttpClient 提供相同的调用方式"""
+
+    def __init__(self, base_url: str = "", timeout: int = 30, retry_times: int = 3,
+                 max_connections: int = 100, log_requests: bool = True):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retry_times = retry_times
+        self.max_connections = max_connections
+        # 压测时关闭逐请求日志，每秒数千个请求时日志格式化和写入会成为瓶颈并拉高测得的延迟
+        self.log_requests = log_requests
+        self.headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "API-Test-Framework/1.0"
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """获取会话对象，会话与当前事件循环绑定，循环变化时重新创建"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._loop = loop
+        return self._session
+
+    def _build_url(self, endpoint: str) -> str:
+        """构建完整URL"""
+        if endpoint.startswith('http'):
+            return endpoint
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _log_request(self, method: str, url: str, **kwargs) -> None:
+        """记录请求日志，请求体仅在DEBUG级别启用时才格式化"""
+        logger.info(f"发送 {method} 请求到: {url}")
+        if 'json' in kwargs:
+            logger.opt(lazy=True).debug(
+                "请求体: {}", lambda: truncate_body(json.dumps(kwargs['json'], ensure_ascii=False)))
+        if 'data' in kwargs:
+            logger.opt(lazy=True).debug("请求数据: {}", lambda: truncate_body(str(kwargs['data'])))
+
+    def _log_response(self, response: AsyncResponse) -> None:
+        """记录响应日志，响应体仅在DEBUG级别启用时才解码"""
+        logger.info(f"响应状态码: {response.status_code}")
+        logger.opt(lazy=True).debug(
+            "响应体: {}", lambda: truncate_body_bytes(response.content, response.encoding))
+
+    @staticmethod
+    def _backoff_time(retry_count: int) -> float:
+        """计算重试等待时间，与urllib3一致：首次重试不等待，之后指数退避"""
+        if retry_count <= 1:
+            return 0
+        return RETRY_BACKOFF_FACTOR * (2 ** (retry_count - 1))
+
+    async def request(self, method: str, endpoint: str, **kwargs) -> AsyncResponse:
+        """发送HTTP请求"""
+        url = self._build_url(endpoint)
+        timeout = kwargs.pop('timeout', self.timeout)
+        kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        if self.log_requests:
+            self._log_request(method, url, **kwargs)
+        session = await self._get_session()
+
+        retry_count = 0
+        start_time = time.time()
+        while True:
+            try:
+                async with session.request(method, url, **kwargs) as resp:
+                    content = await resp.read()
+                    response = AsyncResponse(
+                        method, url, resp.status, dict(resp.headers), content,
+                        time.time() - start_time, resp.charset
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if retry_count >= self.retry_times:
+                    raise
+                retry_count += 1
+                await asyncio.sleep(self._backoff_time(retry_count))
+                continue
+
+            if response.status_code not in RETRY_STATUS_FORCELIST:
+                break
+            if retry_count >= self.retry_times:
+                raise AsyncRetryError(method, url, response.status_code)
+            retry_count += 1
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                await asyncio.sleep(int(retry_after))
+            else:
+                await asyncio.sleep(self._backoff_time(retry_count))
+
+        if self.log_requests:
+            logger.info(f"请求耗时: {time.time() - start_time:.2f}秒")
+            self._log_response(response)
+
+        return response
+
+    async def get(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """发送GET请求"""
+        return await self.request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """发送POST请求"""
+        return await self.request("POST", endpoint, **kwargs)
+
+    async def put(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """发送PUT请求"""
+        return await self.request("PUT", endpoint, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """发送DELETE请求"""
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def patch(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """发送PATCH请求"""
+        return await self.request("PATCH", endpoint, **kwargs)
+
+    async def gather(self, requests: Iterable[Awaitable[AsyncResponse]],
+                     concurrency: Optional[int] = None,
+                     return_exceptions: bool = False) -> List[Any]:
+        """并发执行一批请求，concurrency 限制同时在途的请求数量"""
+        if concurrency is None:
+            return await asyncio.gather(*requests, return_exceptions=return_exceptions)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*[_bounded(c) for c in requests],
+                                    return_exceptions=return_exceptions)
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """在同步代码（如普通pytest用例）中运行协程，结束后关闭会话"""
+        async def _run():
+            try:
+                return await coro
+            finally:
+                await self.close()
+        return asyncio.run(_run())
+
+    async def close(self) -> None:
+        """关闭会话"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -1,38 +1,50 @@
 import json
 import time
 import os
+import threading
 from pathlib import Path
-from common.http_client import HttpClient
+from common.config import Config
+from common.cassette import CASSETTE_REPLAY
+from common.client_registry import http_client_registry
 from common.logger import logger
+from common.token_cache import FileTokenCache
+
+# 默认认证服务地址，可通过环境变量 GODGPT_AUTH_URL 覆盖
+AUTH_BASE_URL = "https://auth-station.aevatar.ai"
+
+# token过期前的缓冲时间（秒），进入缓冲期的token视为已过期
+TOKEN_EXPIRY_BUFFER = 300
+
+# token过期前多久（秒）开始在后台提前刷新，需大于 TOKEN_EXPIRY_BUFFER
+TOKEN_REFRESH_AHEAD = 600
 
 
 class AuthManager:
     """认证管理器，用于获取和管理全局认证token"""
     
-    def __init__(self):
+    def __init__(self, auth_base_url=None, refresh_ahead=TOKEN_REFRESH_AHEAD, token_cache_file=None):
         self.auth_token = None
         self.token_expires_at = 0
-        self.auth_client = HttpClient("https://auth-station.aevatar.ai")
+        self.refresh_ahead = refresh_ahead
         
-        # 认证请求头
-        self.auth_headers = {
-            'accept': 'application/json',
-            'accept-language': 'zh-CN,zh;q=0.9',
-            'content-type': 'application/x-www-form-urlencoded',
-            'origin': 'https://godgpt.portkey.finance',
-            'priority': 'u=1, i',
-            'referer': 'https://godgpt.portkey.finance/',
-            'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'cross-site',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36'
+        # 同一时刻只允许一个刷新请求，其余线程等待其结果
+        self._refresh_lock = threading.Lock()
+        self._refresh_generation = 0
+        self._background_refreshing = False
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "refresh_count": 0,
+            "refresh_failures": 0,
+            "background_refreshes": 0,
+            "cache_hits": 0,
+            "wait_count": 0,
+            "wait_time_ms_total": 0.0,
+            "wait_time_ms_max": 0.0
         }
         
         # 加载.env文件
         self._load_env_file()
+        self.auth_client = http_client_registry.get_client(auth_base_url or os.getenv('GODGPT_AUTH_URL', AUTH_BASE_URL))
         
         # 从环境变量获取认证凭据
         self.auth_credentials = {
@@ -44,12 +56,21 @@ class AuthManager:
             'password': os.getenv('GODGPT_PASSWORD')
         }
         
-        # 检查环境变量是否设置
+        # 检查环境变量是否设置，回放模式下使用录制的认证响应，不需要真实凭据
         if not self.auth_credentials['username'] or not self.auth_credentials['password']:
-            logger.error("未设置环境变量 GODGPT_USERNAME 或 GODGPT_PASSWORD")
-            logger.error("请创建 .env 文件并设置认证信息")
-            logger.error("参考 env.example 文件")
-            raise ValueError("认证凭据未配置，请设置 GODGPT_USERNAME 和 GODGPT_PASSWORD 环境变量")
+            if self.auth_client.cassette is not None and self.auth_client.cassette.mode == CASSETTE_REPLAY:
+                logger.warning("未设置认证凭据，回放模式下使用录制的认证响应")
+            else:
+                logger.error("未设置环境变量 GODGPT_USERNAME 或 GODGPT_PASSWORD")
+                logger.error("请创建 .env 文件并设置认证信息")
+                logger.error("参考 env.example 文件")
+                raise ValueError("认证凭据未配置，请设置 GODGPT_USERNAME 和 GODGPT_PASSWORD 环境变量")
+        
+        # 跨进程共享的token缓存，pytest-xdist并行执行时所有worker只登录一次
+        if token_cache_file is None:
+            token_cache_file = Config().get("token_cache_file")
+        self.token_cache = FileTokenCache(token_cache_file) if token_cache_file else None
+        self._cache_key = FileTokenCache.cache_key(self.auth_client.base_url, self.auth_credentials['username'])
     
     def _load_env_file(self):
         """加载.env文件到环境变量"""
@@ -73,60 +94,141 @@ class AuthManager:
         """
         获取认证token，如果token不存在或已过期则重新获取
         
+        多线程同时发现token过期时只会发送一次认证请求，其余线程等待该请求的结果；
+        token进入提前刷新窗口（过期前 refresh_ahead 秒）时在后台刷新，调用方继续使用当前token。
+        
         Args:
             force_refresh (bool): 是否强制刷新token
             
         Returns:
             str: 认证token
         """
-        current_time = time.time()
-        
-        # 检查token是否存在且未过期（预留5分钟缓冲时间）
-        if (not force_refresh and 
-            self.auth_token and 
-            current_time < self.token_expires_at - 300):
-            logger.info("使用缓存的认证token")
+        if not force_refresh and self.is_token_valid():
+            if time.time() >= self.token_expires_at - self.refresh_ahead:
+                self._start_background_refresh()
+            logger.debug("使用缓存的认证token")
             return self.auth_token
         
+        generation = self._refresh_generation
+        wait_start = time.perf_counter()
+        with self._refresh_lock:
+            self._record_wait(time.perf_counter() - wait_start)
+            
+            # 等待期间其他线程已完成刷新，直接使用其结果；刷新失败时同样返回失败，不再重复请求
+            if self._refresh_generation != generation:
+                if self.is_token_valid():
+                    logger.debug("使用其他线程刷新的认证token")
+                    return self.auth_token
+                logger.warning("其他线程刚刚刷新认证token失败，不再重复请求")
+                return None
+            if not force_refresh and self.is_token_valid():
+                return self.auth_token
+            return self._refresh_shared(TOKEN_EXPIRY_BUFFER, stale_token=self.auth_token if force_refresh else None)
+    
+    def _refresh_shared(self, min_valid_seconds, stale_token=None):
+        """
+        持有跨进程锁刷新token，调用方需持有 _refresh_lock
+        
+        其他进程已写入剩余有效期不少于 min_valid_seconds 的token时直接使用，
+        stale_token 为调用方认为已失效的token（强制刷新时），不会被复用。
+        """
+        if self.token_cache is None:
+            return self._fetch_token()
+        
+        with self.token_cache.lock():
+            cached = self.token_cache.load(self._cache_key, min_valid_seconds=min_valid_seconds)
+            if cached and cached[0] != stale_token:
+                self.token_expires_at = cached[1]
+                self.auth_token = cached[0]
+                self._refresh_generation += 1
+                self._increment_stat("cache_hits")
+                logger.info("使用其他进程缓存的认证token")
+                return self.auth_token
+            
+            token = self._fetch_token()
+            if token:
+                self.token_cache.store(self._cache_key, token, self.token_expires_at)
+            return token
+    
+    def _fetch_token(self):
+        """发送认证请求获取新token，调用方需持有 _refresh_lock"""
         logger.info("开始获取新的认证token")
+        current_time = time.time()
+        self._increment_stat("refresh_count")
         
         try:
             # 构建认证请求数据
             auth_data = '&'.join([f"{k}={v}" for k, v in self.auth_credentials.items()])
             
             # 发送认证请求
-            response = self.auth_client.post(
-                '/connect/token',
-                data=auth_data,
-                headers=self.auth_headers
-            )
+            response = self.auth_client.call('connect-token', data=auth_data)
             
             if response.status_code == 200:
                 response_json = response.json()
                 
                 # 提取token信息
                 if 'access_token' in response_json:
-                    self.auth_token = response_json['access_token']
-                    
                     # 计算token过期时间（如果有expires_in字段）
                     if 'expires_in' in response_json:
                         self.token_expires_at = current_time + response_json['expires_in']
                     else:
                         # 默认1小时过期
                         self.token_expires_at = current_time + 3600
+                    self.auth_token = response_json['access_token']
+                    self._refresh_generation += 1
                     
                     logger.info(f"成功获取认证token，过期时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.token_expires_at))}")
                     return self.auth_token
                 else:
                     logger.error("认证响应中缺少access_token字段")
-                    return None
             else:
                 logger.error(f"认证请求失败，状态码: {response.status_code}, 响应: {response.text}")
-                return None
                 
         except Exception as e:
             logger.error(f"获取认证token时发生错误: {e}")
-            return None
+        
+        # 失败同样发布给等待中的线程，避免每个等待者依次重发认证请求
+        self._refresh_generation += 1
+        self._increment_stat("refresh_failures")
+        return None
+    
+    def _start_background_refresh(self):
+        """token临近过期时启动后台刷新，已有刷新在进行时不重复启动"""
+        with self._stats_lock:
+            if self._background_refreshing or self._refresh_lock.locked():
+                return
+            self._background_refreshing = True
+        threading.Thread(target=self._background_refresh, name="AuthTokenRefresh", daemon=True).start()
+    
+    def _background_refresh(self):
+        try:
+            with self._refresh_lock:
+                # 前台线程可能已经刷新过
+                if time.time() < self.token_expires_at - self.refresh_ahead:
+                    return
+                logger.info("认证token即将过期，后台提前刷新")
+                self._increment_stat("background_refreshes")
+                self._refresh_shared(self.refresh_ahead)
+        finally:
+            self._background_refreshing = False
+    
+    def _increment_stat(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+    
+    def _record_wait(self, seconds):
+        wait_ms = seconds * 1000
+        with self._stats_lock:
+            self.stats["wait_count"] += 1
+            self.stats["wait_time_ms_total"] += wait_ms
+            self.stats["wait_time_ms_max"] = max(self.stats["wait_time_ms_max"], wait_ms)
+    
+    def get_stats(self):
+        """返回token刷新次数与等待刷新锁的耗时统计"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["wait_time_ms_avg"] = stats["wait_time_ms_total"] / stats["wait_count"] if stats["wait_count"] else 0.0
+        return stats
     
     def refresh_token(self):
         """强制刷新认证token"""
@@ -135,15 +237,48 @@ class AuthManager:
     def is_token_valid(self):
         """检查当前token是否有效"""
         current_time = time.time()
-        return (self.auth_token and 
-                current_time < self.token_expires_at - 300)  # 预留5分钟缓冲
+        return bool(self.auth_token and 
+                    current_time < self.token_expires_at - TOKEN_EXPIRY_BUFFER)  # 预留5分钟缓冲
     
     def clear_token(self):
-        """清除当前token"""
+        """清除当前进程的token，跨进程缓存中的token不受影响"""
         self.auth_token = None
         self.token_expires_at = 0
         logger.info("已清除认证token")
 
 
-# 创建全局认证管理器实例
-auth_manager = AuthManager() 
\ No newline at end of file
+class LazyAuthManager:
+    """
+    AuthManager的延迟初始化代理
+
+    首次访问属性（如 get_auth_token）时才创建AuthManager，导入模块、收集用例和只运行访客用例时
+    不会解析 .env、创建客户端，也不会因缺少认证凭据而报错。
+    """
+
+    def __init__(self, factory=AuthManager):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    @property
+    def initialized(self):
+        """是否已创建AuthManager实例"""
+        return self._instance is not None
+
+    def _get_instance(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+
+    def __getattr__(self, name):
+        # 私有和特殊属性不触发初始化：代理自身的属性尚未设置时（如复制、反序列化），
+        # 以及 pytest 收集用例时探测模块级对象的 _pytestfixturefunction 等属性
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._get_instance(), name)
+
+
+# 全局认证管理器实例，首次使用时初始化
+auth_manager = LazyAuthManager()
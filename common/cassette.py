@@ -0,0 +1,280 @@
+import hashlib
+import io
+import json
+import mmap
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from common.logger import logger
+from common.log_sink import xdist_worker_suffix
+
+
+# 录制/回放模式
+CASSETTE_OFF = "off"
+CASSETTE_RECORD = "record"
+CASSETTE_REPLAY = "replay"
+
+# 计算请求键时忽略、录制响应时脱敏的字段（登录凭据与token）
+REDACTED_FIELDS = frozenset({"username", "password", "access_token", "refresh_token", "id_token"})
+REDACTED_VALUE = "<redacted>"
+
+# 响应体已解压并完整读出，回放时这些响应头不再成立
+_DROPPED_HEADERS = frozenset({"content-encoding", "transfer-encoding", "content-length"})
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """回放模式下没有与请求匹配的录制记录"""
+
+
+def _canonical_body(body: Any, content_type: str) -> bytes:
+    """请求体归一化：JSON与表单按键排序并去掉凭据字段，其余按原始字节处理"""
+    if not body:
+        return b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, bytes):
+        # 文件等流式请求体无法在不消费的前提下读取，不参与匹配
+        return b"<stream>"
+    try:
+        if "json" in content_type:
+            data = json.loads(body)
+            if isinstance(data, dict):
+                data = {k: v for k, v in data.items() if k not in REDACTED_FIELDS}
+            return json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        if "x-www-form-urlencoded" in content_type:
+            pairs = [(k, v) for k, v in parse_qsl(body.decode("utf-8")) if k not in REDACTED_FIELDS]
+            return urlencode(sorted(pairs)).encode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        pass
+    return body
+
+
+def request_keys(request: requests.PreparedRequest) -> tuple:
+    """
+    计算请求的 (完整键, 路由键)
+
+    路由键为 METHOD host/path?排序后的query，完整键在路由键后附加归一化请求体的摘要。
+    请求体含时间戳等每次变化的内容时，回放退回到按路由键匹配。
+    """
+    parts = urlsplit(request.url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    route = f"{request.method.upper()} {parts.netloc.lower()}{parts.path}"
+    if query:
+        route = f"{route}?{query}"
+    body = _canonical_body(request.body, request.headers.get("Content-Type", ""))
+    digest = hashlib.sha1(body).hexdigest()[:16]
+    return f"{route} {digest}", route
+
+
+def _redact_json_body(body: bytes, content_type: str) -> bytes:
+    if "json" not in content_type or not body:
+        return body
+    try:
+        data = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        return body
+    if not isinstance(data, dict) or not REDACTED_FIELDS.intersection(data):
+        return body
+    data = {k: (REDACTED_VALUE if k in REDACTED_FIELDS else v) for k, v in data.items()}
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+class _BodyReader(io.RawIOBase):
+    """从内存映射中按需读取响应体，SSE等分块读取时不复制完整响应体"""
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = min(len(buffer), len(self._view) - self._pos)
+        buffer[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self) -> None:
+        self._view.release()
+        super().close()
+
+
+class Cassette:
+    """
+    HTTP请求录制/回放存储
+
+    一个录制目录包含 index[_gwN].jsonl（每行一条响应元数据）和 bodies[_gwN].bin（响应体顺序拼接）。
+    pytest-xdist 并行录制时每个worker写各自的文件，回放时合并所有索引。
+    回放时索引全部载入字典，按请求键 O(1) 查找；响应体文件通过 mmap 映射，读取时才加载对应页面。
+    同一请求录制多次时按录制顺序依次回放，超出录制次数后重复最后一条。
+    """
+
+    def __init__(self, cassette_dir: str, mode: str = CASSETTE_REPLAY, suffix: Optional[str] = None):
+        if mode not in (CASSETTE_RECORD, CASSETTE_REPLAY):
+            raise ValueError(f"不支持的录制回放模式: {mode}")
+        self.cassette_dir = Path(cassette_dir)
+        self.mode = mode
+        self.suffix = xdist_worker_suffix() if suffix is None else suffix
+        self._lock = threading.Lock()
+        self._by_key: Dict[str, List[dict]] = {}
+        self._by_route: Dict[str, List[dict]] = {}
+        self._played: Dict[str, int] = {}
+        self._bodies: Dict[str, Any] = {}
+        self._index_file = None
+        self._bodies_file = None
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+
+        if mode == CASSETTE_RECORD:
+            self.cassette_dir.mkdir(parents=True, exist_ok=True)
+            worker = f"_{self.suffix}" if self.suffix else ""
+            self._index_file = open(self.cassette_dir / f"index{worker}.jsonl", "a", encoding="utf-8")
+            self._bodies_file = open(self.cassette_dir / f"bodies{worker}.bin", "ab")
+        else:
+            self._load()
+
+    def _load(self) -> None:
+        if not self.cassette_dir.is_dir():
+            raise FileNotFoundError(f"录制目录不存在: {self.cassette_dir}")
+        for index_path in sorted(self.cassette_dir.glob("index*.jsonl")):
+            bodies_name = "bodies" + index_path.stem[len("index"):] + ".bin"
+            bodies_path = self.cassette_dir / bodies_name
+            size = bodies_path.stat().st_size if bodies_path.exists() else 0
+            if size:
+                with open(bodies_path, "rb") as f:
+                    self._bodies[bodies_name] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._bodies[bodies_name] = b""
+            with open(index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    entry["bodies"] = bodies_name
+                    self._by_key.setdefault(entry["key"], []).append(entry)
+                    self._by_route.setdefault(entry["route"], []).append(entry)
+        logger.info(f"加载录制记录 {self.cassette_dir}: {len(self._by_key)} 个请求")
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_key.values())
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        """保存一次请求的响应，调用方需已读取完整响应体"""
+        key, route = request_keys(request)
+        content_type = response.headers.get("Content-Type", "")
+        body = _redact_json_body(response.content or b"", content_type)
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        with self._lock:
+            offset = self._bodies_file.tell()
+            self._bodies_file.write(body)
+            self._bodies_file.flush()
+            entry = {
+                "key": key,
+                "route": route,
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": headers,
+                "offset": offset,
+                "length": len(body),
+                "elapsed_ms": round(response.elapsed.total_seconds() * 1000, 3)
+            }
+            self._index_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._index_file.flush()
+            self.recorded += 1
+
+    def _next_entry(self, index: Dict[str, List[dict]], key: str) -> Optional[dict]:
+        entries = index.get(key)
+        if not entries:
+            return None
+        played = self._played.get(key, 0)
+        self._played[key] = played + 1
+        return entries[min(played, len(entries) - 1)]
+
+    def lookup(self, request: requests.PreparedRequest) -> Optional[dict]:
+        """按完整键查找录制记录，请求体不一致时退回到路由键"""
+        key, route = request_keys(request)
+        with self._lock:
+            entry = self._next_entry(self._by_key, key) or self._next_entry(self._by_route, route)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.replayed += 1
+        return entry
+
+    def build_response(self, request: requests.PreparedRequest, entry: dict) -> requests.Response:
+        """用录制记录构造响应，响应体按需从内存映射读取"""
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        start = entry["offset"]
+        view = memoryview(self._bodies[entry["bodies"]])[start:start + entry["length"]]
+        response.raw = _BodyReader(view)
+        return response
+
+    def close(self) -> None:
+        """关闭录制文件；回放使用的内存映射随进程退出释放"""
+        with self._lock:
+            for f in (self._index_file, self._bodies_file):
+                if f is not None:
+                    f.close()
+            self._index_file = self._bodies_file = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"recorded": self.recorded, "replayed": self.replayed, "misses": self.misses}
+
+
+class CassetteAdapter(BaseAdapter):
+    """挂载到 requests.Session 的传输适配器：录制模式转发并保存响应，回放模式直接返回录制的响应"""
+
+    def __init__(self, cassette: Cassette, adapter: BaseAdapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    @property
+    def poolmanager(self):
+        """连接池统计沿用被包装的适配器"""
+        return self.adapter.poolmanager
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.cassette.mode == CASSETTE_REPLAY:
+            start = time.perf_counter()
+            entry = self.cassette.lookup(request)
+            if entry is None:
+                raise CassetteMissError(f"录制记录中没有匹配的请求: {request.method} {request.url}", request=request)
+            response = self.cassette.build_response(request, entry)
+            response.elapsed = timedelta(seconds=time.perf_counter() - start)
+            return response
+
+        response = self.adapter.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert,
+                                     proxies=proxies)
+        # 录制时读取完整响应体（流式响应在录制模式下不再逐块到达）
+        response.content
+        self.cassette.record(request, response)
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def create_cassette(config) -> Optional[Cassette]:
+    """按配置中的 cassette_mode / cassette_dir 创建录制回放存储，off 时返回 None"""
+    mode = (config.get("cassette_mode") or CASSETTE_OFF).lower()
+    if mode == CASSETTE_OFF:
+        return None
+    cassette = Cassette(config.get("cassette_dir", "./cassettes/default"), mode=mode)
+    logger.info(f"HTTP录制回放模式: {mode}，目录: {cassette.cassette_dir}")
+    return cassette
@@ -0,0 +1,106 @@
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import requests
+from common.cassette import Cassette, create_cassette
+from common.config import Config
+from common.http_client import HttpClient
+from common.logger import logger
+
+
+class ClientRegistry:
+    """
+    按 base_url 共享的HttpClient注册表，同一主机的所有测试复用同一个连接池
+
+    每个 base_url（含路径前缀）对应一个客户端，相对路径按完整的 base_url 拼接；
+    同一主机的客户端共用第一个客户端创建的会话和连接池。
+    """
+
+    def __init__(self, config: Config = None):
+        self._config = config
+        self._clients: Dict[str, HttpClient] = {}
+        # 每个主机创建会话的客户端，连接统计、清除cookie和关闭都按主机进行
+        self._host_clients: Dict[str, HttpClient] = {}
+        self._lock = threading.Lock()
+        self._cassette: Optional[Cassette] = None
+        self._cassette_loaded = False
+        self._cassette_lock = threading.Lock()
+
+    @property
+    def config(self) -> Config:
+        if self._config is None:
+            self._config = Config()
+        return self._config
+
+    @property
+    def cassette(self) -> Optional[Cassette]:
+        """按配置创建的录制回放存储，所有主机的客户端共用；cassette_mode 为 off 时为 None"""
+        if not self._cassette_loaded:
+            with self._cassette_lock:
+                if not self._cassette_loaded:
+                    self._cassette = create_cassette(self.config)
+                    self._cassette_loaded = True
+        return self._cassette
+
+    @staticmethod
+    def host_key(base_url: str) -> str:
+        """提取 scheme://host[:port] 作为注册表键"""
+        parts = urlsplit(base_url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    @staticmethod
+    def client_key(base_url: str) -> str:
+        """主机部分转为小写、去掉末尾斜杠的 base_url，作为客户端的键"""
+        parts = urlsplit(base_url)
+        return f"{parts.scheme}://{parts.netloc}".lower() + parts.path.rstrip('/')
+
+    def _create_client(self, base_url: str, session: Optional[requests.Session] = None) -> HttpClient:
+        pool_config = self.config.get("http_pool", {}) or {}
+        return HttpClient(
+            base_url,
+            timeout=int(self.config.get("timeout", 30)),
+            retry_times=int(self.config.get("retry_times", 3)),
+            pool_connections=int(pool_config.get("pool_connections", 10)),
+            pool_maxsize=int(pool_config.get("pool_maxsize", 10)),
+            keep_alive=bool(pool_config.get("keep_alive", True)),
+            log_body_max_length=int(self.config.get("log_body_max_length", 2000)),
+            cassette=self.cassette,
+            session=session
+        )
+
+    def get_client(self, base_url: str) -> HttpClient:
+        """获取指定 base_url 的共享客户端，不存在时创建，同一主机的客户端共用连接池"""
+        key = self.client_key(base_url)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    host = self.host_key(base_url)
+                    owner = self._host_clients.get(host)
+                    client = self._create_client(key, session=owner.session if owner else None)
+                    self._clients[key] = client
+                    self._host_clients.setdefault(host, client)
+                    logger.debug(f"创建共享HTTP客户端: {key}")
+        return client
+
+    def clear_cookies(self) -> None:
+        """清除所有共享客户端的cookie，避免测试之间相互影响"""
+        for client in list(self._host_clients.values()):
+            client.session.cookies.clear()
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """按主机统计新建连接数与复用次数"""
+        return {host: client.connection_stats() for host, client in list(self._host_clients.items())}
+
+    def close_all(self) -> None:
+        """关闭所有共享客户端"""
+        with self._lock:
+            for client in self._host_clients.values():
+                client.close()
+            self._clients.clear()
+            self._host_clients.clear()
+
+
+# 全局HTTP客户端注册表
+http_client_registry = ClientRegistry()
@@ -18,8 +18,29 @@ class Config:
             "timeout": 30,
             "retry_times": 3,
             "log_level": "INFO",
+            "file_log_level": "DEBUG",
+            "log_body_max_length": 2000,
+            "log_async": True,
+            "log_queue_size": 10000,
+            "log_overflow": "drop",
+            "log_compression": None,
+            "log_retention_days": 30,
             "allure_results_dir": "./allure-results",
-            "allure_report_dir": "./allure-report"
+            "allure_report_dir": "./allure-report",
+            "latency_report_file": "./latency-results/latency_report.json",
+            "token_cache_file": "./.pytest_cache/auth_token.json",
+            "jsonl_cases_file": "./data/requests.jsonl",
+            "voice_fixture_dir": "./data/voice",
+            "test_data_seed": 0,
+            "test_data_run_id": "",
+            "test_data_store": "./.pytest_cache/test_data.db",
+            "cassette_mode": "off",
+            "cassette_dir": "./cassettes/default",
+            "http_pool": {
+                "pool_connections": 10,
+                "pool_maxsize": 10,
+                "keep_alive": True
+            }
         }
         
         # 从配置文件加载
@@ -47,4 +68,27 @@ class Config:
     
     def get_all(self) -> Dict[str, Any]:
         """获取所有配置"""
-        return self._config.copy() 
\ No newline at end of file
+        return self._config.copy()
+    
+    @property
+    def environment(self) -> str:
+        """当前测试环境，由环境变量 TEST_ENV 指定，默认 dev"""
+        return os.getenv("TEST_ENV", "dev")
+    
+    def get_slos(self, environment: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        获取指定环境（默认当前环境）各接口的延迟SLO预算
+        
+        slo.endpoints 为所有环境通用的预算，slo.environments.<环境> 中同一接口的同名指标覆盖通用值。
+        
+        Returns:
+            {接口名: {指标: 预算毫秒}}，如 {"user-chat": {"p95_ms": 30000, "ttft_p95_ms": 10000}}
+        """
+        slo = self.get("slo") or {}
+        common = slo.get("endpoints") or {}
+        overrides = (slo.get("environments") or {}).get(environment or self.environment) or {}
+        budgets = {}
+        for name in {**common, **overrides}:
+            merged = {**(common.get(name) or {}), **(overrides.get(name) or {})}
+            budgets[name] = {metric: float(value) for metric, value in merged.items()}
+        return budgets 
\ No newline at end of file
@@ -0,0 +1,242 @@
+import gzip
+import json
+import os
+from contextlib import closing, contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+from common.logger import logger
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时使用标准库json
+    orjson = None
+
+
+# 列表数据每行保存的元素数量
+DATA_FILE_CHUNK_SIZE = 1000
+
+# gzip压缩级别：测试数据写一次读多次，优先写入速度
+DATA_FILE_COMPRESS_LEVEL = 1
+
+# 索引文件后缀，与数据文件放在同一目录
+DATA_FILE_INDEX_SUFFIX = ".index.json"
+
+DATA_FILE_FORMAT = 1
+
+# 行的类型：value 为一行保存的完整值，items 为列表的一段元素
+KIND_VALUE = "value"
+KIND_ITEMS = "items"
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(line: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def is_data_file(path: Union[str, Path]) -> bool:
+    """按后缀判断是否为JSONL数据文件（.jsonl 或 .jsonl.gz）"""
+    name = str(path)
+    return name.endswith(".jsonl") or name.endswith(".jsonl.gz")
+
+
+def _is_compressed(path: Path) -> bool:
+    return path.suffix == ".gz"
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + DATA_FILE_INDEX_SUFFIX)
+
+
+def _is_items(value: Any) -> bool:
+    """列表、元组和生成器等可迭代对象按元素分段写入，字典和字符串整体写入"""
+    return not isinstance(value, (dict, str, bytes)) and isinstance(value, Iterable)
+
+
+class DataFileWriter:
+    """
+    流式写入JSONL数据文件
+
+    每行是 {"key": ..., "value": ...} 或 {"key": ..., "items": [...]}，列表按 chunk_size 分段，
+    同一个键的行连续存放；生成器边迭代边写入，不构建完整列表。文件名以 .gz 结尾时每个键写成
+    独立的gzip成员，读取时可以直接定位到某个键。关闭时写入索引文件，记录每个键的偏移量和行数。
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = DATA_FILE_CHUNK_SIZE):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.compressed = _is_compressed(self.path)
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # 先写临时文件再改名，读取方不会看到写了一半的文件
+        self._tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self._raw = open(self._tmp_path, 'wb')
+
+    def write(self, key: str, value: Any) -> None:
+        """写入一个键"""
+        if key in self._index:
+            raise ValueError(f"数据文件中已存在键: {key}")
+        offset = self._raw.tell()
+        out = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=DATA_FILE_COMPRESS_LEVEL) if self.compressed else self._raw
+        lines = count = 0
+        if _is_items(value):
+            chunk: List[Any] = []
+            for item in value:
+                chunk.append(item)
+                if len(chunk) >= self.chunk_size:
+                    out.write(_dumps({"key": key, KIND_ITEMS: chunk}) + b"\n")
+                    lines, count, chunk = lines + 1, count + len(chunk), []
+            if chunk or not lines:
+                out.write(_dumps({"key": key, KIND_ITEMS: chunk}) + b"\n")
+                lines, count = lines + 1, count + len(chunk)
+            kind = KIND_ITEMS
+        else:
+            out.write(_dumps({"key": key, KIND_VALUE: value}) + b"\n")
+            lines, kind = 1, KIND_VALUE
+        if self.compressed:
+            out.close()  # 结束当前gzip成员，不关闭底层文件
+        self._index[key] = {"offset": offset, "lines": lines, "kind": kind, "count": count}
+
+    def write_all(self, data: Dict[str, Any]) -> None:
+        for key, value in data.items():
+            self.write(key, value)
+
+    def close(self) -> None:
+        if self._raw.closed:
+            return
+        self._raw.close()
+        os.replace(self._tmp_path, self.path)
+        index = {
+            "format": DATA_FILE_FORMAT,
+            "size": self.path.stat().st_size,
+            "compressed": self.compressed,
+            "keys": self._index,
+        }
+        index_tmp = self._tmp_path.with_name(self._tmp_path.name + DATA_FILE_INDEX_SUFFIX)
+        index_tmp.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+        os.replace(index_tmp, _index_path(self.path))
+
+    def abort(self) -> None:
+        """放弃写入，删除临时文件"""
+        self._raw.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "DataFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class DataFile:
+    """
+    按键延迟读取的JSONL数据文件
+
+    打开时只读取索引，load/iter_items 按索引定位到键所在的位置只读该键的行；每次读取单独打开文件，
+    多个线程可以同时读取。索引文件缺失或与数据文件大小不符时扫描一遍数据文件重建索引
+    （压缩文件重建的索引没有偏移量，读取时从头查找）。
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.compressed = _is_compressed(self.path)
+        self._index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        index_file = _index_path(self.path)
+        if index_file.exists():
+            index = json.loads(index_file.read_text(encoding="utf-8"))
+            if index.get("format") == DATA_FILE_FORMAT and index.get("size") == self.path.stat().st_size:
+                return index["keys"]
+            logger.warning(f"数据文件索引已过期，重新扫描: {self.path}")
+        return self._scan()
+
+    def _scan(self) -> Dict[str, Dict[str, Any]]:
+        index: Dict[str, Dict[str, Any]] = {}
+        with self._open(None) as f:
+            offset = 0
+            for line in f:
+                record = _loads(line)
+                entry = index.get(record["key"])
+                if entry is None:
+                    kind = KIND_ITEMS if KIND_ITEMS in record else KIND_VALUE
+                    entry = index[record["key"]] = {
+                        "offset": None if self.compressed else offset, "lines": 0, "kind": kind, "count": 0
+                    }
+                entry["lines"] += 1
+                entry["count"] += len(record.get(KIND_ITEMS, ()))
+                offset += len(line)
+        return index
+
+    @contextmanager
+    def _open(self, offset: Optional[int]):
+        """从偏移量处打开数据文件，压缩文件的偏移量指向该键gzip成员的开头"""
+        with open(self.path, 'rb') as raw:
+            if offset:
+                raw.seek(offset)
+            if self.compressed:
+                with gzip.GzipFile(fileobj=raw, mode='rb') as f:
+                    yield f
+            else:
+                yield raw
+
+    def _records(self, key: str) -> Iterator[Dict[str, Any]]:
+        """读取一个键的所有行，读完即停止，不读其他键"""
+        entry = self._entry(key)
+        with self._open(entry["offset"]) as f:
+            records = (_loads(line) for line in f)
+            if entry["offset"] is None:
+                records = (record for record in records if record["key"] == key)
+            yield from islice(records, entry["lines"])
+
+    def _entry(self, key: str) -> Dict[str, Any]:
+        if key not in self._index:
+            raise KeyError(key)
+        return self._index[key]
+
+    def keys(self) -> List[str]:
+        return list(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def count(self, key: str) -> int:
+        """列表键的元素数量，整体保存的值返回 0"""
+        return self._entry(key)["count"]
+
+    def iter_items(self, key: str) -> Iterator[Any]:
+        """逐个读取列表键的元素，一次只在内存中保留一段"""
+        if self._entry(key)["kind"] == KIND_VALUE:
+            value = self.load(key)
+            if not isinstance(value, list):
+                raise TypeError(f"数据 {key} 不是列表")
+            yield from value
+            return
+        for record in self._records(key):
+            yield from record[KIND_ITEMS]
+
+    def load(self, key: str) -> Any:
+        """读取一个键的完整值"""
+        if self._entry(key)["kind"] == KIND_ITEMS:
+            return list(self.iter_items(key))
+        with closing(self._records(key)) as records:
+            return next(records)[KIND_VALUE]
+
+    def stream(self, key: str) -> Any:
+        """列表键返回逐个读取元素的迭代器，其他键返回完整值，用于不加载列表地转存到另一个数据文件"""
+        if self._entry(key)["kind"] == KIND_ITEMS:
+            return self.iter_items(key)
+        return self.load(key)
+
+    def __repr__(self) -> str:
+        return f"DataFile({self.path}, {len(self._index)} 个键)"
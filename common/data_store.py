@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from common.logger import logger
+from common.token_cache import file_lock
+
+
+# 等待其他连接释放数据库写锁的最长时间（秒），每次写入只持有写锁一条语句的时间
+DATA_STORE_BUSY_TIMEOUT = 60
+
+_MISSING = object()
+
+
+def _expires_at(ttl: Optional[float]) -> Optional[float]:
+    return None if ttl is None else time.time() + ttl
+
+
+class MemoryDataStore:
+    """
+    进程内测试数据存储，线程安全
+
+    值按原对象保存，不做序列化。ttl 为秒数，过期后视为不存在；未指定 ttl 的值一直保留。
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+        # 可重入：get_or_create 的创建函数中可以再保存其他数据
+        self._lock = threading.RLock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            value, expires_at = self._data.get(key, (_MISSING, None))
+            if value is _MISSING or (expires_at is not None and expires_at <= time.time()):
+                return default
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._data[key] = (value, _expires_at(ttl))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def keys(self) -> List[str]:
+        now = time.time()
+        with self._lock:
+            return [key for key, (_, expires_at) in self._data.items() if expires_at is None or expires_at > now]
+
+    def get_or_create(self, key: str, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """存在未过期的值时直接返回，否则调用 factory 创建并保存；同一时间只有一个线程在创建"""
+        with self._lock:
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                value = factory()
+                self.set(key, value, ttl)
+            return value
+
+    def purge(self, untimed: bool = False) -> int:
+        """删除已过期的值，untimed 为 True 时同时删除未指定 ttl 的值，返回删除数量"""
+        now = time.time()
+        with self._lock:
+            stale = [key for key, (_, expires_at) in self._data.items()
+                     if (expires_at is None and untimed) or (expires_at is not None and expires_at <= now)]
+            for key in stale:
+                del self._data[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class SqliteDataStore:
+    """
+    跨线程、跨进程共享的测试数据存储（SQLite WAL模式）
+
+    pytest-xdist 的各个worker打开同一个数据库文件，一个worker创建的会话ID等数据其他worker可以直接使用。
+    每个线程使用独立的连接；WAL模式下读取不等待写入。值以JSON保存，只支持可JSON序列化的值。
+    get_or_create 持有该键的文件锁（数据库旁的 <文件名>.locks 目录）检查并创建，整个并行执行中同一个键
+    只创建一次，其他进程在该键的锁上等待创建结果；创建期间不持有数据库写锁，其他键的读写不受影响。
+    """
+
+    def __init__(self, path: Union[str, Path], busy_timeout: float = DATA_STORE_BUSY_TIMEOUT):
+        self.path = Path(path)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self.lock_dir = self.path.with_name(self.path.name + ".locks")
+
+    def _connection(self) -> sqlite3.Connection:
+        """当前线程的连接，fork出的子进程重新连接"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # isolation_level=None 时每条语句自动提交，不会长时间持有写锁
+            conn = sqlite3.connect(str(self.path), timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS test_data "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, updated_at REAL NOT NULL)"
+            )
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._connection().execute(
+            "SELECT value FROM test_data WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time())
+        ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO test_data (key, value, expires_at, updated_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False), _expires_at(ttl), time.time())
+        )
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM test_data WHERE key = ?", (key,))
+
+    def keys(self) -> List[str]:
+        rows = self._connection().execute(
+            "SELECT key FROM test_data WHERE expires_at IS NULL OR expires_at > ? ORDER BY rowid", (time.time(),)
+        )
+        return [row[0] for row in rows]
+
+    def _key_lock(self, key: str):
+        """按键加锁，不同键的创建互不等待"""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return file_lock(self.lock_dir / f"{digest}.lock")
+
+    def get_or_create(self, key: str, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """存在未过期的值时直接返回，否则调用 factory 创建并保存；所有进程中同一个键同一时间只有一个在创建"""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._key_lock(key):
+            # 等待锁期间可能已被其他进程创建
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                started = time.perf_counter()
+                value = factory()
+                self.set(key, value, ttl)
+                logger.debug(f"创建共享测试数据 {key}，耗时 {(time.perf_counter() - started) * 1000:.0f}ms")
+        return value
+
+    def purge(self, untimed: bool = False) -> int:
+        """删除已过期的值，untimed 为 True 时同时删除未指定 ttl 的值，返回删除数量"""
+        condition = "expires_at <= ?" + (" OR expires_at IS NULL" if untimed else "")
+        return self._connection().execute(f"DELETE FROM test_data WHERE {condition}", (time.time(),)).rowcount
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM test_data")
+
+    def close(self) -> None:
+        """关闭当前线程的连接"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __repr__(self) -> str:
+        return f"SqliteDataStore({self.path})"
+
+
+DataStore = Union[MemoryDataStore, SqliteDataStore]
+
+
+def create_data_store(path: Optional[str]) -> DataStore:
+    """配置了数据库文件时使用跨进程共享的存储，否则使用进程内存储"""
+    return SqliteDataStore(path) if path else MemoryDataStore()
@@ -0,0 +1,130 @@
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+import yaml
+from common.logger import logger
+
+
+# 流式接口的响应类型，通过 stream_sse 读取
+EVENT_STREAM = "text/event-stream"
+
+
+class Endpoint:
+    """接口定义：加载时预先合并好请求头，调用时不再复制请求头字典"""
+
+    def __init__(self, name: str, method: str, path: str, base_headers: Mapping[str, str],
+                 headers: Optional[Mapping[str, str]] = None, auth: bool = False,
+                 content_type: str = "application/json"):
+        self.name = name
+        self.method = method.upper()
+        self.path = path
+        self.auth = auth
+        self.content_type = content_type
+        self.headers = MappingProxyType({**base_headers, **(headers or {})})
+        # (token, 请求头)，整体替换保证多线程读取时token与请求头一致
+        self._auth_headers = (None, None)
+
+    @property
+    def stream(self) -> bool:
+        """是否为SSE流式接口"""
+        return self.content_type == EVENT_STREAM
+
+    @property
+    def metrics_key(self) -> str:
+        """用于耗时统计的稳定接口标识（路径模板，不含实际参数）"""
+        return self.path
+
+    def format_path(self, path_params: Optional[Mapping[str, Any]] = None) -> str:
+        """用路径参数填充路径模板"""
+        if not path_params:
+            return self.path
+        try:
+            return self.path.format(**path_params)
+        except KeyError as e:
+            raise ValueError(f"接口 {self.name} 缺少路径参数: {e.args[0]}")
+
+    def headers_for(self, token: Optional[str] = None) -> Mapping[str, str]:
+        """
+        返回只读请求头，传入token时附带 authorization
+
+        同一token的认证请求头只构建一次，token刷新后重新构建。
+        """
+        if not token:
+            return self.headers
+        cached_token, headers = self._auth_headers
+        if cached_token != token:
+            headers = MappingProxyType({**self.headers, 'authorization': f'Bearer {token}'})
+            self._auth_headers = (token, headers)
+        return headers
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.name}: {self.method} {self.path})"
+
+
+class EndpointCatalog:
+    """接口目录，从 endpoints.yaml 加载一次并编译为 Endpoint 对象"""
+
+    def __init__(self, catalog_file: str = "endpoints.yaml"):
+        self.catalog_file = catalog_file
+        self._endpoints: Optional[Dict[str, Endpoint]] = None
+        self._base_headers: Mapping[str, str] = MappingProxyType({})
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Endpoint]:
+        path = Path(self.catalog_file)
+        if not path.is_absolute() and not path.exists():
+            # 从其他目录运行时回退到项目根目录
+            path = Path(__file__).resolve().parent.parent / self.catalog_file
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+
+        self._base_headers = MappingProxyType(dict(data.get("base_headers") or {}))
+        endpoints = {}
+        for name, spec in (data.get("endpoints") or {}).items():
+            endpoints[name] = Endpoint(
+                name,
+                spec["method"],
+                spec["path"],
+                self._base_headers,
+                headers=spec.get("headers"),
+                auth=bool(spec.get("auth", False)),
+                content_type=spec.get("content_type", "application/json")
+            )
+        logger.debug(f"加载接口目录 {path}: {len(endpoints)} 个接口")
+        return endpoints
+
+    @property
+    def endpoints(self) -> Dict[str, Endpoint]:
+        if self._endpoints is None:
+            with self._lock:
+                if self._endpoints is None:
+                    self._endpoints = self._load()
+        return self._endpoints
+
+    @property
+    def base_headers(self) -> Mapping[str, str]:
+        """所有接口共用的只读浏览器请求头"""
+        self.endpoints
+        return self._base_headers
+
+    def get(self, name: str) -> Endpoint:
+        """按名称获取接口定义"""
+        try:
+            return self.endpoints[name]
+        except KeyError:
+            raise ValueError(f"未知接口: {name}，可用接口: {', '.join(self.names())}")
+
+    def names(self) -> List[str]:
+        return list(self.endpoints)
+
+    def headers(self, name: str, token: Optional[str] = None) -> Dict[str, str]:
+        """返回可修改的请求头副本，用于需要改动请求头的异常场景测试"""
+        return dict(self.get(name).headers_for(token))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.endpoints
+
+
+# 全局接口目录
+endpoint_catalog = EndpointCatalog()
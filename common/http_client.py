@@ -1,20 +1,64 @@
 import time
 import json
 from typing import Dict, Any, Optional, Union
+from urllib.parse import urlsplit
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from common.logger import logger
+from common.logger import logger, truncate_body, truncate_body_bytes, LOG_BODY_MAX_LENGTH
+from common.sse import SSEStream, SSE_CHUNK_SIZE
+from common.metrics import StreamMetrics, LatencyRecorder, global_latency_recorder, global_ttft_recorder
+from common.endpoints import endpoint_catalog
+from common.cassette import Cassette, CassetteAdapter
+from common.response import ApiResponse
+from common.config import Config
+
+
+def is_target_host(url: str, base_url: Optional[str] = None) -> bool:
+    """url 是否与被测服务地址（默认为配置的 base_url）的主机和端口相同"""
+    if base_url is None:
+        base_url = Config().get("base_url", "")
+    target = urlsplit(base_url or "").netloc.lower()
+    return bool(target) and urlsplit(url or "").netloc.lower() == target
 
 
 class HttpClient:
-    """HTTP客户端封装类"""
+    """
+    HTTP客户端封装类
+
+    每个客户端的请求耗时记入自己的 latency_recorder / ttft_recorder。只有访问被测服务（配置的 base_url）
+    的客户端同时记入全局直方图，供延迟报告和SLO评估使用；访问本地桩服务、认证服务的请求不计入。
+    """
     
-    def __init__(self, base_url: str = "", timeout: int = 30, retry_times: int = 3):
+    def __init__(
+        self,
+        base_url: str = "",
+        timeout: int = 30,
+        retry_times: int = 3,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        log_body_max_length: int = LOG_BODY_MAX_LENGTH,
+        cassette: Optional[Cassette] = None,
+        record_global: Optional[bool] = None,
+        session: Optional[requests.Session] = None
+    ):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.retry_times = retry_times
-        self.session = self._create_session()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.log_body_max_length = log_body_max_length
+        self.cassette = cassette
+        # 传入 session 时与其他客户端共用连接池（同一主机不同路径前缀），由创建方负责关闭
+        self._owns_session = session is None
+        self.session = self._create_session() if session is None else session
+        self.latency_recorder = LatencyRecorder()
+        self.ttft_recorder = LatencyRecorder()
+        # 未指定时按是否访问配置的被测服务判断
+        self.record_global = is_target_host(self.base_url) if record_global is None else record_global
+        self.endpoint_catalog = endpoint_catalog
     
     def _create_session(self) -> requests.Session:
         """创建会话对象"""
@@ -28,18 +72,44 @@ class HttpClient:
             backoff_factor=1
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize
+        )
+        if self.cassette is not None:
+            # 录制/回放模式下由 CassetteAdapter 代理所有请求
+            adapter = CassetteAdapter(self.cassette, adapter)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         # 设置默认请求头
         session.headers.update({
             "Content-Type": "application/json",
-            "User-Agent": "API-Test-Framework/1.0"
+            "User-Agent": "API-Test-Framework/1.0",
+            "Connection": "keep-alive" if self.keep_alive else "close"
         })
         
         return session
     
+    def connection_stats(self) -> Dict[str, int]:
+        """统计连接池新建连接数与复用次数"""
+        opened = requests_sent = 0
+        adapters = {id(a): a for a in self.session.adapters.values()}.values()
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                opened += pool.num_connections
+                requests_sent += pool.num_requests
+        return {
+            "opened": opened,
+            "reused": max(0, requests_sent - opened),
+            "requests": requests_sent
+        }
+    
     def _build_url(self, endpoint: str) -> str:
         """构建完整URL"""
         if endpoint.startswith('http'):
@@ -47,29 +117,43 @@ class HttpClient:
         return f"{self.base_url}/{endpoint.lstrip('/')}"
     
     def _log_request(self, method: str, url: str, **kwargs) -> None:
-        """记录请求日志"""
+        """记录请求日志，请求体仅在DEBUG级别启用时才格式化"""
         logger.info(f"发送 {method} 请求到: {url}")
         if 'json' in kwargs:
-            logger.debug(f"请求体: {json.dumps(kwargs['json'], ensure_ascii=False, indent=2)}")
+            logger.opt(lazy=True).debug(
+                "请求体: {}",
+                lambda: truncate_body(json.dumps(kwargs['json'], ensure_ascii=False), self.log_body_max_length)
+            )
         if 'data' in kwargs:
-            logger.debug(f"请求数据: {kwargs['data']}")
+            logger.opt(lazy=True).debug(
+                "请求数据: {}",
+                lambda: truncate_body(str(kwargs['data']), self.log_body_max_length)
+            )
     
     def _log_response(self, response: requests.Response) -> None:
-        """记录响应日志"""
+        """记录响应日志，响应体仅在DEBUG级别启用时才解码，不做JSON解析"""
         logger.info(f"响应状态码: {response.status_code}")
-        try:
-            response_json = response.json()
-            logger.debug(f"响应体: {json.dumps(response_json, ensure_ascii=False, indent=2)}")
-        except:
-            logger.debug(f"响应体: {response.text[:500]}...")
+        logger.opt(lazy=True).debug(
+            "响应体: {}",
+            lambda: truncate_body_bytes(response.content, response.encoding, self.log_body_max_length)
+        )
     
     def request(
         self,
         method: str,
         endpoint: str,
+        metrics_key: Optional[str] = None,
         **kwargs
-    ) -> requests.Response:
-        """发送HTTP请求"""
+    ) -> ApiResponse:
+        """
+        发送HTTP请求
+        
+        Args:
+            metrics_key: 耗时统计使用的接口标识，默认按实际路径归一化
+            
+        Returns:
+            ApiResponse，多次调用 json() 只解码一次
+        """
         url = self._build_url(endpoint)
         
         # 设置超时
@@ -78,15 +162,105 @@ class HttpClient:
         
         self._log_request(method, url, **kwargs)
         
-        start_time = time.time()
-        response = self.session.request(method, url, **kwargs)
-        end_time = time.time()
+        start_time = time.perf_counter_ns()
+        response = ApiResponse.wrap(self.session.request(method, url, **kwargs))
+        duration_ns = time.perf_counter_ns() - start_time
         
-        logger.info(f"请求耗时: {end_time - start_time:.2f}秒")
+        self.latency_recorder.record(method, metrics_key or endpoint, duration_ns)
+        if self.record_global:
+            global_latency_recorder.record(method, metrics_key or endpoint, duration_ns)
+        
+        logger.info(f"请求耗时: {duration_ns / 1e9:.2f}秒")
         self._log_response(response)
         
         return response
     
+    def stream_sse(
+        self,
+        method: str,
+        endpoint: str,
+        chunk_size: int = SSE_CHUNK_SIZE,
+        metrics_key: Optional[str] = None,
+        **kwargs
+    ) -> SSEStream:
+        """
+        发送请求并以SSE事件流方式逐个读取响应
+        
+        流读取结束后，总耗时计入延迟直方图，首token耗时计入首token耗时直方图
+        """
+        url = self._build_url(endpoint)
+        
+        if 'timeout' not in kwargs:
+            kwargs['timeout'] = self.timeout
+        
+        headers = dict(kwargs.pop('headers', None) or {})
+        if not any(k.lower() == 'accept' for k in headers):
+            headers['accept'] = 'text/event-stream'
+        
+        self._log_request(method, url, headers=headers, **kwargs)
+        
+        metrics = StreamMetrics()
+        response = self.session.request(method, url, headers=headers, stream=True, **kwargs)
+        
+        logger.info(f"响应状态码: {response.status_code}")
+        logger.info(f"首个响应头耗时: {response.elapsed.total_seconds():.2f}秒")
+        
+        return SSEStream(response, chunk_size=chunk_size, metrics=metrics,
+                         on_end=lambda m: self._record_stream(method, metrics_key or endpoint, m))
+    
+    def _record_stream(self, method: str, metrics_key: str, metrics: StreamMetrics) -> None:
+        """汇总流式响应的总耗时和首token耗时"""
+        duration_ns = int(metrics.duration_ms * 1e6)
+        ttft_ns = int(metrics.ttft_ms * 1e6) if metrics.ttft_ms is not None else None
+        self.latency_recorder.record(method, metrics_key, duration_ns)
+        if ttft_ns is not None:
+            self.ttft_recorder.record(method, metrics_key, ttft_ns)
+        if self.record_global:
+            global_latency_recorder.record(method, metrics_key, duration_ns)
+            if ttft_ns is not None:
+                global_ttft_recorder.record(method, metrics_key, ttft_ns)
+    
+    def call(
+        self,
+        name: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        token: Optional[str] = None,
+        sse: Optional[bool] = None,
+        method: Optional[str] = None,
+        anonymous: bool = False,
+        **kwargs
+    ) -> Union[requests.Response, SSEStream]:
+        """
+        按接口目录中的名称发送请求
+        
+        Args:
+            name: 接口名称，见 endpoints.yaml
+            path_params: 路径模板参数，如 {"session_id": "..."}
+            token: 认证token，传入时附带 authorization 请求头
+            sse: 是否按SSE事件流读取，默认由接口声明的响应类型决定；False时一次性读取完整响应
+            method: 覆盖接口声明的请求方式，用于验证接口拒绝不支持的请求方式
+            anonymous: 不带token调用需要认证的接口，用于验证接口拒绝未认证的请求
+            **kwargs: 其他请求参数；传入 headers 时覆盖目录中的同名请求头
+            
+        Returns:
+            普通接口返回 requests.Response，text/event-stream 接口（或 sse=True）返回 SSEStream
+            
+        Raises:
+            ValueError: 接口声明了 auth 但未传入token，且未指定 anonymous
+        """
+        endpoint = self.endpoint_catalog.get(name)
+        if endpoint.auth and not token and not anonymous:
+            raise ValueError(f"接口 {name} 需要认证，请传入token（验证未认证请求时指定 anonymous=True）")
+        headers = endpoint.headers_for(token)
+        if 'headers' in kwargs:
+            headers = {**headers, **kwargs.pop('headers')}
+        path = endpoint.format_path(path_params)
+        method = method or endpoint.method
+        
+        if endpoint.stream if sse is None else sse:
+            return self.stream_sse(method, path, metrics_key=endpoint.metrics_key, headers=headers, **kwargs)
+        return self.request(method, path, metrics_key=endpoint.metrics_key, headers=headers, **kwargs)
+    
     def get(self, endpoint: str, **kwargs) -> requests.Response:
         """发送GET请求"""
         return self.request("GET", endpoint, **kwargs)
@@ -108,8 +282,9 @@ class HttpClient:
         return self.request("PATCH", endpoint, **kwargs)
     
     def close(self) -> None:
-        """关闭会话"""
-        self.session.close()
+        """关闭会话，共用的会话由其创建方关闭"""
+        if self._owns_session:
+            self.session.close()
     
     def __enter__(self):
         return self
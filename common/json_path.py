@@ -0,0 +1,141 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+
+# 编译后的路径表达式缓存数量
+JSON_PATH_CACHE_SIZE = 1024
+
+# 路径片段类型
+MEMBER = "member"      # 对象键；JSON Pointer 中的数字片段也可作为数组下标
+INDEX = "index"        # 数组下标，负数从末尾计数
+WILDCARD = "wildcard"  # 对象的所有值或数组的所有元素
+
+_JSONPATH_TOKEN = re.compile(
+    r"\.(?P<name>[A-Za-z_$][\w$-]*)"
+    r"|\.\*|\[\*\]"
+    r"|\[(?P<index>-?\d+)\]"
+    r"|\[(?P<quote>['\"])(?P<key>.*?)(?P=quote)\]"
+)
+
+Token = Tuple[str, Any]
+
+
+def _parse_pointer(expression: str) -> Tuple[Token, ...]:
+    """RFC 6901 JSON Pointer，如 /data/0/sessionId"""
+    if expression == "":
+        return ()
+    return tuple((MEMBER, part.replace("~1", "/").replace("~0", "~")) for part in expression[1:].split("/"))
+
+
+def _parse_jsonpath(expression: str) -> Tuple[Token, ...]:
+    """JSONPath子集：$、.name、['name']、[index]、[*]、.*"""
+    tokens = []
+    pos = 1
+    while pos < len(expression):
+        match = _JSONPATH_TOKEN.match(expression, pos)
+        if match is None:
+            raise ValueError(f"不支持的JSONPath表达式: {expression}（位置 {pos}）")
+        if match.group("name") is not None:
+            tokens.append((MEMBER, match.group("name")))
+        elif match.group("index") is not None:
+            tokens.append((INDEX, int(match.group("index"))))
+        elif match.group("quote") is not None:
+            tokens.append((MEMBER, match.group("key")))
+        else:
+            tokens.append((WILDCARD, None))
+        pos = match.end()
+    return tuple(tokens)
+
+
+def _step(value: Any, token: Token) -> Iterable[Any]:
+    """对单个值应用一个路径片段，返回匹配到的子值"""
+    kind, arg = token
+    if kind == MEMBER:
+        if isinstance(value, dict):
+            if arg in value:
+                yield value[arg]
+        elif isinstance(value, list) and arg.isdigit() and int(arg) < len(value):
+            yield value[int(arg)]
+    elif kind == INDEX:
+        if isinstance(value, list) and -len(value) <= arg < len(value):
+            yield value[arg]
+    elif isinstance(value, dict):
+        yield from value.values()
+    elif isinstance(value, list):
+        yield from value
+
+
+class JsonPath:
+    """编译后的路径表达式，支持 JSON Pointer（/a/0/b）和 JSONPath 子集（$.a[0].b、$.a[*]），不带前缀时按 $. 处理"""
+
+    __slots__ = ("expression", "tokens", "single")
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        if expression == "" or expression.startswith("/"):
+            self.tokens = _parse_pointer(expression)
+        elif expression.startswith("$"):
+            self.tokens = _parse_jsonpath(expression)
+        else:
+            self.tokens = _parse_jsonpath(f"$.{expression}")
+        # 不含通配符的路径最多匹配一个值
+        self.single = all(kind != WILDCARD for kind, _ in self.tokens)
+
+    def find(self, document: Any) -> List[Any]:
+        """返回所有匹配的值，没有匹配时返回空列表"""
+        values = [document]
+        for token in self.tokens:
+            values = [child for value in values for child in _step(value, token)]
+            if not values:
+                break
+        return values
+
+    def __repr__(self) -> str:
+        return f"JsonPath({self.expression!r})"
+
+
+class JsonPathSet:
+    """
+    一组路径表达式合并成前缀树，一次遍历文档求出所有路径的值
+
+    公共前缀（如 $.data 下的多个字段）只求值一次。
+    """
+
+    __slots__ = ("expressions", "_root")
+
+    def __init__(self, expressions: Sequence[str]):
+        self.expressions = tuple(expressions)
+        # 节点: [子节点字典 {片段: 节点}, 在此结束的表达式列表]
+        self._root = [{}, []]
+        for expression in self.expressions:
+            node = self._root
+            for token in compile_path(expression).tokens:
+                node = node[0].setdefault(token, [{}, []])
+            node[1].append(expression)
+
+    def evaluate(self, document: Any) -> Dict[str, List[Any]]:
+        """返回 {表达式: 匹配值列表}"""
+        results = {expression: [] for expression in self.expressions}
+        stack = [(self._root, [document])]
+        while stack:
+            (children, ends), values = stack.pop()
+            for expression in ends:
+                results[expression].extend(values)
+            for token, child in children.items():
+                matched = [v for value in values for v in _step(value, token)]
+                if matched:
+                    stack.append((child, matched))
+        return results
+
+
+@lru_cache(maxsize=JSON_PATH_CACHE_SIZE)
+def compile_path(expression: str) -> JsonPath:
+    """编译路径表达式，相同表达式只解析一次"""
+    return JsonPath(expression)
+
+
+@lru_cache(maxsize=JSON_PATH_CACHE_SIZE)
+def compile_paths(expressions: Tuple[str, ...]) -> JsonPathSet:
+    """编译一组路径表达式，相同的一组表达式只构建一次前缀树"""
+    return JsonPathSet(expressions)
@@ -0,0 +1,212 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+import pytest
+from common.assertions import ApiAssertions
+from common.config import Config
+from common.logger import logger
+from common.sse import SSEStream
+
+
+# 用例参数名，测试函数声明该参数即按JSONL文件逐行生成用例
+JSONL_CASE_FIXTURE = "jsonl_case"
+
+# 期望字段到 ApiAssertions 断言的映射，值为单个参数时直接传入
+EXPECTATIONS = {
+    "status": ApiAssertions.assert_status_code,
+    "contains": ApiAssertions.assert_response_contains,
+    "schema": ApiAssertions.assert_json_schema,
+    "max_time": ApiAssertions.assert_response_time,
+    "length": ApiAssertions.assert_list_length,
+    "paths": ApiAssertions.assert_json_paths,
+    "ttfb_ms": ApiAssertions.assert_ttfb,
+    "ttft_ms": ApiAssertions.assert_ttft,
+    "stream_duration_ms": ApiAssertions.assert_stream_duration,
+}
+
+# 由 check_expectations 单独处理的期望字段
+COMPOSITE_EXPECTATIONS = {"json", "keys", "headers", "not_empty"}
+
+# 依赖流式耗时指标的期望字段，只适用于SSE响应（记录中 "sse": true）
+STREAM_EXPECTATIONS = {"ttfb_ms", "ttft_ms", "stream_duration_ms"}
+
+# 需要读取完整响应体的期望字段，SSE响应的事件在执行时已读完，不支持
+BODY_EXPECTATIONS = {"contains", "schema", "length", "paths", "json", "keys", "not_empty"}
+
+
+class JsonlCase:
+    """
+    JSONL用例引用，只保存文件位置，执行时再按偏移量读取记录
+
+    收集阶段不持有记录内容，用例数量增加时内存只随引用数量线性增长。
+    """
+
+    __slots__ = ("path", "offset", "line_no", "case_id", "markers")
+
+    def __init__(self, path: str, offset: int, line_no: int, case_id: str, markers: tuple = ()):
+        self.path = path
+        self.offset = offset
+        self.line_no = line_no
+        self.case_id = case_id
+        self.markers = markers
+
+    def load(self) -> Dict[str, Any]:
+        """读取该行记录"""
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            return json.loads(f.readline())
+
+    def __repr__(self) -> str:
+        return f"JsonlCase({self.path}:{self.line_no} {self.case_id})"
+
+
+def iter_cases(path: Union[str, Path]) -> Iterator[JsonlCase]:
+    """
+    逐行读取JSONL用例文件，跳过空行和 # 开头的注释行
+
+    记录中的 id 字段作为用例ID，未提供时使用行号；markers 字段作为用例标记。
+    """
+    path = str(path)
+    offset = 0
+    with open(path, 'rb') as f:
+        for line_no, line in enumerate(f, start=1):
+            line_offset = offset
+            offset += len(line)
+            text = line.strip()
+            if not text or text.startswith(b"#"):
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"JSONL用例格式错误 {path}:{line_no}: {e}")
+            if not isinstance(record, dict):
+                raise ValueError(f"JSONL用例必须是JSON对象 {path}:{line_no}")
+            case_id = str(record.get("id") or f"line{line_no}")
+            error = expectation_error(record)
+            if error:
+                raise ValueError(f"JSONL用例 {case_id} 的期望不合法 {path}:{line_no}: {error}")
+            yield JsonlCase(path, line_offset, line_no, case_id, tuple(record.get("markers") or ()))
+
+
+def iter_params(path: Union[str, Path]) -> Iterator[Any]:
+    """将JSONL用例转换为 pytest.param"""
+    for case in iter_cases(path):
+        marks = [getattr(pytest.mark, name) for name in case.markers]
+        yield pytest.param(case, id=case.case_id, marks=marks)
+
+
+def is_stream_record(record: Dict[str, Any]) -> bool:
+    """记录是否按SSE事件流读取响应，只有通过接口目录调用且声明 "sse": true 的记录是"""
+    return "endpoint" in record and bool(record.get("sse", False))
+
+
+def expectation_error(record: Dict[str, Any]) -> Optional[str]:
+    """检查 expect 中的字段是否受支持、是否适用于记录的响应类型，不合法时返回原因"""
+    expect = record.get("expect") or {}
+    if not isinstance(expect, dict):
+        return "expect 必须是JSON对象"
+    unknown = [key for key in expect if key not in EXPECTATIONS and key not in COMPOSITE_EXPECTATIONS]
+    if unknown:
+        return f"不支持的期望字段: {', '.join(unknown)}"
+    if is_stream_record(record):
+        invalid = [key for key in expect if key in BODY_EXPECTATIONS]
+        if invalid:
+            return f"期望字段 {', '.join(invalid)} 不适用于SSE响应"
+    else:
+        invalid = [key for key in expect if key in STREAM_EXPECTATIONS]
+        if invalid:
+            return f"期望字段 {', '.join(invalid)} 只适用于SSE响应（记录中设置 \"sse\": true）"
+    return None
+
+
+def check_expectations(response, expect: Dict[str, Any], case_id: str = "") -> None:
+    """按记录中的 expect 字段依次执行断言，期望字段与响应类型不符时断言失败"""
+    stream = isinstance(response, SSEStream)
+    for key, value in expect.items():
+        if (key in STREAM_EXPECTATIONS and not stream) or (key in BODY_EXPECTATIONS and stream):
+            kind = "SSE" if stream else "普通"
+            raise AssertionError(f"用例 {case_id} 的期望字段 {key} 不适用于{kind}响应")
+        if key in EXPECTATIONS:
+            EXPECTATIONS[key](response, value)
+        elif key == "json":
+            for json_key, json_value in value.items():
+                ApiAssertions.assert_json_contains(response, json_key, json_value)
+        elif key == "keys":
+            for json_key in value:
+                ApiAssertions.assert_json_contains(response, json_key)
+        elif key == "headers":
+            for header_name, header_value in value.items():
+                ApiAssertions.assert_header_contains(response, header_name, header_value)
+        elif key == "not_empty":
+            if value:
+                ApiAssertions.assert_not_empty(response)
+        else:
+            raise ValueError(f"不支持的期望字段: {key}")
+
+
+def run_case(client, record: Dict[str, Any], token: Optional[str] = None):
+    """
+    发送一条JSONL记录描述的请求并校验期望
+
+    记录格式::
+
+        {"id": "profile-ok", "endpoint": "user-profile", "expect": {"status": 200, "keys": ["username"]}}
+        {"id": "raw-get", "method": "GET", "path": "/api/ping", "expect": {"status": 200}}
+
+    endpoint 为接口目录中的名称，可选 path_params/method/sse/json/data/params/headers；
+    未使用接口目录时通过 method + path 指定请求。
+    """
+    kwargs = {key: record[key] for key in ("json", "data", "params", "headers") if key in record}
+    if "endpoint" in record:
+        response = client.call(
+            record["endpoint"],
+            path_params=record.get("path_params"),
+            token=token,
+            sse=record.get("sse", False),
+            method=record.get("method"),
+            # 记录显式声明 "auth": false 时不带token调用，用于验证接口拒绝未认证的请求
+            anonymous=record.get("auth") is False,
+            **kwargs
+        )
+    else:
+        if token:
+            kwargs["headers"] = {**kwargs.get("headers", {}), 'authorization': f'Bearer {token}'}
+        response = client.request(record["method"], record["path"], **kwargs)
+
+    if isinstance(response, SSEStream):
+        with response:
+            for _ in response:
+                pass
+    check_expectations(response, record.get("expect") or {}, case_id=str(record.get("id", "")))
+    return response
+
+
+def requires_auth(client, record: Dict[str, Any]) -> bool:
+    """记录显式声明的 auth 优先，否则沿用接口目录中的定义"""
+    if "auth" in record:
+        return bool(record["auth"])
+    if "endpoint" in record:
+        return client.endpoint_catalog.get(record["endpoint"]).auth
+    return False
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--jsonl-cases",
+        action="store",
+        default=None,
+        help="数据驱动用例的JSONL文件，默认读取 config.yaml 中的 jsonl_cases_file"
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """为声明了 jsonl_case 参数的测试逐行生成用例"""
+    if JSONL_CASE_FIXTURE not in metafunc.fixturenames:
+        return
+    path = metafunc.config.getoption("--jsonl-cases") or Config().get("jsonl_cases_file")
+    if path and Path(path).exists():
+        params = list(iter_params(path))
+        logger.debug(f"从 {path} 生成 {len(params)} 个数据驱动用例")
+    else:
+        params = []
+    metafunc.parametrize(JSONL_CASE_FIXTURE, params)
@@ -0,0 +1,281 @@
+import asyncio
+import bisect
+import datetime
+import json
+import time
+from typing import Any, Callable, Dict, Optional
+
+from common.async_http_client import AsyncHttpClient, AsyncRetryError
+from common.endpoints import endpoint_catalog
+from common.http_client import HttpClient
+from common.logger import logger
+from common.metrics import LatencyHistogram, LatencyRecorder
+
+
+# 示例会话ID，与测试用例保持一致
+SAMPLE_SESSION_ID = "71d34ea5-a9d5-45eb-bfc8-fe79132c7a4d"
+SAMPLE_HISTORY_SESSION_ID = "a4eb7361-4a48-48df-9b0b-3e21dffa42d5"
+
+# 延迟直方图分桶上限（毫秒）
+HISTOGRAM_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000]
+
+
+def _now() -> str:
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class LoadScenario:
+    """压测场景：接口目录中的一个接口及其请求体"""
+
+    def __init__(self, name: str, endpoint_name: str,
+                 json_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                 path_params: Optional[Dict[str, Any]] = None,
+                 setup: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None):
+        self.name = name
+        self.endpoint_name = endpoint_name
+        self.json_factory = json_factory
+        self.path_params = path_params
+        self.setup = setup
+
+    @property
+    def api(self):
+        """接口目录中的接口定义"""
+        return endpoint_catalog.get(self.endpoint_name)
+
+    @property
+    def method(self) -> str:
+        return self.api.method
+
+    @property
+    def endpoint(self) -> str:
+        """填充路径参数后的请求路径"""
+        return self.api.format_path(self.path_params)
+
+    @property
+    def requires_auth(self) -> bool:
+        return self.api.auth
+
+    def prepare(self, base_url: str, auth_token: Optional[str] = None) -> Dict[str, Any]:
+        """执行场景前置步骤，返回构造请求所需的上下文"""
+        context = {"auth_token": auth_token}
+        if self.setup:
+            context.update(self.setup(base_url, context))
+        return context
+
+    def build_request(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """构造单次请求参数，请求头使用接口目录中预先构建的只读请求头"""
+        token = context.get("auth_token") if self.requires_auth else None
+        kwargs = {"headers": self.api.headers_for(token)}
+        if self.json_factory:
+            kwargs["json"] = self.json_factory(context)
+        return kwargs
+
+
+def _create_user_session(base_url: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """创建用户会话，供聊天场景复用"""
+    with HttpClient(base_url) as client:
+        response = client.call("user-create-session", token=context['auth_token'], json={"guider": ""})
+    response_json = response.json()
+    return {"session_id": response_json.get("data") if isinstance(response_json, dict) else response_json}
+
+
+SCENARIOS: Dict[str, LoadScenario] = {
+    scenario.name: scenario for scenario in [
+        LoadScenario(
+            "guest-create-session", "guest-create-session",
+            json_factory=lambda ctx: {"guider": ""}
+        ),
+        LoadScenario(
+            "guest-chat", "guest-chat",
+            json_factory=lambda ctx: {"content": f"你好，当前时间：{_now()}", "images": [], "region": ""}
+        ),
+        LoadScenario(
+            "user-create-session", "user-create-session",
+            json_factory=lambda ctx: {"guider": ""}
+        ),
+        LoadScenario(
+            "user-chat", "user-chat",
+            json_factory=lambda ctx: {"content": f"hello，当前时间：{_now()}", "images": [], "region": "",
+                                      "sessionId": ctx["session_id"]},
+            setup=_create_user_session
+        ),
+        LoadScenario("user-profile", "user-profile"),
+        LoadScenario("chat-history", "chat-history", path_params={"session_id": SAMPLE_HISTORY_SESSION_ID}),
+        LoadScenario(
+            "share-session", "share-session",
+            json_factory=lambda ctx: {"sessionId": SAMPLE_SESSION_ID}
+        ),
+        LoadScenario(
+            "invitation-redeem", "invitation-redeem",
+            json_factory=lambda ctx: {"inviteCode": "uRzyNbg"}
+        ),
+    ]
+}
+
+
+class LoadResult:
+    """
+    压测结果
+
+    延迟记录到 LatencyRecorder 的直方图中（键为场景的 "METHOD 接口模板"），内存占用与请求数量无关，
+    可与用例的延迟报告合并；固定分桶的直方图在记录时同步计数。
+    """
+
+    def __init__(self, scenario: str, target_rps: float, duration: float,
+                 method: str = "GET", endpoint: str = ""):
+        self.scenario = scenario
+        self.target_rps = target_rps
+        self.duration = duration
+        self.method = method
+        self.endpoint = endpoint or f"/{scenario}"
+        self.latency_recorder = LatencyRecorder()
+        self.status_counts: Dict[str, int] = {}
+        self.bucket_counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.wall_time = 0.0
+
+    def record(self, status: str, latency_ms: float) -> None:
+        """记录单次请求结果，status为状态码或异常类型"""
+        self.latency_recorder.record(self.method, self.endpoint, int(latency_ms * 1_000_000))
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self.bucket_counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, latency_ms)] += 1
+
+    @property
+    def latency_histogram(self) -> LatencyHistogram:
+        return self.latency_recorder.get(self.method, self.endpoint) or LatencyHistogram()
+
+    @property
+    def total(self) -> int:
+        return sum(self.status_counts.values())
+
+    @property
+    def error_count(self) -> int:
+        return sum(count for status, count in self.status_counts.items()
+                   if not (status.isdigit() and int(status) < 400))
+
+    @property
+    def error_rate(self) -> float:
+        return self.error_count / self.total if self.total else 0.0
+
+    def latency_percentile_ms(self, p: float) -> Optional[float]:
+        """延迟p分位数（毫秒），直方图相对误差不超过 1/64"""
+        value = self.latency_histogram.value_at_percentile(p)
+        return None if value is None else value / 1000
+
+    def histogram(self) -> Dict[str, int]:
+        """按固定分桶统计延迟分布"""
+        buckets = {f"<={b}ms": count for b, count in zip(HISTOGRAM_BUCKETS_MS, self.bucket_counts)}
+        buckets[f">{HISTOGRAM_BUCKETS_MS[-1]}ms"] = self.bucket_counts[-1]
+        return buckets
+
+    def summary(self) -> Dict[str, Any]:
+        """汇总延迟分位数、错误率和吞吐量"""
+        return {
+            "scenario": self.scenario,
+            "target_rps": self.target_rps,
+            "duration": self.duration,
+            "total_requests": self.total,
+            "achieved_rps": round(self.total / self.wall_time, 2) if self.wall_time else 0.0,
+            "latency_ms": {
+                "p50": self.latency_percentile_ms(50),
+                "p90": self.latency_percentile_ms(90),
+                "p99": self.latency_percentile_ms(99),
+                "max": self.latency_percentile_ms(100),
+            },
+            "status_counts": dict(sorted(self.status_counts.items())),
+            "error_rate": round(self.error_rate, 4),
+            "error_rate_by_status": {
+                status: round(count / self.total, 4)
+                for status, count in sorted(self.status_counts.items())
+                if not (status.isdigit() and int(status) < 400)
+            },
+            "histogram": self.histogram(),
+        }
+
+    def format_report(self) -> str:
+        """生成文本报告"""
+        summary = self.summary()
+        latency = summary["latency_ms"]
+        lines = [
+            f"场景: {self.scenario}",
+            f"目标RPS: {self.target_rps}  持续时间: {self.duration}秒",
+            f"请求总数: {summary['total_requests']}  实际吞吐: {summary['achieved_rps']} req/s",
+            "延迟(ms): " + "  ".join(
+                f"{k}={v:.1f}" if v is not None else f"{k}=-" for k, v in latency.items()),
+            f"错误率: {summary['error_rate']:.2%}",
+            "状态码分布: " + ", ".join(f"{k}={v}" for k, v in summary["status_counts"].items()),
+            "延迟直方图:",
+        ]
+        peak = max(summary["histogram"].values()) or 1
+        for bucket, count in summary["histogram"].items():
+            bar = "#" * round(40 * count / peak)
+            lines.append(f"  {bucket:>10} | {count:>7} {bar}")
+        return "\n".join(lines)
+
+
+class LoadGenerator:
+    """开环压测器：按目标RPS固定节奏发起请求，不等待前一个请求完成"""
+
+    def __init__(self, scenario: LoadScenario, base_url: str, rps: float, duration: float,
+                 concurrency: int = 100, timeout: int = 30, auth_token: Optional[str] = None):
+        if rps <= 0:
+            raise ValueError(f"压测目标RPS必须大于0: {rps}")
+        if duration <= 0:
+            raise ValueError(f"压测持续时间必须大于0: {duration}")
+        if concurrency < 1:
+            raise ValueError(f"压测并发上限至少为1: {concurrency}")
+        self.scenario = scenario
+        self.base_url = base_url
+        self.rps = rps
+        self.duration = duration
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.auth_token = auth_token
+
+    async def _send(self, client: AsyncHttpClient, semaphore: asyncio.Semaphore,
+                    scheduled_at: float, context: Dict[str, Any], result: LoadResult) -> None:
+        # 延迟从计划发送时间开始计算，避免协调遗漏（coordinated omission）低估排队时间
+        async with semaphore:
+            try:
+                response = await client.request(self.scenario.method, self.scenario.endpoint,
+                                                **self.scenario.build_request(context))
+                status = str(response.status_code)
+            except AsyncRetryError as e:
+                status = str(e.status_code)
+            except Exception as e:
+                status = type(e).__name__
+        result.record(status, (time.perf_counter() - scheduled_at) * 1000)
+
+    async def _run(self, context: Dict[str, Any]) -> LoadResult:
+        result = LoadResult(self.scenario.name, self.rps, self.duration,
+                            method=self.scenario.method, endpoint=self.scenario.endpoint)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        interval = 1.0 / self.rps
+        total_requests = int(self.rps * self.duration)
+        # 只保留在途请求的任务，完成后立即移除，内存不随 rps×duration 增长
+        pending = set()
+
+        async with AsyncHttpClient(self.base_url, timeout=self.timeout, retry_times=0,
+                                   max_connections=self.concurrency, log_requests=False) as client:
+            start_time = time.perf_counter()
+            for i in range(total_requests):
+                scheduled_at = start_time + i * interval
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                task = asyncio.create_task(self._send(client, semaphore, scheduled_at, context, result))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+            result.wall_time = time.perf_counter() - start_time
+
+        return result
+
+    def run(self) -> LoadResult:
+        """执行压测并返回结果"""
+        context = self.scenario.prepare(self.base_url, self.auth_token)
+        logger.info(f"开始压测 {self.scenario.name}: rps={self.rps}, "
+                    f"duration={self.duration}s, concurrency={self.concurrency}")
+        result = asyncio.run(self._run(context))
+        logger.info(f"压测完成: {json.dumps(result.summary(), ensure_ascii=False)}")
+        return result
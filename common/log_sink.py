@@ -0,0 +1,187 @@
+import gzip
+import os
+import queue
+import re
+import shutil
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+
+# 队列满时的处理策略
+OVERFLOW_DROP = "drop"
+OVERFLOW_BLOCK = "block"
+
+# 队列满时不丢弃的最低日志级别（WARNING），保证告警和错误一定落盘
+NEVER_DROP_LEVEL_NO = 30
+
+# 停止时等待后台线程写完剩余日志的最长时间（秒）
+STOP_TIMEOUT = 10
+
+_STOP = object()
+
+
+class AsyncFileSink:
+    """
+    后台线程写文件的loguru日志sink
+
+    调用线程只把格式化好的日志放入有界队列，由后台线程写入按日期命名的日志文件；
+    队列满时按 overflow 策略丢弃（drop）或阻塞等待（block），WARNING及以上级别始终阻塞等待不丢弃。
+    首次打开和日期变化时，将本进程（同一worker后缀）之前日期的日志压缩为 .gz（可选），并清理超过保留天数的文件。
+    后台线程处理单条日志出错时输出到stderr后继续运行；线程已退出时写入的日志直接计入丢弃数，不会阻塞调用线程。
+    """
+
+    def __init__(self, log_dir: Path, prefix: str = "api_test", suffix: str = "",
+                 queue_size: int = 10000, overflow: str = OVERFLOW_DROP,
+                 compression: Optional[str] = None, retention_days: int = 30,
+                 encoding: str = "utf-8"):
+        if overflow not in (OVERFLOW_DROP, OVERFLOW_BLOCK):
+            raise ValueError(f"不支持的日志队列溢出策略: {overflow}")
+        if compression not in (None, "", "gz"):
+            raise ValueError(f"不支持的日志压缩格式: {compression}")
+
+        self.log_dir = Path(log_dir)
+        self.prefix = prefix
+        self.suffix = suffix
+        self.overflow = overflow
+        self.compression = compression or None
+        self.retention_days = retention_days
+        self.encoding = encoding
+        self.dropped = 0
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._file_date = None
+        self._stopped = False
+        self._thread = threading.Thread(target=self._worker, name="AsyncFileSink", daemon=True)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._thread.start()
+
+    def file_path(self, date: str) -> Path:
+        """指定日期的日志文件路径"""
+        worker = f"_{self.suffix}" if self.suffix else ""
+        return self.log_dir / f"{self.prefix}_{date}{worker}.log"
+
+    def write(self, message) -> None:
+        """loguru调用入口，运行在产生日志的线程中"""
+        if self._stopped:
+            return
+        record = getattr(message, "record", None)
+        level_no = record["level"].no if record else NEVER_DROP_LEVEL_NO
+        timestamp = record["time"] if record else datetime.now()
+
+        if not self._thread.is_alive():
+            self.dropped += 1
+            return
+        if self.overflow == OVERFLOW_BLOCK or level_no >= NEVER_DROP_LEVEL_NO:
+            self._queue.put((timestamp, str(message)))
+            return
+        try:
+            self._queue.put_nowait((timestamp, str(message)))
+        except queue.Full:
+            self.dropped += 1
+
+    def _open(self, date: str) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+        self._file = open(self.file_path(date), "a", encoding=self.encoding)
+        self._file_date = date
+        try:
+            self._housekeep()
+        except Exception as e:
+            self._report_error(e)
+
+    def _housekeep(self) -> None:
+        """压缩本进程之前日期的日志并清理过期文件；短时间运行的进程首次打开文件时同样执行"""
+        if self.compression == "gz":
+            for path in self._previous_files():
+                self._compress(path)
+        self._cleanup()
+
+    def _previous_files(self):
+        """本进程后缀、日期早于当前文件的未压缩日志，其他worker的文件由其自身处理"""
+        worker = f"_{self.suffix}" if self.suffix else ""
+        pattern = re.compile(rf"{re.escape(self.prefix)}_(\d{{4}}-\d{{2}}-\d{{2}}){re.escape(worker)}\.log")
+        for path in self.log_dir.glob(f"{self.prefix}_*.log"):
+            match = pattern.fullmatch(path.name)
+            if match and match.group(1) < self._file_date:
+                yield path
+
+    def _compress(self, path: Path) -> None:
+        try:
+            with open(path, "rb") as src, gzip.open(f"{path}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            path.unlink()
+        except FileNotFoundError:
+            pass  # 同名进程已压缩
+
+    def _cleanup(self) -> None:
+        """删除超过保留天数的日志文件，其他worker可能同时删除，文件已不存在时跳过"""
+        if self.retention_days <= 0:
+            return
+        cutoff = time.time() - timedelta(days=self.retention_days).total_seconds()
+        for path in self.log_dir.glob(f"{self.prefix}_*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
+
+    @staticmethod
+    def _report_error(error: BaseException) -> None:
+        """后台线程出错时输出到stderr，不能再写入日志（会回到本sink）"""
+        print(f"[AsyncFileSink] 写入日志文件失败: {type(error).__name__}: {error}", file=sys.stderr)
+
+    def _write_dropped_notice(self) -> None:
+        if self.dropped and self._file:
+            self._file.write(f"[AsyncFileSink] 日志队列已满，累计丢弃 {self.dropped} 条日志\n")
+
+    def _worker(self) -> None:
+        reported_dropped = 0
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            try:
+                timestamp, text = item
+                date = timestamp.strftime("%Y-%m-%d")
+                if date != self._file_date:
+                    self._open(date)
+                self._file.write(text)
+                if self.dropped != reported_dropped:
+                    reported_dropped = self.dropped
+                    self._write_dropped_notice()
+                if self._queue.empty():
+                    self._file.flush()
+            except Exception as e:
+                self._report_error(e)
+        if self._file:
+            try:
+                self._write_dropped_notice()
+                self._file.close()
+            except Exception as e:
+                self._report_error(e)
+            self._file = None
+
+    def stop(self) -> None:
+        """写完队列中剩余的日志后停止后台线程，loguru移除处理器时调用"""
+        if self._stopped:
+            return
+        self._stopped = True
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=STOP_TIMEOUT)
+        except queue.Full:
+            print("[AsyncFileSink] 日志队列已满，停止时未能写完剩余日志", file=sys.stderr)
+            return
+        self._thread.join(STOP_TIMEOUT)
+
+
+def xdist_worker_suffix() -> str:
+    """pytest-xdist worker标识（如 gw0），非并行执行时为空"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "")
@@ -1,6 +1,10 @@
 import sys
 from pathlib import Path
 from loguru import logger
+from common.config import Config
+from common.log_sink import AsyncFileSink, OVERFLOW_DROP, xdist_worker_suffix
+
+_config = Config()
 
 # 移除默认的日志处理器
 logger.remove()
@@ -9,7 +13,7 @@ logger.remove()
 logger.add(
     sys.stdout,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="INFO",
+    level=_config.get("log_level", "INFO"),
     colorize=True
 )
 
@@ -17,14 +21,55 @@ logger.add(
 log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
 
-logger.add(
-    log_dir / "api_test_{time:YYYY-MM-DD}.log",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="DEBUG",
-    rotation="1 day",
-    retention="30 days",
-    encoding="utf-8"
-)
+_file_format = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+_file_level = _config.get("file_log_level", "DEBUG")
+
+if _config.get("log_async", True):
+    # 后台线程写文件，并行执行时每个xdist worker写各自的文件
+    file_sink = AsyncFileSink(
+        log_dir,
+        suffix=xdist_worker_suffix(),
+        queue_size=int(_config.get("log_queue_size", 10000)),
+        overflow=_config.get("log_overflow", OVERFLOW_DROP),
+        compression=_config.get("log_compression"),
+        retention_days=int(_config.get("log_retention_days", 30))
+    )
+    logger.add(file_sink, format=_file_format, level=_file_level, colorize=False)
+else:
+    logger.add(
+        log_dir / "api_test_{time:YYYY-MM-DD}.log",
+        format=_file_format,
+        level=_file_level,
+        rotation="1 day",
+        retention=f"{int(_config.get('log_retention_days', 30))} days",
+        compression=_config.get("log_compression") or None,
+        encoding="utf-8"
+    )
+
+# 请求/响应体日志的最大长度，0 表示不记录请求/响应体
+LOG_BODY_MAX_LENGTH = int(_config.get("log_body_max_length", 2000))
+
+
+def truncate_body(text: str, max_length: int = LOG_BODY_MAX_LENGTH) -> str:
+    """截断过长的请求/响应体日志"""
+    if max_length <= 0:
+        return "<已省略>"
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}...<共{len(text)}字符，已截断>"
+
+
+def truncate_body_bytes(content: bytes, encoding: str = "utf-8",
+                        max_length: int = LOG_BODY_MAX_LENGTH) -> str:
+    """只解码响应体的前 max_length 字节用于日志，避免解码整个大响应体"""
+    if max_length <= 0:
+        return "<已省略>"
+    content = content or b""
+    text = content[:max_length].decode(encoding or "utf-8", errors="replace")
+    if len(content) > max_length:
+        text += f"...<共{len(content)}字节，已截断>"
+    return text
+
 
 # 导出logger实例
-__all__ = ["logger"] 
\ No newline at end of file
+__all__ = ["logger", "truncate_body", "truncate_body_bytes", "LOG_BODY_MAX_LENGTH"]
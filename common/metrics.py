@@ -0,0 +1,269 @@
+import json
+import math
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+
+def percentile(values: Sequence[float], p: float) -> Optional[float]:
+    """计算百分位数（最近秩法），p取值0-100，空序列返回None"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class StreamMetrics:
+    """流式响应耗时指标，时间单位均为毫秒"""
+
+    def __init__(self, start_time: Optional[float] = None):
+        self.start_time = start_time if start_time is not None else time.perf_counter()
+        self.first_byte_time: Optional[float] = None
+        self.event_times: List[float] = []
+        self.end_time: Optional[float] = None
+
+    def _elapsed_ms(self, t: Optional[float]) -> Optional[float]:
+        return None if t is None else (t - self.start_time) * 1000
+
+    def mark_first_byte(self) -> None:
+        """记录收到首个响应体字节的时间"""
+        if self.first_byte_time is None:
+            self.first_byte_time = time.perf_counter()
+
+    def mark_event(self) -> None:
+        """记录收到一个事件的时间"""
+        self.event_times.append(time.perf_counter())
+
+    def mark_end(self) -> None:
+        """记录流结束时间"""
+        if self.end_time is None:
+            self.end_time = time.perf_counter()
+
+    @property
+    def completed(self) -> bool:
+        return self.end_time is not None
+
+    @property
+    def ttfb_ms(self) -> Optional[float]:
+        """首字节耗时"""
+        return self._elapsed_ms(self.first_byte_time)
+
+    @property
+    def ttft_ms(self) -> Optional[float]:
+        """首个事件（首token）耗时"""
+        return self._elapsed_ms(self.event_times[0]) if self.event_times else None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """流总耗时"""
+        return self._elapsed_ms(self.end_time)
+
+    @property
+    def event_gaps_ms(self) -> List[float]:
+        """相邻事件之间的间隔"""
+        return [(b - a) * 1000 for a, b in zip(self.event_times, self.event_times[1:])]
+
+    def gap_percentile_ms(self, p: float) -> Optional[float]:
+        """事件间隔百分位数"""
+        return percentile(self.event_gaps_ms, p)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """汇总指标"""
+        return {
+            "ttfb_ms": self.ttfb_ms,
+            "ttft_ms": self.ttft_ms,
+            "gap_p50_ms": self.gap_percentile_ms(50),
+            "gap_p95_ms": self.gap_percentile_ms(95),
+            "gap_max_ms": self.gap_percentile_ms(100),
+            "duration_ms": self.duration_ms,
+            "event_count": len(self.event_times),
+        }
+
+
+# 每个2的幂区间内的子桶数量（2^7），相对误差不超过 1/64
+HISTOGRAM_SUB_BUCKET_BITS = 7
+HISTOGRAM_SUB_BUCKET_COUNT = 1 << HISTOGRAM_SUB_BUCKET_BITS
+
+_UUID_SEGMENT = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+_NUMERIC_SEGMENT = re.compile(r"^\d+$")
+
+
+def endpoint_template(url: str) -> str:
+    """将请求URL归一化为接口模板，去掉域名和查询参数，路径中的UUID和数字替换为 {id}"""
+    path = urlsplit(url).path if "://" in url else url.split("?", 1)[0]
+    segments = [
+        "{id}" if _UUID_SEGMENT.match(seg) or _NUMERIC_SEGMENT.match(seg) else seg
+        for seg in path.split("/")
+    ]
+    return "/".join(segments) or "/"
+
+
+class LatencyHistogram:
+    """
+    HDR风格的对数-线性延迟直方图，单位微秒
+
+    数值按2的幂分段、每段128个子桶记录，内存占用与请求数量无关，多个直方图可直接合并
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.total_count = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+        self.sum_us = 0
+
+    @staticmethod
+    def _bucket_index(value: int) -> int:
+        shift = max(0, value.bit_length() - HISTOGRAM_SUB_BUCKET_BITS)
+        return (shift << HISTOGRAM_SUB_BUCKET_BITS) | (value >> shift)
+
+    @staticmethod
+    def _bucket_value(index: int) -> int:
+        """桶内最大值，作为该桶的代表值"""
+        shift = index >> HISTOGRAM_SUB_BUCKET_BITS
+        sub = index & (HISTOGRAM_SUB_BUCKET_COUNT - 1)
+        return ((sub + 1) << shift) - 1
+
+    def record_ns(self, duration_ns: int) -> None:
+        """记录一次耗时（纳秒）"""
+        self.record_us(duration_ns // 1000)
+
+    def record_us(self, value: int, count: int = 1) -> None:
+        """记录一次耗时（微秒）"""
+        value = max(0, int(value))
+        index = self._bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += count
+        self.sum_us += value * count
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+        self.max_us = value if self.max_us is None else max(self.max_us, value)
+
+    def value_at_percentile(self, p: float) -> Optional[int]:
+        """返回p分位数（微秒）"""
+        if not self.total_count:
+            return None
+        target = max(1, math.ceil(p / 100 * self.total_count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._bucket_value(index), self.max_us)
+        return self.max_us
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """合并另一个直方图"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += other.total_count
+        self.sum_us += other.sum_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        if other.max_us is not None:
+            self.max_us = other.max_us if self.max_us is None else max(self.max_us, other.max_us)
+
+    def summary(self) -> Dict[str, Any]:
+        """汇总统计，单位毫秒"""
+        def ms(value):
+            return None if value is None else round(value / 1000, 3)
+
+        return {
+            "count": self.total_count,
+            "min_ms": ms(self.min_us),
+            "mean_ms": ms(self.sum_us / self.total_count) if self.total_count else None,
+            "p50_ms": ms(self.value_at_percentile(50)),
+            "p90_ms": ms(self.value_at_percentile(90)),
+            "p95_ms": ms(self.value_at_percentile(95)),
+            "p99_ms": ms(self.value_at_percentile(99)),
+            "max_ms": ms(self.max_us),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counts": {str(k): v for k, v in self.counts.items()},
+            "total_count": self.total_count,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "sum_us": self.sum_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = {int(k): v for k, v in data.get("counts", {}).items()}
+        histogram.total_count = data.get("total_count", 0)
+        histogram.min_us = data.get("min_us")
+        histogram.max_us = data.get("max_us")
+        histogram.sum_us = data.get("sum_us", 0)
+        return histogram
+
+
+class LatencyRecorder:
+    """按 "METHOD 接口模板" 分组的延迟直方图集合，线程安全"""
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(method: str, endpoint: str) -> str:
+        return f"{method.upper()} {endpoint_template(endpoint)}"
+
+    def record(self, method: str, endpoint: str, duration_ns: int) -> None:
+        """记录一次请求耗时（纳秒）"""
+        key = self.make_key(method, endpoint)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.record_ns(duration_ns)
+
+    def get(self, method: str, endpoint: str) -> Optional[LatencyHistogram]:
+        return self.histograms.get(self.make_key(method, endpoint))
+
+    def merge(self, other: "LatencyRecorder") -> None:
+        """合并另一个记录器"""
+        with self._lock:
+            for key, histogram in other.histograms.items():
+                self.histograms.setdefault(key, LatencyHistogram()).merge(histogram)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {key: h.summary() for key, h in sorted(self.histograms.items())}
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {key: h.to_dict() for key, h in self.histograms.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyRecorder":
+        recorder = cls()
+        recorder.histograms = {key: LatencyHistogram.from_dict(h) for key, h in data.items()}
+        return recorder
+
+    def export_json(self, file_path: str) -> None:
+        """导出为JSON，包含可合并的原始直方图和汇总统计"""
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"summary": self.summary(), "histograms": self.to_dict()},
+                      f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load_json(cls, file_path: str) -> "LatencyRecorder":
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f)["histograms"])
+
+
+# 进程级全局延迟记录器，访问被测服务（配置的 base_url）的 HttpClient 共享
+global_latency_recorder = LatencyRecorder()
+
+# 进程级SSE首token耗时记录器，键与 global_latency_recorder 相同
+global_ttft_recorder = LatencyRecorder()
@@ -0,0 +1,331 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+from aiohttp import web
+from common.config import Config
+from common.endpoints import EndpointCatalog, endpoint_catalog
+from common.logger import logger
+
+
+# 流式聊天默认回复，每个元素作为一个SSE事件发送
+MOCK_REPLY = ["你好", "，", "我是", "GodGPT", "的", "本地", "模拟", "服务", "。"]
+
+# 模拟认证服务签发的token有效期（秒）
+MOCK_TOKEN_TTL = 3600
+
+# 模拟token前缀，带此前缀的token视为有效（多进程运行时无需共享已签发的token）
+MOCK_TOKEN_PREFIX = "mock-"
+
+# 请求体上限，语音聊天的请求体可能达到数十MB
+MOCK_MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# 注入错误和限流不作用于认证接口，避免认证失败掩盖被测接口的行为
+FAULT_EXEMPT_ENDPOINTS = frozenset({"connect-token"})
+
+
+def _ok(data: Any) -> web.Response:
+    return web.json_response({"code": "20000", "data": data, "message": ""})
+
+
+class MockGodGPTServer:
+    """
+    本地模拟GodGPT服务（aiohttp），实现 endpoints.yaml 中的全部接口，认证服务与业务接口共用同一地址
+
+    可配置固定延迟（latency_ms）、流式事件间隔（token_interval_ms）、错误注入比例（error_rate/error_status）
+    和每秒请求上限（rate_limit，超出返回429）。服务运行在独立线程的事件循环中，不占用测试线程。
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0,
+                 token_interval_ms: float = 0.0, reply: Optional[List[str]] = None,
+                 error_rate: float = 0.0, error_status: int = 500, rate_limit: float = 0.0,
+                 seed: Optional[int] = None, reuse_port: bool = False,
+                 catalog: EndpointCatalog = endpoint_catalog):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.token_interval_ms = token_interval_ms
+        self.reply = reply or MOCK_REPLY
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.reuse_port = reuse_port
+        self.catalog = catalog
+        self.requests: Dict[str, int] = {}
+        self.injected_errors = 0
+        self.rate_limited = 0
+
+        self._random = random.Random(seed)
+        self._endpoints = {}
+        # 桶容量至少为1：多进程平分后每个进程的上限可能小于1（如 --rate-limit 2 --workers 4），仍按该速率放行
+        self._burst = max(1.0, rate_limit)
+        self._bucket = self._burst
+        self._bucket_updated = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._start_error: Optional[BaseException] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @classmethod
+    def from_config(cls, config: Config, **kwargs) -> "MockGodGPTServer":
+        """按 config.yaml 中的 mock_server 配置创建"""
+        options = dict(config.get("mock_server", {}) or {})
+        options.update(kwargs)
+        return cls(**options)
+
+    def build_app(self) -> web.Application:
+        """按接口目录注册路由，未声明的请求方式由aiohttp返回405"""
+        app = web.Application(middlewares=[self._fault_middleware], client_max_size=MOCK_MAX_BODY_SIZE)
+        handlers = {
+            "connect-token": self._connect_token,
+            "guest-create-session": self._create_session,
+            "user-create-session": self._create_session,
+            "guest-chat": self._chat,
+            "user-chat": self._chat,
+            "voice-chat": self._chat,
+            "chat-history": self._chat_history,
+            "share-session": self._share_session,
+            "user-profile": self._user_profile,
+            "invitation-redeem": self._invitation_redeem,
+        }
+        for name in self.catalog.names():
+            endpoint = self.catalog.get(name)
+            handler = handlers.get(name)
+            if handler is None:
+                logger.warning(f"模拟服务未实现接口 {name}，请求将返回404")
+                continue
+            app.router.add_route(endpoint.method, endpoint.path, handler, name=name)
+            self._endpoints[name] = endpoint
+        return app
+
+    # ---- 中间件：限流、延迟、错误注入、认证 ----
+
+    def _take_token(self) -> bool:
+        """令牌桶限流，事件循环单线程执行，无需加锁"""
+        now = time.monotonic()
+        self._bucket = min(self._burst, self._bucket + (now - self._bucket_updated) * self.rate_limit)
+        self._bucket_updated = now
+        if self._bucket < 1:
+            return False
+        self._bucket -= 1
+        return True
+
+    @web.middleware
+    async def _fault_middleware(self, request: web.Request, handler):
+        # 未匹配路由（404/405）时 name 为 None，直接交给aiohttp处理
+        name = request.match_info.route.name
+        if name is None:
+            return await handler(request)
+        self.requests[name] = self.requests.get(name, 0) + 1
+        faults = name not in FAULT_EXEMPT_ENDPOINTS
+
+        if faults and self.rate_limit and not self._take_token():
+            self.rate_limited += 1
+            return web.json_response({"code": "42900", "message": "Too Many Requests"}, status=429,
+                                     headers={"Retry-After": "1"})
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        if faults and self.error_rate and self._random.random() < self.error_rate:
+            self.injected_errors += 1
+            return web.json_response({"code": str(self.error_status * 100), "message": "mock injected error"},
+                                     status=self.error_status)
+
+        if self._endpoints[name].auth:
+            authorization = request.headers.get("authorization", "")
+            if not authorization.startswith(f"Bearer {MOCK_TOKEN_PREFIX}"):
+                return web.json_response({"code": "40100", "message": "Unauthorized"}, status=401)
+        return await handler(request)
+
+    # ---- 接口实现 ----
+
+    async def _connect_token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        if not form.get("username") or not form.get("password"):
+            return web.json_response({"error": "invalid_grant"}, status=400)
+        token = f"{MOCK_TOKEN_PREFIX}{uuid.uuid4().hex}"
+        return web.json_response({"access_token": token, "token_type": "Bearer", "expires_in": MOCK_TOKEN_TTL})
+
+    async def _create_session(self, request: web.Request) -> web.Response:
+        await request.read()
+        return _ok(str(uuid.uuid4()))
+
+    async def _chat(self, request: web.Request) -> web.StreamResponse:
+        # 读取并丢弃请求体（语音聊天的请求体可能很大）
+        await request.read()
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+        await response.prepare(request)
+        message_id = str(uuid.uuid4())
+        for i, text in enumerate(self.reply):
+            if i and self.token_interval_ms:
+                await asyncio.sleep(self.token_interval_ms / 1000)
+            event = {"ResponseType": 2, "Response": text, "ErrorCode": 0, "MessageId": message_id, "ChunkIndex": i}
+            await response.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def _chat_history(self, request: web.Request) -> web.Response:
+        try:
+            uuid.UUID(request.match_info["session_id"])
+        except ValueError:
+            return _ok([])
+        return _ok([
+            {"role": "user", "content": "你好"},
+            {"role": "assistant", "content": "".join(self.reply)},
+        ])
+
+    async def _share_session(self, request: web.Request) -> web.Response:
+        await request.read()
+        return _ok({"shareId": uuid.uuid4().hex})
+
+    async def _user_profile(self, request: web.Request) -> web.Response:
+        return _ok({"id": str(uuid.uuid4()), "userName": "mock-user", "email": "mock-user@example.com", "roles": []})
+
+    async def _invitation_redeem(self, request: web.Request) -> web.Response:
+        await request.read()
+        return _ok({"success": True})
+
+    # ---- 生命周期 ----
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._runner = web.AppRunner(self.build_app(), access_log=None)
+            self._loop.run_until_complete(self._runner.setup())
+            site = web.TCPSite(self._runner, self.host, self.port, backlog=1024,
+                               reuse_port=self.reuse_port or None)
+            self._loop.run_until_complete(site.start())
+            self.port = self._runner.addresses[0][1]
+        except BaseException as e:
+            self._start_error = e
+            self._started.set()
+            return
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+    def start(self) -> str:
+        """在后台线程启动服务，返回服务地址"""
+        self._bucket_updated = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="MockGodGPTServer", daemon=True)
+        self._thread.start()
+        self._started.wait()
+        if self._start_error is not None:
+            raise self._start_error
+        logger.info(f"本地模拟GodGPT服务已启动: {self.base_url}")
+        return self.base_url
+
+    def stop(self) -> None:
+        """停止服务并等待后台线程退出"""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+        self._thread = None
+        logger.info(f"本地模拟GodGPT服务已停止，共处理 {sum(self.requests.values())} 个请求")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--mock-server",
+        action="store_true",
+        default=False,
+        help="启动本地模拟GodGPT服务，所有用例和认证请求改为访问该服务"
+    )
+
+
+def pytest_configure(config):
+    # 并行执行时只由主进程启动服务，worker继承主进程设置的环境变量
+    if not config.getoption("--mock-server", False) or hasattr(config, "workerinput"):
+        return
+    server = MockGodGPTServer.from_config(Config())
+    base_url = server.start()
+    config._mock_godgpt_server = server
+    os.environ["API_TEST_BASE_URL"] = base_url
+    os.environ["GODGPT_AUTH_URL"] = base_url
+    os.environ.setdefault("GODGPT_USERNAME", "mock-user")
+    os.environ.setdefault("GODGPT_PASSWORD", "mock-password")
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "_mock_godgpt_server", None)
+    if server is not None:
+        server.stop()
+
+
+def _serve_forever(options: Dict[str, Any]) -> None:
+    server = MockGodGPTServer(**options)
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="本地模拟GodGPT服务")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="每个请求的固定延迟（毫秒）")
+    parser.add_argument("--token-interval-ms", type=float, default=0.0, help="流式聊天事件间隔（毫秒）")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="注入错误的请求比例（0~1）")
+    parser.add_argument("--error-status", type=int, default=500, help="注入错误的状态码")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="每秒请求上限，超出返回429，0表示不限")
+    parser.add_argument("--seed", type=int, default=None, help="错误注入的随机种子")
+    parser.add_argument("--workers", type=int, default=1, help="服务进程数，大于1时通过 SO_REUSEPORT 共享端口")
+    args = parser.parse_args(argv)
+
+    options = {
+        "host": args.host,
+        "port": args.port,
+        "latency_ms": args.latency_ms,
+        "token_interval_ms": args.token_interval_ms,
+        "error_rate": args.error_rate,
+        "error_status": args.error_status,
+        # 每个进程各自限流，总上限平均分配
+        "rate_limit": args.rate_limit / args.workers,
+        "seed": args.seed,
+        "reuse_port": args.workers > 1
+    }
+    if args.workers <= 1:
+        _serve_forever(options)
+        return 0
+
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_serve_forever, args=(options,), daemon=True) for _ in range(args.workers)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+import json
+from typing import Any, Optional
+import requests
+from requests.exceptions import JSONDecodeError as RequestsJSONDecodeError
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时使用标准库json
+    orjson = None
+
+
+# orjson只接受UTF-8，其它编码的响应体仍交给标准库解码
+_UTF8_ENCODINGS = frozenset({"utf-8", "utf8", "ascii", "us-ascii"})
+
+_UNSET = object()
+
+
+def loads(content: bytes, encoding: Optional[str] = None) -> Any:
+    """
+    解码JSON响应体，安装了 orjson 时优先使用
+
+    解码失败统一抛出 requests 的 JSONDecodeError（json.JSONDecodeError 的子类）。
+    """
+    utf8 = encoding is None or encoding.lower().replace("_", "-") in _UTF8_ENCODINGS
+    try:
+        if orjson is not None and utf8:
+            return orjson.loads(content)
+        return json.loads(content.decode(encoding or "utf-8", errors="replace"))
+    except json.JSONDecodeError as e:
+        raise RequestsJSONDecodeError(e.msg, e.doc, e.pos)
+
+
+class ApiResponse(requests.Response):
+    """
+    只解码一次JSON的响应对象
+
+    HttpClient 返回的响应都是 ApiResponse，日志、ApiAssertions 和测试代码多次调用 json() 时
+    共用第一次解码的结果。返回的是同一个对象，修改它会影响之后的断言。
+    """
+
+    _parsed_json = _UNSET
+
+    @classmethod
+    def wrap(cls, response: requests.Response) -> "ApiResponse":
+        """原地把 requests.Response 转换为 ApiResponse，不复制响应体"""
+        response.__class__ = cls
+        return response
+
+    def json(self, **kwargs) -> Any:
+        # 传入自定义解码参数时按原始方式解码，不缓存
+        if kwargs:
+            return super().json(**kwargs)
+        if self._parsed_json is _UNSET:
+            if self.encoding is None:
+                # 未声明编码时沿用 requests 的UTF编码探测
+                self._parsed_json = super().json()
+            else:
+                self._parsed_json = loads(self.content, self.encoding)
+        return self._parsed_json
@@ -0,0 +1,119 @@
+from typing import Dict, List, Optional
+import pytest
+from common.config import Config
+from common.endpoints import EndpointCatalog, endpoint_catalog
+from common.logger import logger
+from common.metrics import LatencyRecorder, global_latency_recorder, global_ttft_recorder
+
+
+# SLO指标的数据来源
+LATENCY = "latency"  # 请求耗时；SSE接口为流读取完成的总耗时
+TTFT = "ttft"        # SSE首token耗时
+
+# 支持的SLO指标: 指标名 -> (数据来源, 百分位)
+SLO_METRICS = {
+    "p50_ms": (LATENCY, 50),
+    "p90_ms": (LATENCY, 90),
+    "p95_ms": (LATENCY, 95),
+    "p99_ms": (LATENCY, 99),
+    "ttft_p50_ms": (TTFT, 50),
+    "ttft_p90_ms": (TTFT, 90),
+    "ttft_p95_ms": (TTFT, 95),
+    "ttft_p99_ms": (TTFT, 99),
+}
+
+# 样本数少于该值的接口不做评估，可由 config.yaml 中的 slo.min_samples 覆盖
+SLO_MIN_SAMPLES = 5
+
+
+class SloResult:
+    """单个接口单项指标的评估结果，actual_ms 为 None 表示样本不足未评估"""
+
+    __slots__ = ("endpoint", "metric", "budget_ms", "actual_ms", "samples")
+
+    def __init__(self, endpoint: str, metric: str, budget_ms: float, actual_ms: Optional[float], samples: int):
+        self.endpoint = endpoint
+        self.metric = metric
+        self.budget_ms = budget_ms
+        self.actual_ms = actual_ms
+        self.samples = samples
+
+    @property
+    def evaluated(self) -> bool:
+        return self.actual_ms is not None
+
+    @property
+    def breached(self) -> bool:
+        return self.evaluated and self.actual_ms > self.budget_ms
+
+    def __str__(self) -> str:
+        if not self.evaluated:
+            return f"{self.endpoint} {self.metric}: 样本不足（{self.samples} 个），未评估"
+        return (f"{self.endpoint} {self.metric}: {self.actual_ms:.1f}ms / 预算 {self.budget_ms:.0f}ms"
+                f"（{self.samples} 个样本）")
+
+
+def evaluate_slos(
+    budgets: Dict[str, Dict[str, float]],
+    latency_recorder: LatencyRecorder = global_latency_recorder,
+    ttft_recorder: LatencyRecorder = global_ttft_recorder,
+    catalog: EndpointCatalog = endpoint_catalog,
+    min_samples: int = SLO_MIN_SAMPLES
+) -> List[SloResult]:
+    """
+    按整个会话汇总的延迟直方图评估各接口的SLO预算
+
+    Args:
+        budgets: {接口名: {指标: 预算毫秒}}，见 Config.get_slos
+        min_samples: 样本数少于该值的指标不评估
+    """
+    recorders = {LATENCY: latency_recorder, TTFT: ttft_recorder}
+    results = []
+    for name, metrics in budgets.items():
+        endpoint = catalog.get(name)
+        for metric, budget_ms in metrics.items():
+            if metric not in SLO_METRICS:
+                raise ValueError(f"不支持的SLO指标: {name}.{metric}，可用指标: {', '.join(SLO_METRICS)}")
+            source, p = SLO_METRICS[metric]
+            histogram = recorders[source].get(endpoint.method, endpoint.metrics_key)
+            samples = histogram.total_count if histogram is not None else 0
+            actual_ms = histogram.value_at_percentile(p) / 1000 if samples and samples >= min_samples else None
+            results.append(SloResult(name, metric, budget_ms, actual_ms, samples))
+    return results
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-slo",
+        action="store_true",
+        default=False,
+        help="会话结束时不评估 config.yaml 中的接口延迟SLO"
+    )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """会话结束时评估延迟SLO，超出预算时将会话标记为失败"""
+    # 并行执行时由主进程合并所有worker的直方图后统一评估
+    if hasattr(session.config, "workerinput") or session.config.getoption("--no-slo", False):
+        return
+    config = Config()
+    budgets = config.get_slos()
+    if not budgets:
+        return
+    min_samples = int((config.get("slo") or {}).get("min_samples", SLO_MIN_SAMPLES))
+    results = evaluate_slos(budgets, min_samples=min_samples)
+    if not any(result.samples for result in results):
+        return
+
+    breached = [result for result in results if result.breached]
+    for result in results:
+        if result.breached:
+            logger.error(f"SLO超出预算 {result}")
+        elif result.evaluated:
+            logger.info(f"SLO达标 {result}")
+        elif result.samples:
+            logger.debug(f"SLO {result}")
+    logger.info(f"SLO评估({config.environment}): {len([r for r in results if r.evaluated])} 项已评估, "
+                f"{len(breached)} 项超出预算")
+    if breached and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
@@ -0,0 +1,171 @@
+import json
+from typing import Any, Callable, Iterable, Iterator, Optional
+import requests
+from common.logger import logger
+from common.metrics import StreamMetrics
+
+
+# SSE流结束标记
+SSE_DONE = "[DONE]"
+
+# 每次从socket读取的字节数，分块传输时按实际到达的数据块返回
+SSE_CHUNK_SIZE = 1024
+
+
+class SSEEvent:
+    """SSE事件"""
+
+    def __init__(self, data: str, event: str = "message", id: Optional[str] = None,
+                 retry: Optional[int] = None):
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    @property
+    def is_done(self) -> bool:
+        """是否为流结束标记"""
+        return self.data.strip() == SSE_DONE
+
+    def json(self, **kwargs) -> Any:
+        """将data字段解析为JSON"""
+        return json.loads(self.data, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<SSEEvent event={self.event!r} id={self.id!r} data={self.data[:50]!r}>"
+
+
+def iter_sse_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """将字节块切分为文本行，兼容 \\n 与 \\r\\n 换行且不会因块边界产生多余空行"""
+    pending = b""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        pending += chunk
+        lines = pending.split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            yield line.decode("utf-8", errors="replace")
+    if pending:
+        if pending.endswith(b"\r"):
+            pending = pending[:-1]
+        yield pending.decode("utf-8", errors="replace")
+
+
+def parse_sse(lines: Iterable[str]) -> Iterator[SSEEvent]:
+    """
+    增量解析SSE文本行，每遇到空行分派一个事件
+
+    支持多行data字段、event/id/retry字段和注释行；流结束时未以空行结尾的事件也会被分派
+    """
+    data_lines = []
+    event_type = ""
+    last_event_id = None
+    retry = None
+
+    for line in lines:
+        if not line:
+            if data_lines:
+                yield SSEEvent("\n".join(data_lines), event_type or "message", last_event_id, retry)
+            data_lines = []
+            event_type = ""
+            retry = None
+            continue
+
+        if line.startswith(":"):
+            continue
+
+        field, sep, value = line.partition(":")
+        if sep and value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            data_lines.append(value)
+        elif field == "event":
+            event_type = value
+        elif field == "id":
+            if "\0" not in value:
+                last_event_id = value
+        elif field == "retry":
+            if value.isdigit():
+                retry = int(value)
+
+    if data_lines:
+        yield SSEEvent("\n".join(data_lines), event_type or "message", last_event_id, retry)
+
+
+class SSEStream:
+    """SSE流式响应，边接收边解析，不缓存完整响应体"""
+
+    def __init__(self, response: requests.Response, chunk_size: int = SSE_CHUNK_SIZE,
+                 stop_on_done: bool = True, metrics: Optional[StreamMetrics] = None,
+                 on_end: Optional[Callable[[StreamMetrics], None]] = None):
+        self.response = response
+        self.chunk_size = chunk_size
+        self.stop_on_done = stop_on_done
+        self.metrics = metrics or StreamMetrics()
+        # 流读取结束时回调，用于汇总耗时指标
+        self.on_end = on_end
+        self.event_count = 0
+        self.bytes_received = 0
+        self.done = False
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @property
+    def headers(self):
+        return self.response.headers
+
+    @property
+    def elapsed(self):
+        return self.response.elapsed
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for chunk in self.response.iter_content(chunk_size=self.chunk_size):
+            if chunk:
+                self.metrics.mark_first_byte()
+            self.bytes_received += len(chunk)
+            yield chunk
+
+    def __iter__(self) -> Iterator[SSEEvent]:
+        try:
+            for event in parse_sse(iter_sse_lines(self._iter_chunks())):
+                if event.is_done:
+                    self.done = True
+                    if self.stop_on_done:
+                        break
+                    continue
+                self.event_count += 1
+                self.metrics.mark_event()
+                yield event
+        finally:
+            self.metrics.mark_end()
+            logger.info(f"SSE流结束，共 {self.event_count} 个事件，{self.bytes_received} 字节")
+            logger.info(f"SSE流耗时指标: {self.metrics.summary()}")
+            if self.on_end is not None:
+                self.on_end(self.metrics)
+                self.on_end = None
+            self.close()
+
+    def iter_json(self) -> Iterator[Any]:
+        """逐个返回可解析为JSON的事件数据，无法解析的片段记录日志后跳过"""
+        for event in self:
+            try:
+                yield event.json()
+            except json.JSONDecodeError as e:
+                logger.warning(f"SSE事件JSON解析失败，跳过此片段: {e}")
+                logger.debug(f"原始数据: {event.data}")
+
+    def close(self) -> None:
+        """关闭底层连接"""
+        self.response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
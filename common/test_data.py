@@ -1,12 +1,50 @@
 import json
 import random
 import string
-from typing import Dict, Any, List
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Callable, Iterator, List, Optional
 from faker import Faker
+from common.config import Config
+from common.data_file import DataFile, DataFileWriter, is_data_file
+from common.data_store import DataStore, create_data_store
+from common.log_sink import xdist_worker_suffix
 from common.logger import logger
 
-# 设置中文locale
-fake = Faker(['zh_CN'])
+# 批量生成时每个字段预先生成的候选值数量
+DATA_POOL_SIZE = 1000
+
+# 批量生成时每批抽样的记录数，每批每个字段一次抽样
+DATA_BATCH_SIZE = 1000
+
+# 聊天提示词模板，{} 处填入词语池中的词
+CHAT_PROMPT_TEMPLATES = (
+    "请介绍一下{}",
+    "{}有哪些常见的问题？",
+    "用简单的话解释{}",
+    "帮我写一段关于{}的文字",
+    "{}和生活有什么关系？",
+    "给我三个学习{}的建议",
+)
+
+
+@lru_cache(maxsize=1)
+def get_faker() -> Faker:
+    """中文Faker实例，首次使用时创建，导入模块时不加载locale数据"""
+    return Faker(['zh_CN'])
+
+
+_MISSING = object()
+
+
+class _LazyFaker:
+    """转发到 get_faker()，保留 fake.xxx() 的用法"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_faker(), name)
+
+
+fake = _LazyFaker()
 
 
 class TestDataGenerator:
@@ -100,59 +138,292 @@ class TestDataGenerator:
         }
 
 
+class ValuePools:
+    """
+    按种子预先生成的字段候选值
+
+    每个字段调用 pool_size 次Faker，之后批量生成的记录都从这些候选值中抽样，不再调用Faker。
+    """
+
+    def __init__(self, seed: int, pool_size: int = DATA_POOL_SIZE):
+        self.seed = seed
+        self.pool_size = pool_size
+        faker = Faker(['zh_CN'])
+        faker.seed_instance(seed)
+
+        def pool(make) -> List[Any]:
+            return [make() for _ in range(pool_size)]
+
+        self.names = pool(faker.name)
+        self.emails = pool(faker.email)
+        self.phones = pool(faker.phone_number)
+        self.addresses = pool(faker.address)
+        self.companies = pool(faker.company)
+        self.jobs = pool(faker.job)
+        self.usernames = pool(faker.user_name)
+        self.passwords = pool(faker.password)
+        self.websites = pool(faker.url)
+        self.bios = pool(lambda: faker.text(max_nb_chars=200))
+        self.titles = pool(faker.sentence)
+        self.bodies = pool(lambda: faker.text(max_nb_chars=500))
+        self.words = pool(faker.word)
+        self.prompts = [
+            CHAT_PROMPT_TEMPLATES[i % len(CHAT_PROMPT_TEMPLATES)].format(word)
+            for i, word in enumerate(self.words)
+        ]
+        logger.debug(f"生成测试数据候选值: 种子 {seed}, 每个字段 {pool_size} 个")
+
+
+@lru_cache(maxsize=8)
+def get_value_pools(seed: int, pool_size: int = DATA_POOL_SIZE) -> ValuePools:
+    """同一种子和大小的候选值每个进程只生成一次"""
+    return ValuePools(seed, pool_size)
+
+
+class BulkDataGenerator:
+    """
+    批量测试数据生成器
+
+    候选值由 seed 决定，抽样随机数由 seed 和 xdist worker 名称决定：相同种子的每次运行生成相同的数据，
+    并行执行时各worker从同一份候选值中抽到不同的记录。生成方法返回生成器，按批抽样，不构建完整列表。
+    未指定 start_id 时 id 接着同一生成器上次调用的编号，多次调用生成的账号不重复。
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        worker: Optional[str] = None,
+        pool_size: int = DATA_POOL_SIZE,
+        batch_size: int = DATA_BATCH_SIZE,
+        run_id: Optional[str] = None
+    ):
+        config = Config()
+        self.seed = int(config.get("test_data_seed", 0)) if seed is None else seed
+        self.worker = xdist_worker_suffix() if worker is None else worker
+        self.run_id = str(config.get("test_data_run_id") or "") if run_id is None else run_id
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.rng = random.Random(f"{self.seed}:{self.worker}")
+        self._next_ids = {"users": 1, "posts": 1}
+        self._id_lock = threading.Lock()
+
+    @property
+    def pools(self) -> ValuePools:
+        return get_value_pools(self.seed, self.pool_size)
+
+    def _batches(self, count: int) -> Iterator[int]:
+        """把 count 拆成每批不超过 batch_size 的数量"""
+        for start in range(0, count, self.batch_size):
+            yield min(self.batch_size, count - start)
+
+    def _reserve_ids(self, kind: str, count: int, start_id: Optional[int]) -> int:
+        """在调用时预留 count 个 id 并返回起始 id，之后未指定 start_id 的调用从预留的编号之后继续"""
+        with self._id_lock:
+            first = self._next_ids[kind] if start_id is None else start_id
+            self._next_ids[kind] = max(self._next_ids[kind], first + max(count, 0))
+        return first
+
+    def users(self, count: int, start_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        逐条生成用户数据，字段与 TestDataGenerator.random_user_data 相同，另带从 start_id 开始的 id
+
+        username 和 email 的本地部分加上 id、worker和运行标识后缀（如 john_42_gw1_1018093000、
+        john_42_gw1_1018093000@example.com），同一次执行中各worker、各次调用生成的账号互不重复，
+        设置了运行标识时不同运行之间也不重复。
+        """
+        next_id = self._reserve_ids("users", count, start_id)
+        return self._iter_users(count, next_id)
+
+    def _iter_users(self, count: int, next_id: int) -> Iterator[Dict[str, Any]]:
+        pools, choices = self.pools, self.rng.choices
+        suffix = "".join(f"_{part}" for part in (self.worker, self.run_id) if part)
+        for size in self._batches(count):
+            columns = zip(
+                choices(pools.names, k=size), choices(pools.emails, k=size), choices(pools.phones, k=size),
+                choices(pools.addresses, k=size), choices(pools.companies, k=size), choices(pools.jobs, k=size),
+                choices(pools.usernames, k=size), choices(pools.passwords, k=size),
+                choices(pools.websites, k=size), choices(pools.bios, k=size)
+            )
+            for name, email, phone, address, company, job, username, password, website, bio in columns:
+                unique = f"_{next_id}{suffix}"
+                local, _, domain = email.partition("@")
+                yield {
+                    "name": name, "email": f"{local}{unique}@{domain}", "phone": phone, "address": address,
+                    "company": company, "job": job, "username": username + unique, "password": password,
+                    "website": website, "bio": bio,
+                    "id": next_id
+                }
+                next_id += 1
+
+    def posts(self, count: int, start_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """逐条生成文章数据，字段与 TestDataGenerator.random_post_data 相同，另带从 start_id 开始的 id"""
+        next_id = self._reserve_ids("posts", count, start_id)
+        return self._iter_posts(count, next_id)
+
+    def _iter_posts(self, count: int, next_id: int) -> Iterator[Dict[str, Any]]:
+        pools, choices = self.pools, self.rng.choices
+        user_ids, tag_counts = range(1, 11), range(1, 6)
+        for size in self._batches(count):
+            counts = choices(tag_counts, k=size)
+            tags = choices(pools.words, k=sum(counts))
+            offset = 0
+            columns = zip(choices(pools.titles, k=size), choices(pools.bodies, k=size),
+                          choices(user_ids, k=size), counts, choices(pools.words, k=size))
+            for title, body, user_id, tag_count, category in columns:
+                yield {
+                    "title": title, "body": body, "userId": user_id,
+                    "tags": tags[offset:offset + tag_count], "category": category, "id": next_id
+                }
+                offset += tag_count
+                next_id += 1
+
+    def chat_prompts(self, count: int) -> Iterator[str]:
+        """逐条生成聊天提示词，用作聊天请求的 content"""
+        for size in self._batches(count):
+            yield from self.rng.choices(self.pools.prompts, k=size)
+
+
 class DataManager:
-    """测试数据管理器"""
+    """
+    测试数据管理器
+
+    save_test_data / get_test_data 的数据保存在 store 中。默认按配置 test_data_store 使用SQLite数据库文件，
+    多线程和并行执行的各个worker共享同一份数据；配置为空时使用进程内存储。
+    """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, store: Optional[DataStore] = None):
         self.generator = TestDataGenerator()
-        self._test_data = {}
+        self._seed = seed
+        self._bulk: Optional[BulkDataGenerator] = None
+        self.store = create_data_store(Config().get("test_data_store")) if store is None else store
+        self._data_file: Optional[DataFile] = None
+        # 从数据文件加载的键只缓存在本进程，不写入共享存储
+        self._file_values: Dict[str, Any] = {}
+        self._file_lock = threading.Lock()
+
+    @property
+    def bulk(self) -> BulkDataGenerator:
+        """批量生成器，首次使用时按配置的种子和当前xdist worker创建"""
+        if self._bulk is None:
+            self._bulk = BulkDataGenerator(self._seed)
+        return self._bulk
+
+    def iter_user_data(self, count: int, start_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """逐条生成用户测试数据，适合压测场景的大批量数据，未指定 start_id 时接着上次生成的 id"""
+        return self.bulk.users(count, start_id)
+
+    def iter_post_data(self, count: int, start_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """逐条生成文章测试数据，适合压测场景的大批量数据"""
+        return self.bulk.posts(count, start_id)
+
+    def iter_chat_prompts(self, count: int) -> Iterator[str]:
+        """逐条生成聊天提示词"""
+        return self.bulk.chat_prompts(count)
     
     def generate_user_data(self, count: int = 1) -> List[Dict[str, Any]]:
         """生成用户测试数据"""
-        users = []
-        for i in range(count):
-            user_data = self.generator.random_user_data()
-            user_data['id'] = i + 1
-            users.append(user_data)
-        
+        users = list(self.iter_user_data(count))
         logger.info(f"生成了 {count} 条用户测试数据")
         return users
     
     def generate_post_data(self, count: int = 1) -> List[Dict[str, Any]]:
         """生成文章测试数据"""
-        posts = []
-        for i in range(count):
-            post_data = self.generator.random_post_data()
-            post_data['id'] = i + 1
-            posts.append(post_data)
-        
+        posts = list(self.iter_post_data(count))
         logger.info(f"生成了 {count} 条文章测试数据")
         return posts
     
-    def save_test_data(self, key: str, data: Any) -> None:
-        """保存测试数据"""
-        self._test_data[key] = data
+    def save_test_data(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """保存测试数据，ttl 为有效秒数，过期后视为不存在；未指定时保留到下次测试会话开始"""
+        self.store.set(key, data, ttl)
         logger.info(f"保存测试数据: {key}")
     
     def get_test_data(self, key: str) -> Any:
-        """获取测试数据"""
-        return self._test_data.get(key)
+        """获取测试数据，导入的JSONL数据文件中的键在首次获取时加载"""
+        value = self.store.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if self._data_file is not None and key in self._data_file:
+            with self._file_lock:
+                if key not in self._file_values:
+                    self._file_values[key] = self._data_file.load(key)
+                return self._file_values[key]
+        return None
+
+    def get_or_create_test_data(self, key: str, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        获取测试数据，不存在或已过期时调用 factory 创建并保存
+
+        适合会话ID等需要请求服务端创建的数据：使用共享存储时整个并行执行中只创建一次，
+        其他线程和worker等待创建完成后直接使用。factory 抛出异常时不保存。
+        """
+        return self.store.get_or_create(key, factory, ttl)
+
+    def delete_test_data(self, key: str) -> None:
+        """删除测试数据，如服务端对象已失效时"""
+        self.store.delete(key)
+
+    def iter_test_data(self, key: str) -> Iterator[Any]:
+        """逐个读取列表数据的元素，未加载的键直接从数据文件流式读取，不加载整个列表"""
+        value = self.store.get(key, _MISSING)
+        if value is _MISSING and key not in self._file_values:
+            if self._data_file is not None and key in self._data_file:
+                return self._data_file.iter_items(key)
+        if value is _MISSING:
+            value = self._file_values.get(key)
+        return iter(value or ())
+
+    def test_data_keys(self) -> List[str]:
+        """数据文件中和已保存的所有键"""
+        file_keys = self._data_file.keys() if self._data_file is not None else []
+        return list(dict.fromkeys([*file_keys, *self.store.keys()]))
     
     def clear_test_data(self) -> None:
-        """清空测试数据"""
-        self._test_data.clear()
+        """清空测试数据，使用共享存储时所有worker的数据都被清空"""
+        self.store.clear()
+        self._data_file = None
+        self._file_values = {}
         logger.info("清空所有测试数据")
     
-    def export_test_data(self, file_path: str) -> None:
-        """导出测试数据到文件"""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(self._test_data, f, ensure_ascii=False, indent=2)
+    def export_test_data(self, file_path: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        导出测试数据到文件
+
+        文件名以 .jsonl 或 .jsonl.gz 结尾时流式写入JSONL数据文件：列表分段写入，数据文件中尚未加载的键
+        直接从原文件转存；data 中的值可以是生成器（如 iter_user_data），边生成边写入。
+        其他文件名整体写成JSON。data 默认为保存的所有测试数据。
+        """
+        if is_data_file(file_path):
+            with DataFileWriter(file_path) as writer:
+                if data is not None:
+                    writer.write_all(data)
+                else:
+                    for key in self.test_data_keys():
+                        value = self.store.get(key, _MISSING)
+                        if value is _MISSING:
+                            value = self._file_values.get(key, _MISSING)
+                        writer.write(key, self._data_file.stream(key) if value is _MISSING else value)
+        else:
+            data = {key: self.get_test_data(key) for key in self.test_data_keys()} if data is None else data
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
         logger.info(f"测试数据已导出到: {file_path}")
     
     def import_test_data(self, file_path: str) -> None:
-        """从文件导入测试数据"""
+        """
+        从文件导入测试数据
+
+        JSONL数据文件只读取索引，各个键在 get_test_data / iter_test_data 时按需读取，
+        并行执行的每个worker只加载自己用到的键；已保存的同名键优先。
+        JSON文件的所有键保存到 store，覆盖同名的键。
+        """
+        if is_data_file(file_path):
+            self._data_file = DataFile(file_path)
+            self._file_values = {}
+            logger.info(f"测试数据文件已打开: {file_path}，共 {len(self._data_file.keys())} 个键，按需加载")
+            return
         with open(file_path, 'r', encoding='utf-8') as f:
-            self._test_data = json.load(f)
+            for key, value in json.load(f).items():
+                self.store.set(key, value)
         logger.info(f"测试数据已从文件导入: {file_path}")
 
 
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileTokenCache:
+    """
+    跨进程共享的认证token文件缓存
+
+    pytest-xdist 的各个worker通过同一个缓存文件共享token：刷新前持有文件锁，
+    其他进程在锁上等待并读取刷新后的token，整个并行执行只登录一次。
+    缓存文件通过临时文件+重命名原子写入，读取时无需加锁。
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+
+    @staticmethod
+    def cache_key(auth_url: str, username: str) -> str:
+        """按认证地址和用户名区分缓存条目，不在文件中保存明文用户名"""
+        return hashlib.sha256(f"{auth_url}|{username}".encode("utf-8")).hexdigest()[:32]
+
+    def _read_all(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def load(self, key: str, min_valid_seconds: float = 0) -> Optional[Tuple[str, float]]:
+        """读取未过期的token，返回 (token, 过期时间戳)；剩余有效期不足 min_valid_seconds 时返回None"""
+        entry = self._read_all().get(key)
+        if not entry or time.time() >= entry["expires_at"] - min_valid_seconds:
+            return None
+        return entry["token"], entry["expires_at"]
+
+    def _write_all(self, entries: Dict[str, Dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def store(self, key: str, token: str, expires_at: float) -> None:
+        """写入token并清理已过期的条目，调用方需持有 lock()"""
+        entries = {k: v for k, v in self._read_all().items() if v["expires_at"] > time.time()}
+        entries[key] = {"token": token, "expires_at": expires_at}
+        self._write_all(entries)
+
+    def clear(self, key: str) -> None:
+        """删除指定缓存条目"""
+        with self.lock():
+            entries = self._read_all()
+            if entries.pop(key, None) is not None:
+                self._write_all(entries)
+
+    def lock(self):
+        """跨进程排他锁"""
+        return file_lock(self.lock_path)
+
+
+@contextmanager
+def file_lock(lock_path: Path):
+    """
+    跨进程排他文件锁
+
+    锁属于每次打开的文件，同一进程的不同线程各自打开时也会互相等待；不可重入。
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
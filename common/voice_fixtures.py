@@ -0,0 +1,247 @@
+import base64
+import io
+import json
+import math
+import mmap
+import os
+import tempfile
+import threading
+import wave
+from array import array
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import yaml
+from common.config import Config
+from common.logger import logger
+
+
+# 语音素材清单文件名，位于素材目录下
+VOICE_MANIFEST = "voices.yaml"
+
+# 合成音频参数：16kHz 单声道 16位PCM（WAV），每秒 32000 字节
+SYNTHETIC_SAMPLE_RATE = 16000
+SYNTHETIC_FREQUENCY = 440
+SYNTHETIC_AMPLITUDE = 8000
+SYNTHETIC_MIME = "audio/wav"
+
+# 流式请求体每次编码的最大音频字节数（3的倍数，编码后为4的倍数）
+BASE64_CHUNK_SIZE = 48 * 1024
+
+
+class VoiceFixture:
+    """
+    磁盘上的语音素材，按需内存映射
+
+    data 为只读内存映射，不把音频读入进程内存；base64 编码结果每个进程只计算一次。
+    """
+
+    def __init__(self, name: str, path: Union[str, Path], duration_seconds: float, mime: str = ""):
+        self.name = name
+        self.path = Path(path)
+        self.duration_seconds = duration_seconds
+        self.mime = mime
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size
+
+    @property
+    def data(self) -> Union[mmap.mmap, bytes]:
+        """音频内容的只读内存映射"""
+        if self._mmap is None:
+            with self._lock:
+                if self._mmap is None:
+                    if self.size == 0:
+                        return b""
+                    self._file = open(self.path, 'rb')
+                    self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    @cached_property
+    def base64(self) -> str:
+        """base64编码后的音频，首次访问时编码并缓存"""
+        return base64.b64encode(self.data).decode("ascii")
+
+    def request_data(self, content_field: str = "content", **fields) -> Dict[str, Any]:
+        """
+        语音聊天请求数据，适合小素材直接以 json= 发送
+
+        content_field 为缓存的base64，voiceDurationSeconds 默认取素材时长。
+        """
+        fields.setdefault("voiceDurationSeconds", self.duration_seconds)
+        return {content_field: self.base64, **fields}
+
+    def request_body(self, content_field: str = "content", **fields) -> "VoiceRequestBody":
+        """语音聊天流式请求体，适合大素材以 data= 发送，不在内存中构建完整JSON"""
+        fields.setdefault("voiceDurationSeconds", self.duration_seconds)
+        return VoiceRequestBody(self.data, content_field=content_field, **fields)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._file.close()
+                self._mmap = self._file = None
+
+    def __repr__(self) -> str:
+        return f"VoiceFixture({self.name}: {self.path.name}, {self.duration_seconds}s)"
+
+
+class VoiceRequestBody(io.RawIOBase):
+    """
+    语音聊天JSON请求体，content 字段的base64按读取位置从音频增量编码
+
+    与 json.dumps(fixture.request_data(...)) 的结果逐字节一致。实现了 __len__、seek 和 tell，
+    requests 据此设置 Content-Length，重试和重定向时可以回到开头重新发送。
+    """
+
+    def __init__(self, audio: Union[mmap.mmap, bytes], content_field: str = "content", **fields):
+        self._audio = audio
+        # 用占位符序列化其余字段，得到base64前后的JSON片段
+        marker = "\x00voice\x00"
+        text = json.dumps({content_field: marker, **fields}, ensure_ascii=False)
+        head, tail = text.split(json.dumps(marker), 1)
+        self._prefix = f'{head}"'.encode("utf-8")
+        self._suffix = f'"{tail}'.encode("utf-8")
+        self._encoded_length = 4 * math.ceil(len(audio) / 3)
+        self._length = len(self._prefix) + self._encoded_length + len(self._suffix)
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._length}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def _encoded(self, start: int, size: int) -> bytes:
+        """base64片段中 [start, start + size) 的部分"""
+        size = min(size, BASE64_CHUNK_SIZE // 3 * 4)
+        first = start // 4 * 3
+        last = min(len(self._audio), math.ceil((start + size) / 4) * 3)
+        chunk = base64.b64encode(self._audio[first:last])
+        skip = start - first // 3 * 4
+        return chunk[skip:skip + size]
+
+    def readinto(self, buffer) -> int:
+        pos, size = self._pos, len(buffer)
+        prefix_end = len(self._prefix)
+        encoded_end = prefix_end + self._encoded_length
+        if pos < prefix_end:
+            chunk = self._prefix[pos:pos + size]
+        elif pos < encoded_end:
+            chunk = self._encoded(pos - prefix_end, min(size, encoded_end - pos))
+        else:
+            chunk = self._suffix[pos - encoded_end:pos - encoded_end + size]
+        buffer[:len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+    def __repr__(self) -> str:
+        return f"VoiceRequestBody(<{self._length} 字节>)"
+
+
+class VoiceFixtureManager:
+    """
+    语音素材管理器
+
+    素材目录下的 voices.yaml 声明素材文件和时长；合成音频写入缓存目录，相同参数只生成一次。
+    """
+
+    def __init__(self, fixture_dir: Optional[str] = None, cache_dir: Optional[str] = None):
+        self.fixture_dir = Path(fixture_dir or Config().get("voice_fixture_dir", "./data/voice"))
+        if not self.fixture_dir.is_absolute() and not self.fixture_dir.exists():
+            # 从其他目录运行时回退到项目根目录
+            self.fixture_dir = Path(__file__).resolve().parent.parent / self.fixture_dir
+        self.cache_dir = Path(cache_dir or Path(tempfile.gettempdir()) / "api_test_voice")
+        self._fixtures: Dict[str, VoiceFixture] = {}
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        if self._manifest is None:
+            manifest_file = self.fixture_dir / VOICE_MANIFEST
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                self._manifest = yaml.safe_load(f) or {}
+        return self._manifest
+
+    def get(self, name: str) -> VoiceFixture:
+        """按名称获取 voices.yaml 中声明的素材"""
+        with self._lock:
+            fixture = self._fixtures.get(name)
+            if fixture is None:
+                if name not in self.manifest:
+                    raise ValueError(f"未知语音素材: {name}，可用素材: {', '.join(self.manifest)}")
+                spec = self.manifest[name]
+                fixture = self._fixtures[name] = VoiceFixture(
+                    name, self.fixture_dir / spec["file"], float(spec["duration_seconds"]), spec.get("mime", "")
+                )
+            return fixture
+
+    def synthetic(
+        self,
+        duration_seconds: float,
+        sample_rate: int = SYNTHETIC_SAMPLE_RATE,
+        frequency: int = SYNTHETIC_FREQUENCY
+    ) -> VoiceFixture:
+        """
+        生成指定时长的合成音频（正弦波WAV），用于请求体大小的伸缩测试
+
+        大小约为 44 + duration_seconds * sample_rate * 2 字节。
+        """
+        name = f"synthetic_{round(duration_seconds * 1000)}ms_{sample_rate}hz_{frequency}"
+        with self._lock:
+            fixture = self._fixtures.get(name)
+            if fixture is None:
+                path = self.cache_dir / f"{name}.wav"
+                if not path.exists():
+                    _write_sine_wav(path, duration_seconds, sample_rate, frequency)
+                fixture = self._fixtures[name] = VoiceFixture(name, path, duration_seconds, SYNTHETIC_MIME)
+            return fixture
+
+    def close(self) -> None:
+        """关闭所有素材的内存映射"""
+        with self._lock:
+            for fixture in self._fixtures.values():
+                fixture.close()
+            self._fixtures.clear()
+
+
+def _write_sine_wav(path: Path, duration_seconds: float, sample_rate: int, frequency: int) -> None:
+    """按秒重复写入同一段正弦波，整数频率在一秒内正好是整数个周期，拼接处连续"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    second = array("h", (
+        int(SYNTHETIC_AMPLITUDE * math.sin(2 * math.pi * frequency * i / sample_rate)) for i in range(sample_rate)
+    )).tobytes()
+    total_frames = round(duration_seconds * sample_rate)
+    # 先写临时文件再改名，多个进程同时生成时不会读到写了一半的文件
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with wave.open(str(tmp_path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        full_seconds, remainder = divmod(total_frames, sample_rate)
+        for _ in range(full_seconds):
+            wav.writeframesraw(second)
+        wav.writeframes(second[:remainder * 2])
+    os.replace(tmp_path, path)
+    logger.debug(f"生成合成音频 {path}: {duration_seconds}秒, {path.stat().st_size} 字节")
+
+
+# 全局语音素材管理器
+voice_fixtures = VoiceFixtureManager()
@@ -1,6 +1,8 @@
+import asyncio
 import pytest
 import os
 import sys
+import time
 from pathlib import Path
 
 # 添加项目根目录到Python路径
@@ -9,6 +11,17 @@ sys.path.insert(0, str(project_root))
 
 from common.config import Config
 from common.logger import logger
+from common.async_http_client import AsyncHttpClient
+from common.metrics import LatencyRecorder, global_latency_recorder, global_ttft_recorder
+from common.client_registry import http_client_registry as _http_client_registry
+from common.test_data import test_data_manager
+
+# JSONL数据驱动用例插件、本地模拟服务插件、接口延迟SLO评估插件
+pytest_plugins = ["common.jsonl_cases", "common.mock_server", "common.slo"]
+
+# pytest-xdist worker 回传延迟直方图、首token耗时直方图使用的键
+LATENCY_WORKEROUTPUT_KEY = "latency_histograms"
+TTFT_WORKEROUTPUT_KEY = "ttft_histograms"
 
 @pytest.fixture(scope="session")
 def config():
@@ -20,6 +33,23 @@ def base_url(config):
     """基础URL fixture"""
     return config.get("base_url", "https://jsonplaceholder.typicode.com")
 
+@pytest.fixture(scope="session")
+def http_client_registry():
+    """按主机共享的HTTP客户端注册表fixture，所有测试复用连接池"""
+    return _http_client_registry
+
+@pytest.fixture(scope="function")
+def async_http_client(config):
+    """异步HTTP客户端fixture，通过 client.run(coro) 在用例中执行并发请求"""
+    client = AsyncHttpClient(
+        config.get("base_url", ""),
+        timeout=int(config.get("timeout", 30)),
+        retry_times=int(config.get("retry_times", 3))
+    )
+    yield client
+    # 用例自行 asyncio.run 而未调用 client.run 时会话仍未关闭，在新的事件循环中关闭连接
+    asyncio.run(client.close())
+
 @pytest.fixture(scope="function")
 def test_data():
     """测试数据fixture"""
@@ -30,6 +60,7 @@ def setup_test(request):
     """每个测试用例的自动设置"""
     logger.info(f"开始执行测试: {request.node.name}")
     yield
+    _http_client_registry.clear_cookies()
     logger.info(f"测试完成: {request.node.name}")
 
 @pytest.fixture(scope="session")
@@ -40,4 +71,61 @@ def allure_environment_info():
         "pytest版本": pytest.__version__,
         "项目路径": str(project_root),
         "测试环境": os.getenv("TEST_ENV", "dev")
-    } 
\ No newline at end of file
+    }
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """并行执行时合并各worker回传的延迟直方图"""
+    workeroutput = getattr(node, "workeroutput", {})
+    histograms = workeroutput.get(LATENCY_WORKEROUTPUT_KEY)
+    if histograms:
+        global_latency_recorder.merge(LatencyRecorder.from_dict(histograms))
+    ttft_histograms = workeroutput.get(TTFT_WORKEROUTPUT_KEY)
+    if ttft_histograms:
+        global_ttft_recorder.merge(LatencyRecorder.from_dict(ttft_histograms))
+
+def pytest_configure(config):
+    """访问真实服务时主进程按启动时间生成测试数据运行标识，worker继承环境变量，使每次运行注册的账号互不重复"""
+    if hasattr(config, "workerinput") or config.getoption("--mock-server", False):
+        return
+    if not Config().get("test_data_run_id"):
+        os.environ["API_TEST_TEST_DATA_RUN_ID"] = time.strftime("%m%d%H%M%S")
+
+def pytest_sessionstart(session):
+    """主进程在会话开始时清除共享测试数据中已过期和未设置ttl的数据，设置了ttl的会话ID等跨会话复用"""
+    if hasattr(session.config, "workerinput"):
+        return
+    purged = test_data_manager.store.purge(untimed=True)
+    if purged:
+        logger.info(f"清除上次会话的共享测试数据 {purged} 条")
+
+def pytest_sessionfinish(session, exitstatus):
+    """会话结束时导出延迟直方图报告，并关闭共享连接池"""
+    for host, stats in _http_client_registry.connection_stats().items():
+        logger.info(f"连接池统计 {host}: 新建连接 {stats['opened']} 次, 复用 {stats['reused']} 次, 请求 {stats['requests']} 次")
+    _http_client_registry.close_all()
+    
+    cassette = _http_client_registry.cassette
+    if cassette is not None:
+        stats = cassette.stats()
+        logger.info(f"HTTP录制回放({cassette.mode}): 录制 {stats['recorded']} 次, 回放 {stats['replayed']} 次, 未命中 {stats['misses']} 次")
+        cassette.close()
+    
+    # 只在本次会话用到认证时输出token刷新统计
+    auth_module = sys.modules.get("common.auth_manager")
+    if auth_module is not None and auth_module.auth_manager.initialized:
+        stats = auth_module.auth_manager.get_stats()
+        logger.info(f"认证token统计: 刷新 {stats['refresh_count']} 次(后台 {stats['background_refreshes']} 次, 失败 {stats['refresh_failures']} 次), "
+                    f"等待刷新锁 {stats['wait_count']} 次, 平均 {stats['wait_time_ms_avg']:.1f}ms, 最长 {stats['wait_time_ms_max']:.1f}ms")
+    
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        # xdist worker 只回传数据，由主进程合并后统一导出
+        workeroutput[LATENCY_WORKEROUTPUT_KEY] = global_latency_recorder.to_dict()
+        workeroutput[TTFT_WORKEROUTPUT_KEY] = global_ttft_recorder.to_dict()
+        return
+    
+    if global_latency_recorder.histograms:
+        report_file = Config().get("latency_report_file")
+        global_latency_recorder.export_json(report_file)
+        logger.info(f"延迟直方图报告已导出到: {report_file}")
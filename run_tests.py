@@ -47,7 +47,7 @@ def install_dependencies():
     return run_command(f"{venv_activate} && pip install -r requirements.txt", "安装Python依赖")
 
 
-def run_tests(markers=None, parallel=False, report=True):
+def run_tests(markers=None, parallel=False, report=True, mock_server=False):
     """运行测试"""
     print("\n🧪 运行测试...")
     
@@ -62,6 +62,10 @@ def run_tests(markers=None, parallel=False, report=True):
     if parallel:
         cmd += " -n auto"
     
+    # 访问本地模拟服务
+    if mock_server:
+        cmd += " --mock-server"
+    
     # 添加Allure报告
     if report:
         cmd += " --alluredir=./allure-results --clean-alluredir"
@@ -78,6 +82,61 @@ def run_tests(markers=None, parallel=False, report=True):
     return success
 
 
+def run_load(scenario_name, rps, duration, concurrency, output=None, max_error_rate=None, mock_server=False):
+    """运行压测模式"""
+    print("\n🔥 运行压测...")
+    
+    from common.config import Config
+    from common.load_generator import LoadGenerator, SCENARIOS
+    
+    config = Config()
+    scenario = SCENARIOS[scenario_name]
+    base_url = config.get("base_url")
+    
+    if mock_server:
+        from common.mock_server import MockGodGPTServer
+        base_url = MockGodGPTServer.from_config(config).start()
+        os.environ["GODGPT_AUTH_URL"] = base_url
+        os.environ.setdefault("GODGPT_USERNAME", "mock-user")
+        os.environ.setdefault("GODGPT_PASSWORD", "mock-password")
+        print(f"🧪 使用本地模拟服务: {base_url}")
+    
+    auth_token = None
+    if scenario.requires_auth:
+        from common.auth_manager import auth_manager
+        auth_token = auth_manager.get_auth_token()
+        if not auth_token:
+            print("❌ 无法获取认证token，压测终止")
+            return False
+    
+    generator = LoadGenerator(
+        scenario,
+        base_url,
+        rps=rps,
+        duration=duration,
+        concurrency=concurrency,
+        timeout=int(config.get("timeout", 30)),
+        auth_token=auth_token
+    )
+    result = generator.run()
+    
+    print(f"\n{'='*50}")
+    print(result.format_report())
+    print(f"{'='*50}")
+    
+    if output:
+        import json
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(result.summary(), f, ensure_ascii=False, indent=2)
+        print(f"📄 压测结果已保存到: {output}")
+    
+    if max_error_rate is not None and result.error_rate > max_error_rate:
+        print(f"❌ 错误率 {result.error_rate:.2%} 超过阈值 {max_error_rate:.2%}")
+        return False
+    return True
+
+
 def open_report():
     """打开Allure报告"""
     print("\n🌐 打开Allure报告...")
@@ -124,12 +183,86 @@ def main():
         default="dev",
         help="测试环境 (默认: dev)"
     )
+    parser.add_argument(
+        "--load",
+        metavar="SCENARIO",
+        help="压测模式，指定压测场景 (使用 --list-scenarios 查看可选场景)"
+    )
+    parser.add_argument(
+        "--list-scenarios",
+        action="store_true",
+        help="列出可用的压测场景"
+    )
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=10.0,
+        help="压测目标每秒请求数 (默认: 10)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=100,
+        help="压测最大在途请求数 (默认: 100)"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=60.0,
+        help="压测持续时间，单位秒 (默认: 60)"
+    )
+    parser.add_argument(
+        "--load-output",
+        default="./load-results/load_result.json",
+        help="压测结果JSON输出路径 (默认: ./load-results/load_result.json)"
+    )
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=None,
+        help="压测允许的最大错误率 (0-1)，超过时以非零状态退出"
+    )
+    parser.add_argument(
+        "--mock-server",
+        action="store_true",
+        help="启动本地模拟GodGPT服务，测试和压测不访问线上接口"
+    )
     
     args = parser.parse_args()
     
     # 设置环境变量
     os.environ["TEST_ENV"] = args.env
     
+    # 压测模式
+    if args.list_scenarios or args.load:
+        from common.load_generator import SCENARIOS
+        if args.list_scenarios:
+            for name, scenario in SCENARIOS.items():
+                print(f"{name:<22} {scenario.method:<5} {scenario.endpoint}")
+            return
+        if args.load not in SCENARIOS:
+            print(f"❌ 未知的压测场景: {args.load}，可选: {', '.join(SCENARIOS)}")
+            sys.exit(1)
+        if args.rps <= 0:
+            parser.error(f"--rps 必须大于0: {args.rps}")
+        if args.duration <= 0:
+            parser.error(f"--duration 必须大于0: {args.duration}")
+        if args.concurrency < 1:
+            parser.error(f"--concurrency 至少为1: {args.concurrency}")
+        
+        print("🚀 API自动化测试框架 - 压测模式")
+        print(f"测试环境: {args.env}")
+        print(f"压测场景: {args.load}")
+        print(f"目标RPS: {args.rps}  并发上限: {args.concurrency}  持续时间: {args.duration}秒")
+        
+        if not run_load(args.load, args.rps, args.duration, args.concurrency,
+                        output=args.load_output, max_error_rate=args.max_error_rate,
+                        mock_server=args.mock_server):
+            print("\n💥 压测未通过！")
+            sys.exit(1)
+        print("\n🎉 压测完成！")
+        return
+    
     print("🚀 API自动化测试框架")
     print(f"测试环境: {args.env}")
     print(f"测试标记: {args.markers}")
@@ -150,7 +283,8 @@ def main():
     success = run_tests(
         markers=args.markers,
         parallel=args.parallel,
-        report=not args.no_report
+        report=not args.no_report,
+        mock_server=args.mock_server
     )
     
     if success:
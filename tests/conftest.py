@@ -0,0 +1,58 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+
+class TokenStubHandler(BaseHTTPRequestHandler):
+    """模拟 /connect/token 的桩服务，记录收到的认证请求数"""
+
+    requests = 0
+    delay = 0.2
+    expires_in = 3600
+    status = 200
+    lock = threading.Lock()
+
+    @classmethod
+    def reset(cls):
+        cls.requests = 0
+        cls.delay = 0.2
+        cls.expires_in = 3600
+        cls.status = 200
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with type(self).lock:
+            type(self).requests += 1
+            index = type(self).requests
+        time.sleep(type(self).delay)
+        if type(self).status == 200:
+            body = json.dumps({"access_token": f"token-{index}", "expires_in": type(self).expires_in}).encode()
+        else:
+            body = json.dumps({"error": "rate_limited"}).encode()
+        self.send_response(type(self).status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="session")
+def token_server():
+    """本地认证桩服务地址，整个会话共用一个"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TokenStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def token_stub(token_server):
+    """认证桩服务的处理类，每个测试开始时重置请求计数和返回的有效期"""
+    TokenStubHandler.reset()
+    return TokenStubHandler
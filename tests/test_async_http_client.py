@@ -0,0 +1,158 @@
+import asyncio
+import time
+import pytest
+import allure
+from aiohttp import web
+from loguru import logger
+from common.async_http_client import AsyncHttpClient, AsyncRetryError
+from common.assertions import ApiAssertions
+
+
+STUB_LATENCY = 0.2
+
+
+async def _start_stub_server(handlers):
+    """启动本地桩服务，返回 (runner, base_url)"""
+    app = web.Application()
+    for method, path, handler in handlers:
+        app.router.add_route(method, path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _slow_create_session(request):
+    await asyncio.sleep(STUB_LATENCY)
+    body = await request.json()
+    return web.json_response({"code": "20000", "data": "stub-session-id", "guider": body.get("guider")})
+
+
+@allure.epic("测试框架")
+@allure.feature("异步HTTP客户端")
+@pytest.mark.unit
+class TestAsyncHttpClient:
+    """AsyncHttpClient 本地桩服务测试类"""
+
+    @allure.story("并发请求耗时")
+    def test_concurrent_requests_take_max_latency(self, async_http_client):
+        """测试N个并发请求总耗时接近单次延迟而不是延迟之和"""
+        request_count = 50
+        endpoint = "/godgptprod-client/api/godgpt/guest/create-session"
+
+        async def scenario():
+            runner, base_url = await _start_stub_server([("POST", endpoint, _slow_create_session)])
+            try:
+                async_http_client.base_url = base_url
+                start_time = time.perf_counter()
+                responses = await async_http_client.gather(
+                    async_http_client.post(endpoint, json={"guider": ""}) for _ in range(request_count)
+                )
+                return responses, time.perf_counter() - start_time
+            finally:
+                await async_http_client.close()
+                await runner.cleanup()
+
+        with allure.step(f"发送{request_count}个并发请求"):
+            responses, elapsed = async_http_client.run(scenario())
+
+        with allure.step("验证所有请求成功"):
+            assert len(responses) == request_count
+            for response in responses:
+                ApiAssertions.assert_status_code(response, 200)
+                ApiAssertions.assert_json_contains(response, "data", "stub-session-id")
+
+        with allure.step("验证总耗时接近最大延迟"):
+            assert elapsed < STUB_LATENCY * 5, \
+                f"并发请求耗时 {elapsed:.2f}秒，串行耗时约为 {STUB_LATENCY * request_count:.2f}秒"
+
+    @allure.story("并发数限制")
+    def test_gather_respects_concurrency_limit(self):
+        """测试gather的concurrency参数限制在途请求数量"""
+        in_flight = {"current": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.05)
+            in_flight["current"] -= 1
+            return web.json_response({"ok": True})
+
+        async def scenario():
+            runner, base_url = await _start_stub_server([("GET", "/ping", handler)])
+            try:
+                async with AsyncHttpClient(base_url) as client:
+                    return await client.gather((client.get("/ping") for _ in range(20)), concurrency=4)
+            finally:
+                await runner.cleanup()
+
+        responses = asyncio.run(scenario())
+        assert all(r.status_code == 200 for r in responses)
+        assert in_flight["peak"] <= 4
+
+    @allure.story("重试策略")
+    def test_retry_on_status_then_succeed(self):
+        """测试5xx/429响应按重试策略重试"""
+        calls = {"count": 0}
+
+        async def flaky(request):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                return web.json_response({"error": "busy"}, status=503)
+            return web.json_response({"ok": True})
+
+        async def scenario():
+            runner, base_url = await _start_stub_server([("GET", "/flaky", flaky)])
+            try:
+                async with AsyncHttpClient(base_url, retry_times=3) as client:
+                    return await client.get("/flaky")
+            finally:
+                await runner.cleanup()
+
+        response = asyncio.run(scenario())
+        assert response.status_code == 200
+        assert calls["count"] == 2
+
+    @allure.story("重试策略")
+    def test_retry_exhausted_raises(self):
+        """测试重试次数耗尽后抛出包含状态码的异常"""
+        async def limited(request):
+            return web.json_response({"error": "rate limited"}, status=429, headers={"Retry-After": "0"})
+
+        async def scenario():
+            runner, base_url = await _start_stub_server([("GET", "/limited", limited)])
+            try:
+                async with AsyncHttpClient(base_url, retry_times=1) as client:
+                    await client.get("/limited")
+            finally:
+                await runner.cleanup()
+
+        with pytest.raises(AsyncRetryError) as exc_info:
+            asyncio.run(scenario())
+        assert "429" in str(exc_info.value)
+
+    @allure.story("压测模式日志")
+    def test_log_requests_disabled(self):
+        """测试关闭逐请求日志后请求不产生INFO日志（压测模式）"""
+        async def ok(request):
+            return web.json_response({"code": "20000"})
+
+        async def scenario(log_requests):
+            runner, base_url = await _start_stub_server([("GET", "/ok", ok)])
+            try:
+                async with AsyncHttpClient(base_url, log_requests=log_requests) as client:
+                    return await client.get("/ok")
+            finally:
+                await runner.cleanup()
+
+        messages = []
+        handler_id = logger.add(lambda message: messages.append(message.record["message"]), level="INFO")
+        try:
+            assert asyncio.run(scenario(False)).status_code == 200
+            assert messages == []
+            asyncio.run(scenario(True))
+            assert any("发送 GET 请求到" in message for message in messages)
+        finally:
+            logger.remove(handler_id)
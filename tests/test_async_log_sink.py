@@ -0,0 +1,148 @@
+import gzip
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+import pytest
+import allure
+from loguru import logger
+from common.log_sink import _STOP, AsyncFileSink, OVERFLOW_DROP, xdist_worker_suffix
+
+
+class _Record(str):
+    """模拟loguru传给sink的消息对象"""
+
+    def __new__(cls, text, level_no=20, time=None):
+        message = super().__new__(cls, text)
+        message.record = {"level": type("Level", (), {"no": level_no})(), "time": time or datetime.now()}
+        return message
+
+
+@allure.epic("测试框架")
+@allure.feature("异步日志")
+@pytest.mark.unit
+class TestAsyncLogSink:
+    """异步文件日志sink测试类"""
+
+    @allure.story("写入与停止")
+    def test_loguru_messages_written_on_stop(self, tmp_path):
+        """测试loguru日志经后台线程写入文件，移除处理器时写完剩余日志"""
+        sink = AsyncFileSink(tmp_path, suffix="gw1")
+        handler_id = logger.add(sink, format="{level} | {message}", level="DEBUG", colorize=False)
+        for i in range(100):
+            logger.debug(f"异步日志 {i}")
+        logger.remove(handler_id)
+
+        content = sink.file_path(datetime.now().strftime("%Y-%m-%d")).read_text(encoding="utf-8")
+        assert content.count("异步日志") == 100
+        assert "DEBUG | 异步日志 99" in content
+        assert sink.file_path("2024-01-01").name == "api_test_2024-01-01_gw1.log"
+
+    @allure.story("队列满时丢弃")
+    def test_drop_policy_keeps_warnings(self, tmp_path):
+        """测试队列满时丢弃INFO日志并计数，WARNING日志等待写入不丢弃"""
+        sink = AsyncFileSink(tmp_path, queue_size=1, overflow=OVERFLOW_DROP)
+        blocker = threading.Event()
+        original_open = sink._open
+
+        def slow_open(date):
+            blocker.wait(5)
+            original_open(date)
+
+        sink._open = slow_open
+        for i in range(20):
+            sink.write(_Record(f"info {i}\n"))
+        assert sink.dropped > 0
+
+        def release():
+            time.sleep(0.1)
+            blocker.set()
+
+        threading.Thread(target=release).start()
+        sink.write(_Record("warning kept\n", level_no=30))
+        sink.stop()
+
+        content = sink.file_path(datetime.now().strftime("%Y-%m-%d")).read_text(encoding="utf-8")
+        assert "warning kept" in content
+        assert f"累计丢弃 {sink.dropped} 条日志" in content
+
+    @allure.story("按天切换与压缩")
+    def test_rotation_compresses_previous_day(self, tmp_path):
+        """测试日期变化时切换文件、压缩前一天的日志并清理过期文件"""
+        expired = tmp_path / "api_test_2000-01-01.log.gz"
+        expired.write_bytes(b"")
+        old_time = time.time() - 40 * 86400
+        os.utime(expired, (old_time, old_time))
+
+        sink = AsyncFileSink(tmp_path, compression="gz", retention_days=30)
+        yesterday = datetime.now() - timedelta(days=1)
+        sink.write(_Record("yesterday\n", time=yesterday))
+        sink.write(_Record("today\n"))
+        sink.stop()
+
+        previous = sink.file_path(yesterday.strftime("%Y-%m-%d"))
+        assert not previous.exists()
+        with gzip.open(f"{previous}.gz", "rt", encoding="utf-8") as f:
+            assert f.read() == "yesterday\n"
+        assert sink.file_path(datetime.now().strftime("%Y-%m-%d")).read_text(encoding="utf-8") == "today\n"
+        assert not expired.exists()
+
+    @allure.story("启动时压缩与清理")
+    def test_first_open_compresses_own_previous_logs(self, tmp_path):
+        """测试首次打开文件时压缩本worker之前日期的日志、清理过期文件，不处理其他worker的文件"""
+        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        for name in (f"api_test_{yesterday}_gw1.log", f"api_test_{yesterday}_gw2.log", f"api_test_{yesterday}.log"):
+            (tmp_path / name).write_text(name, encoding="utf-8")
+        expired = tmp_path / "api_test_2000-01-01_gw2.log.gz"
+        expired.write_bytes(b"")
+        old_time = time.time() - 40 * 86400
+        os.utime(expired, (old_time, old_time))
+
+        sink = AsyncFileSink(tmp_path, suffix="gw1", compression="gz", retention_days=30)
+        sink.write(_Record("today\n"))
+        sink.stop()
+
+        with gzip.open(tmp_path / f"api_test_{yesterday}_gw1.log.gz", "rt", encoding="utf-8") as f:
+            assert f.read() == f"api_test_{yesterday}_gw1.log"
+        assert not (tmp_path / f"api_test_{yesterday}_gw1.log").exists()
+        assert (tmp_path / f"api_test_{yesterday}_gw2.log").exists()
+        assert (tmp_path / f"api_test_{yesterday}.log").exists()
+        assert not expired.exists()
+
+    @allure.story("后台线程出错")
+    def test_worker_survives_errors(self, tmp_path, capsys):
+        """测试后台线程处理日志出错时输出到stderr并继续写入；线程退出后写入和停止都不阻塞"""
+        sink = AsyncFileSink(tmp_path, queue_size=1)
+        original_open = sink._open
+        failures = []
+
+        def flaky_open(date):
+            if not failures:
+                failures.append(date)
+                raise FileNotFoundError("其他worker已删除")
+            original_open(date)
+
+        sink._open = flaky_open
+        sink.write(_Record("lost\n", level_no=30))
+        sink.write(_Record("kept\n", level_no=30))
+        sink.stop()
+        assert sink.file_path(datetime.now().strftime("%Y-%m-%d")).read_text(encoding="utf-8") == "kept\n"
+        assert "FileNotFoundError: 其他worker已删除" in capsys.readouterr().err
+
+        sink = AsyncFileSink(tmp_path / "dead", queue_size=1)
+        sink._queue.put(_STOP)
+        sink._thread.join(5)
+        start = time.perf_counter()
+        for i in range(5):
+            sink.write(_Record(f"warning {i}\n", level_no=30))
+        sink.stop()
+        assert time.perf_counter() - start < 1
+        assert sink.dropped == 5
+
+    @allure.story("xdist文件命名")
+    def test_xdist_worker_suffix(self, monkeypatch):
+        """测试从环境变量读取xdist worker标识"""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        assert xdist_worker_suffix() == "gw3"
+        monkeypatch.delenv("PYTEST_XDIST_WORKER")
+        assert xdist_worker_suffix() == ""
@@ -0,0 +1,148 @@
+import importlib
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import pytest
+import allure
+from urllib3.util.retry import Retry
+
+
+@pytest.fixture
+def auth_manager_factory(token_server, token_stub, monkeypatch, tmp_path):
+    """创建指向本地桩服务的认证管理器"""
+    monkeypatch.setenv("GODGPT_USERNAME", "tester")
+    monkeypatch.setenv("GODGPT_PASSWORD", "secret")
+    module = importlib.import_module("common.auth_manager")
+
+    def factory(**kwargs):
+        return module.AuthManager(auth_base_url=token_server, token_cache_file=tmp_path / "auth_token.json", **kwargs)
+
+    return factory
+
+
+@allure.epic("测试框架")
+@allure.feature("认证Token刷新")
+@pytest.mark.unit
+class TestAuthRefresh:
+    """认证token并发刷新测试类"""
+
+    @allure.story("单飞刷新")
+    def test_concurrent_callers_share_one_refresh(self, auth_manager_factory, token_stub):
+        """测试多线程同时获取token只发送一次认证请求"""
+        manager = auth_manager_factory()
+
+        with allure.step("20个线程同时获取token"):
+            with ThreadPoolExecutor(max_workers=20) as pool:
+                tokens = list(pool.map(lambda _: manager.get_auth_token(), range(20)))
+
+        with allure.step("验证只刷新一次且所有线程拿到同一个token"):
+            assert token_stub.requests == 1
+            assert set(tokens) == {"token-1"}
+            stats = manager.get_stats()
+            assert stats["refresh_count"] == 1
+            assert stats["wait_count"] == 20
+            assert stats["wait_time_ms_max"] >= 100
+
+    @allure.story("刷新失败不重复请求")
+    def test_waiters_share_failed_refresh(self, auth_manager_factory, token_stub, monkeypatch):
+        """测试认证服务返回429时，等待中的线程直接拿到失败结果，只发起一次认证"""
+        # 客户端对429的重试不等待退避，缩短用例耗时
+        monkeypatch.setattr(Retry, "get_backoff_time", lambda self: 0)
+        manager = auth_manager_factory()
+        token_stub.status = 429
+
+        with allure.step("10个线程同时获取token"):
+            with ThreadPoolExecutor(max_workers=10) as pool:
+                tokens = list(pool.map(lambda _: manager.get_auth_token(), range(10)))
+
+        with allure.step("验证只认证一次（含客户端重试），所有线程都拿到失败结果"):
+            assert tokens == [None] * 10
+            stats = manager.get_stats()
+            assert stats["refresh_count"] == 1
+            assert stats["refresh_failures"] == 1
+            assert token_stub.requests == manager.auth_client.retry_times + 1
+
+        with allure.step("之后的调用重新认证"):
+            token_stub.status = 200
+            assert manager.get_auth_token() is not None
+            assert manager.get_stats()["refresh_count"] == 2
+
+    @allure.story("强制刷新合并")
+    def test_force_refresh_waiters_reuse_new_token(self, auth_manager_factory, token_stub):
+        """测试并发强制刷新时，等待中的线程复用刚刷新的token"""
+        manager = auth_manager_factory()
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            tokens = list(pool.map(lambda _: manager.refresh_token(), range(5)))
+
+        assert token_stub.requests == 1
+        assert set(tokens) == {"token-1"}
+
+    @allure.story("后台提前刷新")
+    def test_background_refresh_before_expiry(self, auth_manager_factory, token_stub):
+        """测试token进入提前刷新窗口时在后台刷新，调用方不等待"""
+        manager = auth_manager_factory(refresh_ahead=600)
+        token_stub.expires_in = 500
+        assert manager.get_auth_token() == "token-1"
+
+        with allure.step("提前刷新窗口内获取token，立即返回当前token"):
+            start = time.perf_counter()
+            assert manager.get_auth_token() == "token-1"
+            assert time.perf_counter() - start < token_stub.delay
+
+        with allure.step("等待后台刷新完成"):
+            token_stub.expires_in = 3600
+            deadline = time.time() + 5
+            while manager.auth_token == "token-1" and time.time() < deadline:
+                time.sleep(0.05)
+            assert manager.get_auth_token() == "token-2"
+            assert manager.get_stats()["background_refreshes"] == 1
+
+    @allure.story("延迟初始化")
+    def test_lazy_proxy_initializes_on_first_use(self, auth_manager_factory):
+        """测试全局认证管理器代理在首次访问时才创建实例"""
+        from common.auth_manager import LazyAuthManager
+
+        created = []
+
+        def factory():
+            created.append(auth_manager_factory())
+            return created[-1]
+
+        proxy = LazyAuthManager(factory)
+        assert not proxy.initialized and created == []
+
+        assert proxy.get_auth_token() == "token-1"
+        assert proxy.initialized and len(created) == 1
+        assert proxy.is_token_valid()
+        assert len(created) == 1
+
+    @allure.story("延迟初始化")
+    def test_import_without_credentials(self, tmp_path):
+        """测试未配置认证凭据时导入认证模块不报错"""
+        env = {k: v for k, v in os.environ.items() if not k.startswith("GODGPT_")}
+        result = subprocess.run(
+            [sys.executable, "-c", "from common.auth_manager import auth_manager; print(auth_manager.initialized)"],
+            cwd=Path(__file__).resolve().parent.parent, env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().endswith("False")
+
+    @allure.story("延迟初始化")
+    def test_collect_does_not_initialize(self):
+        """测试收集导入了全局认证管理器的用例模块时不创建AuthManager"""
+        script = (
+            "import pytest\n"
+            "from common.auth_manager import auth_manager\n"
+            "pytest.main(['--collect-only', '-q', '-p', 'no:cacheprovider',\n"
+            "             'tests/test_user_session_api.py', 'tests/test_share_session_api.py'])\n"
+            "print('INITIALIZED', auth_manager.initialized)\n"
+        )
+        # 配置了凭据时创建AuthManager会成功，未延迟的代理在收集时就会初始化
+        env = {**os.environ, "GODGPT_USERNAME": "tester", "GODGPT_PASSWORD": "secret"}
+        result = subprocess.run([sys.executable, "-c", script], cwd=Path(__file__).resolve().parent.parent,
+                                env=env, capture_output=True, text=True, timeout=120)
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert "INITIALIZED False" in result.stdout, result.stdout[-2000:]
@@ -0,0 +1,126 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import allure
+from common.cassette import Cassette, CassetteMissError, CASSETTE_RECORD, CASSETTE_REPLAY, REDACTED_VALUE
+from common.http_client import HttpClient
+
+LARGE_BODY = bytes(range(256)) * 8192
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    """按路径返回JSON、SSE、大响应体或404的桩服务，并统计收到的请求数"""
+
+    hits = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _reply(self):
+        type(self).hits += 1
+        length = int(self.headers.get("Content-Length", 0))
+        payload = self.rfile.read(length) if length else b""
+        if self.path == "/chat":
+            self._send(200, b'data: {"content": "a"}\n\ndata: {"content": "b"}\n\ndata: [DONE]\n\n',
+                       "text/event-stream")
+        elif self.path == "/session":
+            self._send(200, json.dumps({"id": type(self).hits}).encode())
+        elif self.path == "/token":
+            self._send(200, json.dumps({"access_token": "secret-token", "expires_in": 3600}).encode())
+        elif self.path == "/large":
+            self._send(200, LARGE_BODY, "application/octet-stream")
+        elif self.path.startswith("/echo"):
+            self._send(200, json.dumps({"path": self.path, "body": payload.decode()}).encode())
+        else:
+            self._send(404, b'{"error": "not found"}')
+
+    do_GET = do_POST = _reply
+
+
+@pytest.fixture(scope="module")
+def recording_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@allure.epic("测试框架")
+@allure.feature("HTTP录制回放")
+@pytest.mark.unit
+class TestCassette:
+    """HTTP录制回放测试类"""
+
+    @allure.story("录制后离线回放")
+    def test_record_then_replay(self, recording_server, tmp_path):
+        """测试录制的状态码、JSON响应和SSE事件流可以在不访问网络的情况下回放"""
+        with allure.step("录制"):
+            cassette = Cassette(tmp_path, mode=CASSETTE_RECORD, suffix="")
+            with HttpClient(recording_server, retry_times=0, cassette=cassette) as client:
+                recorded = client.get("/echo?b=2&a=1", json={"time": "2024-01-01 00:00:00"}).json()
+                first, second = client.post("/session").json(), client.post("/session").json()
+                assert client.get("/missing").status_code == 404
+                with client.stream_sse("POST", "/chat") as stream:
+                    recorded_events = [event.data for event in stream]
+            cassette.close()
+            assert cassette.recorded == 5
+
+        with allure.step("回放"):
+            hits = _RecordingHandler.hits
+            cassette = Cassette(tmp_path, mode=CASSETTE_REPLAY, suffix="")
+            with HttpClient(recording_server, retry_times=0, cassette=cassette) as client:
+                # query参数顺序不同、请求体时间戳变化时仍能命中
+                assert client.get("/echo?a=1&b=2", json={"time": "2025-06-01 12:00:00"}).json() == recorded
+                assert [client.post("/session").json() for _ in range(3)] == [first, second, second]
+                assert client.get("/missing").status_code == 404
+                with client.stream_sse("POST", "/chat") as stream:
+                    assert [event.data for event in stream] == recorded_events
+                    assert stream.done
+                with pytest.raises(CassetteMissError):
+                    client.get("/never-recorded")
+            assert _RecordingHandler.hits == hits
+            assert cassette.stats() == {"recorded": 0, "replayed": 6, "misses": 1}
+
+    @allure.story("凭据脱敏")
+    def test_credentials_are_redacted(self, recording_server, tmp_path):
+        """测试录制时token被脱敏，请求键不包含用户名和密码"""
+        cassette = Cassette(tmp_path, mode=CASSETTE_RECORD, suffix="")
+        with HttpClient(recording_server, retry_times=0, cassette=cassette) as client:
+            response = client.post("/token", data="username=alice&password=p1&grant_type=password",
+                                   headers={"Content-Type": "application/x-www-form-urlencoded"})
+            assert response.json()["access_token"] == "secret-token"
+        cassette.close()
+        stored = (tmp_path / "index.jsonl").read_text(encoding="utf-8") + \
+            (tmp_path / "bodies.bin").read_text(encoding="utf-8")
+        assert "secret-token" not in stored and "p1" not in stored
+
+        cassette = Cassette(tmp_path, mode=CASSETTE_REPLAY, suffix="")
+        with HttpClient(recording_server, retry_times=0, cassette=cassette) as client:
+            response = client.post("/token", data="grant_type=password&username=None&password=None",
+                                   headers={"Content-Type": "application/x-www-form-urlencoded"})
+            assert response.json()["access_token"] == REDACTED_VALUE
+        assert cassette.stats()["misses"] == 0
+
+    @allure.story("大响应体内存映射")
+    def test_large_body_is_memory_mapped(self, recording_server, tmp_path):
+        """测试回放的大响应体从内存映射按块读取，内容与录制一致"""
+        cassette = Cassette(tmp_path, mode=CASSETTE_RECORD, suffix="")
+        with HttpClient(recording_server, retry_times=0, cassette=cassette) as client:
+            client.get("/large")
+        cassette.close()
+
+        cassette = Cassette(tmp_path, mode=CASSETTE_REPLAY, suffix="")
+        with HttpClient(recording_server, retry_times=0, cassette=cassette) as client:
+            response = client.get("/large", stream=True)
+            chunks = list(response.iter_content(chunk_size=65536))
+        assert len(chunks) == len(LARGE_BODY) // 65536
+        assert b"".join(chunks) == LARGE_BODY
@@ -1,37 +1,24 @@
 import pytest
 import allure
-from common.http_client import HttpClient
 from common.assertions import ApiAssertions
 from common.logger import logger
 from common.auth_manager import auth_manager
 
+# 用于查询聊天历史的会话ID
+HISTORY_SESSION_ID = "a4eb7361-4a48-48df-9b0b-3e21dffa42d5"
+
+
 @allure.epic("GodGPT API")
 @allure.feature("聊天历史功能")
 class TestChatHistoryAPI:
     """GodGPT 聊天历史功能API测试类"""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, base_url, http_client_registry):
         """测试前置设置"""
-        self.client = HttpClient("https://station-developer.aevatar.ai")
+        self.client = http_client_registry.get_client(base_url)
         self.assertions = ApiAssertions()
         
-        self.default_headers = {
-            'accept': '*/*',
-            'accept-language': 'zh-CN,zh;q=0.9',
-            'content-type': 'application/json',
-            'origin': 'https://godgpt.portkey.finance',
-            'priority': 'u=1, i',
-            'referer': 'https://godgpt.portkey.finance/',
-            'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'cross-site',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36'
-        }
-        
         self.auth_token = auth_manager.get_auth_token()
         if not self.auth_token:
             logger.warning("无法获取认证token，某些测试可能会跳过")
@@ -46,17 +33,9 @@ class TestChatHistoryAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/chat/a4eb7361-4a48-48df-9b0b-3e21dffa42d5"
-        
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         with allure.step("发送GET请求查询聊天历史"):
             try:
-                response = self.client.get(
-                    endpoint,
-                    headers=auth_headers
-                )
+                response = self.client.call("chat-history", path_params={"session_id": HISTORY_SESSION_ID}, token=self.auth_token)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
@@ -64,9 +43,6 @@ class TestChatHistoryAPI:
                 with allure.step("验证响应不为空"):
                     self.assertions.assert_not_empty(response)
                 
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 10.0)
-                
                 with allure.step("验证响应格式"):
                     try:
                         response_json = response.json()
@@ -76,22 +52,12 @@ class TestChatHistoryAPI:
                         
                         # 如果是字典，检查常见字段
                         if isinstance(response_json, dict):
-                            history_fields = ['data', 'messages', 'history', 'chat', 'session']
-                            found_field = None
-                            for field in history_fields:
-                                if field in response_json:
-                                    found_field = field
-                                    break
-                            
-                            if found_field:
-                                field_value = response_json[found_field]
-                                logger.info(f"找到聊天历史字段: {found_field}")
-                                if isinstance(field_value, list):
-                                    logger.info(f"聊天历史包含 {len(field_value)} 条消息")
-                                elif isinstance(field_value, dict):
-                                    logger.info(f"聊天历史为对象格式")
-                            else:
-                                logger.info("响应中未找到标准历史字段，但API调用成功")
+                            field_value = self.assertions.assert_json_path_any(
+                                response, ['data', 'messages', 'history', 'chat', 'session'])
+                            if isinstance(field_value, list):
+                                logger.info(f"聊天历史包含 {len(field_value)} 条消息")
+                            elif isinstance(field_value, dict):
+                                logger.info(f"聊天历史为对象格式")
                         
                         # 如果是数组，检查数组内容
                         elif isinstance(response_json, list):
@@ -120,17 +86,9 @@ class TestChatHistoryAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/chat/invalid-session-id-12345"
-        
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         with allure.step("发送GET请求查询无效sessionId的聊天历史"):
             try:
-                response = self.client.get(
-                    endpoint,
-                    headers=auth_headers
-                )
+                response = self.client.call("chat-history", path_params={"session_id": "invalid-session-id-12345"}, token=self.auth_token)
                 
                 with allure.step("验证响应状态码"):
                     # API可能返回200（空历史）或错误状态码
@@ -165,14 +123,10 @@ class TestChatHistoryAPI:
     @pytest.mark.api
     def test_get_chat_history_no_auth(self):
         """测试查询聊天历史-缺少认证"""
-        endpoint = "/godgptprod-client/api/godgpt/chat/a4eb7361-4a48-48df-9b0b-3e21dffa42d5"
-        
         with allure.step("发送GET请求查询聊天历史-无认证"):
             try:
-                response = self.client.get(
-                    endpoint,
-                    headers=self.default_headers
-                )
+                response = self.client.call("chat-history", path_params={"session_id": HISTORY_SESSION_ID},
+                                            anonymous=True)
                 
                 with allure.step("验证响应状态码为401"):
                     self.assertions.assert_status_code(response, 401)
@@ -193,11 +147,6 @@ class TestChatHistoryAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/chat/a4eb7361-4a48-48df-9b0b-3e21dffa42d5"
-        
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         with allure.step("发送多次GET请求测试性能"):
             try:
                 import time
@@ -205,13 +154,9 @@ class TestChatHistoryAPI:
                 
                 # 发送3次请求测试性能
                 for i in range(3):
-                    response = self.client.get(
-                        endpoint,
-                        headers=auth_headers
-                    )
+                    response = self.client.call("chat-history", path_params={"session_id": HISTORY_SESSION_ID}, token=self.auth_token)
                     
                     assert response.status_code == 200, f"请求{i+1}失败，状态码: {response.status_code}"
-                    self.assertions.assert_response_time(response, 5.0)
                     
                     logger.info(f"性能测试请求{i+1}通过，响应时间: {response.elapsed.total_seconds():.2f}秒")
                 
@@ -240,11 +185,6 @@ class TestChatHistoryAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/chat/a4eb7361-4a48-48df-9b0b-3e21dffa42d5"
-        
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         responses = []
         
         with allure.step("发送3个并发GET请求"):
@@ -252,10 +192,7 @@ class TestChatHistoryAPI:
                 import concurrent.futures
                 
                 def make_history_request():
-                    return self.client.get(
-                        endpoint,
-                        headers=auth_headers
-                    )
+                    return self.client.call("chat-history", path_params={"session_id": HISTORY_SESSION_ID}, token=self.auth_token)
                 
                 with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
                     futures = [executor.submit(make_history_request) for _ in range(3)]
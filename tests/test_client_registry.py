@@ -0,0 +1,97 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import allure
+from common.client_registry import ClientRegistry
+from common.config import Config
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """支持HTTP/1.1长连接的桩服务，记录服务端建立的连接数"""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps({"code": "20000", "data": {"name": "stub"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "sid=abc; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def keep_alive_server():
+    _KeepAliveHandler.connections = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@allure.epic("测试框架")
+@allure.feature("共享连接池")
+@pytest.mark.unit
+class TestClientRegistry:
+    """按主机共享的客户端注册表测试类"""
+
+    @allure.story("按主机复用客户端")
+    def test_same_host_returns_same_client(self):
+        """测试同一地址的不同写法返回同一个客户端；同一主机不同路径前缀的客户端保留前缀并共用连接池"""
+        registry = ClientRegistry(Config())
+        a = registry.get_client("https://station-developer.aevatar.ai")
+        b = registry.get_client("https://Station-Developer.aevatar.ai/")
+        prefixed = registry.get_client("https://Station-Developer.aevatar.ai/godgptprod-client/")
+        c = registry.get_client("https://auth-station.aevatar.ai")
+
+        assert a is b
+        assert a is not c and a.session is not c.session
+        assert prefixed is not a and prefixed.session is a.session
+        assert prefixed.base_url == "https://station-developer.aevatar.ai/godgptprod-client"
+        assert prefixed._build_url("/api/profile") == "https://station-developer.aevatar.ai/godgptprod-client/api/profile"
+        assert list(registry.connection_stats()) == ["https://station-developer.aevatar.ai", "https://auth-station.aevatar.ai"]
+        registry.close_all()
+
+    @allure.story("连接池配置")
+    def test_pool_config_from_config(self):
+        """测试连接池大小从配置读取"""
+        config = Config()
+        config.set("http_pool", {"pool_connections": 3, "pool_maxsize": 7, "keep_alive": False})
+        registry = ClientRegistry(config)
+        client = registry.get_client("https://station-developer.aevatar.ai")
+
+        adapter = client.session.get_adapter("https://station-developer.aevatar.ai")
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 7
+        assert client.session.headers["Connection"] == "close"
+        registry.close_all()
+
+    @allure.story("连接复用统计")
+    def test_connections_reused_across_tests(self, keep_alive_server):
+        """测试多次获取客户端发送请求只建立一次连接"""
+        registry = ClientRegistry(Config())
+
+        for _ in range(5):
+            client = registry.get_client(keep_alive_server)
+            response = client.get("/godgptprod-client/api/profile/user-info")
+            assert response.status_code == 200
+
+        stats = registry.connection_stats()[registry.host_key(keep_alive_server)]
+        assert stats == {"opened": 1, "reused": 4, "requests": 5}
+        assert _KeepAliveHandler.connections == 1
+
+        registry.clear_cookies()
+        assert len(registry.get_client(keep_alive_server).session.cookies) == 0
+        registry.close_all()
+        assert registry.connection_stats() == {}
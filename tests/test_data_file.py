@@ -0,0 +1,105 @@
+import json
+import tracemalloc
+import pytest
+import allure
+from common.data_file import DATA_FILE_INDEX_SUFFIX, DataFile, DataFileWriter
+from common.data_store import MemoryDataStore
+from common.test_data import BulkDataGenerator, DataManager
+
+
+def _users(count):
+    return BulkDataGenerator(seed=3, worker="", pool_size=50).users(count)
+
+
+@allure.epic("测试框架")
+@allure.feature("测试数据文件")
+@pytest.mark.unit
+class TestDataFile:
+    """JSONL测试数据文件测试类"""
+
+    @allure.story("分段写入与按键读取")
+    @pytest.mark.parametrize("file_name", ["data.jsonl", "data.jsonl.gz"])
+    def test_round_trip(self, tmp_path, file_name):
+        """测试列表分段写入、生成器边迭代边写入，按键读取的值与写入的一致；缺少索引时扫描重建"""
+        path = tmp_path / file_name
+        data = {"config": {"region": "北京", "retry": 3}, "empty": [], "token": "mock-1", "nothing": None}
+        with DataFileWriter(path, chunk_size=100) as writer:
+            writer.write("users", _users(250))
+            writer.write_all(data)
+            with pytest.raises(ValueError):
+                writer.write("users", [])
+
+        expected_users = list(_users(250))
+        for data_file in (DataFile(path), None):
+            if data_file is None:
+                (tmp_path / (file_name + DATA_FILE_INDEX_SUFFIX)).unlink()
+                data_file = DataFile(path)
+            assert data_file.keys() == ["users", "config", "empty", "token", "nothing"]
+            assert data_file.count("users") == 250
+            assert data_file.load("users") == expected_users
+            assert list(data_file.iter_items("users")) == expected_users
+            for key, value in data.items():
+                assert data_file.load(key) == value
+            with pytest.raises(KeyError):
+                data_file.load("missing")
+
+    @allure.story("按键延迟读取")
+    def test_reads_only_requested_key(self, tmp_path):
+        """测试读取一个键时直接定位到该键，不读取其他键的内容；流式读取只在内存中保留一段"""
+        path = tmp_path / "data.jsonl"
+        with DataFileWriter(path, chunk_size=100) as writer:
+            writer.write("users", _users(20000))
+            writer.write("token", "mock-1")
+        index = json.loads((tmp_path / ("data.jsonl" + DATA_FILE_INDEX_SUFFIX)).read_text(encoding="utf-8"))
+        token_offset = index["keys"]["token"]["offset"]
+
+        # 破坏 users 的内容后仍能读取 token
+        raw = bytearray(path.read_bytes())
+        raw[:token_offset] = b"x" * token_offset
+        path.write_bytes(bytes(raw))
+        assert DataFile(path).load("token") == "mock-1"
+
+        with DataFileWriter(path, chunk_size=100) as writer:
+            writer.write("users", _users(20000))
+        data_file = DataFile(path)
+        tracemalloc.start()
+        try:
+            streamed = sum(1 for _ in data_file.iter_items("users"))
+            _, stream_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            loaded = len(data_file.load("users"))
+            _, load_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert streamed == loaded == 20000
+        assert stream_peak < load_peak / 10
+
+    @allure.story("数据管理器导入导出")
+    def test_data_manager_lazy_import(self, tmp_path):
+        """测试导出生成器数据到压缩文件，导入后按键加载；再次导出时未加载的键直接转存；JSON文件保持原格式"""
+        path = tmp_path / "fixtures.jsonl.gz"
+        producer = DataManager(seed=3, store=MemoryDataStore())
+        producer.save_test_data("token", "mock-1")
+        producer.export_test_data(str(path), data={"users": _users(300), "posts": [{"id": 1}]})
+
+        consumer = DataManager(store=MemoryDataStore())
+        consumer.save_test_data("saved", 1)
+        consumer.import_test_data(str(path))
+        assert consumer.test_data_keys() == ["users", "posts", "saved"]
+        assert sum(1 for _ in consumer.iter_test_data("users")) == 300
+        assert consumer._file_values == {}
+        assert consumer.get_test_data("posts") == [{"id": 1}]
+        assert consumer.get_test_data("saved") == 1
+
+        consumer.save_test_data("token", "mock-2")
+        copy_path = tmp_path / "copy.jsonl"
+        consumer.export_test_data(str(copy_path))
+        assert DataFile(copy_path).load("users") == list(_users(300))
+
+        json_path = tmp_path / "fixtures.json"
+        consumer.export_test_data(str(json_path))
+        assert list(json.loads(json_path.read_text(encoding="utf-8"))) == ["users", "posts", "saved", "token"]
+        restored = DataManager(store=MemoryDataStore())
+        restored.import_test_data(str(json_path))
+        assert restored.get_test_data("token") == "mock-2"
+        assert list(restored.iter_test_data("posts")) == [{"id": 1}]
@@ -0,0 +1,95 @@
+import types
+from itertools import islice
+import pytest
+import allure
+from common.test_data import BulkDataGenerator, DataManager, TestDataGenerator, get_value_pools
+
+POOL_SIZE = 50
+
+
+@allure.epic("测试框架")
+@allure.feature("测试数据生成")
+@pytest.mark.unit
+class TestBulkDataGenerator:
+    """批量测试数据生成测试类"""
+
+    @allure.story("候选值抽样")
+    def test_records_are_sampled_from_pools(self):
+        """测试记录字段与逐条生成的一致，值都来自按种子只生成一次的候选值"""
+        generator = BulkDataGenerator(seed=7, worker="", pool_size=POOL_SIZE, batch_size=16)
+        pools = generator.pools
+        assert pools is get_value_pools(7, POOL_SIZE)
+        assert len(pools.names) == POOL_SIZE
+
+        users = list(generator.users(40, start_id=101))
+        assert [user["id"] for user in users] == list(range(101, 141))
+        assert set(users[0]) == set(TestDataGenerator.random_user_data()) | {"id"}
+        assert {user["name"] for user in users} <= set(pools.names)
+        assert {user["bio"] for user in users} <= set(pools.bios)
+
+        posts = list(generator.posts(40))
+        assert set(posts[0]) == set(TestDataGenerator.random_post_data()) | {"id"}
+        assert all(1 <= len(post["tags"]) <= 5 and 1 <= post["userId"] <= 10 for post in posts)
+        assert {tag for post in posts for tag in post["tags"]} <= set(pools.words)
+
+        prompts = list(generator.chat_prompts(5))
+        assert len(prompts) == 5 and set(prompts) <= set(pools.prompts)
+
+    @allure.story("确定性种子")
+    def test_seed_and_worker_determine_records(self, monkeypatch):
+        """测试相同种子和worker生成相同数据，不同worker共用候选值但抽到不同记录"""
+        def users(seed, worker):
+            return list(BulkDataGenerator(seed=seed, worker=worker, pool_size=POOL_SIZE).users(30))
+
+        assert users(7, "gw0") == users(7, "gw0")
+        assert users(7, "gw0") != users(7, "gw1")
+        assert users(7, "gw0") != users(8, "gw0")
+
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+        monkeypatch.setenv("API_TEST_TEST_DATA_SEED", "7")
+        assert DataManager().bulk.seed == 7 and DataManager().bulk.worker == "gw1"
+        assert len(DataManager(seed=7).generate_user_data(3)) == 3
+
+    @allure.story("账号唯一")
+    def test_user_identities_are_unique(self):
+        """测试用户名和邮箱在同一worker内、不同worker之间都不重复"""
+        users = DataManager(seed=7).generate_user_data(1000)
+        assert len({user["username"] for user in users}) == 1000
+        assert len({user["email"] for user in users}) == 1000
+
+        workers = [list(BulkDataGenerator(seed=7, worker=worker, pool_size=POOL_SIZE, run_id="").users(200))
+                   for worker in ("gw0", "gw1")]
+        identities = [(user["username"], user["email"]) for records in workers for user in records]
+        assert len(set(identities)) == len(identities) == 400
+        assert workers[1][0]["username"].endswith("_1_gw1")
+        assert workers[1][0]["email"].split("@")[0].endswith("_1_gw1")
+
+    @allure.story("账号唯一")
+    def test_ids_continue_across_calls(self, monkeypatch):
+        """测试多次调用接着上次的 id 编号，运行标识加在账号后缀中"""
+        generator = BulkDataGenerator(seed=7, worker="gw1", pool_size=POOL_SIZE, run_id="1018093000")
+        first, second = generator.users(30), generator.users(30)
+        users = list(second) + list(first)
+        assert sorted(user["id"] for user in users) == list(range(1, 61))
+        assert len({user["username"] for user in users}) == len({user["email"] for user in users}) == 60
+        assert users[0]["username"].endswith("_31_gw1_1018093000")
+        assert [user["id"] for user in generator.users(2, start_id=101)] == [101, 102]
+        assert next(generator.users(1))["id"] == 103
+        assert [post["id"] for post in generator.posts(3)] == [1, 2, 3]
+
+        monkeypatch.setenv("API_TEST_TEST_DATA_RUN_ID", "run7")
+        manager = DataManager(seed=7)
+        users = manager.generate_user_data(5) + manager.generate_user_data(5)
+        assert [user["id"] for user in users] == list(range(1, 11))
+        assert all(user["username"].endswith("_run7") for user in users)
+        assert len({user["username"] for user in users}) == 10
+
+    @allure.story("流式生成")
+    def test_records_are_streamed(self):
+        """测试生成方法返回生成器，只按需抽样，不构建完整列表"""
+        generator = BulkDataGenerator(seed=7, worker="", pool_size=POOL_SIZE, batch_size=10)
+        users = generator.users(10 ** 9)
+        assert isinstance(users, types.GeneratorType)
+        first = list(islice(users, 25))
+        assert [user["id"] for user in first] == list(range(1, 26))
+        assert len(list(generator.posts(0))) == 0
@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import allure
+from common.data_store import MemoryDataStore, SqliteDataStore
+from common.test_data import DataManager
+
+
+def _worker_get_session(db_file, created_file, start_at):
+    """子进程入口：模拟一个xdist worker获取共享会话ID"""
+    store = SqliteDataStore(db_file)
+
+    def create():
+        with open(created_file, "a") as f:
+            f.write(f"{os.getpid()}\n")
+        time.sleep(0.5)  # 模拟请求服务端创建会话
+        return f"session-{os.getpid()}"
+
+    time.sleep(max(0, start_at - time.time()))
+    return store.get_or_create("chat-session", create, ttl=60)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryDataStore()
+    else:
+        store = SqliteDataStore(tmp_path / "test_data.db")
+        yield store
+        store.close()
+
+
+@allure.epic("测试框架")
+@allure.feature("共享测试数据存储")
+@pytest.mark.unit
+class TestDataStore:
+    """共享测试数据存储测试类"""
+
+    @allure.story("读写与过期")
+    def test_set_get_and_ttl(self, store):
+        """测试读写、ttl过期后视为不存在，清理过期和未设置ttl的数据"""
+        store.set("session", {"id": "s1", "shareId": "x"})
+        store.set("short", "gone", ttl=0.05)
+        store.set("long", "kept", ttl=60)
+        assert store.get("session") == {"id": "s1", "shareId": "x"}
+        assert store.get("missing", "default") == "default"
+        time.sleep(0.1)
+        assert store.get("short") is None
+        assert store.keys() == ["session", "long"]
+
+        assert store.purge() == 1
+        assert store.purge(untimed=True) == 1
+        assert store.keys() == ["long"]
+        store.delete("long")
+        assert store.keys() == []
+
+    @allure.story("多线程只创建一次")
+    def test_get_or_create_once_across_threads(self, store):
+        """测试多个线程同时获取同一个键只创建一次；创建失败时不保存"""
+        calls = []
+
+        def create():
+            calls.append(threading.get_ident())
+            time.sleep(0.2)
+            return "session-1"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: store.get_or_create("chat-session", create, ttl=60), range(8)))
+        assert results == ["session-1"] * 8
+        assert len(calls) == 1
+
+        def fail():
+            raise RuntimeError("创建失败")
+
+        with pytest.raises(RuntimeError):
+            store.get_or_create("broken", fail)
+        assert store.get("broken", "missing") == "missing"
+        assert store.get_or_create("nested", lambda: store.get_or_create("inner", lambda: 1) + 1) == 2
+        assert store.get("inner") == 1
+
+    @allure.story("创建期间不锁库")
+    def test_factory_does_not_block_other_keys(self, tmp_path):
+        """测试一个键创建期间，其他连接仍可读写数据库、创建其他键"""
+        db_file = tmp_path / "test_data.db"
+        store = SqliteDataStore(db_file)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_create():
+            started.set()
+            release.wait(5)
+            return "session-1"
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            creating = pool.submit(store.get_or_create, "chat-session", slow_create)
+            assert started.wait(5)
+            other = SqliteDataStore(db_file, busy_timeout=0.5)
+            other.set("share-id", "abc")
+            assert other.get_or_create("guest-session", lambda: "guest-1") == "guest-1"
+            release.set()
+            assert creating.result() == "session-1"
+        assert other.get("chat-session") == "session-1"
+
+    @allure.story("多进程共享")
+    def test_processes_share_created_value(self, tmp_path):
+        """测试多个进程同时获取同一个键只创建一次，都拿到同一个值"""
+        db_file = str(tmp_path / "test_data.db")
+        created_file = str(tmp_path / "created.txt")
+        context = multiprocessing.get_context("spawn")
+
+        with allure.step("4个进程同时获取会话ID"):
+            with context.Pool(4) as pool:
+                start_at = time.time() + 3
+                sessions = pool.starmap(_worker_get_session, [(db_file, created_file, start_at)] * 4)
+
+        with allure.step("验证只创建一次"):
+            with open(created_file) as f:
+                creators = f.read().split()
+            assert len(creators) == 1
+            assert set(sessions) == {f"session-{creators[0]}"}
+
+    @allure.story("数据管理器")
+    def test_data_manager_uses_shared_store(self, tmp_path):
+        """测试两个数据管理器通过同一个数据库文件共享数据，ttl过期后重新创建"""
+        db_file = tmp_path / "test_data.db"
+        first = DataManager(store=SqliteDataStore(db_file))
+        second = DataManager(store=SqliteDataStore(db_file))
+
+        first.save_test_data("share-id", "abc")
+        assert second.get_test_data("share-id") == "abc"
+        assert second.get_or_create_test_data("session", lambda: "s1", ttl=0.05) == "s1"
+        assert first.get_or_create_test_data("session", lambda: "s2", ttl=0.05) == "s1"
+        time.sleep(0.1)
+        assert first.get_or_create_test_data("session", lambda: "s2", ttl=60) == "s2"
+
+        second.delete_test_data("share-id")
+        assert first.get_test_data("share-id") is None
+        assert first.test_data_keys() == ["session"]
+        first.clear_test_data()
+        assert second.test_data_keys() == []
@@ -0,0 +1,118 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import allure
+from common.endpoints import EndpointCatalog, endpoint_catalog
+from common.http_client import HttpClient
+from common.sse import SSEStream
+
+
+class _CatalogHandler(BaseHTTPRequestHandler):
+    """记录请求路径与请求头的桩服务，聊天接口返回SSE事件流"""
+
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        type(self).requests.append((self.command, self.path, dict(self.headers)))
+        if self.path.endswith("/chat"):
+            body = b'data: {"content": "hi"}\n\ndata: [DONE]\n\n'
+            content_type = "text/event-stream"
+        else:
+            body = json.dumps({"code": "20000", "data": {}}).encode()
+            content_type = "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+
+@pytest.fixture(scope="module")
+def catalog_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CatalogHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@allure.epic("测试框架")
+@allure.feature("接口目录")
+@pytest.mark.unit
+class TestEndpointCatalog:
+    """声明式接口目录测试类"""
+
+    @allure.story("加载与预构建请求头")
+    def test_catalog_prebuilds_headers(self):
+        """测试接口目录合并公共请求头，并按token缓存认证请求头"""
+        catalog = EndpointCatalog()
+        chat = catalog.get("user-chat")
+
+        assert chat.method == "POST" and chat.auth and chat.stream
+        assert chat.headers["accept"] == "text/event-stream"
+        assert chat.headers["origin"] == catalog.base_headers["origin"]
+        assert chat.headers_for() is chat.headers
+        assert chat.headers_for("t1") is chat.headers_for("t1")
+        assert chat.headers_for("t2")["authorization"] == "Bearer t2"
+        with pytest.raises(TypeError):
+            chat.headers["accept"] = "*/*"
+
+        headers = catalog.headers("user-profile", token="t1")
+        headers["authorization"] = "Bearer invalid"
+        assert catalog.get("user-profile").headers_for("t1")["authorization"] == "Bearer t1"
+
+    @allure.story("路径模板")
+    def test_path_template_and_unknown_endpoint(self):
+        """测试路径参数填充、缺少参数和未知接口的报错"""
+        history = endpoint_catalog.get("chat-history")
+        assert history.format_path({"session_id": "abc"}) == "/godgptprod-client/api/godgpt/chat/abc"
+        with pytest.raises(ValueError, match="session_id"):
+            history.format_path({"id": "abc"})
+        with pytest.raises(ValueError, match="未知接口"):
+            endpoint_catalog.get("no-such-endpoint")
+
+    @allure.story("按名称调用")
+    def test_client_call_by_name(self, catalog_server):
+        """测试HttpClient按接口名称发送请求，耗时按路径模板统计，流式接口返回SSEStream"""
+        _CatalogHandler.requests = []
+        with HttpClient(catalog_server) as client:
+            response = client.call("chat-history", path_params={"session_id": "11111111-2222-3333-4444-555555555555"},
+                                   token="t1")
+            assert response.status_code == 200
+
+            with client.call("user-chat", token="t1", json={"content": "hi"}) as stream:
+                assert isinstance(stream, SSEStream)
+                assert [event.data for event in stream] == ['{"content": "hi"}']
+                assert stream.done
+
+            client.call("user-profile", token="t1", headers={"authorization": "Bearer override"})
+
+            method, path, headers = _CatalogHandler.requests[0]
+            assert (method, path) == ("GET", "/godgptprod-client/api/godgpt/chat/11111111-2222-3333-4444-555555555555")
+            assert headers["authorization"] == "Bearer t1"
+            assert _CatalogHandler.requests[1][2]["accept"] == "text/event-stream"
+            assert _CatalogHandler.requests[2][2]["authorization"] == "Bearer override"
+            assert client.latency_recorder.get("GET", "/godgptprod-client/api/godgpt/chat/{session_id}").total_count == 1
+
+    @allure.story("认证声明")
+    def test_call_requires_token_for_auth_endpoints(self, catalog_server):
+        """测试声明了 auth 的接口未传token时直接报错不发送请求，anonymous=True 时不带token发送"""
+        _CatalogHandler.requests = []
+        with HttpClient(catalog_server) as client:
+            with pytest.raises(ValueError, match="接口 user-profile 需要认证"):
+                client.call("user-profile")
+            assert _CatalogHandler.requests == []
+
+            client.call("user-profile", anonymous=True)
+            client.call("guest-create-session", json={"guider": ""})
+            assert len(_CatalogHandler.requests) == 2
+            assert "authorization" not in {name.lower() for name in _CatalogHandler.requests[0][2]}
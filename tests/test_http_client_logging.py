@@ -0,0 +1,68 @@
+import json
+import pytest
+import allure
+import requests
+from common.http_client import HttpClient
+from common.logger import logger, truncate_body, truncate_body_bytes
+
+
+class _CountingResponse(requests.Response):
+    """记录 json() 调用次数的响应对象"""
+
+    def __init__(self, body: bytes):
+        super().__init__()
+        self.status_code = 200
+        self.encoding = "utf-8"
+        self._content = body
+        self.json_calls = 0
+
+    def json(self, **kwargs):
+        self.json_calls += 1
+        return super().json(**kwargs)
+
+
+@pytest.fixture
+def captured_logs():
+    """临时替换日志处理器，返回 (添加处理器函数, 日志列表)"""
+    messages = []
+    handler_ids = []
+
+    def add_sink(level):
+        handler_ids.append(logger.add(lambda m: messages.append(m.record["message"]), level=level))
+
+    yield add_sink, messages
+    for handler_id in handler_ids:
+        logger.remove(handler_id)
+
+
+@allure.epic("测试框架")
+@allure.feature("请求日志")
+@pytest.mark.unit
+class TestHttpClientLogging:
+    """HttpClient 惰性日志测试类"""
+
+    @allure.story("日志截断")
+    def test_truncate_body(self):
+        """测试请求/响应体截断"""
+        assert truncate_body("abc", 10) == "abc"
+        assert truncate_body("a" * 20, 5).startswith("aaaaa...<共20字符")
+        assert truncate_body("abc", 0) == "<已省略>"
+        assert truncate_body_bytes("你好世界".encode("utf-8"), "utf-8", 6) == "你好...<共12字节，已截断>"
+
+    @allure.story("惰性格式化")
+    def test_debug_body_logged_with_truncation(self, captured_logs):
+        """测试DEBUG启用时请求/响应体被截断记录，且不会再次解析JSON"""
+        add_sink, messages = captured_logs
+        add_sink("DEBUG")
+        client = HttpClient("https://station-developer.aevatar.ai", log_body_max_length=32)
+        response = _CountingResponse(json.dumps({"data": "x" * 100}).encode())
+
+        client._log_request("POST", "https://station-developer.aevatar.ai/x", json={"content": "y" * 100})
+        client._log_response(response)
+        client.close()
+
+        request_body = next(m for m in messages if m.startswith("请求体: "))
+        response_body = next(m for m in messages if m.startswith("响应体: "))
+        assert "已截断" in request_body and len(request_body) < 100
+        assert "已截断" in response_body and len(response_body) < 100
+        assert response.json_calls == 0
@@ -1,6 +1,5 @@
 import pytest
 import allure
-from common.http_client import HttpClient
 from common.assertions import ApiAssertions
 from common.logger import logger
 from common.auth_manager import auth_manager
@@ -12,28 +11,11 @@ class TestInvitationAPI:
     """GodGPT 邀请功能API测试类"""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, base_url, http_client_registry):
         """测试前置设置"""
-        self.client = HttpClient("https://station-developer.aevatar.ai")
+        self.client = http_client_registry.get_client(base_url)
         self.assertions = ApiAssertions()
         
-        # 设置默认请求头
-        self.default_headers = {
-            'accept': '*/*',
-            'accept-language': 'zh-CN,zh;q=0.9',
-            'content-type': 'application/json',
-            'origin': 'https://godgpt.portkey.finance',
-            'priority': 'u=1, i',
-            'referer': 'https://godgpt.portkey.finance/',
-            'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'cross-site',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36'
-        }
-        
         # 获取全局认证token
         self.auth_token = auth_manager.get_auth_token()
         if not self.auth_token:
@@ -49,22 +31,12 @@ class TestInvitationAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/invitation/redeem"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（使用示例邀请码）
         request_data = {"inviteCode": "uRzyNbg"}
         
         with allure.step("发送POST请求兑换邀请码"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("invitation-redeem", token=self.auth_token, json=request_data)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
@@ -72,9 +44,6 @@ class TestInvitationAPI:
                 with allure.step("验证响应不为空"):
                     self.assertions.assert_not_empty(response)
                 
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 10.0)
-                
                 with allure.step("验证响应格式"):
                     try:
                         response_json = response.json()
@@ -83,23 +52,12 @@ class TestInvitationAPI:
                         # 打印响应内容以便调试
                         logger.info(f"兑换邀请码响应内容: {response_json}")
                         
-                        # 检查是否包含成功相关字段
-                        success_fields = ['success', 'message', 'data', 'code']
-                        found_success_field = None
-                        for field in success_fields:
-                            if field in response_json:
-                                found_success_field = field
-                                break
-                        
-                        if found_success_field:
-                            field_value = response_json[found_success_field]
-                            logger.info(f"兑换邀请码成功，{found_success_field}: {field_value}")
-                        else:
-                            logger.info("响应中未找到成功相关字段，但API调用成功")
-                            pytest.fail("响应中未找到成功相关字段，但API调用成功")
-                        
                     except Exception as e:
                         logger.warning(f"响应格式验证失败: {e}")
+                
+                with allure.step("验证成功相关字段"):
+                    field_value = self.assertions.assert_json_path_any(response, ['success', 'message', 'data', 'code'])
+                    logger.info(f"兑换邀请码成功: {field_value}")
                         
             except Exception as e:
                 if "401" in str(e) or "403" in str(e):
@@ -119,22 +77,12 @@ class TestInvitationAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/invitation/redeem"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（使用无效的邀请码）
         request_data = {"inviteCode": "INVALID_CODE"}
         
         with allure.step("发送POST请求兑换无效邀请码"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("invitation-redeem", token=self.auth_token, json=request_data)
                 
                 # 无效邀请码可能返回400或其他错误状态码
                 logger.info(f"无效邀请码兑换响应状态码: {response.status_code}")
@@ -166,22 +114,12 @@ class TestInvitationAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/invitation/redeem"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（空邀请码）
         request_data = {"inviteCode": ""}
         
         with allure.step("发送POST请求兑换空邀请码"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("invitation-redeem", token=self.auth_token, json=request_data)
                 
                 # 空邀请码可能返回400或其他错误状态码
                 logger.info(f"空邀请码兑换响应状态码: {response.status_code}")
@@ -206,22 +144,12 @@ class TestInvitationAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/invitation/redeem"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（缺少邀请码）
         request_data = {}
         
         with allure.step("发送POST请求兑换缺少邀请码"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("invitation-redeem", token=self.auth_token, json=request_data)
                 
                 # 缺少邀请码可能返回400或其他错误状态码
                 logger.info(f"缺少邀请码兑换响应状态码: {response.status_code}")
@@ -246,22 +174,12 @@ class TestInvitationAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/invitation/redeem"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（使用已使用的邀请码）
         request_data = {"inviteCode": "USED_CODE"}
         
         with allure.step("发送POST请求兑换已使用邀请码"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("invitation-redeem", token=self.auth_token, json=request_data)
                 
                 # 已使用邀请码可能返回400或其他错误状态码
                 logger.info(f"已使用邀请码兑换响应状态码: {response.status_code}")
@@ -293,22 +211,12 @@ class TestInvitationAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/invitation/redeem"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（使用过期的邀请码）
         request_data = {"inviteCode": "EXPIRED_CODE"}
         
         with allure.step("发送POST请求兑换过期邀请码"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("invitation-redeem", token=self.auth_token, json=request_data)
                 
                 # 过期邀请码可能返回400或其他错误状态码
                 logger.info(f"过期邀请码兑换响应状态码: {response.status_code}")
@@ -341,29 +249,16 @@ class TestInvitationAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/invitation/redeem"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据
         request_data = {"inviteCode": "uRzyNbg"}
         
         with allure.step("发送POST请求进行性能测试"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("invitation-redeem", token=self.auth_token, json=request_data)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
                 
-                with allure.step("验证响应时间不超过5秒"):
-                    self.assertions.assert_response_time(response, 5.0)
-                
                 logger.info("兑换邀请码性能测试通过")
                 
             except Exception as e:
@@ -385,12 +280,6 @@ class TestInvitationAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/invitation/redeem"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         responses = []
         
         with allure.step("发送3个并发兑换邀请码请求"):
@@ -399,11 +288,7 @@ class TestInvitationAPI:
                 
                 def make_redeem_request():
                     request_data = {"inviteCode": "uRzyNbg"}
-                    return self.client.post(
-                        endpoint,
-                        json=request_data,
-                        headers=auth_headers
-                    )
+                    return self.client.call("invitation-redeem", token=self.auth_token, json=request_data)
                 
                 with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
                     futures = [executor.submit(make_redeem_request) for _ in range(3)]
@@ -0,0 +1,94 @@
+import json
+import pytest
+import allure
+import requests
+from common.assertions import ApiAssertions
+from common.json_path import compile_path, compile_paths
+from common.jsonl_cases import check_expectations
+from common.response import ApiResponse
+
+DOCUMENT = {
+    "code": "20000",
+    "data": {
+        "sessionId": "s-1",
+        "a/b": 1,
+        "messages": [
+            {"role": "user", "content": "你好"},
+            {"role": "assistant", "content": "你好！"},
+        ],
+    },
+}
+
+
+def _api_response(document):
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = json.dumps(document).encode()
+    return ApiResponse.wrap(response)
+
+
+@allure.epic("测试框架")
+@allure.feature("JSON路径断言")
+@pytest.mark.unit
+class TestJsonPath:
+    """JSON Pointer / JSONPath 路径断言测试类"""
+
+    @allure.story("路径语法")
+    def test_pointer_and_jsonpath_syntax(self):
+        """测试 JSON Pointer、JSONPath 子集和简写形式求值一致，非法表达式报错"""
+        cases = {
+            "/data/sessionId": ["s-1"],
+            "$.data.sessionId": ["s-1"],
+            "data.sessionId": ["s-1"],
+            "$['data']['sessionId']": ["s-1"],
+            "/data/a~1b": [1],
+            "/data/messages/1/role": ["assistant"],
+            "$.data.messages[-1].role": ["assistant"],
+            "$.data.messages[*].role": ["user", "assistant"],
+            "$.data.messages.*.content": ["你好", "你好！"],
+            "/data/messages/5": [],
+            "$.code.missing": [],
+            "": [DOCUMENT],
+        }
+        for expression, expected in cases.items():
+            assert compile_path(expression).find(DOCUMENT) == expected, expression
+        assert compile_path("$.data") is compile_path("$.data")
+        with pytest.raises(ValueError):
+            compile_path("$.data[")
+
+    @allure.story("批量求值")
+    def test_batch_evaluation_matches_single_paths(self):
+        """测试一组路径一次遍历的结果与逐个求值一致，公共前缀只展开一次"""
+        paths = ("$.code", "/data/sessionId", "$.data.messages[*].role", "$.data.messages[0]", "$.none")
+        path_set = compile_paths(paths)
+        assert path_set is compile_paths(paths)
+        results = path_set.evaluate(DOCUMENT)
+        assert results == {path: compile_path(path).find(DOCUMENT) for path in paths}
+        # "$.data" 与 "/data" 编译为相同片段，前缀树中合并为一个节点
+        assert len(path_set._root[0]) == 3
+        assert len(path_set._root[0][("member", "data")][0]) == 2
+
+    @allure.story("路径断言")
+    def test_path_assertions(self):
+        """测试单路径、批量和候选路径断言的返回值与汇总错误"""
+        response = _api_response(DOCUMENT)
+        assertions = ApiAssertions()
+
+        assert assertions.assert_json_path(response, "/data/sessionId") == "s-1"
+        assert assertions.assert_json_path(response, "$.data.messages[*].role", ["user", "assistant"]) == \
+            ["user", "assistant"]
+        assert assertions.assert_json_path_any(response, ["session_id", "data.sessionId", "code"]) == "s-1"
+        values = assertions.assert_json_paths(response, {"$.code": "20000", "/data/sessionId": lambda v: len(v) > 0})
+        assert values == {"$.code": "20000", "/data/sessionId": "s-1"}
+
+        with pytest.raises(AssertionError) as error:
+            assertions.assert_json_paths(response, {"$.code": "0", "$.data.sessionId": "s-1", "$.missing": 1})
+        message = str(error.value)
+        assert "'$.code' 的值不匹配" in message and "'$.missing' 不存在" in message
+        assert "'$.data.sessionId'" not in message.split("实际响应")[0]
+        with pytest.raises(AssertionError):
+            assertions.assert_json_path_any(response, ["session_id", "id"])
+
+        check_expectations(response, {"status": 200, "paths": {"$.data.messages[0].role": "user"}})
+        check_expectations(response, {"paths": ["$.code", "/data/messages/1"]})
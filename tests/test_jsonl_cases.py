@@ -0,0 +1,150 @@
+import json
+import subprocess
+import sys
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import pytest
+import allure
+from common.http_client import HttpClient
+from common.jsonl_cases import iter_cases, run_case
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    """返回固定JSON的桩服务"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        body = json.dumps({"code": "20000", "path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+
+@pytest.fixture(scope="module")
+def json_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _write_jsonl(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(record if isinstance(record, str) else json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+    return path
+
+
+@allure.epic("测试框架")
+@allure.feature("数据驱动用例")
+@pytest.mark.unit
+class TestJsonlCases:
+    """JSONL数据驱动用例插件测试类"""
+
+    @allure.story("逐行读取")
+    def test_iter_cases_reads_offsets(self, tmp_path):
+        """测试逐行读取时跳过空行与注释，并能按偏移量重新读取记录"""
+        path = _write_jsonl(tmp_path / "cases.jsonl", [
+            "# 注释行",
+            {"id": "first", "method": "GET", "path": "/a"},
+            "",
+            {"method": "GET", "path": "/中文", "markers": ["smoke"]},
+        ])
+        cases = list(iter_cases(path))
+
+        assert [case.case_id for case in cases] == ["first", "line4"]
+        assert cases[1].markers == ("smoke",)
+        assert cases[1].load()["path"] == "/中文"
+
+        _write_jsonl(path, [{"id": "ok"}, "{broken"])
+        with pytest.raises(ValueError, match=":2"):
+            list(iter_cases(path))
+
+    @allure.story("逐行读取")
+    def test_iter_cases_memory_stays_flat(self, tmp_path):
+        """测试遍历大文件时内存峰值与文件大小无关"""
+        path = tmp_path / "large.jsonl"
+        payload = "x" * 1000
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(20000):
+                f.write(json.dumps({"id": f"case{i}", "method": "POST", "path": "/a", "json": {"content": payload}}))
+                f.write("\n")
+
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in iter_cases(path))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert count == 20000
+        assert peak < path.stat().st_size / 50, f"遍历峰值内存 {peak} 字节"
+
+    @allure.story("期望映射到断言")
+    def test_run_case_checks_expectations(self, json_server):
+        """测试记录中的期望映射到 ApiAssertions 断言"""
+        with HttpClient(json_server) as client:
+            run_case(client, {"method": "GET", "path": "/ping", "expect": {
+                "status": 200, "json": {"code": "20000"}, "keys": ["path"], "contains": "/ping", "not_empty": True
+            }})
+            run_case(client, {"endpoint": "chat-history", "path_params": {"session_id": "abc"},
+                              "expect": {"json": {"path": "/godgptprod-client/api/godgpt/chat/abc"}}}, token="t1")
+
+            with pytest.raises(AssertionError, match="期望状态码 404"):
+                run_case(client, {"method": "GET", "path": "/ping", "expect": {"status": 404}})
+            with pytest.raises(ValueError, match="不支持的期望字段"):
+                run_case(client, {"method": "GET", "path": "/ping", "expect": {"unknown": 1}})
+            with pytest.raises(AssertionError, match="用例 plain 的期望字段 ttft_ms 不适用于普通响应"):
+                run_case(client, {"id": "plain", "method": "GET", "path": "/ping", "expect": {"ttft_ms": 100}})
+
+    @allure.story("期望校验")
+    def test_invalid_expectations_rejected_at_collection(self, tmp_path):
+        """测试收集阶段检查期望字段是否受支持、是否与记录的响应类型相符"""
+        valid = [
+            {"id": "chat", "endpoint": "user-chat", "sse": True, "expect": {"status": 200, "ttft_ms": 5000}},
+            {"id": "profile", "endpoint": "user-profile", "expect": {"status": 200, "contains": "id"}},
+        ]
+        assert [case.case_id for case in iter_cases(_write_jsonl(tmp_path / "ok.jsonl", valid))] == ["chat", "profile"]
+
+        invalid = {
+            "typo": ({"endpoint": "user-profile", "expect": {"stauts": 200}}, "不支持的期望字段: stauts"),
+            "body-on-sse": ({"endpoint": "user-chat", "sse": True, "expect": {"contains": "hi"}}, "不适用于SSE响应"),
+            "ttft-on-json": ({"method": "GET", "path": "/a", "expect": {"ttft_ms": 100}}, "只适用于SSE响应"),
+        }
+        for case_id, (record, message) in invalid.items():
+            path = _write_jsonl(tmp_path / f"{case_id}.jsonl", [{"id": "ok"}, {"id": case_id, **record}])
+            with pytest.raises(ValueError, match=f"{case_id}.*:2: .*{message}"):
+                list(iter_cases(path))
+
+    @allure.story("生成用例")
+    def test_generates_items_per_line(self, tmp_path):
+        """测试每行记录生成一个用例，记录中的标记可用于筛选"""
+        path = _write_jsonl(tmp_path / "cases.jsonl", [
+            {"id": "a", "method": "GET", "path": "/a"},
+            {"id": "b", "method": "GET", "path": "/b", "markers": ["smoke"]},
+            {"id": "c", "method": "GET", "path": "/c"},
+        ])
+        command = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider",
+                   "tests/test_recorded_cases_api.py", f"--jsonl-cases={path}"]
+
+        result = subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60)
+        assert "3 tests collected" in result.stdout, result.stdout + result.stderr
+        assert "test_recorded_case[b]" in result.stdout
+
+        result = subprocess.run(command + ["-m", "smoke"], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60)
+        assert "1/3 tests collected" in result.stdout, result.stdout + result.stderr
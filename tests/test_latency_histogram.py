@@ -0,0 +1,129 @@
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import allure
+from common.http_client import HttpClient, is_target_host
+from common.metrics import (
+    LatencyHistogram, LatencyRecorder, endpoint_template, global_latency_recorder, percentile
+)
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    """返回固定JSON的桩服务"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps({"code": "20000", "data": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def json_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@allure.epic("测试框架")
+@allure.feature("延迟直方图")
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """HDR风格延迟直方图测试类"""
+
+    @allure.story("分位数精度")
+    def test_percentiles_within_relative_error(self):
+        """测试分位数与精确值的相对误差不超过桶精度"""
+        rng = random.Random(42)
+        values = [int(rng.lognormvariate(11, 1)) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record_us(value)
+
+        for p in (50, 90, 99, 99.9):
+            exact = percentile(values, p)
+            approx = histogram.value_at_percentile(p)
+            assert abs(approx - exact) / exact <= 1 / 64, f"p{p}: {approx} vs {exact}"
+        assert histogram.value_at_percentile(100) == max(values)
+        assert histogram.min_us == min(values)
+
+    @allure.story("内存占用")
+    def test_bucket_count_independent_of_sample_count(self):
+        """测试桶数量不随记录次数增长"""
+        histogram = LatencyHistogram()
+        for i in range(200000):
+            histogram.record_us(1000 + i % 5000)
+        bucket_count = len(histogram.counts)
+
+        for i in range(200000):
+            histogram.record_us(1000 + i % 5000)
+        assert len(histogram.counts) == bucket_count
+        assert bucket_count < 400
+        assert histogram.total_count == 400000
+
+    @allure.story("合并与导出")
+    def test_merge_and_json_roundtrip(self, tmp_path):
+        """测试多个记录器（如xdist worker）合并及JSON导出导入"""
+        worker_a, worker_b = LatencyRecorder(), LatencyRecorder()
+        for ms in (10, 20, 30):
+            worker_a.record("GET", "/godgptprod-client/api/profile/user-info", ms * 1_000_000)
+        for ms in (40, 50):
+            worker_b.record("get", "https://station-developer.aevatar.ai/godgptprod-client/api/profile/user-info",
+                            ms * 1_000_000)
+        worker_b.record("POST", "/godgptprod-client/api/godgpt/share", 5_000_000)
+
+        combined = LatencyRecorder.from_dict(json.loads(json.dumps(worker_a.to_dict())))
+        combined.merge(LatencyRecorder.from_dict(json.loads(json.dumps(worker_b.to_dict()))))
+
+        profile = combined.get("GET", "/godgptprod-client/api/profile/user-info")
+        assert profile.total_count == 5
+        assert profile.min_us == 10_000
+        assert profile.max_us == 50_000
+        assert combined.summary()["POST /godgptprod-client/api/godgpt/share"]["count"] == 1
+
+        report_file = tmp_path / "latency_report.json"
+        combined.export_json(str(report_file))
+        reloaded = LatencyRecorder.load_json(str(report_file))
+        assert reloaded.summary() == combined.summary()
+
+    @allure.story("接口模板")
+    def test_endpoint_template(self):
+        """测试URL中的会话ID、数字和查询参数被归一化"""
+        assert endpoint_template(
+            "https://station-developer.aevatar.ai/godgptprod-client/api/godgpt/chat/a4eb7361-4a48-48df-9b0b-3e21dffa42d5"
+        ) == "/godgptprod-client/api/godgpt/chat/{id}"
+        assert endpoint_template("/api/users/123?page=2") == "/api/users/{id}"
+
+    @allure.story("客户端记录")
+    def test_http_client_records_latency(self, json_server, monkeypatch):
+        """测试HttpClient按客户端记录请求耗时，只有访问被测服务的客户端计入全局直方图"""
+        endpoint = "/godgptprod-client/api/godgpt/chat/71d34ea5-a9d5-45eb-bfc8-fe79132c7a4d"
+
+        def global_count():
+            histogram = global_latency_recorder.get("GET", endpoint)
+            return histogram.total_count if histogram else 0
+
+        before = global_count()
+        with HttpClient(json_server) as client:
+            assert not client.record_global
+            for _ in range(3):
+                client.get(endpoint)
+        assert client.latency_recorder.get("GET", endpoint).total_count == 3
+        assert global_count() == before
+
+        monkeypatch.setenv("API_TEST_BASE_URL", json_server)
+        with HttpClient(json_server) as client:
+            assert client.record_global
+
+        assert is_target_host(json_server + "/api", json_server)
+        assert not is_target_host("http://127.0.0.1:1/api", json_server)
+        assert not is_target_host(json_server, "")
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import pytest
+import allure
+from aiohttp import web
+from common.load_generator import LoadGenerator, LoadResult, SCENARIOS
+
+
+SERVER_LATENCY = 0.3
+
+
+class _StubServer:
+    """在后台线程事件循环中运行的访客会话桩服务"""
+
+    def __init__(self):
+        self.calls = 0
+        self.loop = asyncio.new_event_loop()
+        self.base_url = None
+        self._runner = None
+
+    async def _create_session(self, request):
+        self.calls += 1
+        call_index = self.calls
+        await asyncio.sleep(SERVER_LATENCY)
+        if call_index % 5 == 0:
+            return web.json_response({"error": "rate limited"}, status=429)
+        return web.json_response({"code": "20000", "data": "stub-session-id"})
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_post(SCENARIOS["guest-create-session"].endpoint, self._create_session)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    def start(self):
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+@pytest.fixture
+def stub_server():
+    server = _StubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@allure.epic("测试框架")
+@allure.feature("压测模式")
+@pytest.mark.unit
+class TestLoadGenerator:
+    """开环压测器测试类"""
+
+    @allure.story("开环调度")
+    def test_open_loop_throughput_and_status_breakdown(self, stub_server):
+        """测试按目标RPS发送请求，吞吐不受服务端延迟影响，并按状态码统计错误率"""
+        rps, duration = 40, 1.0
+        generator = LoadGenerator(SCENARIOS["guest-create-session"], stub_server.base_url,
+                                  rps=rps, duration=duration, concurrency=50)
+
+        with allure.step("执行压测"):
+            result = generator.run()
+        summary = result.summary()
+
+        with allure.step("验证请求数与吞吐"):
+            assert summary["total_requests"] == int(rps * duration)
+            # 闭环串行发送需要 40 * 0.3 = 12 秒，开环调度应在持续时间加单次延迟附近完成
+            assert result.wall_time < duration + SERVER_LATENCY * 3
+            assert summary["achieved_rps"] > rps / 2
+
+        with allure.step("验证状态码分布和错误率"):
+            assert summary["status_counts"] == {"200": 32, "429": 8}
+            assert summary["error_rate_by_status"] == {"429": 0.2}
+            assert summary["error_rate"] == 0.2
+
+        with allure.step("验证延迟分位数"):
+            assert summary["latency_ms"]["p50"] >= SERVER_LATENCY * 1000
+            assert summary["latency_ms"]["p50"] <= summary["latency_ms"]["p90"] \
+                <= summary["latency_ms"]["p99"] <= summary["latency_ms"]["max"]
+            assert sum(summary["histogram"].values()) == summary["total_requests"]
+
+    @allure.story("排队延迟")
+    def test_latency_includes_queueing_when_concurrency_saturated(self, stub_server):
+        """测试并发上限打满时延迟包含排队时间"""
+        generator = LoadGenerator(SCENARIOS["guest-create-session"], stub_server.base_url,
+                                  rps=20, duration=0.5, concurrency=1)
+        summary = generator.run().summary()
+
+        assert summary["total_requests"] == 10
+        assert summary["latency_ms"]["max"] >= SERVER_LATENCY * 1000 * 5
+
+    @allure.story("结果统计")
+    def test_result_report(self):
+        """测试异常类型计入错误率并生成文本报告"""
+        result = LoadResult("demo", 10, 1)
+        result.record("200", 12.0)
+        result.record("503", 80.0)
+        result.record("ClientConnectorError", 5.0)
+        result.wall_time = 1.0
+
+        assert result.error_rate == pytest.approx(2 / 3)
+        report = result.format_report()
+        assert "p99" in report
+        assert "ClientConnectorError=1" in report
+
+    @allure.story("结果统计")
+    def test_result_memory_is_bounded(self):
+        """测试延迟记录到直方图，内存占用与请求数量无关，分位数误差在直方图精度内"""
+        result = LoadResult("demo", 10, 1, method="POST", endpoint="/api/demo")
+        for i in range(100000):
+            result.record("200", (i % 1000) + 0.5)
+        summary = result.summary()
+
+        assert summary["total_requests"] == 100000
+        assert summary["latency_ms"]["p50"] == pytest.approx(500, rel=1 / 64)
+        assert summary["latency_ms"]["max"] == pytest.approx(999.5, abs=0.001)
+        assert len(result.latency_histogram.counts) < 1000
+        assert result.latency_recorder.summary()["POST /api/demo"]["count"] == 100000
+        assert summary["histogram"]["<=10ms"] == 1000
+        assert sum(summary["histogram"].values()) == 100000
+
+    @allure.story("参数校验")
+    @pytest.mark.parametrize("kwargs", [{"rps": 0}, {"rps": -5}, {"duration": 0}, {"concurrency": 0}])
+    def test_rejects_invalid_parameters(self, kwargs):
+        """测试RPS、持续时间不大于0或并发上限小于1时直接报错"""
+        options = {"rps": 10, "duration": 1, **kwargs}
+        with pytest.raises(ValueError):
+            LoadGenerator(SCENARIOS["guest-create-session"], "http://127.0.0.1:1", **options)
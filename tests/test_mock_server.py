@@ -0,0 +1,81 @@
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+import allure
+import requests
+from common.http_client import HttpClient
+from common.mock_server import MockGodGPTServer
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _login(client):
+    return client.call("connect-token", data="grant_type=password&username=u&password=p").json()["access_token"]
+
+
+@allure.epic("测试框架")
+@allure.feature("本地模拟服务")
+@pytest.mark.unit
+class TestMockServer:
+    """本地模拟GodGPT服务测试类"""
+
+    @allure.story("接口实现")
+    def test_endpoints_behave_like_godgpt(self):
+        """测试认证、401/405、会话创建、SSE流式聊天和聊天历史"""
+        with MockGodGPTServer(token_interval_ms=20) as server, HttpClient(server.base_url, retry_times=0) as client:
+            token = _login(client)
+
+            assert client.call("user-profile", token="invalid_token_here").status_code == 401
+            assert client.call("user-profile", method="POST", token=token).status_code == 405
+            session_id = client.call("user-create-session", token=token, json={"guider": ""}).json()["data"]
+
+            with client.call("user-chat", token=token, json={"content": "你好", "sessionId": session_id}) as stream:
+                chunks = [event.json()["Response"] for event in stream]
+            assert "".join(chunks) == "".join(server.reply)
+            assert stream.done
+            assert stream.metrics.gap_percentile_ms(50) >= 15
+
+            history = client.call("chat-history", path_params={"session_id": session_id}, token=token).json()
+            assert len(history["data"]) == 2
+            assert server.requests["user-chat"] == 1
+
+    @allure.story("错误注入与限流")
+    def test_error_injection_and_rate_limit(self):
+        """测试按比例注入错误、超出每秒请求上限返回429，认证接口不受影响"""
+        with MockGodGPTServer(error_rate=1.0, error_status=418) as server, \
+                HttpClient(server.base_url, retry_times=0) as client:
+            token = _login(client)
+            assert client.call("share-session", token=token, json={}).status_code == 418
+            assert server.injected_errors == 1
+
+        with MockGodGPTServer(rate_limit=5) as server, HttpClient(server.base_url, retry_times=0) as client:
+            token = _login(client)
+            # 绕过HttpClient的429重试，直接观察模拟服务的响应
+            url = f"{server.base_url}{client.endpoint_catalog.get('user-profile').path}"
+            headers = {"authorization": f"Bearer {token}"}
+            statuses = [requests.get(url, headers=headers).status_code for _ in range(20)]
+            assert 200 in statuses and 429 in statuses
+            assert server.rate_limited == statuses.count(429)
+
+    @allure.story("错误注入与限流")
+    def test_fractional_rate_limit(self):
+        """测试每个进程的上限小于1（多进程平分总上限）时按该速率放行，而不是全部返回429"""
+        server = MockGodGPTServer(rate_limit=0.5)
+        assert server._take_token()
+        assert not server._take_token()
+        # 2秒后补充一个令牌
+        server._bucket_updated -= 2.0
+        assert server._take_token()
+        assert not server._take_token()
+
+    @allure.story("离线运行API用例")
+    def test_api_suite_runs_against_mock_server(self):
+        """测试 --mock-server 下API用例访问本地模拟服务"""
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-o", "addopts=",
+             "tests/test_user_profile_api.py", "--mock-server"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120
+        )
+        assert result.returncode == 0, result.stdout[-2000:] + result.stderr[-2000:]
+        assert "6 passed" in result.stdout
@@ -0,0 +1,33 @@
+import pytest
+import allure
+from common.auth_manager import auth_manager
+from common.jsonl_cases import requires_auth, run_case
+from common.logger import logger
+
+
+@allure.epic("GodGPT API")
+@allure.feature("数据驱动用例")
+class TestRecordedCasesAPI:
+    """按JSONL文件逐行生成的数据驱动用例，见 config.yaml 中的 jsonl_cases_file"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, base_url, http_client_registry):
+        """测试前置设置"""
+        self.client = http_client_registry.get_client(base_url)
+
+    @allure.story("JSONL记录回放")
+    @pytest.mark.api
+    def test_recorded_case(self, jsonl_case):
+        """发送JSONL记录中的请求并校验 expect 中的期望"""
+        record = jsonl_case.load()
+        allure.dynamic.title(f"{jsonl_case.case_id} ({jsonl_case.path}:{jsonl_case.line_no})")
+
+        token = None
+        if requires_auth(self.client, record):
+            token = auth_manager.get_auth_token()
+            if not token:
+                pytest.skip("无法获取认证token，跳过此测试")
+
+        with allure.step(f"发送请求并校验期望: {record.get('endpoint') or record.get('path')}"):
+            response = run_case(self.client, record, token=token)
+            logger.info(f"数据驱动用例 {jsonl_case.case_id} 通过，状态码: {response.status_code}")
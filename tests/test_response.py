@@ -0,0 +1,79 @@
+import json
+import pytest
+import allure
+import requests
+import common.response as response_module
+from common.assertions import ApiAssertions
+from common.async_http_client import AsyncResponse
+from common.http_client import HttpClient
+from common.mock_server import MockGodGPTServer
+from common.response import ApiResponse
+
+HISTORY = [{"role": "user", "content": "你好"}, {"role": "assistant", "content": "你好！"}]
+
+
+def _api_response(content, encoding="utf-8"):
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = encoding
+    response._content = content
+    return ApiResponse.wrap(response)
+
+
+@pytest.fixture
+def decode_counter(monkeypatch):
+    """统计 common.response.loads 的调用次数"""
+    calls = []
+    original = response_module.loads
+
+    def counting_loads(content, encoding=None):
+        calls.append(len(content))
+        return original(content, encoding)
+
+    monkeypatch.setattr(response_module, "loads", counting_loads)
+    return calls
+
+
+@allure.epic("测试框架")
+@allure.feature("响应解析")
+@pytest.mark.unit
+class TestApiResponse:
+    """只解码一次JSON的响应对象测试类"""
+
+    @allure.story("只解码一次")
+    def test_json_decoded_once_across_assertions(self, decode_counter):
+        """测试断言与测试代码多次读取JSON时共用同一次解码结果"""
+        response = _api_response(json.dumps(HISTORY, ensure_ascii=False).encode("utf-8"))
+
+        ApiAssertions.assert_list_length(response, 2)
+        ApiAssertions.assert_json_schema(response, {"type": "array", "items": {"type": "object"}})
+        ApiAssertions.assert_custom_condition(response, lambda r: r.json()[1]["content"] == "你好！", "第二条消息")
+
+        assert response.json() is response.json()
+        assert response.json(parse_float=str) == HISTORY
+        assert len(decode_counter) == 1
+        assert isinstance(response, requests.Response)
+
+    @allure.story("解码失败与非UTF-8编码")
+    def test_decode_errors_and_other_encodings(self):
+        """测试无效JSON仍抛出 JSONDecodeError，非UTF-8编码的响应按声明的编码解码"""
+        with pytest.raises(json.JSONDecodeError):
+            _api_response(b"<html>").json()
+        with pytest.raises(AssertionError, match="响应不是有效的JSON格式"):
+            ApiAssertions.assert_json_contains(_api_response(b""), "code")
+
+        assert _api_response('{"msg": "中文"}'.encode("gbk"), encoding="gbk").json() == {"msg": "中文"}
+
+        async_response = AsyncResponse("GET", "/history", 200, {}, json.dumps(HISTORY).encode(), 0.01)
+        assert async_response.json() is async_response.json()
+
+    @allure.story("HttpClient返回ApiResponse")
+    def test_http_client_returns_api_response(self, decode_counter):
+        """测试HttpClient返回的响应在日志、断言和用例中只解码一次"""
+        with MockGodGPTServer() as server, HttpClient(server.base_url, retry_times=0) as client:
+            response = client.call("guest-create-session", json={"guider": ""})
+            assert isinstance(response, ApiResponse)
+            ApiAssertions.assert_json_contains(response, "code", "20000")
+            ApiAssertions.assert_json_schema(response, {"type": "object", "required": ["data"]})
+            assert response.json()["data"]
+        assert len(decode_counter) == 1
@@ -0,0 +1,77 @@
+import json
+import pytest
+import allure
+import jsonschema
+import requests
+from common.assertions import ApiAssertions, SchemaValidatorCache, schema_validator_cache
+from common.sse import SSEEvent
+
+SESSION_SCHEMA = {
+    "type": "object",
+    "required": ["code", "data"],
+    "properties": {
+        "code": {"type": "string"},
+        "data": {"type": "object", "properties": {"email": {"type": "string", "format": "email"}}}
+    }
+}
+
+
+def _response(payload, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = "utf-8"
+    response._content = json.dumps(payload).encode() if not isinstance(payload, bytes) else payload
+    return response
+
+
+@allure.epic("测试框架")
+@allure.feature("JSON Schema校验")
+@pytest.mark.unit
+class TestSchemaValidation:
+    """JSON Schema校验器缓存与批量校验测试类"""
+
+    @allure.story("校验器缓存")
+    def test_validator_compiled_once(self):
+        """测试同一schema对象和内容相同的schema只编译一次，超出容量时淘汰最久未用的校验器"""
+        cache = SchemaValidatorCache(maxsize=2)
+        first = cache.get(SESSION_SCHEMA)
+        assert cache.get(SESSION_SCHEMA) is first
+        assert cache.get(json.loads(json.dumps(SESSION_SCHEMA))) is first
+        assert (cache.hits, cache.misses) == (2, 1)
+
+        cache.get({"type": "string"})
+        cache.get({"type": "integer"})
+        assert len(cache) == 2
+        assert cache.get(SESSION_SCHEMA) is not first
+
+        with pytest.raises(jsonschema.exceptions.SchemaError):
+            cache.get({"type": "no-such-type"})
+
+    @allure.story("单个响应校验")
+    def test_assert_json_schema_reports_path(self):
+        """测试校验失败时报告出错字段路径，格式校验器生效"""
+        schema_validator_cache.clear()
+        ApiAssertions.assert_json_schema(_response({"code": "20000", "data": {"email": "a@b.com"}}), SESSION_SCHEMA)
+
+        with pytest.raises(AssertionError, match="data/email"):
+            ApiAssertions.assert_json_schema(_response({"code": "20000", "data": {"email": "bad"}}), SESSION_SCHEMA)
+        with pytest.raises(AssertionError, match="'data' is a required property"):
+            ApiAssertions.assert_json_schema(_response({"code": "20000"}), SESSION_SCHEMA)
+        assert schema_validator_cache.misses == 1
+
+    @allure.story("批量校验")
+    def test_bulk_validation(self):
+        """测试批量校验多个响应与SSE事件，失败时汇总所有不符合的条目"""
+        responses = [_response({"code": "20000", "data": {}}) for _ in range(10)]
+        assert ApiAssertions.assert_json_schema_all(responses, SESSION_SCHEMA) == 10
+
+        responses[3] = _response({"code": 1, "data": {}})
+        responses[7] = _response(b"not json")
+        with pytest.raises(AssertionError, match=r"2/10.*\[3\] code.*\[7\] 响应不是有效的JSON格式"):
+            ApiAssertions.assert_json_schema_all(responses, SESSION_SCHEMA)
+
+        event_schema = {"type": "object", "required": ["Response"], "properties": {"Response": {"type": "string"}}}
+        events = [SSEEvent(json.dumps({"Response": str(i)})) for i in range(5)]
+        assert ApiAssertions.assert_sse_events_schema(iter(events), event_schema) == 5
+        with pytest.raises(AssertionError, match=r"1/6 个事件"):
+            ApiAssertions.assert_sse_events_schema(events + [SSEEvent('{"ErrorCode": 1}')], event_schema)
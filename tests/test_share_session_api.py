@@ -1,6 +1,5 @@
 import pytest
 import allure
-from common.http_client import HttpClient
 from common.assertions import ApiAssertions
 from common.logger import logger
 from common.auth_manager import auth_manager
@@ -12,28 +11,11 @@ class TestShareSessionAPI:
     """GodGPT 会话分享API测试类"""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, base_url, http_client_registry):
         """测试前置设置"""
-        self.client = HttpClient("https://station-developer.aevatar.ai")
+        self.client = http_client_registry.get_client(base_url)
         self.assertions = ApiAssertions()
         
-        # 设置默认请求头
-        self.default_headers = {
-            'accept': '*/*',
-            'accept-language': 'zh-CN,zh;q=0.9',
-            'content-type': 'application/json',
-            'origin': 'https://godgpt.portkey.finance',
-            'priority': 'u=1, i',
-            'referer': 'https://godgpt.portkey.finance/',
-            'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'cross-site',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36'
-        }
-        
         # 获取全局认证token
         self.auth_token = auth_manager.get_auth_token()
         if not self.auth_token:
@@ -51,22 +33,12 @@ class TestShareSessionAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/share"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（使用示例sessionId）
         request_data = {"sessionId": "71d34ea5-a9d5-45eb-bfc8-fe79132c7a4d"}
         
         with allure.step("发送POST请求分享会话"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("share-session", token=self.auth_token, json=request_data)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
@@ -74,9 +46,6 @@ class TestShareSessionAPI:
                 with allure.step("验证响应不为空"):
                     self.assertions.assert_not_empty(response)
                 
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 10.0)
-                
                 with allure.step("验证响应格式"):
                     try:
                         response_json = response.json()
@@ -85,26 +54,13 @@ class TestShareSessionAPI:
                         # 打印响应内容以便调试
                         logger.info(f"分享会话响应内容: {response_json}")
                         
-                        # 检查是否包含分享链接或相关字段
-                        share_fields = ['shareId']
-                        found_share_field = None
-                        response_data = response_json.get('data', {}) 
-                        for field in share_fields:
-                            if field in response_data:
-                                found_share_field = field
-                                break
-                        
-                        if found_share_field:
-                            share_url = response_data[found_share_field]
-                            assert isinstance(share_url, str), f"{found_share_field}应该是字符串"
-                            assert len(share_url) > 0, f"{found_share_field}不应为空"
-                            logger.info(f"成功分享会话，{found_share_field}: {share_url}")
-                        else:
-                            logger.info("响应中未找到分享链接字段，但API调用成功")
-                            pytest.fail("响应中未找到分享链接字段，但API调用成功")
-                        
                     except Exception as e:
                         logger.warning(f"响应格式验证失败: {e}")
+                
+                with allure.step("验证分享链接字段"):
+                    share_id = self.assertions.assert_json_path(
+                        response, '/data/shareId', lambda value: isinstance(value, str) and len(value) > 0)
+                    logger.info(f"成功分享会话，shareId: {share_id}")
                         
             except Exception as e:
                 if "401" in str(e) or "403" in str(e):
@@ -124,22 +80,12 @@ class TestShareSessionAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/share"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（使用无效的sessionId）
         request_data = {"sessionId": "invalid-session-id"}
         
         with allure.step("发送POST请求分享无效会话"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("share-session", token=self.auth_token, json=request_data)
                 
                 # 无效sessionId可能返回400或其他错误状态码
                 logger.info(f"无效sessionId分享响应状态码: {response.status_code}")
@@ -171,22 +117,12 @@ class TestShareSessionAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/share"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（空sessionId）
         request_data = {"sessionId": ""}
         
         with allure.step("发送POST请求分享空sessionId会话"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("share-session", token=self.auth_token, json=request_data)
                 
                 # 空sessionId可能返回400或其他错误状态码
                 logger.info(f"空sessionId分享响应状态码: {response.status_code}")
@@ -211,22 +147,12 @@ class TestShareSessionAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/share"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（缺少sessionId）
         request_data = {}
         
         with allure.step("发送POST请求分享缺少sessionId的会话"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("share-session", token=self.auth_token, json=request_data)
                 
                 # 缺少sessionId可能返回400或其他错误状态码
                 logger.info(f"缺少sessionId分享响应状态码: {response.status_code}")
@@ -252,29 +178,16 @@ class TestShareSessionAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/share"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据
         request_data = {"sessionId": "71d34ea5-a9d5-45eb-bfc8-fe79132c7a4d"}
         
         with allure.step("发送POST请求进行性能测试"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("share-session", token=self.auth_token, json=request_data)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
                 
-                with allure.step("验证响应时间不超过5秒"):
-                    self.assertions.assert_response_time(response, 5.0)
-                
                 logger.info("分享会话性能测试通过")
                 
             except Exception as e:
@@ -296,12 +209,6 @@ class TestShareSessionAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/share"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         responses = []
         
         with allure.step("发送3个并发分享会话请求"):
@@ -310,11 +217,7 @@ class TestShareSessionAPI:
                 
                 def make_share_request():
                     request_data = {"sessionId": "71d34ea5-a9d5-45eb-bfc8-fe79132c7a4d"}
-                    return self.client.post(
-                        endpoint,
-                        json=request_data,
-                        headers=auth_headers
-                    )
+                    return self.client.call("share-session", token=self.auth_token, json=request_data)
                 
                 with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
                     futures = [executor.submit(make_share_request) for _ in range(3)]
@@ -0,0 +1,114 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+import allure
+import yaml
+from common.config import Config
+from common.endpoints import endpoint_catalog
+from common.http_client import HttpClient
+from common.metrics import LatencyRecorder
+from common.mock_server import MockGodGPTServer
+from common.slo import evaluate_slos
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+SLO_CONFIG = {
+    "slo": {
+        "min_samples": 5,
+        "endpoints": {
+            "user-profile": {"p50_ms": 1000, "p95_ms": 3000},
+            "user-chat": {"ttft_p95_ms": 15000},
+        },
+        "environments": {
+            "prod": {"user-chat": {"ttft_p95_ms": 20000, "p95_ms": 60000}},
+        },
+    }
+}
+
+SESSION_TEST = '''
+from common.http_client import HttpClient
+
+
+def test_profile_requests():
+    with HttpClient("{base_url}", retry_times=0) as client:
+        for _ in range(6):
+            assert client.call("user-profile", token="mock-token").status_code == 200
+'''
+
+
+def _record(recorder, name, *durations_ms):
+    endpoint = endpoint_catalog.get(name)
+    for duration_ms in durations_ms:
+        recorder.record(endpoint.method, endpoint.metrics_key, int(duration_ms * 1e6))
+
+
+@allure.epic("测试框架")
+@allure.feature("接口延迟SLO")
+@pytest.mark.unit
+class TestSlo:
+    """接口延迟SLO测试类"""
+
+    @allure.story("按环境加载预算")
+    def test_budgets_per_environment(self, tmp_path, monkeypatch):
+        """测试环境配置覆盖通用配置中同一接口的同名指标"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.safe_dump(SLO_CONFIG), encoding="utf-8")
+        config = Config(str(config_file))
+
+        assert config.get_slos("dev") == {"user-profile": {"p50_ms": 1000.0, "p95_ms": 3000.0},
+                                          "user-chat": {"ttft_p95_ms": 15000.0}}
+        monkeypatch.setenv("TEST_ENV", "prod")
+        assert config.environment == "prod"
+        assert config.get_slos()["user-chat"] == {"ttft_p95_ms": 20000.0, "p95_ms": 60000.0}
+        assert Config(str(tmp_path / "missing.yaml")).get_slos() == {}
+
+    @allure.story("按百分位评估")
+    def test_percentile_budgets(self):
+        """测试单个慢请求不超出p95预算，尾部延迟整体变慢时超出；样本不足不评估"""
+        latency, ttft = LatencyRecorder(), LatencyRecorder()
+        budgets = {"user-profile": {"p50_ms": 100, "p95_ms": 500}, "user-chat": {"ttft_p95_ms": 1000}}
+
+        _record(latency, "user-profile", *[50] * 99, 5000)
+        _record(ttft, "user-chat", 200, 300)
+        results = {(r.endpoint, r.metric): r for r in evaluate_slos(budgets, latency, ttft)}
+        assert not any(r.breached for r in results.values())
+        assert results[("user-profile", "p95_ms")].samples == 100
+        assert not results[("user-chat", "ttft_p95_ms")].evaluated
+
+        _record(latency, "user-profile", *[800] * 10)
+        breached = [r for r in evaluate_slos(budgets, latency, ttft) if r.breached]
+        assert [(r.endpoint, r.metric) for r in breached] == [("user-profile", "p95_ms")]
+        assert "预算 500ms" in str(breached[0])
+
+        with pytest.raises(ValueError):
+            evaluate_slos({"user-profile": {"p42_ms": 1}}, latency, ttft)
+
+    @allure.story("会话级评估")
+    def test_session_fails_on_breach(self, tmp_path):
+        """测试SSE首token耗时计入直方图；会话结束时超出预算则退出码为失败，--no-slo 跳过评估，不访问被测服务的请求不参与评估"""
+        with MockGodGPTServer(latency_ms=20) as server:
+            with HttpClient(server.base_url, retry_times=0) as client:
+                endpoint = endpoint_catalog.get("user-chat")
+                with client.call("user-chat", token="mock-token", json={"content": "hi", "sessionId": "s"}) as stream:
+                    list(stream)
+                assert client.ttft_recorder.get(endpoint.method, endpoint.metrics_key).total_count == 1
+
+            (tmp_path / "conftest.py").write_text('pytest_plugins = ["common.slo"]\n', encoding="utf-8")
+            (tmp_path / "test_session.py").write_text(SESSION_TEST.format(base_url=server.base_url), encoding="utf-8")
+            (tmp_path / "config.yaml").write_text(
+                yaml.safe_dump({"slo": {"endpoints": {"user-profile": {"p95_ms": 5}}}}), encoding="utf-8")
+            # 只有访问被测服务的请求计入SLO评估
+            env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT), "API_TEST_BASE_URL": server.base_url}
+
+            def run(*args):
+                return subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *args],
+                                      cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120)
+
+            result = run()
+            assert result.returncode == pytest.ExitCode.TESTS_FAILED, result.stdout[-2000:]
+            assert "1 passed" in result.stdout and "SLO超出预算 user-profile p95_ms" in result.stdout
+            assert run("--no-slo").returncode == pytest.ExitCode.OK
+            env["API_TEST_BASE_URL"] = "http://127.0.0.1:1"
+            assert run().returncode == pytest.ExitCode.OK
@@ -0,0 +1,74 @@
+import json
+import pytest
+import allure
+import requests
+from common.assertions import ApiAssertions, SoftAssertions
+from common.logger import logger
+from common.response import ApiResponse
+
+
+def _api_response(document, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = "utf-8"
+    response._content = json.dumps(document).encode()
+    return ApiResponse.wrap(response)
+
+
+@pytest.fixture
+def log_messages():
+    """收集测试期间输出的日志"""
+    messages = []
+    handler_id = logger.add(lambda message: messages.append(message.record), level="DEBUG")
+    yield messages
+    logger.remove(handler_id)
+
+
+@allure.epic("测试框架")
+@allure.feature("软断言")
+@pytest.mark.unit
+class TestSoftAssertions:
+    """软断言收集器测试类"""
+
+    @allure.story("全部通过只输出汇总日志")
+    def test_passing_checks_log_one_summary(self, log_messages):
+        """测试收集器中的断言通过时不逐条输出日志，返回值与直接调用一致"""
+        response = _api_response({"code": "20000", "data": {"sessionId": "s-1"}})
+        with ApiAssertions.soft("创建会话") as check:
+            check.status_code(response, 200)
+            check.assert_json_contains(response, "code", "20000")
+            session_id = check.json_path(response, "/data/sessionId")
+            assert check.that(session_id == "s-1", "sessionId不匹配")
+
+        assert session_id == "s-1"
+        assert [record["message"] for record in log_messages] == ["断言汇总[创建会话]: 通过 4/4"]
+
+        # 收集器之外恢复逐条日志
+        ApiAssertions.assert_status_code(response, 200)
+        assert log_messages[-1]["message"] == "状态码断言通过: 200"
+
+    @allure.story("失败汇总")
+    def test_failures_are_aggregated(self, log_messages):
+        """测试失败不中断后续断言，退出时抛出包含所有失败的 AssertionError"""
+        response = _api_response({"code": "50000"}, status_code=500)
+        collector = SoftAssertions("聊天")
+        with pytest.raises(AssertionError) as error:
+            with collector as check:
+                check.status_code(response, 200)
+                check.json_path(response, "$.code", "20000")
+                check.not_empty(response)
+                check.that(False, "[Chunk 3] ErrorCode 不为 0：5")
+
+        report = str(error.value)
+        assert report.startswith("断言汇总[聊天]: 通过 1/4, 失败 3")
+        assert "期望状态码 200, 实际状态码 500" in report
+        assert "'$.code' 的值不匹配" in report and "[Chunk 3] ErrorCode 不为 0" in report
+        assert collector.failures[0].startswith("status_code: ")
+        assert [record["level"].name for record in log_messages] == ["ERROR"]
+
+        # 块内的其它异常照常抛出，断言失败仍记录到日志
+        with pytest.raises(KeyError):
+            with ApiAssertions.soft() as check:
+                check.status_code(response, 200)
+                raise KeyError("data")
+        assert log_messages[-1]["message"].startswith("断言汇总: 通过 0/1, 失败 1")
@@ -0,0 +1,151 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import allure
+from common.http_client import HttpClient
+from common.assertions import ApiAssertions
+from common.metrics import percentile
+from common.sse import parse_sse, iter_sse_lines
+
+
+CHAT_ENDPOINT = "/godgptprod-client/api/godgpt/guest/chat"
+EVENT_INTERVAL = 0.2
+
+
+class _ChatStreamHandler(BaseHTTPRequestHandler):
+    """以分块传输逐个推送事件的聊天桩服务"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _write_chunk(self, payload: str) -> None:
+        data = payload.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, word in enumerate(["你好", "，", "世界"]):
+            self._write_chunk(f"id: {i}\r\ndata: {json.dumps({'Response': word, 'ErrorCode': 0})}\r\n\r\n")
+            time.sleep(EVENT_INTERVAL)
+        self._write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+@pytest.fixture(scope="module")
+def chat_stream_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatStreamHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@allure.epic("测试框架")
+@allure.feature("SSE流式解析")
+@pytest.mark.unit
+class TestSSEParser:
+    """SSE增量解析测试类"""
+
+    @allure.story("字段解析")
+    def test_parse_fields_and_multiline_data(self):
+        """测试event/id/retry字段、注释行与多行data"""
+        lines = [
+            ": keep-alive",
+            "event: delta",
+            "id: 42",
+            "retry: 3000",
+            "data: {\"Response\":",
+            "data:  \"hi\"}",
+            "",
+            "data:no-space",
+            "",
+        ]
+        events = list(parse_sse(lines))
+
+        assert len(events) == 2
+        assert events[0].event == "delta"
+        assert events[0].id == "42"
+        assert events[0].retry == 3000
+        assert events[0].data == "{\"Response\":\n \"hi\"}"
+        assert events[0].json() == {"Response": "hi"}
+        assert events[1].event == "message"
+        assert events[1].id == "42"
+        assert events[1].data == "no-space"
+
+    @allure.story("字段解析")
+    def test_unterminated_event_dispatched_at_eof(self):
+        """测试流末尾未以空行结束的事件仍被分派"""
+        events = list(parse_sse(["data: a", "", "data: b"]))
+        assert [e.data for e in events] == ["a", "b"]
+
+    @allure.story("行切分")
+    def test_crlf_split_across_chunks(self):
+        """测试\\r\\n跨数据块边界时不产生多余空行"""
+        chunks = [b"data: 1\r", b"\ndata: 2\r\n", b"\r\n", "data: 中".encode("utf-8")[:-1],
+                  "中".encode("utf-8")[-1:] + b"\n\n"]
+        lines = list(iter_sse_lines(chunks))
+        assert lines == ["data: 1", "data: 2", "", "data: 中", ""]
+        assert [e.data for e in parse_sse(lines)] == ["1\n2", "中"]
+
+    @allure.story("流式读取")
+    def test_stream_sse_yields_incrementally(self, chat_stream_server):
+        """测试事件到达即返回，且遇到[DONE]后结束"""
+        client = HttpClient(chat_stream_server)
+        start_time = time.perf_counter()
+        arrivals = []
+
+        with client.stream_sse("POST", CHAT_ENDPOINT, json={"content": "hello", "images": [], "region": ""}) as stream:
+            assert stream.status_code == 200
+            for payload in stream.iter_json():
+                arrivals.append((time.perf_counter() - start_time, payload))
+
+        assert [p["Response"] for _, p in arrivals] == ["你好", "，", "世界"]
+        assert stream.done
+        assert stream.event_count == 3
+        assert arrivals[0][0] < EVENT_INTERVAL * 2, "首个事件应在流结束前到达"
+        client.close()
+
+    @allure.story("流式耗时指标")
+    def test_stream_metrics_and_assertions(self, chat_stream_server):
+        """测试首字节、首token、事件间隔和总耗时指标"""
+        client = HttpClient(chat_stream_server)
+
+        with client.stream_sse("POST", CHAT_ENDPOINT, json={"content": "hello"}) as stream:
+            with pytest.raises(AssertionError):
+                ApiAssertions.assert_ttft(stream, 10000)
+            events = list(stream)
+        client.close()
+
+        metrics = stream.metrics
+        assert len(events) == 3
+        assert metrics.ttfb_ms <= metrics.ttft_ms <= metrics.duration_ms
+        assert len(metrics.event_gaps_ms) == 2
+        assert metrics.gap_percentile_ms(50) >= EVENT_INTERVAL * 1000 * 0.8
+
+        ApiAssertions.assert_ttfb(stream, EVENT_INTERVAL * 1000)
+        ApiAssertions.assert_ttft(stream, EVENT_INTERVAL * 1000)
+        ApiAssertions.assert_event_gap_percentile(stream, 95, EVENT_INTERVAL * 1000 * 3)
+        ApiAssertions.assert_stream_duration(stream, EVENT_INTERVAL * 1000 * 6)
+        with pytest.raises(AssertionError):
+            ApiAssertions.assert_event_gap_percentile(stream, 95, 1)
+
+    @allure.story("流式耗时指标")
+    def test_percentile(self):
+        """测试最近秩法百分位数"""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 100) == 100
+        assert percentile([7], 99) == 7
+        assert percentile([], 50) is None
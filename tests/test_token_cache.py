@@ -0,0 +1,106 @@
+import importlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import allure
+from common.token_cache import FileTokenCache
+
+
+def _worker_get_token(auth_url, cache_file, start_at):
+    """子进程入口：模拟一个xdist worker获取token"""
+    os.environ["GODGPT_USERNAME"] = "tester"
+    os.environ["GODGPT_PASSWORD"] = "secret"
+    from common.auth_manager import AuthManager
+
+    manager = AuthManager(auth_base_url=auth_url, token_cache_file=cache_file)
+    time.sleep(max(0, start_at - time.time()))
+    return manager.get_auth_token()
+
+
+@pytest.fixture
+def auth_manager_module(token_stub, monkeypatch):
+    monkeypatch.setenv("GODGPT_USERNAME", "tester")
+    monkeypatch.setenv("GODGPT_PASSWORD", "secret")
+    return importlib.import_module("common.auth_manager")
+
+
+@allure.epic("测试框架")
+@allure.feature("认证Token跨进程缓存")
+@pytest.mark.unit
+class TestTokenCache:
+    """跨进程token缓存测试类"""
+
+    @allure.story("读写与过期")
+    def test_store_load_and_expiry(self, tmp_path):
+        """测试缓存写入、按剩余有效期读取和清除"""
+        cache = FileTokenCache(tmp_path / "token.json")
+        key = FileTokenCache.cache_key("https://auth", "tester")
+        assert cache.load(key) is None
+
+        with cache.lock():
+            cache.store("expired", "old", time.time() - 1)
+            cache.store(key, "abc", time.time() + 100)
+
+        assert cache.load(key)[0] == "abc"
+        assert cache.load(key, min_valid_seconds=300) is None
+        assert "expired" not in cache._read_all()
+        assert oct(os.stat(cache.path).st_mode & 0o777) == "0o600"
+
+        cache.clear(key)
+        assert cache.load(key) is None
+
+    @allure.story("并发读写")
+    def test_concurrent_writers_keep_file_valid(self, tmp_path):
+        """测试多线程同时读写时读取方始终拿到完整的缓存内容"""
+        cache = FileTokenCache(tmp_path / "token.json")
+        expires_at = time.time() + 3600
+        with cache.lock():
+            cache.store("k0", "t0", expires_at)
+
+        def write(i):
+            with cache.lock():
+                cache.store(f"k{i % 4}", f"t{i}", expires_at)
+
+        def read(_):
+            return cache.load("k0") is not None
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            writes = [pool.submit(write, i) for i in range(100)]
+            reads = list(pool.map(read, range(200)))
+            for future in writes:
+                future.result()
+
+        assert all(reads)
+        assert set(cache._read_all()) == {"k0", "k1", "k2", "k3"}
+
+    @allure.story("多进程只登录一次")
+    def test_processes_share_one_login(self, token_server, token_stub, tmp_path):
+        """测试多个进程同时获取token只向认证服务登录一次"""
+        cache_file = str(tmp_path / "auth_token.json")
+        context = multiprocessing.get_context("spawn")
+
+        with allure.step("4个进程同时获取token"):
+            with context.Pool(4) as pool:
+                start_at = time.time() + 3
+                tokens = pool.starmap(_worker_get_token, [(token_server, cache_file, start_at)] * 4)
+
+        with allure.step("验证只登录一次"):
+            assert token_stub.requests == 1
+            assert set(tokens) == {"token-1"}
+
+    @allure.story("强制刷新复用其他进程的新token")
+    def test_force_refresh_adopts_newer_cached_token(self, auth_manager_module, token_server, token_stub, tmp_path):
+        """测试强制刷新时，若其他进程已写入新token则直接使用"""
+        cache_file = tmp_path / "auth_token.json"
+        manager = auth_manager_module.AuthManager(auth_base_url=token_server, token_cache_file=cache_file)
+        other = auth_manager_module.AuthManager(auth_base_url=token_server, token_cache_file=cache_file)
+        assert manager.get_auth_token() == "token-1"
+        assert other.get_auth_token() == "token-1"
+        assert token_stub.requests == 1
+
+        assert other.refresh_token() == "token-2"
+        assert manager.refresh_token() == "token-2"
+        assert token_stub.requests == 2
+        assert manager.get_stats()["cache_hits"] == 1
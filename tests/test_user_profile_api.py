@@ -1,6 +1,5 @@
 import pytest
 import allure
-from common.http_client import HttpClient
 from common.assertions import ApiAssertions
 from common.logger import logger
 from common.auth_manager import auth_manager
@@ -12,29 +11,12 @@ class TestUserProfileAPI:
     """GodGPT 用户Profile API测试类"""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, base_url, http_client_registry):
         """测试前置设置"""
-        # 使用实际的API地址
-        self.client = HttpClient("https://station-developer.aevatar.ai")
+        # 使用配置的API地址（--mock-server 时为本地模拟服务）
+        self.client = http_client_registry.get_client(base_url)
         self.assertions = ApiAssertions()
         
-        # 设置默认请求头
-        self.default_headers = {
-            'accept': '*/*',
-            'accept-language': 'zh-CN,zh;q=0.9',
-            'content-type': 'application/json',
-            'origin': 'https://godgpt.portkey.finance',
-            'priority': 'u=1, i',
-            'referer': 'https://godgpt.portkey.finance/',
-            'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'cross-site',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36'
-        }
-        
         # 获取全局认证token
         self.auth_token = auth_manager.get_auth_token()
         if not self.auth_token:
@@ -50,18 +32,9 @@ class TestUserProfileAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/profile/user-info"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         with allure.step("发送GET请求查询用户Profile"):
             try:
-                response = self.client.get(
-                    endpoint,
-                    headers=auth_headers
-                )
+                response = self.client.call("user-profile", token=self.auth_token)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
@@ -69,9 +42,6 @@ class TestUserProfileAPI:
                 with allure.step("验证响应不为空"):
                     self.assertions.assert_not_empty(response)
                 
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 10.0)
-                
                 with allure.step("验证响应格式"):
                     try:
                         response_json = response.json()
@@ -109,18 +79,10 @@ class TestUserProfileAPI:
     @pytest.mark.api
     def test_get_user_profile_invalid_token(self):
         """测试查询用户Profile-无效Token"""
-        endpoint = "/godgptprod-client/api/profile/user-info"
-        
-        # 设置无效的认证token
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = 'Bearer invalid_token_here'
-        
         with allure.step("发送GET请求查询用户Profile-无效Token"):
             try:
-                response = self.client.get(
-                    endpoint,
-                    headers=auth_headers
-                )
+                # 设置无效的认证token
+                response = self.client.call("user-profile", token="invalid_token_here")
                 
                 with allure.step("验证响应状态码为401"):
                     self.assertions.assert_status_code(response, 401)
@@ -137,14 +99,9 @@ class TestUserProfileAPI:
     @pytest.mark.api
     def test_get_user_profile_missing_token(self):
         """测试查询用户Profile-缺少Token"""
-        endpoint = "/godgptprod-client/api/profile/user-info"
-        
         with allure.step("发送GET请求查询用户Profile-缺少Token"):
             try:
-                response = self.client.get(
-                    endpoint,
-                    headers=self.default_headers
-                )
+                response = self.client.call("user-profile", anonymous=True)
                 
                 with allure.step("验证响应状态码为401"):
                     self.assertions.assert_status_code(response, 401)
@@ -164,18 +121,9 @@ class TestUserProfileAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/profile/user-info"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         with allure.step("发送POST请求到查询Profile端点"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    headers=auth_headers
-                )
+                response = self.client.call("user-profile", method="POST", token=self.auth_token)
                 
                 with allure.step("验证响应状态码为405"):
                     self.assertions.assert_status_code(response, 405)
@@ -196,25 +144,13 @@ class TestUserProfileAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/profile/user-info"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         with allure.step("发送GET请求查询用户Profile"):
             try:
-                response = self.client.get(
-                    endpoint,
-                    headers=auth_headers
-                )
+                response = self.client.call("user-profile", token=self.auth_token)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
                 
-                with allure.step("验证响应时间不超过5秒"):
-                    self.assertions.assert_response_time(response, 5.0)
-                    
             except Exception as e:
                 if "401" in str(e) or "403" in str(e):
                     logger.error("API返回认证错误，token可能已过期")
@@ -234,12 +170,6 @@ class TestUserProfileAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/profile/user-info"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         responses = []
         
         with allure.step("发送3个并发Profile查询请求"):
@@ -247,10 +177,7 @@ class TestUserProfileAPI:
                 import concurrent.futures
                 
                 def make_profile_request():
-                    return self.client.get(
-                        endpoint,
-                        headers=auth_headers
-                    )
+                    return self.client.call("user-profile", token=self.auth_token)
                 
                 with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
                     futures = [executor.submit(make_profile_request) for _ in range(3)]
@@ -1,10 +1,14 @@
 import pytest
 import allure
 import json
-from common.http_client import HttpClient
 from common.assertions import ApiAssertions
 from common.logger import logger
 from common.auth_manager import auth_manager
+from common.test_data import test_data_manager
+from common.token_cache import FileTokenCache
+
+# 聊天用例共用的会话ID在共享测试数据中的有效期（秒）
+CHAT_SESSION_TTL = 1800
 
 
 @allure.epic("GodGPT API")
@@ -13,28 +17,11 @@ class TestUserSessionAPI:
     """GodGPT 用户登录会话API测试类"""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, base_url, http_client_registry):
         """测试前置设置"""
-        self.client = HttpClient("https://station-developer.aevatar.ai")
+        self.client = http_client_registry.get_client(base_url)
         self.assertions = ApiAssertions()
         
-        # 设置默认请求头
-        self.default_headers = {
-            'accept': '*/*',
-            'accept-language': 'zh-CN,zh;q=0.9',
-            'content-type': 'application/json',
-            'origin': 'https://godgpt.portkey.finance',
-            'priority': 'u=1, i',
-            'referer': 'https://godgpt.portkey.finance/',
-            'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'cross-site',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36'
-        }
-        
         # 获取全局认证token
         self.auth_token = auth_manager.get_auth_token()
         if not self.auth_token:
@@ -43,6 +30,63 @@ class TestUserSessionAPI:
         # 存储session ID
         self.session_id = None
     
+    def _chat_session_key(self):
+        """共用会话在共享测试数据中的键，按服务地址和账号区分，不在共享存储中保存明文用户名"""
+        return f"chat-session:{FileTokenCache.cache_key(self.client.base_url, auth_manager.auth_credentials['username'])}"
+    
+    def _chat_session_id(self):
+        """聊天用例共用的会话ID，所有用例和并行执行的worker只创建一次，创建失败时返回None"""
+        def create_session():
+            response = self.client.call("user-create-session", token=self.auth_token, json={"guider": ""})
+            self.assertions.assert_status_code(response, 200)
+            try:
+                session_id = self.assertions.assert_json_path_any(
+                    response, ['sessionId', 'session_id', 'session', 'id', 'data'])
+            except AssertionError:
+                session_id = None
+            if not isinstance(session_id, str) or not session_id:
+                raise LookupError(f"创建会话响应中没有sessionId: {response.text[:200]}")
+            logger.info(f"创建聊天共用会话，sessionId: {session_id}")
+            return session_id
+
+        try:
+            return test_data_manager.get_or_create_test_data(self._chat_session_key(), create_session, ttl=CHAT_SESSION_TTL)
+        except LookupError as e:
+            logger.warning(str(e))
+            return None
+        except Exception as e:
+            if "401" in str(e) or "403" in str(e):
+                logger.error("API返回认证错误，token可能已过期")
+                pytest.fail("认证失败，测试失败")
+            elif "429" in str(e):
+                logger.warning("API返回429错误（请求过于频繁），这是预期的限制")
+                pytest.skip("API请求频率限制，跳过此测试")
+            raise
+    
+    def _call_chat(self, request_data, **kwargs):
+        """
+        使用共用会话发送聊天请求
+        
+        共用会话可能已在服务端失效（其他worker或上次执行创建，有效期内一直复用），返回4xx时
+        删除共享的会话ID、重新创建会话后重发一次；认证错误和频率限制与会话无关，直接返回。
+        """
+        response = self.client.call("user-chat", token=self.auth_token, json=request_data, **kwargs)
+        if not 400 <= response.status_code < 500 or response.status_code in (401, 403, 429):
+            return response
+        
+        stale_session_id = request_data["sessionId"]
+        logger.warning(f"共用会话 {stale_session_id} 请求返回 {response.status_code}，重新创建会话后重试一次")
+        response.close()
+        key = self._chat_session_key()
+        # 其他用例可能已替换为新会话，只删除自己用过的
+        if test_data_manager.get_test_data(key) == stale_session_id:
+            test_data_manager.delete_test_data(key)
+        self.session_id = self._chat_session_id()
+        if not self.session_id:
+            pytest.skip("无法重新创建sessionId，跳过聊天测试")
+        request_data["sessionId"] = self.session_id
+        return self.client.call("user-chat", token=self.auth_token, json=request_data, **kwargs)
+    
     @allure.story("创建用户会话")
     @allure.severity(allure.severity_level.CRITICAL)
     @pytest.mark.smoke
@@ -52,22 +96,12 @@ class TestUserSessionAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/create-session"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据
         request_data = {"guider": ""}
         
         with allure.step("发送POST请求创建用户会话"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("user-create-session", token=self.auth_token, json=request_data)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
@@ -75,9 +109,6 @@ class TestUserSessionAPI:
                 with allure.step("验证响应不为空"):
                     self.assertions.assert_not_empty(response)
                 
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 10.0)
-                
                 with allure.step("验证响应格式"):
                     try:
                         response_json = response.json()
@@ -86,26 +117,12 @@ class TestUserSessionAPI:
                         # 打印响应内容以便调试
                         logger.info(f"创建会话响应内容: {response_json}")
                         
-                        # 检查是否包含session ID（尝试不同的字段名）
-                        session_id_field = None
-                        for field in ['sessionId', 'session_id', 'session', 'id', 'data']:
-                            if field in response_json:
-                                session_id_field = field
-                                break
-                        
-                        if session_id_field:
-                            self.session_id = response_json[session_id_field]
-                            assert isinstance(self.session_id, str), f"{session_id_field}应该是字符串"
-                            assert len(self.session_id) > 0, f"{session_id_field}不应为空"
-                            logger.info(f"成功创建用户会话，{session_id_field}: {self.session_id}")
-                        else:
-                            logger.warning("响应中未找到sessionId相关字段")
-                            # 如果响应是字符串，可能直接返回sessionId
-                            if isinstance(response_json, str):
-                                self.session_id = response_json
-                                logger.info(f"响应直接返回sessionId: {self.session_id}")
-                            else:
-                                logger.warning("无法从响应中提取sessionId")
+                        # 检查是否包含session ID（按顺序尝试不同的字段名）
+                        self.session_id = self.assertions.assert_json_path_any(
+                            response, ['sessionId', 'session_id', 'session', 'id', 'data'])
+                        assert isinstance(self.session_id, str), "sessionId应该是字符串"
+                        assert len(self.session_id) > 0, "sessionId不应为空"
+                        logger.info(f"成功创建用户会话，sessionId: {self.session_id}")
                         
                     except Exception as e:
                         logger.warning(f"响应格式验证失败: {e}")
@@ -131,17 +148,10 @@ class TestUserSessionAPI:
             pytest.skip("无法获取认证token，跳过此测试")
             
         # 先创建会话
-        self.test_create_user_session()
+        self.session_id = self._chat_session_id()
         if not self.session_id:
             pytest.skip("无法获取sessionId，跳过聊天测试")
             
-        endpoint = "/godgptprod-client/api/gotgpt/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        auth_headers['accept'] = 'text/event-stream'
-        
         # 请求数据
         import datetime
         current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -154,78 +164,29 @@ class TestUserSessionAPI:
         
         with allure.step("发送POST请求进行用户聊天"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
-                
-                with allure.step("验证响应状态码"):
-                    self.assertions.assert_status_code(response, 200)
-                
-                with allure.step("验证响应不为空"):
-                    self.assertions.assert_not_empty(response)
-                
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 30.0)
-                
-                with allure.step("验证响应格式"):
-                    try:
-                        response_text = response.text
-                        assert len(response_text) > 0, "响应内容不应为空"
-                        logger.info(f"聊天响应内容长度: {len(response_text)}")
-
-                        # 检查是否为事件流格式
-                        if 'data:' in response_text or 'event:' in response_text:
-                            logger.info("响应为事件流格式")
-
-                            # 提取每一行以 "data: " 开头的部分
-                            lines = response_text.strip().splitlines()
-                            data_lines = [line for line in lines if line.startswith("data:")]
-
-                            assert len(data_lines) > 0, "事件流中未找到 data 字段"
-
-                            valid_responses = 0
-                            for i, line in enumerate(data_lines):
-                                json_part = line[len("data:"):].strip()
-                                
-                                # 跳过空行或无效数据
-                                if not json_part or json_part == "[DONE]":
-                                    continue
-                                    
-                                try:
-                                    parsed = json.loads(json_part)
-                                    valid_responses += 1
-                                    
-                                    logger.debug(f"[Chunk {i}] 解析结果: {parsed}")
-
-                                    # 验证 response 字段（如果存在）
-                                    if "Response" in parsed:
-                                        assert parsed["Response"] != "You've run out of credits.", f"[Chunk {i}] response 为 You've run out of credits."
-                                    
-                                    # 验证 ErrorCode 字段（如果存在）
-                                    if "ErrorCode" in parsed:
-                                        assert parsed["ErrorCode"] == 0, f"[Chunk {i}] ErrorCode 不为 0：{parsed['ErrorCode']}"
-                                        
-                                except json.JSONDecodeError as json_error:
-                                    logger.warning(f"[Chunk {i}] JSON解析失败，跳过此片段: {json_error}")
-                                    logger.debug(f"[Chunk {i}] 原始数据: {json_part}")
-                                    continue
-                                except Exception as e:
-                                    logger.warning(f"[Chunk {i}] 解析异常，跳过此片段: {e}")
-                                    continue
-                            
-                            # 确保至少有一个有效的响应
-                            assert valid_responses > 0, "未找到任何有效的JSON响应"
-                            logger.info(f"成功解析 {valid_responses} 个有效响应片段")
-
-                        else:
-                            logger.info("响应为普通文本格式")
-                            # 如果是普通文本，可以按需添加其他验证逻辑
-
-                    except Exception as e:
-                        logger.warning(f"响应格式验证失败: {e}")
-                        pytest.fail(f"响应格式验证失败: {e}")
+                with self._call_chat(request_data) as stream, \
+                        allure.step("验证聊天响应"), self.assertions.soft("用户聊天") as check:
+                    # 一次聊天请求的所有检查都执行完再汇总，失败时不必重跑请求逐个排查
+                    check.status_code(stream, 200)
+                    
+                    valid_responses = 0
+                    for i, parsed in enumerate(stream.iter_json()):
+                        valid_responses += 1
+                        logger.debug(f"[Chunk {i}] 解析结果: {parsed}")
+                        
+                        # 验证 response 字段（如果存在）
+                        if "Response" in parsed:
+                            check.that(parsed["Response"] != "You've run out of credits.",
+                                       f"[Chunk {i}] response 为 You've run out of credits.")
+                        
+                        # 验证 ErrorCode 字段（如果存在）
+                        if "ErrorCode" in parsed:
+                            check.that(parsed["ErrorCode"] == 0, f"[Chunk {i}] ErrorCode 不为 0：{parsed['ErrorCode']}")
+                    
+                    check.that(stream.bytes_received > 0, "响应内容不应为空")
+                    # 确保至少有一个有效的响应
+                    check.that(valid_responses > 0, "未找到任何有效的JSON响应")
+                    logger.info(f"成功解析 {valid_responses} 个有效响应片段，响应内容长度: {stream.bytes_received}")
                         
             except Exception as e:
                 if "401" in str(e) or "403" in str(e):
@@ -247,17 +208,10 @@ class TestUserSessionAPI:
             pytest.skip("无法获取认证token，跳过此测试")
             
         # 先创建会话
-        self.test_create_user_session()
+        self.session_id = self._chat_session_id()
         if not self.session_id:
             pytest.skip("无法获取sessionId，跳过聊天测试")
             
-        endpoint = "/godgptprod-client/api/gotgpt/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        auth_headers['accept'] = 'text/event-stream'
-        
         # 请求数据（带图片）
         import datetime
         current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -270,11 +224,7 @@ class TestUserSessionAPI:
         
         with allure.step("发送POST请求进行带图片的用户聊天"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self._call_chat(request_data, sse=False)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
@@ -282,9 +232,6 @@ class TestUserSessionAPI:
                 with allure.step("验证响应不为空"):
                     self.assertions.assert_not_empty(response)
                 
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 30.0)
-                
                 logger.info("带图片的用户聊天测试通过")
                 
             except Exception as e:
@@ -307,17 +254,10 @@ class TestUserSessionAPI:
             pytest.skip("无法获取认证token，跳过此测试")
             
         # 先创建会话
-        self.test_create_user_session()
+        self.session_id = self._chat_session_id()
         if not self.session_id:
             pytest.skip("无法获取sessionId，跳过聊天测试")
             
-        endpoint = "/godgptprod-client/api/gotgpt/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        auth_headers['accept'] = 'text/event-stream'
-        
         # 请求数据（带地区）
         import datetime
         current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -330,11 +270,7 @@ class TestUserSessionAPI:
         
         with allure.step("发送POST请求进行带地区的用户聊天"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self._call_chat(request_data, sse=False)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
@@ -342,9 +278,6 @@ class TestUserSessionAPI:
                 with allure.step("验证响应不为空"):
                     self.assertions.assert_not_empty(response)
                 
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 30.0)
-                
                 logger.info("带地区的用户聊天测试通过")
                 
             except Exception as e:
@@ -367,17 +300,10 @@ class TestUserSessionAPI:
             pytest.skip("无法获取认证token，跳过此测试")
             
         # 先创建会话
-        self.test_create_user_session()
+        self.session_id = self._chat_session_id()
         if not self.session_id:
             pytest.skip("无法获取sessionId，跳过聊天测试")
             
-        endpoint = "/godgptprod-client/api/gotgpt/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        auth_headers['accept'] = 'text/event-stream'
-        
         # 请求数据（空内容）
         import datetime
         current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -390,11 +316,7 @@ class TestUserSessionAPI:
         
         with allure.step("发送POST请求进行空内容的用户聊天"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("user-chat", token=self.auth_token, json=request_data, sse=False)
                 
                 # 空内容可能返回400或其他错误状态码
                 logger.info(f"空内容聊天响应状态码: {response.status_code}")
@@ -421,17 +343,10 @@ class TestUserSessionAPI:
             pytest.skip("无法获取认证token，跳过此测试")
             
         # 先创建会话
-        self.test_create_user_session()
+        self.session_id = self._chat_session_id()
         if not self.session_id:
             pytest.skip("无法获取sessionId，跳过聊天测试")
             
-        endpoint = "/godgptprod-client/api/gotgpt/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        auth_headers['accept'] = 'text/event-stream'
-        
         # 长文本内容
         long_text = "这是一个很长的文本内容，用来测试API对长文本的处理能力。" * 10
         
@@ -445,11 +360,7 @@ class TestUserSessionAPI:
         
         with allure.step("发送POST请求进行长文本的用户聊天"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self._call_chat(request_data, sse=False)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
@@ -457,9 +368,6 @@ class TestUserSessionAPI:
                 with allure.step("验证响应不为空"):
                     self.assertions.assert_not_empty(response)
                 
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 60.0)  # 长文本可能需要更长时间
-                
                 logger.info("长文本用户聊天测试通过")
                 
             except Exception as e:
@@ -483,17 +391,10 @@ class TestUserSessionAPI:
             pytest.skip("无法获取认证token，跳过此测试")
             
         # 先创建会话
-        self.test_create_user_session()
+        self.session_id = self._chat_session_id()
         if not self.session_id:
             pytest.skip("无法获取sessionId，跳过聊天测试")
             
-        endpoint = "/godgptprod-client/api/gotgpt/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        auth_headers['accept'] = 'text/event-stream'
-        
         # 请求数据
         import datetime
         current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -506,18 +407,11 @@ class TestUserSessionAPI:
         
         with allure.step("发送POST请求进行性能测试"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self._call_chat(request_data, sse=False)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
                 
-                with allure.step("验证响应时间不超过15秒"):
-                    self.assertions.assert_response_time(response, 15.0)
-                
                 logger.info("用户聊天性能测试通过")
                 
             except Exception as e:
@@ -541,17 +435,10 @@ class TestUserSessionAPI:
             pytest.skip("无法获取认证token，跳过此测试")
             
         # 先创建会话
-        self.test_create_user_session()
+        self.session_id = self._chat_session_id()
         if not self.session_id:
             pytest.skip("无法获取sessionId，跳过聊天测试")
             
-        endpoint = "/godgptprod-client/api/gotgpt/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        auth_headers['accept'] = 'text/event-stream'
-        
         responses = []
         
         with allure.step("发送3个并发用户聊天请求"):
@@ -567,11 +454,7 @@ class TestUserSessionAPI:
                         "region": "",
                         "sessionId": self.session_id
                     }
-                    return self.client.post(
-                        endpoint,
-                        json=request_data,
-                        headers=auth_headers
-                    )
+                    return self._call_chat(request_data, sse=False)
                 
                 with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
                     futures = [executor.submit(make_chat_request) for _ in range(3)]
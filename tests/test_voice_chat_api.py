@@ -1,10 +1,10 @@
 import pytest
 import allure
 import json
-from common.http_client import HttpClient
 from common.assertions import ApiAssertions
 from common.logger import logger
 from common.auth_manager import auth_manager
+from common.voice_fixtures import voice_fixtures
 
 
 @allure.epic("GodGPT API")
@@ -13,30 +13,11 @@ class TestVoiceChatAPI:
     """GodGPT 语音聊天功能API测试类"""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, base_url, http_client_registry):
         """测试前置设置"""
-        self.client = HttpClient("https://station-developer.aevatar.ai")
+        self.client = http_client_registry.get_client(base_url)
         self.assertions = ApiAssertions()
         
-        # 设置默认请求头
-        self.default_headers = {
-            'accept': 'text/event-stream, text/event-stream',
-            'accept-language': 'zh-CN,zh;q=0.9',
-            'cache-control': 'no-cache',
-            'content-type': 'application/json',
-            'origin': 'https://godgpt.portkey.finance',
-            'priority': 'u=1, i',
-            'referer': 'https://godgpt.portkey.finance/',
-            'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'cross-site',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
-            'x-requested-with': 'XMLHttpRequest'
-        }
-        
         # 获取全局认证token
         self.auth_token = auth_manager.get_auth_token()
         if not self.auth_token:
@@ -51,77 +32,45 @@ class TestVoiceChatAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/voice/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
-        # 请求数据（使用示例sessionId）
-        request_data = {
-            "content": "GkXfo59ChoEBQveBAULygQRC84EIQoKEd2VibUKHgQRChYECGFOAZwH/////////FUmpZpkq17GDD0JATYCGQ2hyb21lV0GGQ2hyb21lFlSua7+uvdeBAXPFh0NHSFDgnT2DgQKGhkFfT1BVU2Oik09wdXNIZWFkAQEAAIC7AAAAAADhjbWERzuAAJ+BAWJkgSAfQ7Z1Af/////////ngQCjQ8OBAACA+wN/KQ+tcYcyzUnyXMxbYou8u6FhJWYrZdBzvQWGA4KqKiZ0AbsC+sZAxG4Ckzr/VyOZQY5uiXt6LF5V2HXtbNrLrnjv5LYfWGv2pj+9tuoP+YI08Kded5mqQ9+028pp3lF9dGRhYW2S2+p4jXMVMp9IbFKxZPobHD7auzMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKh6KsP22oONHBxxjE5jFyEZOzWnvLEDV5+dX0/Or6Nq5mNNr4UaLeRPTognp0QI3VJ/if805U1KP1d6H583USGSaTNs7G2nRK4SIdw4q7uV5QyorOHkKzukqZiKK0Org51kBQOXxNIW/wmuWAHNI/HMg/uIqu3k5gNp+cYmQFGRbwBLUKI91pkWmNBbr5iTpbuawieAjnV2lT3tDAfm75/+hTpQqC2YUzPmNUQWySV8okbRgaWFL4z1+FIXTNFYswuldUYpGlWKgYnat8GTpJaU6wrF9EIRhfZyGrjcK7EK/DCj4pG24jitvkyBNjkBWIz3/owJEIzbX2SZI9VpAKbQMd8+qDUBu4GIfFAeR/FJ1QnMnKdulKmdvhE6kB5NQSRIaJ9sE27Qm0zJL6NOg4Rfay+mWGXqRSrSiKsF66TCrdpgkavH+bbfgkAF47p/k5FHepBEoizpknLpRZfBLQt3ipBRkKryUra9EoMPGBSV47bGKdbmzPJI5VJhZydWGlXMtUI/uLlnOyPxBmId095fcUJAQr6Oj7ooJcrZMmkHkFapNOGouQeOkFW7eIKnvdWOYrvcZV/iDuadIUZ504uUQSMubQc1C50TLVbNujuTimOvAteiGPFCn8IYl0N76ADcfrgXEH3/miT+69MIrcEIeRfNJQfSEEt0he41OZ8S3kU0di8fp2BzjZqLK/zscUKENfaEUEBxQbo7VnzOuS+9IDe61gQUhFE0J34OczcJjPeiWkRikvkksVUFCgvPBWeyZi4ShCTf35lnpvXwIFLH3gqAhaAy5lxEi1Hskxa53PDlPtOBMKPQ0A76hOyxIts4bPp2ubovA6SOfHvXZF0WKLTxTVWkwq8YKc5RfGPH8jVzDh4ZBhH9UgGE6tdGAN7kX4yI5V9l8E/SkOTzNu1rphevuPdGu7lzaREvBt81eATpksXDUbd1pfMjSddENxaIFXvznv88Ixg/MMCbANbo+Acl97kwWIf11Zl34/dVnQZ5OsSiTsOTHmy7HLP2O2JyA7LXMAKF11Grmo/rTR6xmSlSDuNVJGU7zvzcMMvzyoBqIrnG13/KjQ8OBADyA+wNA07HQyO0U9BJmS6Lg3QRXr8b7U6/4muxPtmgYrC+rwaqvFQIxlZ5oWOsFSIBbhXqH4HIwMAqRh1fUXZ/40nEHKEkVX4CisNvoamfDtuSgkYkpe05fJLWt07qSzx1x8iNAXYbmk5A5Npjeg3exouwro4Ta9eXOXyZPbmEdu0IUSvW+yCj6bXgyYwfJ+B1+fUNaI1eat8+slOU6ykRTXz78bCn+YCVoVy0hx0ozhkxqxvNUX/Cmx4m1XujSXEvL3hH5m9vdzfz8N7nx+4O+Oir/D5vipohEUUeR6HVdjDGde6BXViIW4448Riuzwpgvnr+D/Pdz4r+hhNEfbi3+xHqZ4P452qD4WIDV8OpF9bdC1+rFmtKo0jc4+i3TG/0ngYyjrBwMHwLUc4DD/wFGRseOnUBkwfMD6b2dmzPi0BemQLgMQAdRpee9nuIXMptTI+GP3dIHADfyE8Vg3w6DGfU93Al8sAw/u49fIMICzOjdXGI5mM/anRMrxElqSmeSpt9Rn2WkEaTBAtv1FKCa7sqDbELdReyV31YG7Gyx4dQGz9NeU5iXkdQf5hwVT4ogduGxDLAhr4YQqfhMx7sZU+2apRrsBewi8HIkTKu6D7OX1Xz7Q/MIQLqwhmvMKYQBoxQ5Qg36DyntnUfgr9WVasj97WxwM9vB03VzW10STABSs5F8TTYoUDHWJ1rTlkVZ5obG841ZMAj+ASl7IoSg9AbzppZh9edNv6hHejPXyOs/XHwes5UGMrrGuHKqRBNjJ9NmHRz0m6dMxs6mzZa7sKiZEHtWELNDcwXeeObj9/rkIP54OWjJppq+EkuCz5XwmxX4kkxEiiJyzYNzSlOxsj2cZPEdUXyaS61bFdr+EPukTgV14FSDG0zSlfxQvsMSUHr2tqoCzqkC7iaxE5eHT4HP7yk/qmfFD1ZwtqtCsrI+DvehJ+GT6k5+n91QZXrzUy1PFes39cj5d3IrUCNBYxzGEgRIvEf9dwnaSU2Q7EoKP/MtKXrIpH2Q5TAAld39ZKr5YGs9WwfunBfQWIHCvokcM55HT5+dQVIeVQCXJAS7JqHr0eQQoA3hKXFfBKAgtNaa3kKRvvcyEVAX7qPufI2xqX+cmtfb0D0wM81RTRYoB1vhp7zP5muQNwb0f89Yh5At9QSJP85bHIXjhY//yIiUfiBc0/uQgrCsUDfG69OPrG1gwyTPJ5YX5eeUtFzZx3fW1s/7Q7EU7E7sZiL5t8fEPi7KR3/ViwjYl2kDTEsjgnT6vSKpxC2ztpYNbGCjQ8OBAHiA+wNAtBLaCQVrO8we/3ERcTsEGn4Qc/Q6wX00J4MsbFRcfFTxqLzGeuKYKaDazrm/Cb/JatUvki6zTx8OUGbgC1jtRwOaSFT5374LpmMh2RKo19gWetAxS62My32PihI3gZsoktq1F00UI+Aqh32D7wmLhosRCDg9Lusnkd4HIU4BK28iuok+RCas56aMuDNJPz68ejd5q6wymj+b36L93jIh80Bk3d0QcdB9gF5wFRLz05wvuUFZClo9rdWw27jEpO0uV5PHG4SXV7ddQ/NWmw73H5G53hjWDnqXVQrOIS73VUpLhONK2jarGR0pDONJ6jCftkSJBT4+x7jImGchUzDzwTw6UEyGiIwbkLPCZqAq5Zfq/sBb9udfnvDBHof4IwtLIRShE8ywSC7uVNWEfZRsQLO8pyBHthsA/qfTnGHwO1R7u9URUBkf7rrE5LcAIphnmNmv/SFHKZid0ePqqDdbeGLP0/D+FyaV3lqAkxZgCbdqe/+KmNnF6EGV1GAaDOOOp0+x6wjdxzo5cGGzUbBsTdg9vWm251NQTiwtilcEORTTr6EIWE8ExpkkgAUcebsXVMj5QulgnSJkBuX4RXAwBhFpMeZk8q2sRnuemcUB8Zrd4xgOBCDZyabACK1xpvvTy6jUd07BDumrEREQlysbYoX8TBaKgos3+XRghGoPqPWzmcHwIEMzQdHMBNkfyEsadvZZtuqi3h67EbSYlvRnHcGzoRkk49L2snP3/KYJsqF18QLgMsySRdddLDUo/x1jKCpnWb0k0PSZRt6gvTMDg7eOMN8ASNgR47+3QT9MPNqOL+01oHZM5d3G4bfQ8WWsiTleu4BuONT0Oe6TM1M2Cw2KaahQLELuw5vlFLHYJHbghVs/XAiyizbZgswVCALYgrylBcSJkOINKRrzyHRsKmL3orvgDHh8A8yddFOLOveprpyqjiaWcy0EB3oQDOseBd9kpGzTm9GMHG7iVuu8hG/xhdfrgAekCJi2ugXNTjiN6FdohwBYMKhkmrlhFXM/6tKLwDeBc0JHdzSSU24ahRHo+N90gmjXNmLCPcgsPa9mmDAudhvt9PHdDcmpeVYqs7elYNyMtLdvocmDs2pSfcclk2PG+giLCFLrgUJSh6KTvCcz6/8C6aNSe09ELvb4m+zguFiDPahflkpHRvOFcR5LPLiwBG3uylVLeNo3dE7NrF/A87HhxPEKmvdkfKHXhlUDTNeoS8QXGsGrXH36kpl+m+8WHbd6RANQdQbscjyVIv0MQSIurRKgHzyjQ8OBALSA+wMTj7ommrEv/vkqh3pDVlex0vcPkYX/v/TW3yGXMZUh1X0/n8rFR8Yib1R5i/tvCPGluAQgin/oLn3AF3rT6cjBBCOt5inIT96yuNxA9hopEV3QcQRp2xqRH8QEDx3EURZZxu5hv+j/cPn9llfkABPM8AMSG4IfADQ3eSTEfYOMETYX/+TaPQPeaFJ3/WBkh4guSjQW2aPSWtoG1R9c2TCDeLzTuIWrmQ3GN4h+31ysWqanTnoDyLLjuDE+EZAbog9+7DXHMCuFcTban3ikuQQ0ZAR5/5rS+BwtljgT7IFhzDUbE2bmJQ5mvaN2N/v7uNXmleyogXHhb5skBWOOlb9Pl6/OO8PSJ3uxUjrXGJ2JC6K5b4KHaLpffW/bedfeR+lKjF2ob7oSG/vFuIv8eLkSbP2eX2e0T4sKGeEnns4LWfmtjsqismeWIyjR8qzKEDk0Z3b2ha7Y+wjRA5owih+5wG/PVjHbBH1TxrjK+juqGgasamG4/fMDTq1wL6Pei9z3FeCZemwPhTPm2eItY/3BMYMAyPwvmxLBaLp5crq9X5W/9Vq9QXCXbOzunUzmN5KyB16MeiB0f9fEjPL/1dkzLaRS0HBasO97v1wLDuME1E4OvClcOt9qKPS0IE6+X+Mwexvb78Ez7qC/psl+zLSB8VGEyvfTBpNJVfVkYivK8MLZUgEKsjNHJ/wfPRyFZOCkK/X4NnwziFP30VJZ947dtz1B+i8jmB31I6Nt37Grn0eXLo1TwInAh1gKZsDVcu7Gh+ts2DALegmhlKlATwdx3j4pGDjoIG7xVZ0/xqkbTY1F4kIIFMM+U5+v5b/ylxrdnTLq+vsDqgSZoJheuDw60k8KmsEph1e/MnGKa4HDzaAvsAXaKFyyBgKKg36Jn0/dTU1+1zJaAuegdQ5f1FbYHVWPmw9KsJyDsNRMm5i/M/4aqxpBNWS7SWKIgkvD36j+OdQdMvRrIJRLdAHtooCc7KQ0D1PcsiPpgGIBma7O3ejvvF7pktXo9kEjLQTCfx/0QgfJF3CxmXoA6z3pMym11kSS9rTku62oL2dNfqYiQE4sayN2ao543e04jkC7SrW0Lycc/ve4sYRuhr5Of9v3QD3Wn/Guce1/NUDzfGon2dDqn/Iuby2dxEKpgtA6MqaBQFmSlj7oo6SdX87U47jZBApPZlGNutC8Gr4q7PNKKw3y8EulJJJJhYVOvvS1phC8RWYMyKlhj/Oq/lEpr/4/wU+5mPnKHbLoiwtIB6utKN31ifF3y6jRldh9uEejQ8OBAPCA+wM9mbh5TAQ1vsPFxeo5Wz2kqPDy9ULXNlIF+GxyLTze1aRu1Qgamc64XHfIVaoExwjThdkVN0SymIiClIAVerHg7zd8+UXRGycQyAufrx3OQ7g1a3F3/0GmvduRt5Fav3jckOsQkM1kTFTMJCLx+Xl0VhBzXI2xrS5LBI//B80iD+nJ/OHbfjpK9lbex1mgYX57fZBiSC5nv8aHFUrKKjSVceSn+GlEGpCjWeUQ1G+ZBY/RUmxCzhAQoTDNO2XWVI8W9lOXRdOy6XvTm2yL8kKW/HUVvL93qjKFrhKR5rqz28AE2pCQnut7p/I8oaBrQHxGVumlm5vPaHr8zVgRTl4Cg5b2ALU5cs9vVq2Tb+dCt5F0mOx0mdkjKocaDi1UOCtrzPcWWoi31kf8L0zWcWkjgmFnUrpiWMrm9amALacXQJ+zWoEuQprqq1TXDGteM7JV2hU3EgDwzz950rULQ048eoeE+AizEM4V/9yUzw96Mw3go1c9xaGYTqBJJ/acpw5FNUZNs6utoYkoU11Tz/IajS3A19HIDnq2/3IIwhcpnfeK5aIJRw8TCr8Vrzr96ErlWklCsrZn4SvvHZxXU02FW7zDmQRPz0vRK7LgdbyedGnMsA4p8rByGH+PK1ffxjleDg4oLXSJGIuDmLd443vMQYnksgCm9YApvalQDO3dQtFQreJtFtzEawLV6AprxtqpnCFDDz86eWlEdVDcid/5NVKs7XOTscdbOGv1OCcitE6ga/jTq3uPQq6wBIKTZjwP69+ei9HHntdxDETlbCPOUtBTDr7SDzUx7k5iCOMHyQDzsEGqPzAd+kA3rBr8IFr/HYpx5T0gwhau522CVDxAfdphwVARebNfWhwPqcVCHCC/T1NwMGZSW8mxHufOy5pmFBQxcE+v3stHzBqeZYj39JF1OgFPSJKYiFEnEn7ZNFVpPzw6wNCigdEsaGGEL8YIT2+w0ec37V8FIRZWklCK7GGjQdYt4SwqestslDM+QUvHjSQaaovTcmYHGHtYhTItJ99mYUfAWb+6oU9dxAOU/DtLhI8HnjWCzEbZ0/43nJ77Da6Vf4D/HjG9v0l72lCtGo/DxhRfKXvdXpcrc42sN+J+QAXlOXI9uAlAO3mOBMRF3AN73KCKKeNLVzgg6sjSOc4gIKaSOPp9hffVC8TgIgA1PXPn9cX+nQPZ6Av5fe9d6uK0npMYrgd5CGwuZ0Iqyt4ihPk/KYJ0oBx/G1SvJbp2bvJ7DyW3SKokg20mY9Died+xVD6yvGfKsqejQ8OBASyA+wM7sYL/mMFkGgcwV7I66HtrGQFJAfgiiffk+n0ZOuW0SWad69xHKT+8wo7djsqTZZRaV/+uEMgDdpYf2oAxasLRcfVCaspVCdQe3dVqErcDMH/oO0SNMA/y/V0SVjwPVXsHb/QD77kLgSl8TXD5HYVkcuVy8oL0/Jxga4Q/N76aE6tGIBgizv1wBf3lTlgVrgQXEGv10P9zQjW1MSOvVYwM8tRWHxjlm8j/rLr4wOkJeeS0jUMoXpY/3QHWsdtE66+imm/4VfC8nYpo3Jn/1W6MLgKmIfXz5UaqszvFIe+mICoPm5cZPo7+rY3qmZj1PHQKJlmIrnSZ0duC2oMVcpqHmp/qqcBgW+9ybxHJlY4y4he2fVwfIg5o/vjen4RBB5Sh94ZmNf/+RneBJqHSgsaq3shDlOL547wL95OABsMbUCsfY0grkWwgeuTyALW4Cia5TZkYOsvQDCF58XUaKzFOlRbWbzqLh1Y/Rz/FE0IZ08XrE5/dL0pwo4vsFliSuO+34n8Wx8a3ToDLd26p/LOj6dEoC3O816VmfUIF1xU/pcSDlfPcr63RFmzDK0yyNZgteoL5w3D82qPFtNOhIWuwrBf4vFxcibJkNSEHjr7wj9i4JyHalCJQtzwQHyh92H+qZ4ZWD5S1Pue87XM0jD+0CoIIswOLxW3r1P8G+1fOneP0qzJLqPBQ6WjtpGnpWwot/Fqnng2Pkv1wwE1knZ9+JVnSyK9sAxpGw7KMGUHUTqfv0wIWrLuxGEesX01Vv/sd/yawaQQlXBxyfQObey7NNEBQeIDeqo3EQkjuEaAS3EVMJZYoWkx5tVhYKHqTv0Q2x6WBqahkh7DpKqs/1hivRT1AsQkODJrUFZ7ZlQVzqFwUI9zdIT3aA1Hbd8sCLIl98NNTLKE72HtzzS3Vmub7JXfA6iThWkeNCGCwxkTMtPj8XMkHUXnlY2T8zBlayhFYG4opouLwf+8hik6o9EHQyqv8nryucFUrA3fmS54jD5GUotnJsrv593jFpzsDRHD+5oruLQNBF7dJx2pbBYeV+TUNfmpGSrYzA27U+61RgO/tn9PS0MSl7zCb6L1o640UKlanSHre4jnajwG1BtDgiePyWG1LJX4QEf4yy7GD7G//1IesEUmvGawXZZkE4m6NfYgoT2TKzt7Jp/zbrx6Qn0cQqhEmvSlXzYoSWGc3VjXVLQQ52wzfZ1Z6L8V1efNkaAkIO8y5NBD1QoJae7fWk3ghB3y4BR3ygZnecGmZW6jGd4SAawrRIgC8yAGjQ8OBAWiA+wM9i/FPeMPw8OFa0nsx5NkXpwvZL1NvO6zG+hOg61HeMqKn/I5QrgXdcBfg2+HnOaBJWUUynMkUWCEt+m1D+VIbK+EC5TufOAlZ/0zx7tN7X9ciHcQwbyBhMprKPUoBszQ7XVR9i2itUm3LELQy6Qe/AoIFE0Ik+Stc1807dUevRDm0zApnHB7BgGNNCK6iaKvFsCZam7OsLZ5iqL9eSgSQe3hoMQm82pGR62FhL/1uV6w7E8CVHCce/KtNCUP+6FJ4X50cS0aQvn5+lxS1IT3Zg49lBStrJA5fiurJGqvtSk5/WV93dMs3OG+KWbv/Q17e4cnfvayYDvA7dLBKhrgtaK1bPCRdzPFHldnAd6hhLSuz4Bsg6KZl9Sw8/bBZTnJ/C0MIEj8AToMGMJWvSsh9vURrSVIw8EKo4WbLLXQhQPXbpzBw3h/i9szqTxo/J13vS85wSFSF+voIVkUhNy9yCw62NqS0sPCGzcIM+dhYlSTQEatL1V4mSZFqJ1PRk8MCFJsJBiCf477s8uYtYNQ3oWQaMhxSDHqDIHwzA4WF643y6MBex+UK84PrdJPSy/KcKQnqROpjVMNBo+R7cYtnH1brALLhUrQ8Ya76dZNj2KYzx7n81BAUR/6Y2c/SZTwBQmuLlFKBbDQHNKkM/kYNHoYrgxYPYBO58YhvjLanPyxgVpIarZkxOzrvLNBgU6dLqqOmVGBjAduG+TH/eW8I4xgE0I7NS/F+N2Fd9jWJ3kLmAeELAsAVbX7H6zM7+dy82UhYFqkqp86/2c2smRdnRkZ5YyLzusV30AnF7hvzy8NXT+tHar5XJrzx6Yl+dwZgE4Hup7uX+W/cr02D5zs9Tz4TB+zebj2TaphywoEHiCJyBntJ44+I7SqEWYPa2pXvJZ/pQ2r2g7AjFvAKbfJDZDzIxelgc2JpGXRegt9fUqldMXzTanveNmMJJ7xAE5JSg4toZ6wA8rXBeUQXDEylFmELzBBo27vc1eWJT7D0Q+KGhzlmd42unRV4AR+sPcDOFZQ2Yx2XgYPBhu3ojnhcBpJ0062gwBqYUXZOlYZkPSDP7OA6vxz4Vbzcoao3PDshqEISTa31jX8GoX1ouaeJZk63eVtY4rpzOj6nZT9y7LQzN5fwVB8GV5Db2x++5ORBhdCmoZ0Jlg0/xD2kqPPVlwRPUyjBh1Oe4acUUX6aLAFZhObm7eEEB1vbhKhp35cQj6RjH5TYafG6SRxKpEDu+IspbMiZ37AANTvxqaLFVuHUGjn/aTGRuKm31UGjQ8OBAaSA+wM/u9yCxeJ/ncLs8feuLfN2HoaFAlWk5FjTCdE41NesT4+jySV64LTNqXCcWwy0wLMrGbfMwfQdaGWNozJt8oPnl1Xn5FwTX42oi7hXuHnX6SWpJ+oz8QKxWqGgXAsCYbbrOEA0O2LsSdZhYnJt7B6aAOY3JfQ4oE4GRsHnuEUpI8dzGH/7mCoHOIcVc6/LnzV+Pz5hEm54iES8DYv8EpuFWtI4ymD6C11DZthk9HZ4HVtyZMPlZagTbmzDUORr1N8ua9r9Rbsj56X+nChw4s4kwan6xYZSufy6/15lDG70qq4FxdAri7ATPpWQ+OtdnMUHdH/2+zkjepJq2Klm8WbcbiWmPbf0wtqxopeshpK/1/htPvUfklUBDUH+dlPCXhoREgPrGxWZ0PLz44eTaSr/53ypZJZ6Y9XBTi5aqEHEPjMqJiThhidDDujNqOvhSvcZocajl55NU9Oo7qd+nILrGD95FxBC4I9M0YrvaesTBLzAbTBlEh1hhp8m3NaaVk7bdE8h1tD8gC7XbMLh3wwC0+yLOD6pXMby63jv6Vnnd//85Tj0q7a1G0DHVdUuQTrcGYO3Zf0y4K0M5RsxcHxaV8jZCicq3+UX+k1E9id53O1yUDbmqi5K9RbJLzLPKS+8zf2TYkOAmRO3XmEdkz5GfTUdVyr0yPP0lJ0WDs1v6+t1KjMM18/q8QP3ibMTvUINEc2mdNt2VpMrfSSDzGMZ+oi2Eoi7W7ZC2MVUIR3RivDN4pdk1ES9uc+8CtFpTyt/wgAzKKQSDN9gU2sjwOYFGTYhvg9gmYP+gbSKErdgpDWJNs03ofnWSmjRnNrAGMPvBX1biR47gQsAzcSxLz/SjhPaL1a+11U8RWrJymoq4Qrcsd5QQBqFLtkZzT4F7XpRr5Fq5J8Xhk09248AS786ZbXDumEqNVk+TUT77UAbcKPVei2aljgbF3yFK5oXXTeayow/R1vb+oK4SohtV+/uobP37ocfzf1EWqHdireTDFsOcGigjCrLg8FxRpWuRnAATPU+zKWhY3rxRmDSkTGolDl8ySJIxyKmX11TiRPCnkBf3aPiNZgszGZ55+ioqFjSL3jsdNL+z+zxBppRjR85s57gdMNCm08aWO7WTYR1xTRHlE8xGv8sT1eHPAcZPhQrYzXKhnqWRQNX1dM1WtDT9iNBZyJEf0QykD5+wOtiKrbd0P1swfSOx5zTjNIdVAwJDPfH4N4Cru9kR24V3+dqOnLVClc8jlgA+SXuRxBaiPozrAyHdI9L4hvGVxSjQ8OBAeCA+wNSjo0yEpnb0y7cG8EJaTyB/gapOjHw6QJMB5CfCdtXlH4fErRaWDzq7mtVE+kIHwdhRcrzOv/30Z/PpBNBlS4nJM0J/mc6H20Tj6wNxhQuBm8hlcSl2pcf7unZ9xeWd73o+RcU8uw6ejRuts4LOFFlzGrCJRHyOADr4rPJSFSRpRj9kyuf6R4OIbrIbxODCnpujMVJdhJ+2RvHlLHw01C5PJTvR3+0dCmwc/S7wAfcNqsqCaEdoLhVMU475fBfoMQqoZMLdcE4vUQSVVu3Zq1xHLM3WiwhiaA3N+jKt8hPGmFwNvLd1jyIxbvCOBnSyMGx3jI4cRFLAJOWfV1q5csLHuzcnEACrfGH8uJTnjMh8PFv2DYmrwHAf7415Zquj524UTpFKKfFBn+MNk6gnXWrNc9BJueKyUYbqgWcv5EoPaCPcxXmGud5+bgZEZPrGZo8uKGBZJNnObOcZ/BJ0h8smQXpTHjs9WVf+hGK8KWAgGb400Gy9HriFUnTv7JXoR6IgKh2CKusioV0FwKggPNWNAbnjuT/Q1OOoycg1cWVwcVUVyGDcJZYtk8GMVandXnmDgMTiFibvNuOH5Wgk+8aRP1GmYHnmQBlphZ05OxWQLjfh2YsrLQHeOzXYvV0hw4Pb4gOvnNs7A0NRAL8lMDsg+yzk2nbohWcWQGPMuKzITQScFk5/19lfDQSV1sNDFzAZU0+wev4LCfhEFZT7JV6t1sqJNL77KDEjmGSr4Wusn47SaBav1uVZTpakaVIV94ZAjqonu8JTDAzKq9zvyOS0/zOHResKwSCG/mREViHe+SOgQwhzEO2VUXpuCoKF28WO6ox3zOfOxY09wCMKUD3JNKOOq0nYULi1FwG18KU4koJcljE0IEHk6Rf1w/vt+2rlEquTbo2RvpBYzt5teLuLWfMWtlXT32Apns7V8rwN514iHu0dlk/EA8Y6drNNa/I0tsi1HAqT6AqhVPzWdXcj7rU/rC171sTe5hF7HLJdyACEEfL1VG+UMBY1IeRlAY/9FwDzM9uANXjWEzzhOwvs2dWrmF/RGpiPw2u5UHZEfP+NcOVFpoBJYFMAW6rA8ZcN1yaY9usuk9Q59PZQiK+cBQDG2OrmxU3h7SpYGHM7hvnMpvJXYdZ81usI5W9wZxj3Q9ebxlUtgxD3gcyTlL/WF6J+iy7KjiOPKjpjJZMJTxEqGOgGfJ9qJEmzH7DybL+vOC8hDkU9PT8ityO7NFCX6mXg9BsV/qohyptSOaa1M0ShzdKs1G20H60rJujQ8OBAhyA+wNABWZf1NFrbyHtXKgwaIijG3UUT5B3jCQu4cfGiGkXnn5rvJ5/t8d2sn83EgQDotNKOg7SWmu77kSwnJXbisy3I1PWzvQauOqQHQMPNqPVoTbZR6q7NCtBbbXDvRKaRGivFMjcYwlG20Ew3ecHReZ2L+vHmrLjb2uk5QPm74rnorEgLQmRvnYuWP70DTDAIGiW96kD/zgnL9N/U+fz1fPzJIKlQ8bsyLURlRRFa/GT4ctsopV1xm/AHjbstdPlc5xHK78VPXGJ5GXFjGoARb5eK8H5a+JJWDiwfM3QiK2F6Tyq3QT2QKxuVjRXTeoNpDj/9Ur44UOP76rzx8PISyEpP0bcidPs4JVGF4z59CPprJRFK54TkT26GmHuTejRZPOluCz19i87/X/mYNjXDdQ5mK/8OpfBJuQjHGPW0ybgPEBvJGgIQc5qjcPHXAvzm3I9gDqDiqhwwoGVdfVpPy4OtYUdQw9Jj2W2kWRkWtrQ76CA6nhRMTuu8Ej54o5LYURN766QufQ2LdWMILF72MtMeaCNnHDkXY1wkJIJ6clnRWpcT9jsAQurrIeV5SwW2i/3Az3rniAi7JskMWqKDv1DFr43GOUwg1Owj5OWVCM69CO8dxY/bv1/1Npp7HBqmWNcmXT/dCmJTnL7RgL/hhIhslItS4iLRg54DU6h6+rSHzz0kde0dn96Ghc7M7GEh8oWnSWC8xaqBlxVP0EdfBhpFrXbYYQ+J7tkPoM0BXBvrPECgP9gfK07sBAd8lO6zBcWscZXCZOh7AvL1YoC/M/W89FKJgy46m68o+JRL9gdU/bh+h6dPm40RtS4AIfalUumRYqis7It0Lqz3Ff68EDKnf7HGLCbh3y4yc09bRQIHNDObO1cFnt28Y9n1zaApCiwDMzvdUazpY7BD9+gcukVslOyoMTUkNd6MPm8t72Ebkt0Ny4/dkGG58tC1hqH3LjugQar8JWTXuqQDtK42BA9RIrqeDfcx+l/ROfQ7Nvo8DdDFkQyi/666WtLCAxXlQnXDQwMZip6iyX3zLRPnfNFWKyqlN/FuQSVGSWstADB1n0lZjqelkQFoPYxf/NWN1X7xgd+VIAJlqhLmIRZ9nI+pff6DdBZbcuHAbPYiKNHxVnY7crB8SrjpA7GDeUBliWu4xfQ6zmBUzjPxcfxUbz4qrSovpgguLQSG1AS1oS19lwmYi3IdX/BvCJW1pC9wRvLYiCMYO5Wx6y4kOJH8W88kR+ZLYfSEmNoRTzgaleq01NDtrGiwLhN1gcHorqjQ8OBAliA+wM/v2hyxTHi5yS7o8IpVZeKYemQGksohtFrX1MKoVF+iaASVj7pRUZ6SF9t/G9bE+9QuvbZ4EXCxHJrFU3WIUfEbWCYwmzOdesyWp38SiAwXF/Rp/6MQchUVjVSaA2rn8buzdvJhFWVQBrw9Huv43UuN0F0lLx+tehrHlfR4bwSaEhP8afaSQrtDY1USRRupAxzz9VaHqLSAL7/RPMU/43fX5znEUPFdfb95io65A/YR+M7TOD2GmHCgNaBvFB9obVFcBQU52MAdy9pv6XntTKrR4aFjjNK1AfGm1VWMVuA7uxRJO69RZ1Tjxl85xJd8nwGlxKs6oFrCfGgvHaNfYmhIS+dA+5CTqAuwpt/jMXiEdlP3dFVo9Q3QczVsrMK6aw027NhedqC8Us2F1H3s8X88eiSrN758EfKa+FD5Vu1O4ES95p4OpRuTvwG7CZ5MzB7oCRb345vOiyMRUCYXC25LK2llWulEyHa9S561z+rYfSOEuO7na1RBSHGLZJbIke70wY/YXKkhzeROS3kJrak+tZIj/oiY+hGIBJPjNsHOms1NAv6K9UrVABTYESk3h4O2gGEMLjZpdbZHUGU2xhPqSPa0xMODF3sjZAd387BeGu1wmBpszncbQGCVdOZ5iDDk2ANJJfwrWmwnIYyPns62ird8FHVGBuQ/Ghs8mMLWmDlh8G2zwMmUKRlaKNEaFK0geMITavsmA+0ZG4TUG6FVFSgiCDzzeORS+RfKHPf2Wm+dZITBCGRLobXmGY4NYpMFv+bktk5nHz72yjDWIeTD3IHQnGWRsPUwtvCPt7fafjKTdmRu1HwxPdk2UV5m9AiRSwSegBJeWznYgeFMj+/vSm8/IyKEZUNpiYhITqK79w8ubf66Psz9GZ/8XXLCVl+rg/LX3GosVOldp9hIrXSZg3886gQ+YHKWMLvlUe5JOU/hv3/MBXPZPMpL9POTnol7436ccwknxmLCLb/Xqt3gbKXna4M3oRSig2TsuBWIhfg5x6lLdOLeVxYG9oHSV6+0OlwWdyFwfFFbLO4asBJCPlkPR89X8IFPFa3Dbn7LXyNHXhJlOypxCAajOVqPZHF3oHrT/+AIkYbodZOj1DMDnWL/p77fkZlKMTyLkCbCS0qeSJ6aASNUbx1yvB5QB0LbZd92Kil0WEyzS64sWiqwEogMgfeJqowo15HJE5PyJrXOypS8CFSl6XMvEsHOM5JNzSVYEQaERGaq81JNQFVT01sRRZyvscSqNSNb9aAW0yaZWmlPa3oV35DXDOjQ8OBApSA+wMaqlXWqWa3McqUfyOJ/had+UasLizRB/estqy0T7cpSQbRauK79zaQu8hg0dDF6txGo9Wcabgb72p+GY3EakMHOZSzRMjDRPsMiU0GIhgSCx0MbV3bxqtFeanCa+05B+/CmUY7jKDarlCCLw8spR7C1wRxuE5D19YiT+tjkWq+1/E6U11ElAOz3rAhdhjxjOKkQuLn6arSA36RxK9ylR3JgKeDY0VJST0x0GDqHqVqjve3f+5jpYSbwMoZv8qb4nh9r3qU0ygaiTQx6f7sBEXXiPe3nEQU4QSSVxU4jdj02Rxe7fjAm/kJHRUo8eRh/YXAXchpMLdncs3vfZIi0mPRVjxvXJa5bKZtvT2hmHHhHa2H5R7sdkcFaehRiXi1Cwfrsk66phI2KwQwGM6CWJcag32hkNopRduxn7JsdoyxPeyfekc77/uHLZD9Nvdwe453ORDp2d2Ke0p9SZHFhKsGKfsmP3wD+irr5bu9yY2IFOXQm32sr7IMXMiR4AzCu06VASw2pxbZwYa01xxcK/V+mY9F2Y9yLpdshy9jte+8mw4wnVChs4l6gDS35behIJ9Dh23o8SGA/G+CZysqsbd/xnrtNoge7sQNrddWB1WE0mcfoUuMs4Poj1YOlaYr2gvljS2QEjbAJfCkzW27GbyFacLrzDv39N0/sDCn4Ex1PBY7p/bhmeXr6FmFHVTu3RoJPZK7xFwmlJHB/PQhOWe5qxUY8x19qfX/5bM5cu4fHHywuiB6KNKpDaigzTcCPHk3LKtRzCAGDvWWDgwE7D6v8GPKndD5hClRFh4aTj5KB/y0G5Q8/knOihaLZhpCsIheEbXa8KU0m7NvVa1FcVDtmwJJ6nfRHUQCm8N7XxoOe1ksXGF0cGO3f9yHM5KM3vGdjUc6mD+z38SEipuwd4OhEIn9v0XdHma0M7R+RWL5cTw/ViRBu7haCilrJ+4hOcvF7Ey1LK4gEqARiQyHayWE55NMJVXQtifPgZcZN18GSO96DyHAstA6mx1gWlirtRu/ZBeu7OnUbBCizJ4pwyVWIxGM7lqitnH/M7ZeTo6tdmITK5UYZKvOlwVZSY9P6aeTkR19eItmLYM05QmOXdtb6rmAZikRdaRsZsYfZkTMiq1uEeZ/NQ43/d6zeyF7UR0P0QPjUPgBDvyJNVDJpd3e1RFH8U/7eo63Bd4e62PBFL5R8yMRJULlvUf298Qxenz5a6pu6KnqOau23gEWkXZ197houXu/OyrfwWmGrA1bADmKHvtB2rG4vGZORHajQ8OBAtCA+wM/a17VElXC+fXbQ6FRTWnnx4vJAH98ohwqE0Q0NMzAOM66cWtX9+iop62t4jdxRimEFgh/nSdHa4PErzA6vxQvQ3fLQ0Ok+BLWs9Q77XSvtvHpUIDzQmfRBzgXM3TXLG8IMvUJ0XxBVwAY7KF7anOHXpULkHsdvWzur0Xuh7r0tVdHmuJwlSPdKUps8bAbbEIlnEex0nD/O+ft3nfFfQwOm0XrUPICqZSyxcChiubqBs4Z8uRzAZv8rkEVNn4u6V8Mo0uIgE1DIT2Sb4bYipJqDNDasEaLpOvt4hEMyhpcrUNjXw0rrxpvBkItXGlSvFVDEtUfZ7R7ktX0OU2oqcmxeYWH2nDwr/x8m6G6oe789EaH83knsPwqPmO6wML47c6hKawrb0hH4m5TxiXB+EumICCQM2oqEq+OeM4imIv+QAVmX8X7cEKDeCqxsN/xDTTaKX1cbldoG5xQ3mULru4MbclUel0uVZt1ILo1mwHNemT6zl2USDn6pRwBn1TrLOkqPiOTVyT5bN1thM2iR4cu0Tly0sl/jRKgzlT+qjwDc869IBQONPtEZ+eya2JRFNQVBVT17EXuTB9CFGUn7yjbEkV+z8y+Q0Tk/U4T4YhbUp3JZFHuzTjYVeLRXoLWLiRfyF9rsW7/loV1RxLEBbm6Se+Y4ycz2QOrmXNBWXDUNVLDr3Qvkfc+lstkKOM9JUGGR4wVNsJqwSxh5INeSrolcbpf7GFoQcP/10f6PV25CSdzaXE6q/RV4dSdZv3WR0gVKdI1BbTCcLhKBRXdrVBnoIlob0E9a+fxegGSgdzTC0UIzpIxt71Wf5ecK548o9c0JSOe+33Nys0y3nlkl1KN79eGjoQZY6g2l5gqZDnPqUF9LmiyXTfZjB2umfhtAE9SLU47yp5klTIupWFpc6KRiN2Z4NMia+P/DbGNk0eZqPH29jvEKa653Z3s6pnkKZcJh42tc5Wryz1m8ueYOY/qvTOEmfpbBfKeW19PtuLb+dR8n5+Weq08InQHg7xuO5NQt9I/0gvbsD11zYmlN4GD+klx6ThVYrcjp8lbQtNQgNLcQbgeq2R9i2/R3tn3tG7VHOxrg5PDWJl3jtDfYLQ9/noIHCEhlLw5p9Ey/Hh4F6WjlvWw25e639m6BLslXDQXzDBw+AtPbrf01JyxAkqVdEhvLnZuIDyvnHbN5nEogjJchJ3+dm66KAFXgQYqKQrlz+Z83587X2TyO949ccJkpo+OZyZlHMo5zDxviGYcyiHCkvtK4/u6asbqwWmjQ8OBAwyA+wM/W5J2cNabVLFIEEJR+SmUxl+beOarBpt9tHefrjomZqOyUTWoMWiELkprBC6mXhHvXnrZUH4DUPuYmHsLUzcz5s89Qf2+HdLhnKMbWo9CINuO12V5PNX3cQNxMEETQ0kwKN+Rp2MJZeAqNbguSXZcMEng3JYGA1C4MGUigxNC1vT5Nl5BJ4pRhHdcAntEfgvxFR4nFLym5rYb0Vt5ye3foZBoP5LxtB9Bo5DezV6TzUdK0Ne4iHNebB/9fBv6euq4DLU3zPsAEEnkFjj2s1rdA5R1SjfvzT/Iqoei7q5clqxSTQFxYdB4C+Ty6qva8W48KCELMcshAMuIeyAmMwC8aCXepP9pgc+rO9FfW40hLpualQ7NsGKvELZOVcVcPs63DEMNuSatQrOsdFLxhoe8YJ10bGL2vCa5OCatP7KmPM1iy1RRPpAxLNWk3AnII70F3Ldd3dVOsMhriF9mBp/amO96XOBKTg/bBIEPSCXFi+qUpp3fKd2X8TI15puMpqc4eeLrM7nfMdRVpaM0AhLgPkKDVucQlGVNo0/HYCZ9/wvJXlODoqNYBP2tk0HeuYK4ljew2+4O0Muw5CNN2LRV8TO7fGHoPLtxIZdVqPYPlFe/U/k/gi8Jdm2s5ZmUSo+n72bgsAmF7QT/EtLlV08B8kAbU7nCRPOpg9rF/iucfimBIjVUCmmPiekp3sFh6+K3AcFlTJvGEXHEbQ3Ytxqc7v1kOPInF+7HrD+g3p4sE+9eDsxwFxToa+vXDk+gr8IEb8wvoBtKaDhY3BTN7v90NDM18rAhbbCAhkMaFibJgozrxkz+3m0FoNurUwdMQaOPe4ZXdt+90Ecp6u6SYVN3MAiPM5MlRiMoDnDkDF4M359frMw/xFNpyb+rhSdFqmDGJ5pAopT9sWaxDIBHh1v9zmYBdGzX78fxGQAzJrLLnR2Fc8WyyYlcOD2sq9YcSGoBV30BJb67mWGWFOzKQBct63DcfK2y93BMrH+tdRDjJVe44Fek8HaRmFggY+Qdqmj61KivZQP2Y1zCIMI/Ndsb4MYV7iMTDzdSlpHLmFmRfss6OdWCf0OtoUNKs2aaatIy+wlOc2X8hAFkM6GetD6YE6YIWrkm3mhUrCrg/c98eiePKxSs/BxAkr7SNFnoSuQFKwU/R2pBxDTzYKW4tOe2PnvH0gihAKq/06Wy5HmTNt9ZmNkhs+EtsKO5ugFrgP+2bMrcC12iVfHQ4BeN+/PeM3Mr002HwcOvFKjMgKvu7YtWr/rmMwdIJReLwx6jQ8OBA0iA+wM/4DEEk3JBhcu2adCEv7wWfN1p6rjBFVmooWMuS9NPN7Ur5oXq45xHs5l21VVumhKqm820GYLFqTVDBfhsCUbocdcnlL7ELR+m3ByPQhql/Ow14U3jDA7JgB10oUdJ+LNTdkA3lWPy6Aext4OGqdjUDCKhegWjks0bSWU2OM44LbptOaV2XHQ/ENiu0BkUwUNzE+13Z8zYdocekjXwuEH1kiBAKxY/T2LFvaHUfzQAgj8esOpQl8sdpUDsjk0xwWxR2HDAgKKjtHoXVBiLBAGiKMEZCJzaGgerosJkGrRAtyG9SfWPo1bpvCxsXJf3wZu9t0bb5T3NaNi3AS3yNLOuGrNjKaq72b02LcMPcpBTS4hKDDPy3RRbc/RYRNGCf7t8bQ1qLjdPuQUIqssru5N23KiFHeGaATuSCwc+DY/pUEmLxkkZ6qTJdfr1p7NFn4Gr5Je5bIOya4ZlGZojyQMW+4wYN3yxZwjCG1fA0LuySFR++CPP941KcLVeoYjTeHVBuE0DKSvaU3C3tZvX96CfG4jl6TEXGTk91/WefCsBslHtJLwR3wMgvy2ukcKiVRuXsfwdMu7wbktU7v7vpFt9+hAjgXt+q5SrTx76ORFUD38e9ead1/wHBwUN5/yW9SXonU20EyIaY3mSXp3yKwhpKobStQeaIIdJFdGc+1Cxju/4u9FdGKJsmi7HeLo7pteqSD5kqFo83+7VrirG2UD+AqQoJNneVX+DY7tqYbn6MIIpg+5riQAQcLYZvgyAIpVrbtV+vltfV6rtDEVYd7hIp1BFfibzv/fEJXqp9et2U1i6GFhEIqSNQOEmm03iWv7JiQgMS3dOSPQ9xqBrHD13O/TFKNPQgraaJI5g2Mubkp+YLhd+IFMKxMednUwlPdfVdnRQoLKLP6aWI5fnjUDekqtbHGS9tBwD9s+oXs7QU3XrhbJc2jT4iWR4JdXrfFi88S4OzB8IbSAwCy4akDCNbx93la9qFZJBRpzVwDoPhuDqKlWdzN7kcAeRNUaYRGzw5BxzV5OR76BqKDfx1jyoFL/u0UFJOqlAmSiL3vCFM9T03tlVJd7/2dXBct39gTLtSCyR0Kr+TIWLwX7qzr67y4FGBjUTQdt//jUu6JDAH4rcjL81N1WvAFCbTNcYqj3NQt8EnRrPdK4B96G4XOD7UyAMMmupw2cmhqcSCOUnCoh943TYbXMWbtJCl5vy+MGbo05tJa5zn/OLUIHi+ldT+JNpuY0rQMhxJeScL6RHezXw5vsDL7jm+UxDTSqjQ8OBA4SA+wM7O75RRdzqkXyr/Yag88Qa4OOo/6osYZcUp+HA6BdSUPterUU6J7Ww9Xjsux8eZGeV8ICPk7SY43YgdkB9l5QVqyaDBYZhxhtKh+MnkfHLKJupgrZS9ihiWN0+P8ghgJsjqqHrzg00MyVNVUgFj/d6TgiwpQNiYPaFrEFdsceXfOyLq66l/d9b7TvljaCkhWEAw9O+BWLwW9lOWzoldrakR0ABAD4aj6UHavzuY/LQiv2NvTbcdIL0eGJy8DDGwF6cSwmsW7S/R8h4Flb3Yy2eXUXj1nOFR7gCHXB5IzOByus/1M/t2xySoMUmHKfnx4o4lJq3aa3+Q/ExiZ0FF3PEcK9wVHmmoIV9PstqRP5TKSLQPbZgLP20VrOf5/7xRdn1/NZt88rHBHLvyTuk0TJ3LbHv1AjyxxH/rEulxcdDP8xunEn+yL7ho7OedHWL5F67xaR1uUGWcA0cg7N/iuJKsDHLe7LyyCU7/v/PaZ0hnQb+gbJI7XR8g5Uv7VyOb7oQQhkYAnQ0uiOvB9nIofn/FgQuPsrLo0re8vTvlXsRxMdE1yR8QCk7fbuwBB+LJHj7D2/DNdjmMYkrxy6qyPJRnDjo6pySySF3dH//g6LNeSETg3IB2+cUFT1S8yVFV0/P791iw6Xsd/YywDv8gcPiJfwA31jd/aQT5fmWdL/xg9MNlzDwBMpMuRxv8WRaE8NFiMjBHYoPh74lNchuvxAwTWs0cp59W7WArZQhJDmqFimZwD0tbhrwZmFuhe3x41Fiq8LoKzXSfrOVtrGxMwzyx/6ORp/PTbOq4LEE0Cq0BuJ8sTWxGZFYvoEyi4X9cYmMSN8CZ6Acmbulg6Rb00DGI1EDapUzK56qB8D6Kly0aD0yfs4JhR9N1fado4DaTeo55HufzA+LjBD6aJiHbZjESHdyZt3pjgtB3lUay/47sJWduvGn9+oKxprDDQDo/V4ISv/bFdWgGpZev9W3rigWF0al1Aqsrg8rySWaNDeu1WeFoVSz6FZRqGEx5tXncF/JhecWF0xbYB3vscce0CKYIHRKrRwzzyKyZHNoUnPfNFcfu6mOxBLx/ZiqB0kMvSV7uhF6MzMuyw0c3Eax+yBzKvpInoZEiL5/Hnd9/A6OcpOMNv6as4gGR7slzGzaQoTWx6sxwBYihsUqlaz7xeqOpaovVF3yqUw74Dh/H4WxRNzVxczgYY+R5JJxrqYbOUZuhYmELOEh+PDBn/ueM84uKrfEGL+6VZ6ixHeZMilGZ2y/HajzVJCKdH0OQcOjQ8OBA8CA+wM7gTcjowZijApmZBarpGzB6uLhCxa6wLwixyoGRqDMIM2DrsQDi+fwmyi1K+SFXiLtY9YfwHef7Dt0ssKmbLmbBkvHWhPRnuBny4RBPgj9Wx8169d9trqh9ux9EQIGub0IYk5pXdmZLMkNm/Cq22WUbnvJfxCemy/hVtt2l57NQpsAVforea6CPDE0YXATZJU1GktKOipj+9EIvhd79kp+/rU38ubMAKNDKtNJy6x665KVIPEn2TdhD72+W3xbHJRNa8k2UtMqCT/9UsiL1aOswr0qIoe+pkGIIlxdQhx1ZTqC5/MzaBQB+XQFFhmV91sW966gvNUXuger+GJn++U892dctxmsUm1p+kKHkrg483JfBnd6d/iRQaLetqVh7KJpOzuMeGw6DDlEXq2tPLXYqTjaYiGffIwWcRX9FlUhT95ac6u45vsZX8w89f5tekYIixPQ+7qNfTxVctythWiQGDsxSLAYpeUPL0GqSOU6T8MtwtqtK7XoBS2vt5Wz0Jt1G2fdzEJHJRGek8oO8RFUQiXWD97Ib/WJJQJSAcy2iGTbVHT2gRg+CNRBun28uWA7+B6IcJWo20IcUUVomEJZ99ExSE54dUOLqbaxMc4dog0efKz4piaIcoUg+P9jae3JxEkUV2LsRlMTXdHFHSrfBBx5WjAF4IIEsCke5c3/UNxrVLS/AQvk0+h5E1X0YS5EFlpfHFrP/o+AW951XVTPga+zS45sLg/O7KhL5eYkjqu3UC7pSUkEGeqqg0cgZeJZMCDMfF6IuNlgUrbXFKig9sMUjsGHAzkgWdC7Sz01gqRXrHch6ELETGApZvKkf2yfYiYI19BS7J9vQCu+iFDQl2M3M77b+RSX6TELTuDoIGcNNSa+bin9Bfea5yc/oRfXw6I9/+dk4o18UHFXtWMFXazpgorcLgI4vSqHey7cmWxWUSBPfUgsZNLRqYfykMXRHCOYeM4+dkNgHtyjJc8soBGHJpoZ5uBAf7xYE4GzOQ/F+1InnNLilz9OQnYhCUdlc+TZgVxNdBob9nnFTmRkBJwNBiyDuaDKUC09RLF96xKXrKmZn4VJu3vfeG95HjK6DD7BEg3mJruntgBG16FfqOiOZWlFznlCtTxMqMI+hYGpgrcqw2E8NZCxiLPTforaiUm6eBWbmDKiWMT6Jq7K9XvyXK5hv+4EEKINse1IFhDfy6Z7o7miu933XlA3YFV4INL4PLGufBDc22XQuMafvbGGh2E1PPCOrz29XSJd3+v07nCNtCzG6SpdLAKjQ8OBA/yA+wM7W2Cd2lC4L8+VwB04YnQ6GlNSgEIYZzFdFkUTYiyg+V55aOlBHwHWe9CLfVgMWPaMbhvFSY58Yg2rANCfDu4OljwT3y2nNxXPg3cGBH+csppHmtwBsNe95dFdipOYz831cKUzpS7EllQuFCxkagFjQCN8zzYx7tiRmhBWLGR003MQ+4QN8yHktHEbyRmv9jGE5MCldPhT65UOLKZNWGcQ+LafrrLD5pdOmBcKqllC7pxuo3o8iDzaQ9J04sk7ckfn/4/lGYFRZTP0yEa5AP1Cwt20zm8EtQZN/fzH3b5EfrFQphbtGtPEOLtZGU3qZwThLxPba30FXWkF/qmm/NsQXTvnqC1GjrjaUmQZ5w5re6aHZKWOU0ZJMsLkvCnfjJVJBsNKM3Yw18wf5uu+JgIjtSleI6Nu+6Ma79vRy8lpP8VlH9DfaRFc/gRBKce+boJiHt5iKs9B6nKZEypkBKwhRhIKx2Lj2HV1Ags0eLK8QJlq1clZNrfRY+4UxzY16g+T0KwDBuBU6sJzo+HWUQytseIEbpEn55LhQLmVHSEmnMW7V+fhBT4xm5X6jB/PNaKVmPaENddsUVbjc4UhHyXuVQocrcrSySmp211RCBDyfs1sl7+N2W4/ACLYoK9S2Mf+D6eIelmdy/zXPWEc7Sez1F/dpoVXZv867L7nZARMObYmvdAhvTSpXF9xneBGlWi5wA7s2PuVSOUcDkUPIDzJ6iqhR0NoyzJy2PbgV0lbI/iAL1ZJ++NIm6sR2tSceGJPkchJaUWSxR9Qha2SXdWboq7r/Uxf1+tiZVoguPsarYuKF/G7AY2lk6CUeR0RZgRaURYWp5OTGLnIAJgf9j13FsYgM25zV8VpE1J5iTcY+Vi1ab4PZPLzuQjYCe2PesaENheuF+jR9ea4nOC9llK2wUhswbw4pxo0PEkHHtKvKl08thYZwKHBC9SdOlYN95bc5gU1s3wqwJIwrXyrR1Emktos4CMlGgwc/DMcwIKTykonaB4N38bucc2HigUnJPUVgW/znGNYpTX7Qcz9fiEiobPNbGuGwRIxUBl5dFFPh/8gdqSZoyOJXZGB6+tIDUe7t+7UlquLCS3GnyjDW45CektFXtc6PXDVX27UFdOsAJsPJvKPTAtXOfQLkCchLQRW3x1J/eenwMc3mufrZnOdB/NvDlyRmPaKgggibOir0EWvQLajmi31B0fvemvyWghFQuepN3LnBYNyLy19e3F29S06WY6JdwKSZfhWmJXsxxEgeQ4oPvVZZRJEHRKjQ8OBBDiA+wM/v/jIWuQnxadB80KaiY7a+n/6mDd8tRDqZT8DHtschakx6Ud1ZHuPp4+SHu+wV1r7KaWg3Y+M+dsDTAdPByWGJm4pbvu78TXLo8i9qxeamKuT3/Z1Tw4UslCmgdQ32uZInlUWEyQVcS6B7yZ/XGFA5I9sk1A2U5u0g1agsZP3q5/jgEV9HLPDge9xShmA80xF8e5aUqqUSFupTiJsnzIWyjWbckP3CsAGpog/XJuzfHS4z3MKpDIMJQSx5U5+X+075AusJ8tQf7O+HfFogCWYaMqtR/+03sBrYMfkCUiAEX60+mRsgxUzqdNkaSo8ts79tVxMO2yybRSMKflfg70oVwotK/c6l9Oj83HAp3+TAqgm/y1Ekg4JdHg5hz6If6BNqTPHoixaJXGkznUPGGROF4PD9b4oeZ6Z9S2GMxGSWhdAiPXoC4TMtXRRUko8ywOwNos8pdUEvs2PyCndV7ob6g9Tfmym8vB9SXkJfYKtJJw969PVFRBX/g7fKN56cCm8BEtMj1IhG5d0K5ajIfa+SF+C62qHjbIhAlf8NQpjN0R2vp9CxBPU117sGNnRAJKtYevq8XAdqXJdTV3a3bTyEdFNhN6B1R37AZJ2Tt2St9io2t0HxyV6kZUJmnKpXnd7S5KrF0lqzGjX4Pd8TSwHyR++iOa4eSlK07IECMB9nMh6lJeKNgKtk2zwqdhg6/SNsE2scGS8HWVpJXLXZRDwW/zLF9XtdDXEDBnb8CzEb2Yk+tuBXrhywOupLaNTTZNroFLX3i+nkdM1AaMWKjS+YHH7acdQa8awvED/Q2odwhSoXnd46iD4izSWuPF0d9ETk+OAqOJDFZM1oFW8uFMjTDEJ0SsyyNiUanXTOlhCUpHyHE8cKj+6kC+3dE9+/uz/UW2Dg+LGHHstSbBth4WObEjBbWql8uLsAINIunIDbBTSUpNQgxAWMrqBO47MYnNbxl4xKJU7/2N6RdoVkwkR/XZKpgVAwsuIenml6LSYc/dffhNdWBwm3SGR9I78BaMGsvB22cTzSy/YVAH7itSNcRWa8LrEe5ePgQO7ZOZUVSss44+yLGx/op9cQmUwmpYDT6LWTAYMYifUKuH/BKmPHs1UE6ueyEZtypFGCYbevwi1tZOOUnCSXWATBYPjeOZcc2sbkdCjzX3t2lGcPVHPKxuadPx37qN1k1nENBeE7KOnrC+M6evS5gGQjAg26jbQemGWG5YBUOqHsnYVAwqVq5bu4QE5w2H9ERKhra1lijDJiQ1poSEa7OFnlDijQ8OBBHSA+wN5PjvAx2bAQ1RWxNsPoII/2kU/tscaoW9qn0c2AErz6Qg99g/HTv+MniXAi2QlqjYPcKclIyGX/mvWlJIkR7DqWNsW33nv+Fr0RjfKhyZyVAFBTL+n2IstuJWfNTWyEgql3MgAgXLXHXSQyadwJALKREkC1fZg6uB4HpghWSnSjJa7yXClzfGWc+41Bq8vnXBdX6OWBOD4rZDZj54ZTlUUYoFZ8CNngvk5bsoeLlam0wfelh7fEty3ZaYdz2blAjeFnERjqKLf1Q6deNsGpuZGv+uKECikVwAaFZwE37+dvT2MxJ2HkRboNY1sti1rfxnMM3a1QgU1mj+asFyBt02wktmiVVowNjIgbqagGQ4SqMTKqbPwh/TMcvCtzzCVo5AccXZ1qvIhuNagKLfyTAPWDBBl5ducWq5TqEyMW7acUcN5W2TxWKSNCP/kTxZ2INWXLcoZwOXVt+f7APBGS4Z3Q+ebfneMBAUTfKqIs0YosDM7bxaINdiPzAiB9/6yguiB96DJHckZ8hVp1xZdDXmJdE+uY+sGGTF/zwrO8CvpVfbfMDEjpVWbyJWXV9YF8X14rieImy+hzKckvUOCPUJaJXHVSsl9N3sMumyAz2MtVr54xI9KHOZ1ZNYqvPS5KcCO92ERbXRXOZ2gqKYSWM+r4t4c0nryDKmz2UY9dr/WPtYKWbCww1KCZMzJ9AfXzeb21hJ3Xzm3xGLNPXvA9ye1GWOpJlN/9sA9Fzq5jG1TdCbxdQfpS1gF1pQJRwZ7Ilv4OJLN9OPYwyFUvA7kv9vsdfeflRNH9vQ6f9YtfBhPSJSMB4UIzj5yPSLL3bLqFkCzmFbfPDB80b2DHr3ex1LsQEfUCafJ7K0uxU/h1BWCs7ZpfD3L3AFRMoWPQEnDPl6JR7CUA8WOwJrr46v7Qwn651DIEj5PYYXBFiB3+Z+Y/Kul5zHFPprFxeCJctZhJqhEJFexrZfbUeZlGpD7l6nf9Xpc754VauHNfrMAY+NlCC4R4I++Olii49tzkjYND3sj0tu0UGN8MOKVKT4zHPp8Cd2XwFLY8ae+cJwK0BeGCRsMBrAeUw2uAi3rnUWEz9ztundyBiWoOvd+6KKgSYxDMDhi3kEw329tFy8fqYYpMpFpnqmIYlk8bug/0QcSp7Rrk3JgEpD6SH6MHubaNp2Ax3FlbNm0xfPVqkitbGUF6lbB8Fr/HjdNL/9c9EQx7ZIb0adTAIYzKizdakT9RJdwe1kSnscHmqC9QArLF8POsSycrAhjSgTrtEmSChejQ8OBBLCA+wM/3D6Nvv8UCiJTvV3pP9/yn1DYDWdRqM6RdQULPKzWa07mkQzqpetw4Zcj2kE71a6dM62EltrU6CuPBmdrY+wh+iSUcOyq+TcDZ9Lk2kh2i1q5j5uvU9pVp+RZwHdBy/5aPOG6PS+uvqVN17yrw62560TgZMRD0uUVi0Ul5FcrAAeghGo4G5AJbBZEk6s0oMp375gr1dwTYh7bm8D3djYQ1yDHrP61+azu6ZK0GYq8VQlnVffEl/kmLuh9nz9UB5dhgyh0DBEzgwHLZzJtnr7S8AflVcl1z+eOx5w20IBz5+4Hb/0g8OtB/v/z8S039MVgWqsILkhcMvTXCXrzZvn8i9uKkm8IBdvvsWfeQAjio0DDgg2WNmhuQnj49VtuX3K19dYHrFPc2LE+IjHsHnU1p/bC2UiOwMJ+/fkgZx6ST9t/9hkUS9iGsqXULP9PFz8m6+eJYHdqDF7po2U9BKk05BvqZTmp96YTQNbSaK5C1XHRzxsYQhtFULNDo9bP2RhVZL7ZSlz9eOh0n1flhN04FTG3CJAhHeNZ5MDpsmusE2jw0nrLAD7pHwVnKIOLxlHBS8oLsI2ia7v7LeiDNrnhNvuSqdWJgDHAolxKpkBknIj792LEp6Q9m+Sllb524VR9hOXXTU7jQv471AECGlDbINPAxL+z+0mohINz4Yf0tta++hDjfcGmHpxlbtszx1gzwzABg6SukLl80t/FVqwCAs56hJOuLUPJo3unY3LJL842z8UpIniQFtYaMloDjQexlGqnrpjPOJyUgzrgIKvnYGAFwe6iqiAxW4FRNhEyYclp9B5YnabW6oblByuVEBuvTGApD62UMarEcVGsWE/dhnTvxq4n55VhuWFEZky7AjKurRslbET0EWdhCRKGrxKJfN/CxK0BMI+31D+LhLRQJRkzy84tzK8GWP+x5IvI8qfpYGPZSRdyFRAMeHmImRu4/KwtSCJSZKLLXAsr+ddr+FZ/Z6WXj2Gsvj9YlnGfRviwin2lFV7U/qFSDFtHtkaxRG8Y2DSnxpMEWphGy8Wz8+Ihi5Dtb82OHuOk9wC8nwK6KhKd1JJ9yrx3O/Un6p4RJeBsOp4+/a4lxyhUSs1uCTlW4QL8NkZD5Cn27n/S8x7SCDmvJccN87VoEXfOf/6oitN+ON1neFIZRTErP9jwzjE4a7iaOZXs4dftz74e2uaXa4KYdjhDBnawGkz7uYbIhYXvQQBtW5IFQBXXLMo+AMmUXgLRSQX/EKDyPRfaDfYP1M6Jv/az0yqBimqjQ8OBBOyA+wM9JtuNQYWdIq+2acMW+IaOd4pZb3sIaAGAumzVUuT0OAj4iIU83YR8gQwwOOhGbd6LghFHNUWniry6VkhsxbNnTbgrRErmzW8KPpldhVL41mncWcK1s8KpfJdkRsGqjFjk1i+tJMlpmCJAkKb2/yl0ApQ/e2M+TgOV7YQUou8PL04x7rMq9T40KrGBRrPOgTNAejh2rM2CLR0ewOma+zaZl3ACJQmbHeV4ubheY9Iza81xskgqv2dMFNrkFNnuMTFHLmabAigroPwmqGunQ6O1YiQnF9vyAGncnlNyuUhtxy0wZD4XQsmeyjIq13+eZsQ1DgqDSLqC/XW5XGXayqC58AT4mQmQZ3G08YbFWPfQ/8OZb4bYu+9ctT4Myjt0vVfgUpEe9CcJ2ljh9bLYbs1azMCshzEieNwgwXSAFIwMPtAn98VfrVy9D/Qvmw90XhipvT+nXz2c3wVxOU0jpyGOwegqVcqkOaRG8zSml48LPhofcJrV3Z4Agz6NN9RB0Oo/gagmBWo8Fd1Q8knQuKT34NOJSk/FoQx7lOCF0JDW+dl2ipEnjD3aDc/C9EYoV5KsWYBubao8huGDRmTGlIGV/lHVZZAj3peQNaFpbKxMYEJlftd9cSDjJaIPM7dyuPW6H2q4w5SwFHOvRcbF4edr0SijrlB4LIpOykzpc7SwDYegQpc9rBcDlnhaeHWwFFiu0z7db9q8Hbn4qPbUcN5UnmtZW8xKnzlLN83jNaldUrpwYx6gs1kJt6NvZM+CFoNMz1v8wcE22t9heJXNR+OY/0a/NiBK01u2o6491s5BTSWUiL9FD5dOlY1iswms3GhFjNGgzmeSxnO7MqXpAT/KSaOkYsV3XOfQvY/pqnXaN5o4fsHhHQ+fRZSxHzjCe4HWlzm7KNDHi1He3cFmUmNhbFT6TPN22UyXKeRiaQkIBfYgRcRoShEzKds+m8SCNDdlzYImkKWG2Yt0ihuO9owQqUA4TCrq1syRf+8pLWFL+pDuVrwvRSXIXHRGfjYEyhx+HhWBxFNQosAgxQp0qXX4rrgXK/f5YrcuzjN4ROhkoleqc5VaLfaHYdUVIM5BubCKs5+mXLZ+7clpXjH8HdISZxy0T2Ov93xYdje78TsKTrZ3vPoywqD8EQhrTCb8sTo0ZSBjLq/TEfTO9Jtb/mIjihHhczge+WdrLW/dGHqz/IQcCAgZTAUhwK2EGuenX/2w6JM05CVnQsuLR6thi/ehaOVXL+XHV4RpvtUrRj1TvX4m139RpGTS8FaVf1ujQ8OBBSiA+wNRFdboEHxFot3QVrO6MZwjvyCkOK4eXsH3KF8/l3vTTBzrgwHhvMuTKKUd35o1Fv3/lzJjPY808gV8jui3w0ye8ux+OzAVmd7MuW/o5eVcpPNFT7jaVdzxLj+yIe5jhiXCcGhEe6HPR2B0aLynZ3wLCqw+ie28DsIGSVdugcDjzaONcLdtO7irQ2qCu8IL8svNmrP040xeupXayBlaF7pE0a+X3WsrgUwK6xVJF6iwWvasnrGq69FC5FIgifty0UdptoWzQ3eEkNLelYhWdzYWAfX1+Ij6SFaz3eVj+hQMsomFX2uw1pNyl6AOvSA2DVONxtXLZL2/n6U4UOkxM6eXKway3bV/J2QDC7izYBDVjLYtA0Y9TDifY0twpiUbDnh/0Tb7hWRt45PC6x6voisO5ciCveQGrkcPOiozg4CzPtWSvqo9isoakPj3o9i3Zds1tIPVrc42mWt9xIiq4pXpWwI+yg6T+LcxjljxcKepnaFxgIVliDpoEgoLvgs960P9uViXqQFw2PwAQ3uzPXGl92r5k0uEyhwCcFvCP4FeDXypUC81xlNsQwutoeMYRhOAWjPH2sV46SIbX+oKSQqN+5HINt5XPTxt0RTC47I0QD6ZXVpou5ID5iqs1A6ikxsrFw73y1kZ8AMPIgftB/nLXvVty5bgO4+aZSfJyEw70naiAc2ubEqstx9SmV/rf6bcWZMqG0tkBHfIRMREByLtEY8ugJePzVfZ3mXfU3peV/2b1HMHtWgL0cJmuWGad9vfjToOOzqf3EMLT6MEZEN8fEhuZbFiBzLjuSkXtnuK1XW3jGppd9kK/qhMgcfGefoKRt6Eg9EVBoPhv2ZdEhjsgUedP9mujnnnPO1cbCVE2j3eVM6a7a5UVczQjH32mIc4Om7sjIa4d9x1N6Y6RFKqhsXF0HB9Zk6bwQGjRxYTcBvYlTm+ev3TIGojaZIqKSWldCqL9xgwcHBeLij+dM7ESsLMegDQKtQ6Co4bTKucMfYYDfLeo8u0Nu+suzpJroF1C+tHO3Eg1e2tgHnzmTSv6DHpEfPuJD4NroV3kOxEErGiajbmVHJLdmC4xf/fc5eX+t0KdQ8d2pHSKQAF7II76eA3DYQ7OmHcYh7waW12R9Znz4BkEajzfTSpRECIIoXpPKAmTcQMcJceOde5efRccqNdrAe0MokgsgbYEgIRmC9z+RScrRb16FOFeWZvBt0rRvGWcJdmtKUtuXERflG6Kst+SfKyzqunfWD2UXpxAO5h8rALVkTzRbvwiDGjQ8OBBWSA+wNQs2b5IZ4w+g/SetWLti31cQDNnCUmhz18UZ6NqJn79odUME0FGjmTLZJtYtA2sSUvs71/MOywzdclbAQ7U0LTIjqOfx4bdY0yfM+/TZ2nMe1Sd5NTQn4TZUhEIXq5R1vIzNpqrmwMIkCPdz0v37p381NN66mlHTIXfLuuwnQPpdkk196AklQBBNQmFfOAbjVlFuTphvCI4BcQyzCAyf1oObYQycH3nv68xzCAmDt+V5B1K2RzZoge3tmY55Emd6/d7wJ6eTzDXcGXHE51oiU2t0zE0w77lN5IHKLHR0DGwevptStZiXB98vPcR60uRxHBIyKbGHmtR4lEzvYIXydn5fjKFYvlgO1WGO3KiG+R0kPqi51s+6kbne2ZIv3rbEIpXi/9uHtTSytaaZ0BtYU4w5hHOD2qzzqIOZd4zu/3QMkefAZW4TlpzeXzId4iEGssvSHK3Tvb6xy0Y0cbAOTZiKQcmEV3JzbhlnYQ7VXz72ILFh+qAsDInFAsKhvJv6Fv9To2hUT5ejQ06uwKeO/P0NVCLQVOgZMIP0rtfVdenKqaSvNVu4qJ00UiochPZWJ2Aua1fc+kfe3Bt5mFETydW3o9BjMJEtnfsAfF22JPmV9oWv2DLm5uoiA13tZNCn5or18irgtVTvmUJTNqn8IZE5w2wd+Mr1dvTa7Vvh7vlKHnooqR6qqPeQN7rSrGklE1qQZDit9FQvrE3G2FsLAnCXoVfQ9RyB0aAYZwO/zzsc+QOgMUaj0f0rPcQje2D6b0vvIHaxm2iIfiGYZd0oCnWX+Pr89E8eb8HsSwxpQ03ZbVMo457DpvFy7kUSJYFSb2FRYK6DT0K4TSvbASwVEMYKyN+WyyRKtuKDDU3dXTf5CvWJ5euYTUb6lTx3/17hg2BrWDD07WWR6xCZihfF5ka2Gxiy5nK01gvRnYIa44NQqwAv9CWdt07ID4fgEQjzAEQHuJjgp9lRszCIKpH67fZGxSskmzK8sqyMIlj1F/u6Z7j/7iIHIce6YcnLhWGcH3PbV9LL58jvJvWIkBi6NbdnKNthavUegzargJdo34ytqUrtY6ffd3yNjoaaFiKpJ/MBV8CfS+IMJmFLx3FAYQW0Zo6Q+hBHzgCXki/2YI1d9BWxqSrjs0oKoRPdtINRXjq1hY11TJ6bQePGlDU4v3ZNDaSeDXSods8r4s9atMIeAlXxc1j4iBZwuffIIRCJc0DhcGR1/0SFd3qM7IJWjQ2c+k1ZScSJi9gdqQBKGLxqziVvHCihL6FJwatd+jQ8OBBaCA+wNQQtaKyIshlvo9sSXwwrMGHeZsfU1UXCkHuFJ567O18R31Qo6K8ESg/WkE8TbJbnKQxPeGvIyWIibbbYLWSUfSNB+qKRs7nFhikOA6QfMUo9LGr+PUWVfcohDYKDyfx6YITacoZfzSeXPZxwUDaDTnUx2SPeFG8DFfnCKjjneqrEKvoqTovSglGlKhCVDkoRvjhaBSPmVo7r05/V/5x9yW9QF60k0DIUYNcZpC9WOSQ/4O99Fj9S5lurVRysLJXTz558hbPhzY3y5b71MKb+9sljxnxjZ4X42CeeXvFLChABvlXRTzzXYEr5wpB/htNunWyASlJNlrvfKQ5Fzx3zkgGJSmy4Z1iSm3CaxJby419kfslIBQXEFzkY4Jp6WZiQBhiwSvFGN4icbY/iadtKkM+x9Ir7pqOSuQgLYcyU7ePyMKip0nZqfGGQPGdl0Efhxk3T7pwcXYGgAy0GKRH6llIxBXVIWobZbKRXojmpHDmk46qv6T6Y8lErAWwovs/9B0RoRgWN7x7Kr//KKiBv0dG/eWH3B1JqD5oHAQB9S+J2IbX8x1fhyjZAb5kr7hHL8J+rJY2El0uOPtfoPDlxU9Nz2wP4kl0nGuesE4LXAc40UmB1hUQD4VtUoJF2gfrtjFg49LHOKWilMUM7VsU8VsOdZWXVimMgx8vtiGXn+aEYUgtxNNuod2ItlBYOi1OLfccpl1dtDhuGcXfZGN+L3lj9DynpmVAt2aRVcF76H1q1lfXNulCtIaq6iYlp3s4cE+AlFweawByXo6WBTTV7Nx6jqQf4aJBUNl3lDZOOEqKN62M1RPCZPeIv7stU6eFXEDA3+J55eqKRlH84lxkVDbqJeh10KePA16kN1rMHMjv/RhRx9jWcFlKXxbNWbT5Z5f6UYT0bACA0mY8uH8P7Ycsc+cs90ULTo7bjBSG976DNN4Qoz66LeAfBO0cKU+dXjoQ278VTGmSawQnfRPy9TH+RZjNS4oj+BkqLnrHlGj6F0E3dhRS6LMMTMMXtEbaFm6594czo5dzniyVdAtAp1txEeKxTwVK5IHLTCvzVIO9Fs+pKoDewJg7wwpg5UWhL4G8CRhknCKsdtQa7DcsiSqluHGckXr9ryFkIHXk6J4Cs2CVSQaSUm0GOWFhLIqcVbvkwGI3t/DnfZK7or8cW5rWTgQt2cBHHVitsGjPyxPDk8X6dkYWd5RIF+ieVpjrwgAbaLMyW3pc/N5zUvIv+ZwLm/maZnlNMJaPz47CoGbRYrRBNTih56mXYW6qHujQ8OBBdyA+wM8+oXue1wvULtqiNWjklR1w3oEDSh/L3XUlOD8CqJcJL0gWQk1TkaoCFjxcytQOQfDTCeNkevFBgJr6rHgb6DDBGwajB1zYNFYX9vFEsHaXpduTj8HMnjQSS1KU9KSHFO3UCdtcnQ8MtTS+CeAIbpg3WLc4OzVeAi8+/I5G9+O67yTlEPzV3Wh0twwp4sduT5/yk5gROBnDjfR0SzkAILC0KbSTLfB4q+uJAum/nah2ONYPSN0w5GiIGwyCXGH/Xmg6rDLPYAgoQlcoasZA9Y0cJteTlubNt9auyTu8XjjTIJbpRWAKb+YcGeKeB0DcY8jzNeJHjFZrDrSzpWwUMVtjsQtbVJ9bI+guEVM0o8DHqVtVfFCo6xlOvAf8nhm3NKqChdYzTAzGXZ3bBHt3RlmZk1J2iiPGSfsUf2uH0qBUFsI4OJIlVSDkTKr+cBe2DyVXzgkvLSjOcSoNqxotDtBd9jC7u9tQNrDMeBsFOI3BxAtAYH6JKNWL0T4YPlY42vgVzusZlHKz890tR9pGtloBxnlUVoxSsGBryCrbe3NapTat1iDuOEdo/6HNsHugW8P5lZWD1LRN3zxAJg8srQopK/grJKMNNlHug+k6VrAxGVbLC/Zd8sAAkLtEeMCJhukr9MS72PZzdjHPeWJsSPbClrcjWUaecA21vJcIJ99BGbkoILgdyBysPjuzQ77eJiMEKCGKRPKFZ3ZrxBvgtqMPexa3PYy8F8xmlhtkwnoP5CbUfGgSplc1NHvz3gT6U42GSOjAwDNs2n/zhIb7ib0Tfv8esLY/WVc0tnVJuCvJJId9E5hLu7rEUkaZwSZc5JcvxiBaVpNGwhLEkEWaz06v9Xj0JDUBRfkhOLkzqeMtzEnk73kC2H8PO52rZNirZ6lUaZjDFsaL9xkMyyP6PhIOf0T05cb44em+2pAiMC51aEBzclEMczh9CtwJvP5oP48EbSssTJt2JXpNpv8Nu9VTnBuyWPRp1sRps9+FvWlbzcRzVcUm5Iq4FFJmYm0ZCSFYbr4xjix7dQFjmDcIF/3UrVZNPyWBvKxlUvZYCego7yPftKV7WVmSb3QASArp2N0it+ZoQUfkazmout7ZPzPB6TUUSGxNxB+rqlmnDXZLTBk6WpbIkBFY8LkWp/6OrMGyCxWdDRI7OpUnCv5yuzC+3vzgg+55en/qaPGwGfZuC4mSskzSNAUZS930fxgFqW4HKjohsGMesFQEx4pcJgZDH55/m2RcnKn5I699no4zctv4RRmWD/7XnODgjejQ8OBBhiA+wNS8PkAOdHoysGBiqo9pzu4U166EWLLWAqfLSvXeXeZJQRAMjEDtNitpytkwhEsAJxxxoHh4D3TtjuuVd3wB8J+6WsIjTahEAT4l8KKvVBQ5eq9BQji9eaaSa4YFwRwPR2PXyKJNRGScEZbzoqX7TfkUmPxrZ5m9YycGbuEYHLLlXcly6tIt95grNFzxQvoieFCcWRnIzLLkCmNn4bukHlF1uHgm7Gy6Uc9LHb18CbIZQfOxXA6Y7fd4z3y9sXpqdgeTLcXNzDqcCONA4ngX+H6lirDknlmsxMyBCYdboAHnap38ZjfkuvySul1A0iADnDHPkmZYNINljIgfab5d/8VSv08Ki0ZxGBEPwODXqPP5Yj3WfjQNTsEUI15oGW0RX9trhG4KgScEz4TbcWqDsW/YpNaTv4pduemSge3Pw0vPooPiprVxLU6r01N/i7IJ79vK2T31L789k3L1QmQvLrBZSfDZd8qZX+fKLVLIcO0ZSpKqgR/3MzflwdwPev8jpMa3ouovYoofl/oMCBJ1qlJZn52T4eQhw+lqy8o8a+DTZDDO2OaYstqSb7L3eeuoOHVt7V6zf5K7WfY2B8bnPDsCIzehN/yWSSBZEoqeM5LPHM/qbCpTjEhrwBO4VSi61Wg7Q+rLunhvYBjTYzRU64RJSBoKt4paJSsAWl+bQ2N/ZuO2fXXqhrrR2T00AnoEtSpygMZQJBjQMjmvu3tuH6IsHpWAedtom3ivxEZdISlkhHMwdLRYDJYi3qLHAoc+SpHy1Q4QL7GrG9tFM0BL3qMmOWS7AXsJik7fm9OdVj9yW4y1OXP21qriPn8TbviHTrC3xHlS+ulqR3Tg08RCn2anOydge7bQr7255vL+7P+CivdTK8xCGqI7hIZI9loodqfiYiohA3kcrINAjVIrxLnAnOMxFvR6BuP4wouN7dgxL/XlbR/2sdaBNwnJBj/i4l1t8ejvAN1vlomKO/UCndi2M5y8/TvWpZpWPA5Pv88cC8wGVo6aSz2vTEbACycV+mAxbPkxTllVQG8arinYZyl0N98VTCCYgbCBmqa21u2HJnE+gjufDH6TRgapvor23tZqgsNCYCes/y6EtVBGPpViI6hJ2elWXbcVrV8zmu2zDqDpJZMFfCameCAs82sXgAAOrA6rNfH0wbVxsnuNm9dJtsj252A9GYyp+KSQgNBUQS9PAVaN1le9IdNKo4W3Qv8MouugpT4Ha6Q/zy2hU+Q96yVQbQitAljwWXOeW4gbmzeSvsJLAbL9v6VflqjQ8OBBlSA+wMzFYomdyOChTkzdyx05wqkgHHYQvU6WugJraWQlHjZuPKmoEBUagqQcPI0WXclXCU5TpPTm6Nxqf2EzweHuSgJdeO7rnsUY9pa8wHJbM9E9h1JzBFQRLTnScMxP5TnbdlLOgGbqbhTyzbUQBWB5M37c4CBhMiaMDVjgTcn29h/ByZH+yTzndMmgkmuqNh0obQiNSsCfrtVuLVTfyUyoWPtDiC08oqd+0Ldh087Ufynv9vqrVeLquBdkipFwf3zQdv64xRX4Y91uPEDQAYzTcprbHip7WA4Xvt8/ml14+1ru1yZ/SsQ6A0cpua96fINo9DycRyoNIvUiiqVB8UqUpYCc2qhlGkLP1YtsroGGjaQcevaoyq9WVeMH8y6JWWwmtnrA4nX8VQxH1rTXR4DTlIbfz4vuvvZkK4X+o+ZOMbfLG+fO4Sz16FkpuOtMvJMBcSvBWUIDBm8WrWeqpPuCGSNFJFIVljTd5ixk16tyhDIC+ExoG+ewgF7UHFKN5tFXhXRN7Yd8T09GFNiQ4yo2O/AwMPS/P7hcLJTuB1b9ocDnqMqWff4TWyjqrOXO0uMieWTgF+GJjOpcVmsS1BfYpySSxa1YdXQyiEhyH7XxT6IJjswEeLkFKP57WxoZ3ygjg8A64IOnAyyGQb9BIRYrXDkjj3LX/yPzfY/unjvjMsjFkru/f++k2kQqDqn1KIOm2bZ/90q3Wq8elP3dBH5w2+kR1np3h6afwF3+YJfZ9QqkM+yiHU0bIVLfdNXeFJ0xYuumUgKdez9C9XCJtTara9C4EhvNSYgUNnI6fhMW7zETg2s9wnBH4VQKonNdl625fIsgfln9LppjAkWO/RGjtmiithQilW+o59cGgh2gFCruQGTDaHNEcdaYMQyxPSTuYEarTdS8V9tJNx7d4vIh5XelR9em+QXi78Npc7q30Q6Mqi11oGC8cLchyl3rhqf5VV2UMccydsd37VoB/X5FtzlCZoDgcl7KhXibcOnDsjIEtig3CUN2eH/s2ogkHv//24t2DrLD3FYhvw0oD3xk93r7hURw9OSJIapwFI7gIHtttaIW4LcOnm/IFaK0WfeIaamQdUmlO2g+vW6GHxUmy3Q8jB71XgCCFe6HtKSimeoVqiYiEGWXFRzJlgQv7AADNoJlM2dd6hkTQnHfudp5VC9fow1POFgpYRY3XTv8wbU4usNf9dLS53rv0xBUW4K1Tb1I5DnPMX9pw59GxdmwNroN86388UJJIWGO3BFCguVhBtO3TqUVr1YZ94zUdSjQ8OBBpCA+wPWJy9BDjgB5e/MU/lVrxPOiwTJr2IyWo0zUqnWLEUr4ZhZpmPtsTiviqzOt06FnQOhbc5r0hF/5yXz1ZamOgOS6GaPEG+PWDPpPnOSPjvy363YsHEF+C/irjcupkuVj2PkjNNmpNiaQ+w0+IYHVr2CwFN4+Y+NcAKw6N8fa1APdxj+tDOkuIzEHWDojoN5t+1Y9CV0DE9YNKm9kS0A3qZk1zuQ3HeLPXKrzqLd0D9VvjLJ6MgJ6GySKCvULc/FqO/8n3iHMTp/YJhs/LZsr48qtfiChjo7LZ13zsJ6F9QDUPNwHKQA3Oo6J/Mv/76AzAh/JBZgnK/ytLQh5LT7G7CS813ajoezfvhkD8DnwzE3pBsxXDm46q5AArL2ZRwUwwj+bzqDmGKJNOV5Su0SeoSA9h8LlFizkJ8biuss/HPR2J1awJUZMXT2aWPm9AUrmrRCVv98N/DsX9UktPOMau6IphSRjFsNUYRaxdIunHV2+95zzKmLjlaI/HWS3aQAjacbdUnnU6Lhvc81wCmE2gty8kcwZlUFOxutGMuTg7Ei16qje1kvEc+S4wgwT8gbT7BKsKhBERUxDhSYjS5PiICUce1bAskjQ89+i8YUXQ1I3ZSDTFDCiImC0cCfIkQi9V47AN29cfkRMRVOyunfSkH2jsEE2r0p9CyDAICDXUnNAI3JkejZJSr9UdZ/1wx98H2eJKhA2mtNHd3n0yNUniV1zavTjPA3tQvpkj7vAh1i2Neo4qHJv+6GBKGIv/A9sSR2MKSum/lGoAwPktqfm/Ita+Vdp0+pM5PMrWmLQPck5YmqX5pqYZopUckMpW04WrWgZ2Bjx4gSTHYQdUTTwuIwbcHUV9VrvAVGEsB3ypbldp6QD3+0B7+cYpdSF+fIq/RFWsHMp4CMFxhyiOGTXe0i+CK42xK6kMTYbJypIHYTHWD3QI2JPrigF+NiyPbV0lGKcs/JDAO1T4BgoI0M5PwusYRicIzwqF+4PjAbRbfxyol46hsvm2/XiMisIJ7dalwKnNz5T2nl2XKcHD3Fw6iGGZXi8EbOxxzeLkJyYf00YVtsRMVNlVJY71hZHlMUcu1ZTV+0fwxsL77FNv6SbcyTamx9VS72rmbYgqxP+IBbM5PxGT/3MocRQqYyd/Hh+bXeE2vAEh44rCCzjCIDasExs/oFE8uoAY11BvNtaQst+7nkOY4/eM0pphn62iZgBBepFanExGBv8f1ZeMtRuSdCW0p+klHR1FTNiUiN6aeco9PTEBGTQenoBEfQVJmjQ8OBBsyA+wPnK4B5gs0CyeMK119VTrp31gbxL8AYz+Q6lkUAavqZ3lRhxXUjVVpgDaNnnnpXnEtl6UChSZB62clz+GjREfGIIrdPPFv/vIrbPkmlSwAr+VfizTjxKAUiO3Xrym4qwwQYtwVe8J7BQZ9+5Ac5YAOrAqj9nTWRDuWGHIdaTLajkVpvCUo4waBvnTD7T++ezdd63r7cQ9QGUBwSzlr8Yk6nzG9Tch81a1SbCauLJQxhbwh/8Rh6oNplhnQuNB54Wb+dIZkYF3j5Z3L0zXsjNLL3Yh4XxF7xrC2jWvFjSP5PQ846fdQZ1agf8Us2qJv7WVHmABmiTf24QVwse2jlGqK2E31tHZdikay5PWhQWNTYZ2ijzXUfN+beLyDkFH2koltUYymu7l1gTUtFVxyUTDtTz6FIP69P52k3icaHCi6Q6EYKZgB1GVfz3Yp+R+oYlzrp0b9ZBBgWp6uVsGmsqO73z6bK8XF0kZ7lCHy7N/237QvkgLGSOiunmyxJCaG/vUeHef2lFhnVv+NY5FnNPl5F2aqc8+aU5N0KWd9esXYE8SX7b+HhbKIJK7ckJ0S3VOJxfyz+fcVPu9dqYyHl9UCCca2GPC9oKznKrDysdYN+oaqNmmhEX+guH/E3LmnfE6jqyeaYnfiegy05LPqmuY/4FNZyJbeH5fm8b9N8HrxbgZroSZ74Kwhc1hsOeNsCpvKRHSzNsWVIQl6NJPAKMHhEMJEyBTLtH6aJdnTYPGGXsmSt93fGaiF+PhjWQE9t2nRkOQ/qIpicBkNriDEH7St7/en0QiqQMBhd2RSrf9u96BaFNyq13I8ycbI52TqBON7V4+qUfewBtbM1GEq2f+hcfNbULOd/po55snLT5FydDUjefW1DWn8NU4bzkHxwPkc3Ns0EaU9YJGnG67i0dpqCZCrV6v944ebMpAmPUhijH5uo8zmz0+mty+nachZDTNgA1h7Wu+XR2jd/a+UcYOVDWsgdigg8XFovZFTra5uFL0z7ygwTMMrlrYer2Dnu/+ipi8MDgivpbpLu2wMbf3TMnkfHB6jgCJHwLMClBbQ8KFS3Ik5pVEJnMFC//2DEH4V4djz5ByyiHHa+fP/cNphCei6H9Q1Itb33/WuOQjfz4PzM5/zTB83nSQLaFU8hRnp9f1teXnwy4lv1Sm0nlXUZHPhJYYuxWU/a8DEtEphUdbr1fN2w4w4vDlzbI1VHxiFZmkjBc8E/cmeI4woNgxv8jTU7dH6zDqApqyisAtIcEBYiC7fGI7TQNY4RtXCjQ8OBBwiA+wPneKSloSv7BWNt/OGU5Up6pry+2disiuFqyyNE/RR71jpEEY0JNCl+P6TfDbr88n96Iw0TIK63nBl3DnR/Q4BoDf2pBwTD/KLplJeTNYilUeroZ8/yypBwNr3fVkTMlfs5+d6B0M7sL+azZe9JU5YoOZFbd5UctYyhI7ImPzP2gTsVNtwbMlgrBeU8Ym6OU9axoQa61LL83ETB3/UPwYznAW/UDMj7HtUmfkXSXQUzFkMa6Uw31UVtphWqQBYx42O18XcTGyjc0D8anzyO5v4xhclUEzivoMaiDxUR1U0c9UJiM556Yukzooi+U+PpW4R6rSf5PMAabF3fVUh1WEa2OMoDUQRA+/SMsEelR3BDJaoXZdUz1fv+G+YlOFfvFj1GN+K2/+Ct1I2miegq9lCNwd9YP3A8oB0PH2UEMfVi6ELBKiet4q+YSsftqsa/rPxnVK0Fm6GHBMEUbNOb2HYX2F5VLjjT2Z/2fmwZ0Xr7HB3PdloXscj5lP9ba1akLzghnwovYFU6kHCfAHYsczfBoi5w4J6ghbRfwCsBJRcP07l8M5RHlgbgwJuhPPyHwae8SynSaiV+WwBq9AtpBxS+qLJgZuaf/isp4Xh2gUHOPDH7x3kZCkAFSyo2OvQuxsW+HLRzC2j007r0ilKliUYiPcCQvWvtgFv1x+OgP+6P9GAaQd2MhNlCG6SsGgIsqi9a2F9ZWoPMsPx1m8wPaMY0qQIk5uvhErmO/X++8U1TQl55N/Q2adugcyY8PKRpOh7EZTPHf7bfZQ6jWPkNDZaIOHo2epTARZED9/oghIxtgy5ywIjQgW5TUlbMp4Ld2H9w/yD3TqgwuYfkY9wNY+g+dyyD1YrpBzt1L4LVQ41x3DOrIzZAi0ixNOpJAeOVj6v/h6f9ZYYbcbxVFe6XB4VT4n+2RCwvol06pjXhvC/RPzDjhraDkT3ZLMMRzC7L0z0xOyQ6HOJlWINyWkhFVO2lvhw6JrCIm6Rc2NLCRvUAIevHLKl4ogdC4LiV6+rbwfUULj14OjuVTm4BxpMZloH/s13GMffF0nHJUX/cCh6KWK1bHViTSGlQBND6F+DR++kal3UjfN3AqreQKvRYpWv/lKVY0EVddIbDivt+G23kEusTQAmalJ3o2wWLWgerUHqYkI69UxObmvKeGePunAVG+EF70kfhwWJp3GgTsSb7wkQIlttykHILbQxBe6QTeZW7AS6qTnDdcWReDbMH+AbGJSCnZwDHTvH5t2PS8ImAfPcWuqS2VJS5NR7rjXOjQ8OBB0SA+wPneamUDLboXwfnEpEMCf/i8ngbX6Ypy8HQl1ql5U+oJpIllUb/Isf7YMVXOfuRld7UWFmAms1rRz6R7Ye4+w5/tkHNd4PQrXb1y8lIOfR9EIAnDD7/xIswzzPNiU0WTuli9p/fST3RQpckcdySmG+LEfLV0TdxyJ0p02JyRafkGwPKIAJautpkC9Rhs9dBiEsmNfxtszmpyIVNQ1n8FyE/6vQQD5HiHO8u0Qj8R5b6FJocm4Y926NBw8w1dVW04oXhbi6Iw2p7lDJU6AExm0CAai1rY+Rvjbj8CSwfW+6DOW0KnDrchQl6ymO5wg/1tfeEH7qMu7l9aLAXEkkHwp5WtpC/fGnCL0zN1NMb7YTR7wXaV6j3geDmXgUZ2gi7xJM7/tyMS65PzsxnEN83aD+yZRjOBceJwIsM6tejsFWB2asGawcaxPXkdCi8rpRQYh5+1ANFU0oUCJaTmjnjeQXPaGYDZcSbxj5MNBIXOek5fe3M39CaHjgivuTxxqFLu9AEZ3TMECbILqM0DG6XxoT7YdbnRixbVc3+Vu3Y5JFsAn2Tj4KekwDypnxrEhjf5WVxxiWLOzAIzXOh/XMu8j3+DfJWRijoTiShMEBwJuWR+M/s7+yF367zAmuSu+Do34e7ppuzGTU9Vb08vrJ5PvfZL4VnoVZuHr0fPMep+00Z0D5OVgEpN/L/Z/Hgp3db94Pl6s3ji7cijaqxfUwz74X9y5h7a1jIG8Yb/JDrO6sDY6knj2lBKFxVZgyKjyve1Ojyb8QM0Wo+MX838jxKESG0xg1LfzFvpcW5ygQvv5CJeKaWn+TcUCmTfCv2wUOZAKjBwWEh3/4l+pmrpulFk9mqq5zJG5HGS2mlQAtu0E0FvJnaESD9pYOCOAN8DVaM9YlIHqo2x86bd67PVQrkF4yAlQxKPtr6Xpo9hGmLpdbGPyX3DvuIq90mjvBvxsm3+wmms2PbOncS01TMGwfqyN+D6p07fsPWLTjzLQG+fUykM0VlbrqOtY0y7ITC42bHlEy0roBD9fAf4cF29fetbCiENWT4UWMuG+z34aAQ+zQ+1z1lQ2ICCBmT/yoaM5WgkYzDciK4aB+1Rua+vJTJWRLlo+xlOefAJSqwaRi9m87blHbMBSswghdSH14ao/tStfezRDS5KqK5S/rTcj4ZQgjpgDsVQYEV15MSeoAmtV1A+/TFUD0JeKWVZRZniG/m7G/CmktTXo+8H9HcvjNqG9+/g5tjYEZCEH2N0EGSlW+LMlPktK67L0JwQsVTtZujQ8OBB4CA+wPiHm6XNWHI2kLSzot96qFtTAj/N0+ck8P7w+3ScUW24OUyQYE+D+cOMOIFJpVWotqcboNTBF+hK4GwmgyAGW2xj7/uDDSmDD+zfxA3ppC1iuJsAe8PflGN//9wG42I2vl754z+7GcoQ+7xhA/0rgxzATJsHpdPQwUSkf3Kk7+h7paAK6ecDL2VNqOPFa6seRihX8oB47ttqtQ1XE3//utDPIX6O15qjmgQAV7P2UA7ZQahXIKcqYlp5vaTPIq/l22F2Awfp9gTrnRKrDjxTho67oeGgAqj3xbPVE+PlDY4kmAXqpByz0+j7HAf8+GIP/I3zk0qf+5pV4EAraLPh0N6vMYNVrHqWKHAi9dJKZpsabhsIcHIt/evalXzCNrNPeAgmT2ewHm+ZKIObGDUAGZdT2PCG7wyZ2k0DFH4Ut2b55LFnioM4mWjUJ2L4sIe2zq34U//bMBAWePQv+3esPTGBuUEMDBlAA4i0YDj16J4wVtNgnW/r3NLBsYJZQPZ6IPwqZ8kC5Q5FIVyBYvwW6RRRND1BNasoKpzKJK/EgrL8Ht7jREXnyqhc93IJPSDJzgd/QbT+cBjdSplKOyKRHZl1nZI1xbO/JroNyrWh9G5nPcNef+nGMUXx9xYzGCA4S4sp6HpQRuy9j0jvWm6cdcTDf7LkFRowmf36Grxpgy93XB0rGPdHYuDLdJFL+A0ifLK/DAZF5jmGa8xWwc2M/3JdVMUCKVeQwLziP8YyMyC/FZPsftxYSzzxgZLHQ4TiHzqR6LU7YplzXxQjQcyCQwa4LJSGA+LML3Z38F63j1OygaeSPW5lYq4uvTsm3+mnJ816jBw77vJsWsGSDRcmOhRT+BYahWP35ArcleLBtKmRGG1a4FFHN/iHLFWpT3obxnzqjVKnlvZR8FqUU66SoEpAbq1tE47+S8WNWrC8WcnnHnenDjuKBfwfCDo9G7OgeqQRVnhPNdiwxyu4xyGkLkUoWKh0D6Zk471NvtLEN9uELi0KXfOFwE/hKjp+ZuJND4xP00lqC68Jx4nTNTnUc2GdkWmOdY6VCWk8gVKuwZiA9nQ1eyoJwU98zXpRsbgJi6VQHtrOxazd46XutbI0EUjqBqvzuOvaBkb7zF8GdiJID4sxIw6TXKIKWViIYexKAFsTMulV7Thfy6O9J+TbGhVwf8lZ4ntZBn/gk4mwnkDpx7weNrbRzZkH+CgD7h2+SIon8jswDHv4O7feAtjgojxbrocMnMYfrKWwI9adMNZE40CUhJz9xenvckSBI+jQ8OBB7yA+wPm7CbbCrWwTzarAqocuCvT3lzP38YYWDfFpJn8H0e1p5jz120IT+vmYEu8MmsjwVT8mU5k8IaJ5EQ3YD3SvSmqOqp+vOdSayfOaDKQ72JGlSvaRjew+OH8h97zr1qbZ+BTPuxNgS5+a7tjvYYaoO0IXOQZr4/PzfiKEsKy9WvxNP0Tyc+JGhB4aRmF7L5qdDWgG0H0S8JGZtK+Bkrrw/Aj5OjqJnZ5YAqPHlOZNcL+SdVhilX4TeTGv+KRNACSKABLanNOVk6/HKe8/fuRYjRiJVbdwdQjJoFdmvVFQgkWbSdHn6xBdLhPNPHrxVxyfbtt5JJQIq+nCz1pejMMh+sy5mXGT6gVEa+TZO4J0Uon1ilsvMS4q93YVKkBGZ6E9rAaVpXUd9/zcosJiJ2OVgDArdToA6QP+3Y4+F4k/vR+5vjk57CRzFnBoGHQ0EGSTOlVMiCOeIMY5/JVDbvCwquN0PTNStwisVsJ/dkhN3XMjOh+XmAWFy62pZZU3An0klaAacdFQEMCIcR/YJVN4JSD5Aau70/rgCLtrZtJnDptfiFfwqL2+dBIDPByq+tMp0NQqG8bwXTxx+ZQ4puppPm/4nZLowUBycAAAAAAAHA/qwAR8obYq/JyPkWq5hKvIlKrNVu/F7gUZ1UyLAku65yRXCoNwMVJqpwdNgoJDRKnp6/9h0x1Pjp5G+uqSsFAhjmn5AbsmpojtiEvfRceE9L5HeLTcVO94sedFCu4EIT/7oQs1XGfJ0RxVhCLCckloIoqKyONEFsiP+d7lPdErFrFiLKiqdGTJzqE6F7RIqQB6UfRPv3CaUTjAkawS8alZiQOBw49PMEeVgNX66j8iOWlYeed+wmEIWffHN+zRJm7P5ufaQMCzqWW9lA2XgPPlHDYsnUUO+EwgxUXO8DHxZ4yJBWzsnj2LKHJyGxFZyYhHQlziKFNqt2AOVYuO19b8ZQRff2G5BEKxSnRMabDBXVMYgiWYOw04RVfn7gu4Gm9OEbI/PH3DpdkJUQdVoyd6y3E1aMoC3RHcZ8OIbYXrcM31vB3YFTpHKUrX7lIvwcnEXhsc831u3Uyv0ILLI/pty1rsCuCWXrHwKrI4bXw/gcp7wqbDJM7p3qnWwMqOduPIewj9yJ227uLypwsgj4ROYG++K/yHGkhd6CfqboKmTZxtEbYxK+68law+5uFxOcLChGFC+pFGjwGZqRbn5GKUpqCLf3+/a4b5cHvLGTjJCHk+dRoFERWv8mPGmKMOOjY4g7PiJI+Xz8AhLbrdIejQ8OBB/iA+wPlp10a6NLkWROa2zIHXxGLCNeV38pls5kupSnMrPGYLX69f2qVQOkWS06qVw0fVGibpSruKCjxRL3K85z9ISDGney7CC/E6G1y+V88g5TIaB+n8DVq+xL/em/uah3DePbhfqFM0KMnKPDSkFdYAf5mYUNqv9weQmCs8/NVdE8pPLqT1Z7pwnjg80U7wyL9Q8727GaKy2WqKunZN/T7GgfZM/tu/WMi/LQCOwf7lXoU5lG69gyxsI6GExm3MB4u/Z3zyZ48o40/jw09cI5pPCjowyqIY13IDM8G0E2G3TX/En8IL7f0Z6CtP4Ms3ycmRCP7JyariV1h+h2Dsa03HSqEq7LrX8+6syfUydAZiG6jr3iMoFORoewv3B5W3Izo8cZSK0UNmqZQmCtT7YtJnk7QQg5Z3Ag7X3XXvLNG9BJ4F3qfOwSMjpEat+ulgUKDElajNcG0jCwqec8RTeC/3BJx+9PZjY/6JjBSDgxnXrQNauI9iav3UuHyrtOHUqfJmMZjfffJnKKQyzd9axtN2nR9NRt3kORAe+Bs70hn8fJPlVHPpItY987IcOSM/z8odcIFKlJfRzme+S1hNZblIMAXCZp9vKbP3pXYBsnGDOdBbwvqp1dEBiyTHdBvpDPu1H/cetnKm3E1OOilBKU/9zJP7WWyLdqcYk/LOm0jnHY2VXC29swVDvv1k4Arih0ZTtSlFjunu5bMkJHKLvHDlNYObZ0x7oHQS3bSAt5P1opaqdWezw6vheNBSUjCkIOK2y5tFeJ2KA/v4MuQrk2Awi1kdclk/Mp8HNnLHMQ7+Jy8Itbe/UkApSLA+Jd3rqrRhLvhZVXzofz/OLjA8GS/e1JB0gxAdRTBYryDG5PYbXnbYYKKmygnXHGundsN0b6+ZXe2OPiGh/CN4FtsBQMUmnkd79f4ncCUd+v+Gi1qlDlWzkx7vy+5uMv0dboqQ0uSVGMYJTwBrEShMxYM6QnAx8oq2nquJmS79X9iO01S85jmIfCN5w5KSSoqOey0xfpgSgXjH8+R/OQoRRS5PSN6/HHracu0KjCn7OO8y6ELq5NiKoncpTKsRMUpaP060xo4eoqcGmjvwS7lrUbtBLG3tVqzYcP/W5KrsizGoPYZwJhbOlhVlJ7NFhAvr7EnTtOZa1rajtCSAY/b5oaUJgyfLR5UgIy0BfQKOUBrBOPyFdEI0s8ysb5/fRjQmQB8TX9WEA9s+ZZBtMBflVVTlBb2VgyDEtzIZBFxLZKpXx0jRDDWunI0WMw8QnxZchyy75+jQ8OBCDSA+wM/vqPidDvyFMMhQitt2HgPpzoL0f4TTdG8XDVl7O+iZDkaYelcpiQUJqHE6du+6UGy7Iovr/wFh+5W5G9kuFuMNNxnzeXl00fkJ90w+eAdkCCtAoF4Nao91G2Y8+YUBzyundbFkSTNwUZCYsaVe6Ycy18+ZNF5NMwL81zQKPqFnJF/7UG5CSHrPuG5BD088Dn12B7N4DQ9/akuLKjvucUhbixfS1JiVR1YBVaaH2/kBNTaTkNwDScdWhMt+N8hUMp/9ZsL2hZvCOf2ezORzBb6EoJb+tz/7LfzsHkmxlE2YTwmltl/huXo7HcOQC3tJcVCZCG562fq1XmG0w5UmErOKtUmcYGI2Dt3H9GP3rWZvvrA5x+jrcYa3Qyi0LgDuwoWXpjk9Phjjd6+ETVJeypep0TBxVWfVYZr/jV0RxtwUEJjIHs9VyfN2PpfGrP3/Fd4F07Vxevp0FC7DqW9yQgBxMHY7vI1TEmBzxVTtfWhPTKJjR8CsueZFH3CcMuwSZOjEgva2e8CUK2/KD0Ps/aZ08upjzP0L1LM0fp4NWbgP02C3E6uibGiFro8JF7kxfYdbKtXesgZ9tUd5tOp44QFBLiZYkBz0mJk2p8QBdU2pGluXMTbs3TMsTFLZSrmlrA0U3N3R4sYhyqIpZCVSv1NCshQBcvosSGdsFG5nTULMqjY8YE3HSALl78huRpmq32ziht/JopzeLdwtdlAZowaPgDc3ioaWTaNkpfeP4z4KirOLpoKp7ajvPtQdq3Zr3e0sKcqDlvRKZvxm+9+rUFL8fpAvMZtO2cK1ia62mJuUb/yBv1ZMn7s+H+e26KEUhb+d8hbfCaRPSEN0koCwUCMU94+gV9yEbp6saLUZhJVB/zevaUF9bpfyydYBMY04x4nq17ow9+iIHzXKgTk5vkUPXyqSaeFIbkW4sQaAhBfADx3/pB3zY/tU2WnP94cAc8g5505vUZ0SdnAMa/VfKenpKnGeO1ZP30c/cb8gSmfgI/TBhGoiXFoRiVKZS8ejhleVtf0gtWMF6zcVoDvhlLdDJi/GcT4ve0DTLxQOhl5XawckrbSXz2f+q+xnu+EPX5yfMMNkr54PiYvKw5uAoiO99C9vpiqVoRcWNhk5SVlCmrkkCBNlr55AJ7eJYgIfrzb1A1JeVCgAvNpa4d0/cQSR3fyKlhfJIBiJzSbfkCEiV+Ih62v7pAlhgWMQ7/Fu3aVjOISfPIruXZ3TyDaza/cp0HrXmvUNyufVR0gEYZSgrh6CrLL+3wiUZPj1hCjQ8OBCHCA+wNaq7iID6mppWxXeIrJu2yiMQVtCUWnjJFwdMbTZ082cqK0t9YepxNcBBXOmTnT4JeqUEVwBfXC3Dc6JlF5dXGVmbCDk+f/fSO3HO6vcyWJjuuAcAqDpFAaZBX+Zx5GXe1Tb5dO3gIm2AvfyMDx5aHs16wnwdku4nqu2isrXAokO1vEmDx/29eRkN2sVcV0lk2dodS+/RVeXSY7DDV6iZ1aDsrDfKBXy0EqWNHfefGcTL2HCiYSsjU40SYCbODgoAd36e5CUaSIdsWgeHO07+P3h7Y9X5Ge0ENnXLlOMwYrDB7Bz6a8wPUIx8v6XMSWYE/4/WbyMvAxcAbsZ4PsjLsKOe6LmNVqcNo9WDg5yN2AFarmMrQpIAOle9Qi4sIduO+DxiaAsxoIBnDuMUBHkjShQmxjdNTXx2gbAAqw/qoePtUPXaDCU4ikRWLisdYLdSEKm2T4seEBf5EMV9APZdR0gOhGFYQ53b238ULQmDjc7fUUx3U6ZVPN9vFHJGRQ3LFFkhBynkGETeysVNoMk/JXUB8VWxiojI/U8kQqTlarE/Wd4T5C5eqwxZX4Lt6qL2cri8WadFPvMumMFSoG9XxeCrJ31e5P6ReQ6y6daJ7kTmEiZh/tXa2e2CoC7RQ1+qpW1OCxirnQQaglTOOzTcc7ckrgzkI3pah1BWYTRZ6vAY/Iq23RgWOYWLAFcwrnB7Z6jPXNTwzSGpArqmg3DNZZKaZWQ/KKlENXmrmdp3lf5hXfiW1otNGbJM97gnXZo5cTkjD/pCmYWmn20oOFsjrXQBBKzRyC6tQO7lJpbbMtN0SQxP3hnN/HY8qtyA3AXdNqYjtcPDWsG0dhA4U9UFPxlBCxgryU1Adjkz9xJ/iEGvbY+WO3wazrp4bmF120a+kWACKLXMvdRkPYxDCupYWicSexWVOK+7REEKBq0mIydoeMRgQpp0RH2e7X2F/09FuR/uU8RNvXJuJtfpFbXJW44NUd6nbIsfK0o8jqcz/+p/e5H3f6Fht8f4SZe2lWcbwTc48wRaT0gdX7989JJoKzBcpbl2QcJ2WdeEUWvlvKq3orKA9MSFWOCwqrkhhgEmiiuWNHz/YL8HokAGntNpiJyN1IfpZsVKe9FEUUlNiQkMYgtciu6dY+9RG290X5zDQsqLaxBlHlteTpHMKi1qhwqlr05hBD3gEwuYrmAkz04g0k1ygX0kn8vhdfDpy8WYsa7bYKvpvvkPptqwypdko+YQYyb+5xQOLUFa+Mg2uUxCPt5Zal7bw2s2uoP8ajQ8OBCKyA+wNZg44dwNZSNQkk/amfHCrX54megvGxRzhwmvtTjVyM7gQ57v/AwUCF9k91dhgorGmrja51g7aN78A3ebBNJGbep9Ot5OMAfzqwtH3swHAqGB6WmtWy8k+gyJ3cNSe7uqF/QF19XK0hmW/XTt0LqVQ1iFfawn2EG3Dyxig9ZtgOe0vOnxVsdp3AeRL55EeAzqxzoWkxiQus+rfLiLtNzKqQQokFwUgsqJ4byU4TNrcQe1Umy5Ykwjm6ax4LFKJxPlPHQuHMxQRWbAbrlfqKyx+HUtXaiwdTZl9PHOppF0b0br7GGwzng74uLc6qvDvXveDRZKb26fOXClBSozCHXxBdbp7JQGfNloO05kuYM0uimgNaDlS3LJ5GLXAaDwHpN/d+L0luU7wgt2kxzZZeiQpZt82pf+RGCR86EMK6FSvrUFoz5/BP0KkkY/9MRZKdP/ukp4+4npy0GNIhM0L2pAqrizuwb3LsIbsW60brE2eSl9pxL80Zm4OTke7ctac2E4hYdZQ9HocZS4Cg/fdYHOUoVdv+jj+uJ9IPv0Kl3IwCFT8hGPXRcjEsJYLdzLrJq4m/gHyQo0DXcAHnbRN8Qn1Fr3F2qOEnAEdxIgQ+1pGeiVnb5pJwES7Hbomw1wNTmj0lkO/ZvudXstOQAzPy410Pzi68Y4im8eseAfyNN9GYHzMCQV+EargD1L1NCv5uNZ6rz0akp9OYMA+KZwrvUflACGID+15YqNXdi8ZC7j5eG4w+X3rOQn8v52Jyc9+FmV6Jb3wgL3kP9O8d/6tXWOX6oQxfpvhKnjafndmseTM6PYKYcu9FCEgCWqpuDNNrFNI4kIhWolqP92aiwVnhjFlSODnfbRR8oTyuhzn+WZnteGKqsVIHKMNGl37Z3DWiPzd6eZuCsv6P465Kntr9mLqcXB7Se+XyzlNxcMoaBRQhwF69uhZVaUtQGqdwI3CElOrZ0OWRiOrkXMsOxdSp2fZIgqbb0ThOo0xitKYOYc3qEip5uxB68IVLO2WrriPnGsdcR2o+LbQBjKtxlmK4dshqjzxHi1ZoK8U/NFzgkE8y89tyMJgW0tG/xGi0kTIfHFcsQh/PG7zEE1vymJb+cCP1sz+Zp95byC3+mb2RxNUu7Stc8GGD0D88c3uJyX+F4cS/dmSxOBXeKB/Vv9med0FrXkKNUQ6oOkGTN7eadniV/coELprCTc/QUxgnEeCSG358M0CEF+lbOGuOztvvtecr/PJvHqpjNrlXxzU2hfhFhvWuUWGmwweI5FxHSug=",
-            "region": "",
-            "sessionId": "71d34ea5-a9d5-45eb-bfc8-fe79132c7a4d",
-            "messageType": 1,
-            "voiceLanguage": 0,
-            "voiceDurationSeconds": 2.18
-        }
+        # 请求数据（使用示例sessionId），语音素材从磁盘内存映射，请求体边编码边发送
+        voice = voice_fixtures.get("sample_zh_2s")
+        request_body = voice.request_body(
+            region="",
+            sessionId="71d34ea5-a9d5-45eb-bfc8-fe79132c7a4d",
+            messageType=1,
+            voiceLanguage=0
+        )
         
         with allure.step("发送POST请求进行语音聊天"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
-                
-                with allure.step("验证响应状态码"):
-                    self.assertions.assert_status_code(response, 200)
-                
-                with allure.step("验证响应不为空"):
-                    self.assertions.assert_not_empty(response)
-                
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 30.0)
-                
-                with allure.step("验证响应格式"):
-                    try:
-                        response_text = response.text
-                        assert len(response_text) > 0, "响应内容不应为空"
-                        logger.info(f"语音聊天响应内容长度: {len(response_text)}")
-
-                        # 检查是否为事件流格式
-                        if 'data:' in response_text or 'event:' in response_text:
-                            logger.info("响应为事件流格式")
-
-                            # 提取每一行以 "data: " 开头的部分
-                            lines = response_text.strip().splitlines()
-                            data_lines = [line for line in lines if line.startswith("data:")]
-
-                            assert len(data_lines) > 0, "事件流中未找到 data 字段"
-
-                            for i, line in enumerate(data_lines):
-                                json_part = line[len("data:"):].strip()
-                                parsed = json.loads(json_part)
-
+                with self.client.call("voice-chat", token=self.auth_token, data=request_body) as stream:
+                    
+                    with allure.step("验证响应状态码"):
+                        self.assertions.assert_status_code(stream, 200)
+                    
+                    with allure.step("验证响应格式"):
+                        try:
+                            event_count = 0
+                            for i, event in enumerate(stream):
+                                parsed = event.json()
+                                event_count += 1
+                                
                                 logger.debug(f"[Chunk {i}] 解析结果: {parsed}")
-
+                                
                                 # 验证 ErrorCode == 0
                                 # assert "ErrorCode" in parsed, f"[Chunk {i}] 缺少 ErrorCode 字段"
                                 # assert parsed["ErrorCode"] == 0, f"[Chunk {i}] ErrorCode 不为 0：{parsed['ErrorCode']}"
-
+                                
                                 # 验证 response 字段
                                 assert "Response" in parsed, f"[Chunk {i}] 缺少 response 字段"
                                 assert parsed["Response"] != "You've run out of credits.", f"[Chunk {i}] response 为 You've run out of credits."
-                                
-
-                        else:
-                            logger.info("响应为普通文本格式")
-                            # 如果是普通文本，可以按需添加其他验证逻辑
-
-                    except Exception as e:
-                        logger.warning(f"响应格式验证失败: {e}")
-                        pytest.fail(f"响应格式验证失败: {e}")
+                            
+                            assert stream.bytes_received > 0, "响应内容不应为空"
+                            logger.info(f"语音聊天响应内容长度: {stream.bytes_received}，事件数: {event_count}")
+                            
+                        except Exception as e:
+                            logger.warning(f"响应格式验证失败: {e}")
+                            pytest.fail(f"响应格式验证失败: {e}")
                         
             except Exception as e:
                 if "401" in str(e) or "403" in str(e):
@@ -143,12 +92,6 @@ class TestVoiceChatAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/voice/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（带地区）
         import datetime
         current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -163,11 +106,7 @@ class TestVoiceChatAPI:
         
         with allure.step("发送POST请求进行带地区的语音聊天"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("voice-chat", token=self.auth_token, json=request_data, sse=False)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
@@ -175,9 +114,6 @@ class TestVoiceChatAPI:
                 with allure.step("验证响应不为空"):
                     self.assertions.assert_not_empty(response)
                 
-                with allure.step("验证响应时间"):
-                    self.assertions.assert_response_time(response, 30.0)
-                
                 logger.info("带地区的语音聊天测试通过")
                 
             except Exception as e:
@@ -199,12 +135,6 @@ class TestVoiceChatAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/voice/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据（无效sessionId）
         import datetime
         current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -219,11 +149,7 @@ class TestVoiceChatAPI:
         
         with allure.step("发送POST请求进行无效sessionId的语音聊天"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("voice-chat", token=self.auth_token, json=request_data, sse=False)
                 
                 # 无效sessionId可能返回400或其他错误状态码
                 logger.info(f"无效sessionId语音聊天响应状态码: {response.status_code}")
@@ -249,12 +175,6 @@ class TestVoiceChatAPI:
         if not self.auth_token:
             pytest.skip("无法获取认证token，跳过此测试")
             
-        endpoint = "/godgptprod-client/api/godgpt/voice/chat"
-        
-        # 设置带认证的请求头
-        auth_headers = self.default_headers.copy()
-        auth_headers['authorization'] = f'Bearer {self.auth_token}'
-        
         # 请求数据
         request_data = {
             "content": "性能测试语音消息",
@@ -267,18 +187,11 @@ class TestVoiceChatAPI:
         
         with allure.step("发送POST请求进行性能测试"):
             try:
-                response = self.client.post(
-                    endpoint,
-                    json=request_data,
-                    headers=auth_headers
-                )
+                response = self.client.call("voice-chat", token=self.auth_token, json=request_data, sse=False)
                 
                 with allure.step("验证响应状态码"):
                     self.assertions.assert_status_code(response, 200)
                 
-                with allure.step("验证响应时间不超过20秒"):
-                    self.assertions.assert_response_time(response, 20.0)
-                
                 logger.info("语音聊天性能测试通过")
                 
             except Exception as e:
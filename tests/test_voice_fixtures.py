@@ -0,0 +1,106 @@
+import hashlib
+import json
+import threading
+import tracemalloc
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import allure
+from common.http_client import HttpClient
+from common.voice_fixtures import VoiceFixtureManager, voice_fixtures
+
+
+class _DigestHandler(BaseHTTPRequestHandler):
+    """分块读取请求体并返回长度和摘要，不在服务端保存完整请求体"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        remaining = int(self.headers["Content-Length"])
+        digest = hashlib.sha256()
+        while remaining:
+            chunk = self.rfile.read(min(remaining, 65536))
+            digest.update(chunk)
+            remaining -= len(chunk)
+        body = json.dumps({"length": int(self.headers["Content-Length"]), "sha256": digest.hexdigest()}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def digest_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _DigestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@allure.epic("测试框架")
+@allure.feature("语音素材")
+@pytest.mark.unit
+class TestVoiceFixtures:
+    """语音素材测试类"""
+
+    @allure.story("磁盘素材")
+    def test_fixture_is_memory_mapped_and_cached(self):
+        """测试素材按清单加载、内存映射读取，base64每个进程只编码一次"""
+        voice = voice_fixtures.get("sample_zh_2s")
+        assert voice is voice_fixtures.get("sample_zh_2s")
+        assert voice.data[:4] == b"\x1a\x45\xdf\xa3"  # WebM/EBML 文件头
+        assert len(voice.data) == voice.size
+
+        assert voice.base64 is voice.base64
+        data = voice.request_data(sessionId="s", messageType=1)
+        assert list(data) == ["content", "sessionId", "messageType", "voiceDurationSeconds"]
+        assert data["voiceDurationSeconds"] == 2.18
+        with pytest.raises(ValueError):
+            voice_fixtures.get("missing")
+
+    @allure.story("流式请求体")
+    def test_request_body_matches_json(self):
+        """测试流式请求体与 json.dumps 的结果逐字节一致，支持任意块大小读取和回到开头"""
+        voice = voice_fixtures.get("sample_zh_2s")
+        fields = {"region": "北京", "sessionId": "s", "messageType": 1}
+        expected = json.dumps(voice.request_data(**fields), ensure_ascii=False).encode("utf-8")
+
+        body = voice.request_body(**fields)
+        assert len(body) == len(expected)
+        for chunk_size in (1, 7, 4096, 1 << 20):
+            body.seek(0)
+            chunks = iter(lambda: body.read(chunk_size), b"")
+            assert b"".join(chunks) == expected, chunk_size
+        body.seek(-3, 2)
+        assert body.read() == expected[-3:]
+
+    @allure.story("合成音频")
+    def test_synthetic_audio_streams_without_buffering(self, tmp_path, digest_server):
+        """测试合成音频的时长和大小，相同参数复用缓存文件；大请求体发送时不在内存中构建完整JSON"""
+        manager = VoiceFixtureManager(cache_dir=str(tmp_path))
+        voice = manager.synthetic(60)
+        assert manager.synthetic(60) is voice
+        with wave.open(str(voice.path), 'rb') as wav:
+            assert wav.getnframes() == 60 * 16000 and wav.getframerate() == 16000
+        assert voice.size == 44 + 60 * 16000 * 2
+        assert VoiceFixtureManager(cache_dir=str(tmp_path)).synthetic(0.5).size == 44 + 8000 * 2
+
+        body = voice.request_body(sessionId="s")
+        expected = hashlib.sha256()
+        for chunk in iter(lambda: body.read(65536), b""):
+            expected.update(chunk)
+        body.seek(0)
+
+        with HttpClient(digest_server, retry_times=0) as client:
+            tracemalloc.start()
+            try:
+                result = client.post("/voice", data=body).json()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        assert result == {"length": len(body), "sha256": expected.hexdigest()}
+        assert peak < len(body) // 4
+        manager.close()